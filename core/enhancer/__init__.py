@@ -5,15 +5,22 @@
 - BrightnessEnhancer: CLAHE-based brightness enhancement
 - SharpnessEnhancer: Unsharp Mask-based sharpness enhancement
 - ImageEnhancer: Orchestrator combining both enhancers
+- ImageQualityProbe: Per-frame quality gate for adaptive enhancement
+- BestFrameSelector: Releases the best-quality crop of a label to OCR
 """
 
 from core.enhancer.brightness_enhancer import BrightnessEnhancer
 from core.enhancer.sharpness_enhancer import SharpnessEnhancer
 from core.enhancer.image_enhancer import ImageEnhancer
+from core.enhancer.quality_probe import ImageQualityProbe
+from core.enhancer.best_frame_selector import BestFrameSelector, FrameCandidate
 
 
 __all__ = [
     "BrightnessEnhancer",
     "SharpnessEnhancer",
-    "ImageEnhancer"
+    "ImageEnhancer",
+    "ImageQualityProbe",
+    "BestFrameSelector",
+    "FrameCandidate"
 ]
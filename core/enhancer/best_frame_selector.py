@@ -0,0 +1,230 @@
+"""
+Best Frame Selector Module
+
+Buffers the S3/S4 crops of a label for a short window and releases only
+the best one to the expensive steps (S6 component extraction, S7 OCR,
+S8 postprocessing), so motion-blurred or badly exposed frames do not cost
+an OCR run.
+
+Quality score (0..1) from ImageQualityProbe metrics on a thumbnail:
+- Sharpness: variance of the Laplacian, as s / (s + sharpnessReference)
+- Exposure: contrast spread (p95 - p5) relative to minContrastSpread,
+  halved when the mean gray level is outside [minMean, maxMean]
+
+Frames only reach the selector after S5 decoded their QR (the QR text is
+the label key), so QR decode success is a precondition, not a weight.
+
+A label's buffer is released when:
+- a frame scores at least releaseScore (good enough, no need to wait)
+- bufferSize frames were collected
+- windowMs elapsed since the first buffered frame, checked by offer() for
+  the label itself and by popDue(), which the pipeline polls every frame so
+  a label that leaves the view is still processed
+
+Follows SRP: Only handles frame scoring and selection.
+"""
+
+import time
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from core.enhancer.quality_probe import ImageQualityProbe
+
+
+@dataclass
+class FrameCandidate:
+    """
+    One buffered frame of a label.
+
+    Attributes:
+        score: Quality score (0..1).
+        payload: Caller data released with the frame (crop, QR result, ...).
+        addedAt: Time the frame was buffered (time.monotonic()).
+    """
+    score: float
+    payload: Any
+    addedAt: float
+
+
+class BestFrameSelector:
+    """
+    Per-label buffer releasing the best-scoring frame of a window.
+    """
+
+    def __init__(
+        self,
+        bufferSize: int = 5,
+        windowMs: float = 300.0,
+        releaseScore: float = 0.8,
+        thumbnailWidth: int = 160,
+        sharpnessReference: float = 200.0,
+        minContrastSpread: float = 80.0,
+        minMeanBrightness: float = 70.0,
+        maxMeanBrightness: float = 200.0,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize BestFrameSelector.
+
+        Args:
+            bufferSize: Maximum frames buffered per label before release.
+            windowMs: Maximum time a label's frames are buffered.
+            releaseScore: Score at which a frame is released immediately.
+            thumbnailWidth: Width of the thumbnail used for scoring.
+            sharpnessReference: Laplacian variance scored as 0.5.
+            minContrastSpread: Contrast spread scored as fully exposed.
+            minMeanBrightness: Mean gray level below which exposure is halved.
+            maxMeanBrightness: Mean gray level above which exposure is halved.
+            logger: Logger instance for debug output.
+        """
+        self._bufferSize = max(1, bufferSize)
+        self._windowSec = windowMs / 1000.0
+        self._releaseScore = releaseScore
+        self._thumbnailWidth = thumbnailWidth
+        self._sharpnessReference = max(1e-6, sharpnessReference)
+        self._minContrastSpread = max(1e-6, minContrastSpread)
+        self._minMeanBrightness = minMeanBrightness
+        self._maxMeanBrightness = maxMeanBrightness
+        self._logger = logger or logging.getLogger(__name__)
+
+        self._probe = ImageQualityProbe(thumbnailWidth=thumbnailWidth)
+        self._buffers: Dict[str, List[FrameCandidate]] = {}
+        self._lock = threading.Lock()
+        self._framesOffered = 0
+        self._framesReleased = 0
+        self._labelsDropped = 0
+
+        self._logger.info(
+            f"BestFrameSelector initialized: bufferSize={bufferSize}, "
+            f"windowMs={windowMs}, releaseScore={releaseScore}, "
+            f"sharpnessReference={sharpnessReference}"
+        )
+
+    def score(self, image: np.ndarray, context=None) -> float:
+        """
+        Score the quality of a label crop.
+
+        Args:
+            image: Label crop (BGR or grayscale).
+            context: Optional ImageContext of the crop; its memoized gray
+                thumbnail is used instead of resizing again.
+
+        Returns:
+            Quality score between 0 and 1.
+        """
+        if context is not None:
+            image, _ = context.thumbnail(self._thumbnailWidth, context.height, gray=True)
+
+        assessment = self._probe.assess(image)
+
+        sharpness = assessment.sharpness / (assessment.sharpness + self._sharpnessReference)
+        exposure = min(1.0, assessment.contrastSpread / self._minContrastSpread)
+        if not self._minMeanBrightness <= assessment.meanBrightness <= self._maxMeanBrightness:
+            exposure *= 0.5
+
+        return float(sharpness * exposure)
+
+    def offer(self, key: str, score: float, payload: Any) -> Optional[FrameCandidate]:
+        """
+        Buffer a frame of a label and release the best one when due.
+
+        Args:
+            key: Label key (QR text).
+            score: Quality score from score().
+            payload: Data returned with the frame when it is selected.
+
+        Returns:
+            Best buffered FrameCandidate when the buffer is released, else None.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._dropStale(now)
+            self._framesOffered += 1
+            buffer = self._buffers.setdefault(key, [])
+            buffer.append(FrameCandidate(score=score, payload=payload, addedAt=now))
+
+            due = (
+                score >= self._releaseScore
+                or len(buffer) >= self._bufferSize
+                or now - buffer[0].addedAt >= self._windowSec
+            )
+            if not due:
+                return None
+
+            best = max(buffer, key=lambda candidate: candidate.score)
+            del self._buffers[key]
+            self._framesReleased += 1
+
+        self._logger.debug(
+            f"Best frame released for {key}: score={best.score:.3f} "
+            f"of {len(buffer)} frame(s)"
+        )
+        return best
+
+    def popDue(self) -> Optional[FrameCandidate]:
+        """
+        Release the best frame of a label whose window expired.
+
+        Call once per frame: labels that left the view get no further
+        offer() calls and would otherwise never be released.
+
+        Returns:
+            Best FrameCandidate of the oldest expired label, else None.
+        """
+        now = time.monotonic()
+        with self._lock:
+            key = next(
+                (
+                    key for key, buffer in self._buffers.items()
+                    if now - buffer[0].addedAt >= self._windowSec
+                ),
+                None
+            )
+            if key is None:
+                return None
+
+            buffer = self._buffers.pop(key)
+            best = max(buffer, key=lambda candidate: candidate.score)
+            self._framesReleased += 1
+
+        self._logger.debug(
+            f"Best frame released on timeout for {key}: score={best.score:.3f} "
+            f"of {len(buffer)} frame(s)"
+        )
+        return best
+
+    def clear(self) -> None:
+        """Drop all buffered frames."""
+        with self._lock:
+            self._buffers.clear()
+
+    def getStatistics(self) -> dict:
+        """
+        Get selection statistics.
+
+        Returns:
+            Dict with framesOffered, framesReleased, labelsDropped and
+            pendingLabels.
+        """
+        with self._lock:
+            return {
+                "framesOffered": self._framesOffered,
+                "framesReleased": self._framesReleased,
+                "labelsDropped": self._labelsDropped,
+                "pendingLabels": len(self._buffers)
+            }
+
+    def _dropStale(self, now: float) -> None:
+        """Drop buffers never released by popDue() (lock held; safety net only)."""
+        stale = [
+            key for key, buffer in self._buffers.items()
+            if now - buffer[-1].addedAt > 10 * self._windowSec
+        ]
+        for key in stale:
+            del self._buffers[key]
+            self._labelsDropped += 1
+            self._logger.warning(f"Best frame buffer dropped unprocessed for {key} (popDue() not polled)")
@@ -50,6 +50,12 @@ def __init__(
         self._clipLimit = clipLimit
         self._tileGridSize = tileGridSize
         
+        # CLAHE object is reused across frames, rebuilt only on settings change
+        self._clahe = cv2.createCLAHE(
+            clipLimit=self._clipLimit,
+            tileGridSize=self._tileGridSize
+        )
+        
         logger.info(
             f"BrightnessEnhancer initialized: clipLimit={clipLimit}, "
             f"tileGridSize={tileGridSize}"
@@ -65,7 +71,41 @@ def tileGridSize(self) -> Tuple[int, int]:
         """Get current tile grid size."""
         return self._tileGridSize
     
-    def enhanceBrightness(self, image: np.ndarray) -> np.ndarray:
+    def setParameters(
+        self,
+        clipLimit: Optional[float] = None,
+        tileGridSize: Optional[Tuple[int, int]] = None
+    ) -> None:
+        """
+        Update CLAHE settings. The cached CLAHE object is rebuilt only if
+        a value actually changes.
+        
+        Args:
+            clipLimit: New clip limit (None = keep current).
+            tileGridSize: New tile grid size (None = keep current).
+        """
+        newClipLimit = self._clipLimit if clipLimit is None else clipLimit
+        newTileGridSize = self._tileGridSize if tileGridSize is None else tuple(tileGridSize)
+        
+        if newClipLimit == self._clipLimit and newTileGridSize == self._tileGridSize:
+            return
+        
+        self._clipLimit = newClipLimit
+        self._tileGridSize = newTileGridSize
+        self._clahe = cv2.createCLAHE(
+            clipLimit=self._clipLimit,
+            tileGridSize=self._tileGridSize
+        )
+        logger.info(
+            f"BrightnessEnhancer updated: clipLimit={self._clipLimit}, "
+            f"tileGridSize={self._tileGridSize}"
+        )
+    
+    def enhanceBrightness(
+        self,
+        image: np.ndarray,
+        dst: Optional[np.ndarray] = None
+    ) -> np.ndarray:
         """
         Enhance image brightness using CLAHE.
         
@@ -75,9 +115,11 @@ def enhanceBrightness(self, image: np.ndarray) -> np.ndarray:
         
         Args:
             image: Input grayscale image (H, W) or (H, W, 1).
+            dst: Optional preallocated output buffer (H, W, uint8).
+                 Must not be the same array as image.
             
         Returns:
-            Brightness-enhanced grayscale image (H, W).
+            Brightness-enhanced grayscale image (H, W), written into dst if given.
             Returns original image if processing fails.
         """
         if image is None or image.size == 0:
@@ -93,12 +135,11 @@ def enhanceBrightness(self, image: np.ndarray) -> np.ndarray:
                     logger.warning("Expected grayscale image, got multi-channel image")
                     return image
             
-            # Create CLAHE object and apply directly on grayscale
-            clahe = cv2.createCLAHE(
-                clipLimit=self._clipLimit,
-                tileGridSize=self._tileGridSize
-            )
-            enhanced = clahe.apply(image)
+            # Apply cached CLAHE directly on grayscale
+            if dst is not None:
+                enhanced = self._clahe.apply(image, dst)
+            else:
+                enhanced = self._clahe.apply(image)
             
             logger.debug("Brightness enhancement applied successfully")
             return enhanced
@@ -9,7 +9,8 @@
 """
 
 import logging
-from typing import Optional
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
 import numpy as np
 import cv2
 
@@ -33,10 +34,17 @@ class ImageEnhancer(IImageEnhancer):
     2. Brightness enhancement SECOND - reveals hidden details
     3. Sharpness enhancement THIRD - sharpens revealed details
     
+    The three steps run as a single fused pass: intermediate images are
+    written into preallocated buffers keyed by crop shape, and only the
+    final output is allocated (or written into a caller-provided buffer).
+    
     Follows DIP: Receives enhancers via dependency injection.
     Follows SRP: Only orchestrates, doesn't implement enhancement logic.
     """
     
+    # Maximum number of crop shapes kept in the buffer cache
+    MAX_CACHED_SHAPES = 4
+    
     def __init__(
         self,
         brightnessEnhancer: BrightnessEnhancer,
@@ -52,6 +60,9 @@ def __init__(
         self._brightnessEnhancer = brightnessEnhancer
         self._sharpnessEnhancer = sharpnessEnhancer
         
+        # Intermediate buffers keyed by (height, width), oldest evicted first
+        self._buffers: "OrderedDict[Tuple[int, int], Dict[str, np.ndarray]]" = OrderedDict()
+        
         logger.info("ImageEnhancer initialized with brightness and sharpness enhancers")
     
     @property
@@ -68,13 +79,14 @@ def enhance(
         self,
         image: np.ndarray,
         applyBrightness: bool = True,
-        applySharpness: bool = True
+        applySharpness: bool = True,
+        out: Optional[np.ndarray] = None
     ) -> EnhancementResult:
         """
         Enhance image quality through brightness and sharpness adjustments on grayscale.
         
-        Pipeline:
-        1. Convert BGR to Grayscale
+        Pipeline (single fused pass):
+        1. Convert BGR to Grayscale (into cached buffer)
         2. If applyBrightness: Apply CLAHE brightness enhancement
         3. If applySharpness: Apply Unsharp Mask sharpness enhancement
         
@@ -82,6 +94,8 @@ def enhance(
             image: Input image (BGR format, numpy array).
             applyBrightness: Whether to apply brightness enhancement.
             applySharpness: Whether to apply sharpness enhancement.
+            out: Optional output buffer (H, W, uint8). Allocated if None or
+                 if its shape does not match the input.
             
         Returns:
             EnhancementResult containing:
@@ -97,33 +111,88 @@ def enhance(
                 sharpnessApplied=False
             )
         
+        if len(image.shape) == 3 and image.shape[2] == 1:
+            image = image[:, :, 0]
+        
+        h, w = image.shape[:2]
+        if out is None or out.shape != (h, w) or out.dtype != np.uint8:
+            out = np.empty((h, w), dtype=np.uint8)
+        
+        buffers = self._getBuffers(h, w)
+        
         # Convert BGR to Grayscale at the beginning
         if len(image.shape) == 3 and image.shape[2] == 3:
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=buffers["gray"])
         else:
             gray = image
         
-        result = gray.copy()
         brightnessApplied = False
         sharpnessApplied = False
         
+        if not applyBrightness and not applySharpness:
+            logger.debug("No enhancement applied, returning grayscale image")
+            np.copyto(out, gray)
+            return EnhancementResult(
+                image=out,
+                brightnessApplied=False,
+                sharpnessApplied=False
+            )
+        
+        result = gray
+        
         # Step 1: Brightness enhancement (CLAHE on grayscale)
         if applyBrightness:
-            result = self._brightnessEnhancer.enhanceBrightness(result)
+            target = buffers["clahe"] if applySharpness else out
+            result = self._brightnessEnhancer.enhanceBrightness(result, dst=target)
             brightnessApplied = True
             logger.debug("Brightness enhancement step completed")
         
         # Step 2: Sharpness enhancement (Unsharp Mask on grayscale)
         if applySharpness:
-            result = self._sharpnessEnhancer.enhanceSharpness(result)
+            result = self._sharpnessEnhancer.enhanceSharpness(
+                result,
+                dst=out,
+                blurBuffer=buffers["blur"]
+            )
             sharpnessApplied = True
             logger.debug("Sharpness enhancement step completed")
         
-        if not applyBrightness and not applySharpness:
-            logger.debug("No enhancement applied, returning grayscale image")
+        # A failed step returns its input, which may be a reused buffer
+        # overwritten by the next frame; the result must always own 'out'
+        if result is not out:
+            np.copyto(out, result)
+            result = out
         
         return EnhancementResult(
             image=result,
             brightnessApplied=brightnessApplied,
             sharpnessApplied=sharpnessApplied
         )
+    
+    def _getBuffers(self, height: int, width: int) -> Dict[str, np.ndarray]:
+        """
+        Get preallocated intermediate buffers for a crop shape.
+        
+        Args:
+            height: Crop height.
+            width: Crop width.
+            
+        Returns:
+            Dict with "gray", "clahe" and "blur" uint8 buffers of shape (H, W).
+        """
+        key = (height, width)
+        buffers = self._buffers.get(key)
+        
+        if buffers is None:
+            buffers = {
+                "gray": np.empty(key, dtype=np.uint8),
+                "clahe": np.empty(key, dtype=np.uint8),
+                "blur": np.empty(key, dtype=np.uint8)
+            }
+            self._buffers[key] = buffers
+            if len(self._buffers) > self.MAX_CACHED_SHAPES:
+                self._buffers.popitem(last=False)
+        else:
+            self._buffers.move_to_end(key)
+        
+        return buffers
@@ -0,0 +1,121 @@
+"""
+Image Quality Probe Module
+
+Measures cheap image-quality statistics on a small thumbnail and decides
+whether brightness (CLAHE) and sharpness (Unsharp Mask) enhancement are
+needed for the current frame.
+
+Metrics:
+- Contrast spread: 95th - 5th percentile of gray levels
+- Mean brightness: average gray level
+- Sharpness: variance of the Laplacian
+
+Follows SRP: Only handles quality measurement and gating decisions.
+"""
+
+import logging
+import numpy as np
+import cv2
+
+from core.interfaces.enhancer_interface import QualityAssessment
+
+
+logger = logging.getLogger(__name__)
+
+
+class ImageQualityProbe:
+    """
+    Decides per frame whether enhancement is needed.
+
+    Brightness enhancement is needed when the thumbnail is too dark,
+    too bright, or has a narrow contrast spread. Sharpness enhancement
+    is needed when the Laplacian variance is below the threshold.
+
+    Thresholds are measured on the thumbnail, so they depend on
+    thumbnailWidth (Laplacian variance grows as the image is downscaled).
+    """
+
+    def __init__(
+        self,
+        thumbnailWidth: int = 160,
+        minContrastSpread: float = 80.0,
+        minMeanBrightness: float = 70.0,
+        maxMeanBrightness: float = 200.0,
+        minSharpness: float = 100.0
+    ):
+        """
+        Initialize ImageQualityProbe.
+
+        Args:
+            thumbnailWidth: Width of the thumbnail used for measurement.
+            minContrastSpread: Minimum p95 - p5 gray spread before CLAHE is needed.
+            minMeanBrightness: Mean gray level below which CLAHE is needed.
+            maxMeanBrightness: Mean gray level above which CLAHE is needed.
+            minSharpness: Laplacian variance below which sharpening is needed.
+        """
+        self._thumbnailWidth = thumbnailWidth
+        self._minContrastSpread = minContrastSpread
+        self._minMeanBrightness = minMeanBrightness
+        self._maxMeanBrightness = maxMeanBrightness
+        self._minSharpness = minSharpness
+
+        logger.info(
+            f"ImageQualityProbe initialized: thumbnailWidth={thumbnailWidth}, "
+            f"minContrastSpread={minContrastSpread}, "
+            f"meanBrightness=[{minMeanBrightness}, {maxMeanBrightness}], "
+            f"minSharpness={minSharpness}"
+        )
+
+    def assess(self, image: np.ndarray) -> QualityAssessment:
+        """
+        Measure quality metrics and decide which enhancements are needed.
+
+        Args:
+            image: Input image (BGR or grayscale).
+
+        Returns:
+            QualityAssessment with metrics and gating decisions.
+        """
+        thumbnail = self._makeThumbnail(image)
+
+        # Contrast spread from the gray-level histogram (p95 - p5)
+        hist = cv2.calcHist([thumbnail], [0], None, [256], [0, 256]).ravel()
+        cdf = np.cumsum(hist)
+        total = cdf[-1]
+        p5 = int(np.searchsorted(cdf, 0.05 * total))
+        p95 = int(np.searchsorted(cdf, 0.95 * total))
+        contrastSpread = float(p95 - p5)
+
+        meanBrightness = float(np.dot(hist, np.arange(256)) / total)
+
+        laplacian = cv2.Laplacian(thumbnail, cv2.CV_32F)
+        sharpness = float(laplacian.var())
+
+        needsBrightness = (
+            contrastSpread < self._minContrastSpread
+            or meanBrightness < self._minMeanBrightness
+            or meanBrightness > self._maxMeanBrightness
+        )
+        needsSharpness = sharpness < self._minSharpness
+
+        return QualityAssessment(
+            contrastSpread=contrastSpread,
+            meanBrightness=meanBrightness,
+            sharpness=sharpness,
+            needsBrightness=needsBrightness,
+            needsSharpness=needsSharpness
+        )
+
+    def _makeThumbnail(self, image: np.ndarray) -> np.ndarray:
+        """Downscale (if needed) and convert to a single-channel thumbnail."""
+        h, w = image.shape[:2]
+        if w > self._thumbnailWidth:
+            scale = self._thumbnailWidth / float(w)
+            newSize = (self._thumbnailWidth, max(1, int(round(h * scale))))
+            image = cv2.resize(image, newSize, interpolation=cv2.INTER_AREA)
+
+        if len(image.shape) == 3 and image.shape[2] == 3:
+            return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        if len(image.shape) == 3:
+            return image[:, :, 0]
+        return image
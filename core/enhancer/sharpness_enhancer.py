@@ -67,7 +67,12 @@ def amount(self) -> float:
         """Get current amount value."""
         return self._amount
     
-    def enhanceSharpness(self, image: np.ndarray) -> np.ndarray:
+    def enhanceSharpness(
+        self,
+        image: np.ndarray,
+        dst: Optional[np.ndarray] = None,
+        blurBuffer: Optional[np.ndarray] = None
+    ) -> np.ndarray:
         """
         Enhance image sharpness using Unsharp Mask.
         
@@ -78,9 +83,11 @@ def enhanceSharpness(self, image: np.ndarray) -> np.ndarray:
         
         Args:
             image: Input grayscale image (H, W) or (H, W, 1).
+            dst: Optional preallocated output buffer (H, W, uint8).
+            blurBuffer: Optional preallocated buffer for the blurred image.
             
         Returns:
-            Sharpness-enhanced grayscale image (H, W).
+            Sharpness-enhanced grayscale image (H, W), written into dst if given.
             Returns original image if processing fails.
         """
         if image is None or image.size == 0:
@@ -97,13 +104,14 @@ def enhanceSharpness(self, image: np.ndarray) -> np.ndarray:
                     return image
             
             # Apply Gaussian blur
-            blurred = cv2.GaussianBlur(image, (0, 0), self._sigma)
+            blurred = cv2.GaussianBlur(image, (0, 0), self._sigma, dst=blurBuffer)
             
             # Apply Unsharp Mask formula using addWeighted
             sharpened = cv2.addWeighted(
                 image, 1.0 + self._amount,
                 blurred, -self._amount,
-                0
+                0,
+                dst=dst
             )
             
             logger.debug("Sharpness enhancement applied successfully")
@@ -165,7 +165,7 @@ def _extractAboveQr(
         # Return empty image if extraction failed
         if roi.size == 0:
             self._logger.warning("Empty above-QR region, creating placeholder")
-            return np.zeros((40, 120, 3), dtype=np.uint8)
+            return np.zeros((40, 120) + image.shape[2:], dtype=image.dtype)
         
         return roi.copy()
     
@@ -226,7 +226,7 @@ def _extractBelowQr(
         # Return empty image if extraction failed
         if roi.size == 0:
             self._logger.warning("Empty below-QR region, creating placeholder")
-            return np.zeros((100, 200, 3), dtype=np.uint8)
+            return np.zeros((100, 200) + image.shape[2:], dtype=image.dtype)
         
         return roi.copy()
     
@@ -244,14 +244,10 @@ def _mergeComponents(
         Regions are stacked vertically with above-QR on top.
         Above-QR region is centered horizontally relative to below-QR region.
         
-        Note: Input is expected to be grayscale from S4 Enhancement.
+        Both regions come from the same image, so they share its format
+        (grayscale from S4 or BGR). The merge works in that format directly;
+        padding and separator are allocated with the same channel count.
         """
-        # Handle grayscale images - convert to BGR for consistent processing
-        if len(aboveQrRoi.shape) == 2:
-            aboveQrRoi = cv2.cvtColor(aboveQrRoi, cv2.COLOR_GRAY2BGR)
-        if len(belowQrRoi.shape) == 2:
-            belowQrRoi = cv2.cvtColor(belowQrRoi, cv2.COLOR_GRAY2BGR)
-        
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
         # SCALE ABOVE QR REGION (Improve OCR accuracy for small text)
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -271,36 +267,22 @@ def _mergeComponents(
         # Use max width for canvas
         targetWidth = max(aboveQrRoi.shape[1], belowQrRoi.shape[1])
         
-        def centerPadToWidth(img: np.ndarray, width: int) -> np.ndarray:
-            """Center image horizontally with white padding on both sides."""
-            if img.shape[1] >= width:
-                return img
-            totalPad = width - img.shape[1]
-            leftPad = totalPad // 2
-            rightPad = totalPad - leftPad
-            leftPadding = np.ones((img.shape[0], leftPad, 3), dtype=np.uint8) * 255
-            rightPadding = np.ones((img.shape[0], rightPad, 3), dtype=np.uint8) * 255
-            return np.hstack([leftPadding, img, rightPadding])
-        
-        def leftPadToWidth(img: np.ndarray, width: int) -> np.ndarray:
-            """Left-align image with white padding on right."""
-            if img.shape[1] >= width:
-                return img
-            padWidth = width - img.shape[1]
-            padding = np.ones((img.shape[0], padWidth, 3), dtype=np.uint8) * 255
-            return np.hstack([img, padding])
+        separatorHeight = 3
+        aboveH, aboveW = aboveQrRoi.shape[:2]
+        belowH, belowW = belowQrRoi.shape[:2]
         
-        # Center above-QR, left-align below-QR
-        aboveQrRoi = centerPadToWidth(aboveQrRoi, targetWidth)
-        belowQrRoi = leftPadToWidth(belowQrRoi, targetWidth)
+        # Single white canvas in the input format, regions copied in place
+        mergedShape = (aboveH + separatorHeight + belowH, targetWidth) + aboveQrRoi.shape[2:]
+        merged = np.full(mergedShape, 255, dtype=aboveQrRoi.dtype)
         
-        # Add separator line
-        separator = np.ones((3, targetWidth, 3), dtype=np.uint8) * 128
+        # Center above-QR
+        leftPad = (targetWidth - aboveW) // 2
+        merged[:aboveH, leftPad:leftPad + aboveW] = aboveQrRoi
         
-        # Stack vertically
-        merged = np.vstack([aboveQrRoi, separator, belowQrRoi])
+        # Separator line
+        merged[aboveH:aboveH + separatorHeight] = 128
         
-        # Convert back to grayscale (input was grayscale from S4)
-        mergedGray = cv2.cvtColor(merged, cv2.COLOR_BGR2GRAY)
+        # Left-align below-QR
+        merged[aboveH + separatorHeight:, :belowW] = belowQrRoi
         
-        return mergedGray
+        return merged
@@ -11,6 +11,8 @@
 from typing import Optional, List, Tuple
 import numpy as np
 
+from core.interfaces.image_format import ImageFormat, FORMAT_GRAY, FORMAT_BGR
+
 
 @dataclass
 class ComponentResult:
@@ -54,3 +56,13 @@ def extractAndMerge(
             ComponentResult if successful, None otherwise
         """
         pass
+    
+    def getAcceptedFormats(self) -> List[ImageFormat]:
+        """
+        Get the input formats this extractor works on without conversion.
+        
+        Returns:
+            Accepted formats, preferred first. The merged image keeps
+            the input format.
+        """
+        return [FORMAT_GRAY, FORMAT_BGR]
@@ -26,6 +26,25 @@ class EnhancementResult:
     sharpnessApplied: bool = False
 
 
+@dataclass
+class QualityAssessment:
+    """
+    Result of an image quality probe.
+    
+    Attributes:
+        contrastSpread: 95th - 5th percentile of gray levels (0-255).
+        meanBrightness: Mean gray level (0-255).
+        sharpness: Variance of the Laplacian on the thumbnail.
+        needsBrightness: Whether brightness enhancement is needed.
+        needsSharpness: Whether sharpness enhancement is needed.
+    """
+    contrastSpread: float
+    meanBrightness: float
+    sharpness: float
+    needsBrightness: bool
+    needsSharpness: bool
+
+
 class IImageEnhancer(ABC):
     """
     Abstract interface for image enhancement.
@@ -41,7 +60,8 @@ def enhance(
         self,
         image: np.ndarray,
         applyBrightness: bool = True,
-        applySharpness: bool = True
+        applySharpness: bool = True,
+        out: Optional[np.ndarray] = None
     ) -> EnhancementResult:
         """
         Enhance image quality.
@@ -50,6 +70,7 @@ def enhance(
             image: Input image (BGR format, numpy array).
             applyBrightness: Whether to apply brightness enhancement.
             applySharpness: Whether to apply sharpness enhancement.
+            out: Optional caller-provided output buffer.
             
         Returns:
             EnhancementResult containing enhanced image and flags.
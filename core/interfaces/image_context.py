@@ -0,0 +1,239 @@
+"""
+Image Context Module.
+
+This module provides ImageContext: one image of the current frame plus its
+derived variants (grayscale, resized, format-converted), computed lazily
+and memoized. Stages that need the same variant share one resample, and
+the time spent on every derived image is recorded so it shows up in the
+pipeline timing.
+
+A context belongs to one frame and is dropped with it.
+"""
+
+import threading
+import time
+from typing import Optional, Sequence, Tuple, Dict, Any
+
+import numpy as np
+
+from core.interfaces.image_format import (
+    ImageFormat,
+    ColorSpace,
+    FORMAT_GRAY,
+    convertImage
+)
+
+
+class ImageContext:
+    """
+    Lazily computed variants of one image.
+
+    Variants are keyed by (kind, size, interpolation, channels), so two
+    stages asking for the same size and interpolation get the same array.
+    Returned arrays are shared and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        image: np.ndarray,
+        imageFormat: Optional[ImageFormat] = None,
+        name: str = "image"
+    ):
+        """
+        Initialize ImageContext.
+
+        Args:
+            image: Source image.
+            imageFormat: Format of image, or None to infer it from the shape.
+            name: Label used in timing keys (e.g. "label", "merged").
+        """
+        self._image = image
+        self._format = imageFormat or ImageFormat.of(image)
+        self._name = name
+        self._variants: Dict[Tuple, Any] = {}
+        self._timings: Dict[str, float] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def image(self) -> np.ndarray:
+        """Source image."""
+        return self._image
+
+    @property
+    def imageFormat(self) -> ImageFormat:
+        """Format of the source image."""
+        return self._format
+
+    @property
+    def width(self) -> int:
+        """Source image width."""
+        return self._image.shape[1]
+
+    @property
+    def height(self) -> int:
+        """Source image height."""
+        return self._image.shape[0]
+
+    def gray(self) -> np.ndarray:
+        """
+        Get the grayscale variant.
+
+        Returns:
+            Grayscale image (the source itself when already grayscale).
+        """
+        if self._format.colorSpace == ColorSpace.GRAY:
+            return self._image
+        return self._getOrCompute(
+            ("gray",),
+            "gray",
+            lambda: convertImage(self._image, self._format, [FORMAT_GRAY])
+        )
+
+    def resized(
+        self,
+        width: int,
+        height: int,
+        interpolation: Optional[int] = None,
+        gray: bool = False
+    ) -> np.ndarray:
+        """
+        Get the image resized to an exact size.
+
+        Args:
+            width: Target width.
+            height: Target height.
+            interpolation: OpenCV interpolation flag. None picks INTER_CUBIC
+                for enlarging and INTER_AREA for shrinking.
+            gray: Resize the grayscale variant instead of the source.
+
+        Returns:
+            Resized image (the source itself when the size already matches).
+        """
+        source = self.gray() if gray else self._image
+        if width == self.width and height == self.height:
+            return source
+
+        import cv2
+
+        if interpolation is None:
+            interpolation = cv2.INTER_CUBIC if width > self.width else cv2.INTER_AREA
+
+        return self._getOrCompute(
+            ("resize", width, height, interpolation, gray),
+            f"resize_{width}x{height}{'_gray' if gray else ''}",
+            lambda: cv2.resize(source, (width, height), interpolation=interpolation)
+        )
+
+    def scaledToWidth(
+        self,
+        width: int,
+        interpolation: Optional[int] = None,
+        gray: bool = False
+    ) -> Tuple[np.ndarray, float]:
+        """
+        Get the image scaled to a width, keeping the aspect ratio.
+
+        Args:
+            width: Target width.
+            interpolation: OpenCV interpolation flag (None = automatic).
+            gray: Scale the grayscale variant instead of the source.
+
+        Returns:
+            Tuple of (scaled image, scale factor applied).
+        """
+        scale = width / float(self.width)
+        if abs(scale - 1.0) < 0.01:
+            return (self.gray() if gray else self._image), 1.0
+
+        height = max(1, int(self.height * scale))
+        return self.resized(width, height, interpolation, gray), scale
+
+    def thumbnail(
+        self,
+        maxWidth: int,
+        maxHeight: int,
+        gray: bool = False
+    ) -> Tuple[np.ndarray, float]:
+        """
+        Get the image shrunk to fit a box (never enlarged).
+
+        Args:
+            maxWidth: Maximum width.
+            maxHeight: Maximum height.
+            gray: Shrink the grayscale variant instead of the source.
+
+        Returns:
+            Tuple of (thumbnail, scale factor applied).
+        """
+        scale = min(maxWidth / float(self.width), maxHeight / float(self.height), 1.0)
+        if scale >= 1.0:
+            return (self.gray() if gray else self._image), 1.0
+
+        import cv2
+
+        width = max(1, int(self.width * scale))
+        height = max(1, int(self.height * scale))
+        return self.resized(width, height, cv2.INTER_AREA, gray), scale
+
+    def convertedTo(self, acceptedFormats: Sequence[ImageFormat]) -> "ImageContext":
+        """
+        Get a context for the image in one of the accepted formats.
+
+        Args:
+            acceptedFormats: Formats the consumer accepts, preferred first.
+
+        Returns:
+            This context when its format is accepted, else a memoized context
+            of the converted image (sharing this context's timing).
+        """
+        if not acceptedFormats or self._format in acceptedFormats:
+            return self
+
+        target = acceptedFormats[0]
+
+        def convert() -> "ImageContext":
+            child = ImageContext(
+                convertImage(self._image, self._format, acceptedFormats),
+                target,
+                f"{self._name}_{target.colorSpace.lower()}"
+            )
+            child._timings = self._timings
+            return child
+
+        return self._getOrCompute(
+            ("convert", target),
+            f"convert_{target.colorSpace.lower()}",
+            convert
+        )
+
+    def getTimings(self) -> Dict[str, float]:
+        """
+        Get the time spent on each derived image.
+
+        Returns:
+            Dict mapping "<name>.<variant>" to milliseconds.
+        """
+        with self._lock:
+            return {k: round(v, 3) for k, v in self._timings.items()}
+
+    def getTotalTimeMs(self) -> float:
+        """
+        Get the total time spent on derived images.
+
+        Returns:
+            Sum of all variant timings in milliseconds.
+        """
+        with self._lock:
+            return sum(self._timings.values())
+
+    def _getOrCompute(self, key: Tuple, label: str, compute) -> Any:
+        """Return the memoized variant, computing and timing it on first use."""
+        with self._lock:
+            if key in self._variants:
+                return self._variants[key]
+
+            startTime = time.perf_counter()
+            value = compute()
+            self._timings[f"{self._name}.{label}"] = (time.perf_counter() - startTime) * 1000
+            self._variants[key] = value
+            return value
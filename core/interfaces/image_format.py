@@ -0,0 +1,116 @@
+"""
+Image Format Module.
+
+This module describes the pixel layout of images passed between pipeline
+stages (color space, channel count and dtype). Stage outputs carry their
+ImageFormat and consumers declare the formats they accept, so the
+orchestrator converts at most once per consumer instead of every stage
+converting defensively.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+
+
+class ColorSpace:
+    """Color space names used by ImageFormat."""
+    GRAY = "GRAY"
+    BGR = "BGR"
+    RGB = "RGB"
+
+
+@dataclass(frozen=True)
+class ImageFormat:
+    """
+    Pixel layout of an image.
+
+    Attributes:
+        colorSpace: Color space (ColorSpace.GRAY, BGR or RGB).
+        dtype: Numpy dtype name (e.g. "uint8").
+    """
+    colorSpace: str
+    dtype: str = "uint8"
+
+    @property
+    def channels(self) -> int:
+        """Number of channels (1 for GRAY, 3 otherwise)."""
+        return 1 if self.colorSpace == ColorSpace.GRAY else 3
+
+    @staticmethod
+    def of(image: np.ndarray, colorSpace: Optional[str] = None) -> "ImageFormat":
+        """
+        Infer the format of an image.
+
+        Args:
+            image: Image array (H, W), (H, W, 1) or (H, W, 3).
+            colorSpace: Known color space of a 3-channel image. None assumes
+                BGR (OpenCV convention).
+
+        Returns:
+            ImageFormat of the image.
+        """
+        if len(image.shape) == 2 or image.shape[2] == 1:
+            return ImageFormat(ColorSpace.GRAY, image.dtype.name)
+        return ImageFormat(colorSpace or ColorSpace.BGR, image.dtype.name)
+
+
+FORMAT_GRAY = ImageFormat(ColorSpace.GRAY)
+FORMAT_BGR = ImageFormat(ColorSpace.BGR)
+FORMAT_RGB = ImageFormat(ColorSpace.RGB)
+
+
+def convertImage(
+    image: np.ndarray,
+    sourceFormat: Optional[ImageFormat],
+    acceptedFormats: Sequence[ImageFormat]
+) -> np.ndarray:
+    """
+    Convert an image to the first accepted format, unless it already matches.
+
+    Args:
+        image: Image to convert.
+        sourceFormat: Format of image, or None to infer it from the shape.
+        acceptedFormats: Formats the consumer accepts, preferred first.
+
+    Returns:
+        The image itself if its format is accepted, else a converted copy.
+    """
+    if image is None or not acceptedFormats:
+        return image
+
+    if sourceFormat is None:
+        sourceFormat = ImageFormat.of(image)
+    if sourceFormat in acceptedFormats:
+        return image
+
+    import cv2
+
+    target = acceptedFormats[0]
+    if len(image.shape) == 3 and image.shape[2] == 1:
+        image = image[:, :, 0]
+
+    if sourceFormat.colorSpace != target.colorSpace:
+        code = _CONVERSION_CODES.get((sourceFormat.colorSpace, target.colorSpace))
+        if code is None:
+            raise ValueError(
+                f"Unsupported conversion {sourceFormat.colorSpace} -> {target.colorSpace}"
+            )
+        image = cv2.cvtColor(image, getattr(cv2, code))
+
+    if image.dtype.name != target.dtype:
+        image = image.astype(target.dtype)
+
+    return image
+
+
+# OpenCV conversion code names, resolved lazily so cv2 is only imported on use
+_CONVERSION_CODES = {
+    (ColorSpace.GRAY, ColorSpace.BGR): "COLOR_GRAY2BGR",
+    (ColorSpace.GRAY, ColorSpace.RGB): "COLOR_GRAY2RGB",
+    (ColorSpace.BGR, ColorSpace.GRAY): "COLOR_BGR2GRAY",
+    (ColorSpace.BGR, ColorSpace.RGB): "COLOR_BGR2RGB",
+    (ColorSpace.RGB, ColorSpace.GRAY): "COLOR_RGB2GRAY",
+    (ColorSpace.RGB, ColorSpace.BGR): "COLOR_RGB2BGR",
+}
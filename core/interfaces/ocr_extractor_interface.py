@@ -10,6 +10,8 @@
 from typing import List, Any
 import numpy as np
 
+from core.interfaces.image_format import ImageFormat, FORMAT_BGR
+
 
 @dataclass
 class TextBlock:
@@ -59,3 +61,27 @@ def extract(self, image: np.ndarray) -> OcrResult:
             OcrResult with list of text blocks
         """
         pass
+    
+    @abstractmethod
+    def recognize(self, images: List[np.ndarray]) -> List[TextBlock]:
+        """
+        Recognize single-line text images (no text detection).
+        
+        Args:
+            images: Text line strips, one line each
+            
+        Returns:
+            One TextBlock per input strip, in input order. Strips below
+            the score threshold get empty text. Each bbox covers its whole
+            strip in strip coordinates.
+        """
+        pass
+    
+    def getAcceptedFormats(self) -> List[ImageFormat]:
+        """
+        Get the input formats this extractor works on without conversion.
+        
+        Returns:
+            Accepted formats, preferred first.
+        """
+        return [FORMAT_BGR]
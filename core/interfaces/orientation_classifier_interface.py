@@ -0,0 +1,84 @@
+"""
+Orientation Classifier Interface Module
+
+Defines the abstract interface for document orientation classification.
+Allows OrientationCorrector to switch between inference backends
+(PaddleOCR, ONNX Runtime, OpenVINO) without changing its logic.
+
+Follows ISP (Interface Segregation Principle): Only contains classification-related methods.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+import numpy as np
+
+
+@dataclass
+class OrientationPrediction:
+    """
+    Data class representing a document orientation prediction.
+
+    Attributes:
+        label: Predicted orientation label ('0', '90', '180' or '270').
+        score: Confidence score of the prediction (0-1).
+    """
+    label: str
+    score: float
+
+
+class IOrientationClassifier(ABC):
+    """
+    Abstract interface for document orientation classifiers.
+
+    Implementations wrap a PP-LCNet doc-orientation model running on a
+    specific inference backend and return the top-1 orientation label.
+
+    Follows DIP: OrientationCorrector depends on this abstraction.
+    """
+
+    @abstractmethod
+    def loadModel(self, modelPath: Optional[str] = None) -> bool:
+        """
+        Load the orientation model.
+
+        Args:
+            modelPath: Path to the model (directory or file, backend specific).
+
+        Returns:
+            bool: True if the model is loaded and ready.
+        """
+        pass
+
+    @abstractmethod
+    def isLoaded(self) -> bool:
+        """
+        Check if the classifier is ready for inference.
+
+        Returns:
+            bool: True if a model is loaded.
+        """
+        pass
+
+    @abstractmethod
+    def classify(self, image: np.ndarray) -> Optional[OrientationPrediction]:
+        """
+        Classify the orientation of an image.
+
+        Args:
+            image: Input image (BGR format).
+
+        Returns:
+            OrientationPrediction with top-1 label and score, or None on failure.
+        """
+        pass
+
+    @abstractmethod
+    def getBackendName(self) -> str:
+        """
+        Get the name of the inference backend.
+
+        Returns:
+            str: Backend name ("paddle", "onnx" or "openvino").
+        """
+        pass
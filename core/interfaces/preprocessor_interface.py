@@ -74,6 +74,6 @@ def isAiAvailable(self) -> bool:
         Check if AI orientation correction is available.
         
         Returns:
-            bool: True if PaddleOCR is loaded and ready.
+            bool: True if the orientation classifier is loaded and ready.
         """
         pass
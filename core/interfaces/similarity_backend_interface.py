@@ -0,0 +1,63 @@
+"""
+Similarity Backend Interface Module
+
+Defines the abstract interface for the string similarity used by S8 catalog
+matching. Allows FuzzyMatchIndex and LabelTextProcessor to switch between a
+pure-Python and a compiled implementation without changing their logic.
+
+Implementations must return exactly the scores of FuzzyMatcher (same
+normalization, same max(Levenshtein, Jaro-Winkler) formula), so the choice
+of backend never changes a match.
+
+Follows ISP (Interface Segregation Principle): Only contains similarity-related methods.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class ISimilarityBackend(ABC):
+    """
+    Abstract interface for string similarity backends.
+
+    Follows DIP: FuzzyMatchIndex depends on this abstraction.
+    """
+
+    @abstractmethod
+    def combinedSimilarity(self, a: str, b: str) -> float:
+        """
+        Calculate combined similarity (max of Levenshtein and Jaro-Winkler).
+
+        Args:
+            a: First string
+            b: Second string
+
+        Returns:
+            Same score as FuzzyMatcher.combinedSimilarity(a, b)
+        """
+        pass
+
+    @abstractmethod
+    def boundedCombinedSimilarity(self, a: str, b: str, minScore: float) -> Optional[float]:
+        """
+        Calculate combinedSimilarity() only if it can reach minScore.
+
+        Args:
+            a: First string
+            b: Second string
+            minScore: Score of interest (inclusive)
+
+        Returns:
+            combinedSimilarity(a, b) if it is >= minScore, otherwise None
+        """
+        pass
+
+    @abstractmethod
+    def getBackendName(self) -> str:
+        """
+        Get the name of the similarity backend.
+
+        Returns:
+            str: Backend name ("python" or "rapidfuzz").
+        """
+        pass
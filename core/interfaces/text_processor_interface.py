@@ -8,7 +8,7 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 
 from core.interfaces.ocr_extractor_interface import TextBlock
 from core.interfaces.qr_detector_interface import QrDetectionResult
@@ -75,7 +75,8 @@ class ITextProcessor(ABC):
     def process(
         self, 
         textBlocks: List[TextBlock], 
-        qrResult: QrDetectionResult
+        qrResult: QrDetectionResult,
+        positionHint: Optional[Tuple[int, int]] = None
     ) -> LabelData:
         """
         Process OCR text blocks and create structured label data.
@@ -83,8 +84,20 @@ def process(
         Args:
             textBlocks: List of text blocks from OCR
             qrResult: QR detection result for validation
+            positionHint: (position, quantity) already known from earlier
+                frames, used when the blocks do not contain it (e.g. only
+                the region below the QR was OCR'd)
             
         Returns:
             LabelData with structured and validated label information
         """
         pass
+    
+    def getMatchStatistics(self) -> Dict[str, dict]:
+        """
+        Get per-field catalog lookup statistics (for debug output).
+        
+        Returns:
+            Dict of field name -> counters; empty if not tracked
+        """
+        return {}
@@ -1,5 +1,18 @@
 """OCR Extractor module."""
 
 from core.ocr.paddle_ocr_extractor import PaddleOcrExtractor
+from core.ocr.text_line_segmenter import TextLineSegmenter, TextLineStrip
+from core.ocr.ocr_extractor_factory import (
+    createOcrExtractor,
+    getSupportedOcrBackends,
+    isOcrBackendAvailable
+)
 
-__all__ = ['PaddleOcrExtractor']
+__all__ = [
+    'PaddleOcrExtractor',
+    'TextLineSegmenter',
+    'TextLineStrip',
+    'createOcrExtractor',
+    'getSupportedOcrBackends',
+    'isOcrBackendAvailable',
+]
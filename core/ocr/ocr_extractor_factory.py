@@ -0,0 +1,168 @@
+"""
+OCR Extractor Factory Module
+
+Factory function for creating OCR extractors based on backend selection.
+Supports PaddleOCR, and exported PP-OCR models on ONNX Runtime or
+OpenVINO Runtime (no Paddle runtime needed).
+
+Follows:
+- OCP (Open/Closed Principle): Easy to extend with new backends
+- DIP (Dependency Inversion): Returns IOcrExtractor interface
+- Factory Pattern: Encapsulates object creation logic
+"""
+
+import logging
+from typing import Optional, List, Dict, Any
+
+from core.interfaces.ocr_extractor_interface import IOcrExtractor
+
+
+logger = logging.getLogger(__name__)
+
+
+# PaddleOcrExtractor arguments that PpOcrExtractor also understands
+_SHARED_KWARGS = (
+    'textDetThresh',
+    'textDetBoxThresh',
+    'textRecScoreThresh',
+    'textDetUnclipRatio',
+    'textDetLimitType',
+    'textDetLimitSideLen',
+    'recBatchSize'
+)
+
+
+def createOcrExtractor(
+    backend: str = "paddle",
+    extractorKwargs: Optional[Dict[str, Any]] = None,
+    detModelPath: Optional[str] = None,
+    recModelPath: Optional[str] = None,
+    recCharDictPath: Optional[str] = None,
+    modelCacheDir: Optional[str] = None,
+    openvinoConfig: Optional[dict] = None
+) -> IOcrExtractor:
+    """
+    Factory function to create an OCR extractor based on backend.
+
+    Supports:
+    - "paddle": PaddleOCR 3.x (models by name, downloaded/cached by PaddleOCR)
+    - "onnx": ONNX Runtime with exported PP-OCRv5 det/rec models (.onnx)
+    - "openvino": OpenVINO Runtime with exported PP-OCRv5 det/rec models (.xml or .onnx)
+
+    Args:
+        backend: Backend name ("paddle", "onnx" or "openvino").
+        extractorKwargs: PaddleOcrExtractor keyword arguments. onnx/openvino
+            use only the thresholds, resize limits and recBatchSize.
+        detModelPath: Exported detection model (onnx/openvino).
+        recModelPath: Exported recognition model (onnx/openvino).
+        recCharDictPath: Recognition dictionary file (onnx/openvino). None
+            reads it from the inference.yml next to the recognition model.
+        modelCacheDir: Compiled/optimized model cache directory (onnx/openvino).
+        openvinoConfig: Thread settings shared with S2 detection, with keys:
+            - numThreads: Number of CPU threads (0 = auto)
+            - numStreams: Number of inference streams (0 = auto)
+            - performanceHint: 'LATENCY' or 'THROUGHPUT'
+            - enableHyperThreading: Enable hyper-threading
+            - enableCpuPinning: Pin threads to CPU cores
+            ONNX Runtime only uses numThreads (as intra-op threads).
+
+    Returns:
+        IOcrExtractor: Extractor instance (models are loaded on first use).
+
+    Raises:
+        ValueError: If backend is invalid or not supported.
+    """
+    # Normalize backend name
+    backend = backend.lower().strip()
+
+    # Validate backend
+    supportedBackends = getSupportedOcrBackends()
+    if backend not in supportedBackends:
+        errorMsg = (
+            f"Invalid OCR backend: '{backend}'. "
+            f"Supported backends: {supportedBackends}"
+        )
+        logger.error(errorMsg)
+        raise ValueError(errorMsg)
+
+    kwargs = dict(extractorKwargs or {})
+    config = openvinoConfig or {}
+
+    logger.info(f"Creating OCR extractor (backend={backend})")
+
+    if backend == "paddle":
+        from core.ocr.paddle_ocr_extractor import PaddleOcrExtractor
+        return PaddleOcrExtractor(**kwargs)
+
+    sharedKwargs = {key: kwargs[key] for key in _SHARED_KWARGS if key in kwargs}
+
+    if backend == "openvino":
+        from core.ocr.openvino_ocr_extractor import OpenVINOOcrExtractor
+        return OpenVINOOcrExtractor(
+            detModelPath=detModelPath,
+            recModelPath=recModelPath,
+            recCharDictPath=recCharDictPath,
+            numThreads=config.get("numThreads", 0),
+            numStreams=config.get("numStreams", 0),
+            performanceHint=config.get("performanceHint", "LATENCY"),
+            enableHyperThreading=config.get("enableHyperThreading", False),
+            enableCpuPinning=config.get("enableCpuPinning", True),
+            modelCacheDir=modelCacheDir,
+            **sharedKwargs
+        )
+
+    from core.ocr.onnx_ocr_extractor import OnnxOcrExtractor
+    return OnnxOcrExtractor(
+        detModelPath=detModelPath,
+        recModelPath=recModelPath,
+        recCharDictPath=recCharDictPath,
+        numThreads=config.get("numThreads", 0),
+        modelCacheDir=modelCacheDir,
+        **sharedKwargs
+    )
+
+
+def getSupportedOcrBackends() -> List[str]:
+    """
+    Get list of supported OCR backend names.
+
+    Returns:
+        List[str]: List of backend names ["paddle", "onnx", "openvino"].
+    """
+    return ["paddle", "onnx", "openvino"]
+
+
+def isOcrBackendAvailable(backend: str) -> bool:
+    """
+    Check if an OCR backend is available (library installed).
+
+    Args:
+        backend: Backend name ("paddle", "onnx" or "openvino").
+
+    Returns:
+        bool: True if backend library is installed and available.
+    """
+    backend = backend.lower().strip()
+
+    if backend == "paddle":
+        try:
+            import paddleocr
+            return True
+        except ImportError:
+            return False
+
+    elif backend == "onnx":
+        try:
+            import onnxruntime
+            return True
+        except ImportError:
+            return False
+
+    elif backend == "openvino":
+        try:
+            from openvino.runtime import Core
+            return True
+        except ImportError:
+            return False
+
+    return False
@@ -0,0 +1,117 @@
+"""
+ONNX OCR Extractor Module
+
+Implements IOcrExtractor using ONNX Runtime for exported PP-OCRv5 text
+detection and recognition models (e.g. converted with paddle2onnx, FP32 or
+INT8-quantized).
+
+Follows SRP: Only handles ONNX Runtime session management and inference.
+"""
+
+import logging
+import os
+from typing import Any, Optional
+import numpy as np
+
+try:
+    import onnxruntime as ort
+except ImportError:
+    ort = None
+
+from core.ocr.ppocr_extractor import PpOcrExtractor
+
+
+class OnnxOcrExtractor(PpOcrExtractor):
+    """
+    PP-OCR text detection + recognition running on ONNX Runtime (CPU).
+    """
+
+    def __init__(
+        self,
+        detModelPath: Optional[str],
+        recModelPath: Optional[str],
+        numThreads: int = 0,
+        modelCacheDir: Optional[str] = None,
+        logger: Optional[logging.Logger] = None,
+        **kwargs
+    ):
+        """
+        Initialize OnnxOcrExtractor.
+
+        Args:
+            detModelPath: Path to the detection .onnx model.
+            recModelPath: Path to the recognition .onnx model.
+            numThreads: Number of intra-op CPU threads (0 = ONNX Runtime default).
+            modelCacheDir: Directory for graph-optimized models. The optimized
+                model is written on first load and reused afterwards, which
+                skips graph optimization at startup. None disables caching.
+            logger: Logger instance for debug output.
+            **kwargs: Thresholds and limits passed to PpOcrExtractor.
+        """
+        super().__init__(detModelPath, recModelPath, logger=logger, **kwargs)
+        self._numThreads = numThreads
+        self._modelCacheDir = modelCacheDir
+
+        self._logger.info(
+            f"OnnxOcrExtractor initialized (threads={numThreads or 'auto'}, "
+            f"cache={modelCacheDir}, models=({detModelPath}, {recModelPath}))"
+        )
+
+    def _loadModel(self, modelPath: str) -> Any:
+        """
+        Create an ONNX Runtime session, reusing a cached optimized model.
+
+        Args:
+            modelPath: Path to the .onnx model file.
+
+        Returns:
+            onnxruntime.InferenceSession
+        """
+        if ort is None:
+            raise RuntimeError(
+                "ONNX Runtime is not installed. Install with: pip install onnxruntime>=1.16.0"
+            )
+
+        sessionOptions = ort.SessionOptions()
+        sessionOptions.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        sessionOptions.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        sessionOptions.inter_op_num_threads = 1
+        if self._numThreads > 0:
+            sessionOptions.intra_op_num_threads = self._numThreads
+
+        loadPath = modelPath
+        if self._modelCacheDir:
+            cachedPath = self._getCachedPath(modelPath)
+            if (os.path.exists(cachedPath)
+                    and os.path.getmtime(cachedPath) >= os.path.getmtime(modelPath)):
+                # Already optimized offline
+                loadPath = cachedPath
+                sessionOptions.graph_optimization_level = (
+                    ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+                )
+            else:
+                os.makedirs(self._modelCacheDir, exist_ok=True)
+                sessionOptions.optimized_model_filepath = cachedPath
+
+        session = ort.InferenceSession(
+            loadPath,
+            sess_options=sessionOptions,
+            providers=['CPUExecutionProvider']
+        )
+        self._logger.debug(f"ONNX session created from {loadPath}")
+        return session
+
+    def _getCachedPath(self, modelPath: str) -> str:
+        """Path of the optimized copy of a model in the cache directory."""
+        parent = os.path.basename(os.path.dirname(os.path.abspath(modelPath)))
+        name = os.path.splitext(os.path.basename(modelPath))[0]
+        return os.path.join(self._modelCacheDir, f"{parent}_{name}.opt.onnx")
+
+    def _infer(self, model: Any, tensor: np.ndarray) -> np.ndarray:
+        """Run ONNX Runtime inference and return the first output."""
+        inputName = model.get_inputs()[0].name
+        return model.run(None, {inputName: tensor})[0]
+
+    def getBackendName(self) -> str:
+        """Get the name of the inference backend."""
+        return "onnx"
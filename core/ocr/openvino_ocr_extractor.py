@@ -0,0 +1,142 @@
+"""
+OpenVINO OCR Extractor Module
+
+Implements IOcrExtractor using OpenVINO Runtime for exported PP-OCRv5 text
+detection and recognition models (.onnx or OpenVINO IR .xml, FP32 or
+INT8-quantized with NNCF).
+
+Uses the same performance settings as the S2 OpenVINO detector
+(threads, streams, hint, hyper-threading, CPU pinning), plus an optional
+compiled-model cache directory.
+
+Follows SRP: Only handles OpenVINO model compilation and inference.
+"""
+
+import logging
+from typing import Any, Dict, Optional
+import numpy as np
+
+try:
+    from openvino.runtime import Core
+    import openvino.properties as props
+    import openvino.properties.hint as hints
+except ImportError:
+    Core = None
+    props = None
+    hints = None
+
+from core.ocr.ppocr_extractor import PpOcrExtractor
+
+
+class OpenVINOOcrExtractor(PpOcrExtractor):
+    """
+    PP-OCR text detection + recognition running on OpenVINO Runtime (CPU).
+    """
+
+    def __init__(
+        self,
+        detModelPath: Optional[str],
+        recModelPath: Optional[str],
+        numThreads: int = 0,
+        numStreams: int = 0,
+        performanceHint: str = "LATENCY",
+        enableHyperThreading: bool = False,
+        enableCpuPinning: bool = True,
+        modelCacheDir: Optional[str] = None,
+        logger: Optional[logging.Logger] = None,
+        **kwargs
+    ):
+        """
+        Initialize OpenVINOOcrExtractor.
+
+        Args:
+            detModelPath: Path to the detection model (.xml or .onnx).
+            recModelPath: Path to the recognition model (.xml or .onnx).
+            numThreads: Number of CPU threads for inference (0 = auto/all cores).
+            numStreams: Number of inference streams (0 = auto based on hint).
+            performanceHint: Performance mode - 'LATENCY' (default) or 'THROUGHPUT'.
+            enableHyperThreading: Enable hyper-threading.
+            enableCpuPinning: Pin threads to CPU cores.
+            modelCacheDir: OpenVINO compiled-model cache directory (skips
+                compilation on later starts). None disables caching.
+            logger: Logger instance for debug output.
+            **kwargs: Thresholds and limits passed to PpOcrExtractor.
+        """
+        super().__init__(detModelPath, recModelPath, logger=logger, **kwargs)
+        self._numThreads = numThreads
+        self._numStreams = numStreams
+        self._performanceHint = performanceHint.upper()
+        self._enableHyperThreading = enableHyperThreading
+        self._enableCpuPinning = enableCpuPinning
+        self._modelCacheDir = modelCacheDir
+        self._core = None
+
+        self._logger.info(
+            f"OpenVINOOcrExtractor initialized (threads={numThreads or 'auto'}, "
+            f"streams={numStreams or 'auto'}, hint={self._performanceHint}, "
+            f"cache={modelCacheDir}, models=({detModelPath}, {recModelPath}))"
+        )
+
+    def _loadModel(self, modelPath: str) -> Any:
+        """
+        Read and compile a model for CPU.
+
+        Args:
+            modelPath: Path to the model file (.xml or .onnx).
+
+        Returns:
+            Infer request of the compiled model.
+        """
+        if Core is None:
+            raise RuntimeError(
+                "OpenVINO Runtime is not installed. Install with: pip install openvino>=2024.0.0"
+            )
+
+        if self._core is None:
+            self._core = Core()
+            if self._modelCacheDir:
+                self._core.set_property({props.cache_dir: self._modelCacheDir})
+
+        model = self._core.read_model(model=modelPath)
+        config = self._buildCompileConfig()
+        compiledModel = self._core.compile_model(model, "CPU", config)
+
+        self._logger.debug(f"OpenVINO model compiled from {modelPath} (config={config})")
+        return compiledModel.create_infer_request()
+
+    def _buildCompileConfig(self) -> Dict:
+        """
+        Build OpenVINO compile configuration (same keys as the S2 detector).
+
+        Returns:
+            Dict: Configuration dictionary for compile_model.
+        """
+        config = {}
+
+        if props is None or hints is None:
+            return config
+
+        if self._performanceHint == "THROUGHPUT":
+            config[hints.performance_mode] = hints.PerformanceMode.THROUGHPUT
+        else:
+            config[hints.performance_mode] = hints.PerformanceMode.LATENCY
+
+        if self._numThreads > 0:
+            config[props.inference_num_threads] = self._numThreads
+
+        if self._numStreams > 0:
+            config[props.num_streams] = self._numStreams
+
+        config[hints.enable_hyper_threading] = self._enableHyperThreading
+        config[hints.enable_cpu_pinning] = self._enableCpuPinning
+
+        return config
+
+    def _infer(self, model: Any, tensor: np.ndarray) -> np.ndarray:
+        """Run OpenVINO inference and return the first output."""
+        model.infer({0: tensor})
+        return model.get_output_tensor(0).data.copy()
+
+    def getBackendName(self) -> str:
+        """Get the name of the inference backend."""
+        return "openvino"
@@ -9,7 +9,7 @@
 """
 
 import logging
-from typing import Optional
+from typing import Optional, List
 
 import numpy as np
 import cv2
@@ -48,6 +48,7 @@ def __init__(
         mkldnnCacheCapacity: int = 10,
         cpuThreads: int = 8,
         device: str = 'cpu',
+        recBatchSize: int = 8,
         logger: Optional[logging.Logger] = None
     ):
         """
@@ -69,10 +70,14 @@ def __init__(
             mkldnnCacheCapacity: MKL-DNN cache capacity
             cpuThreads: Number of CPU threads
             device: Device for inference ('cpu' or 'gpu')
+            recBatchSize: Batch size of recognition-only calls (recognize())
             logger: Logger instance for debug output
         """
         self._logger = logger or logging.getLogger(__name__)
         self._ocrEngine = None
+        self._recEngine = None
+        self._recBatchSize = max(1, recBatchSize)
+        self._recScoreThresh = textRecScoreThresh
         
         # Store config for lazy initialization
         # PaddleOCR 3.x API parameters
@@ -132,6 +137,38 @@ def _ensureOcrEngine(self) -> None:
                 self._logger.error(f"Failed to initialize PaddleOCR: {e}")
                 raise
     
+    def _ensureRecEngine(self) -> None:
+        """Lazily initialize the recognition-only model on first use."""
+        if self._recEngine is None:
+            try:
+                from paddleocr import TextRecognition
+                
+                recConfig = {
+                    'device': self._config['device'],
+                    'precision': self._config['precision'],
+                    'enable_mkldnn': self._config['enable_mkldnn'],
+                    'mkldnn_cache_capacity': self._config['mkldnn_cache_capacity'],
+                    'cpu_threads': self._config['cpu_threads']
+                }
+                modelName = self._config.get('text_recognition_model_name')
+                if modelName:
+                    recConfig['model_name'] = modelName
+                
+                self._recEngine = TextRecognition(**recConfig)
+                self._logger.info(
+                    f"PaddleOCR recognition model initialized "
+                    f"(model={modelName or 'default'}, batchSize={self._recBatchSize})"
+                )
+            except ImportError as e:
+                self._logger.error(
+                    f"Failed to import PaddleOCR. "
+                    f"Please install: pip install paddlepaddle paddleocr. Error: {e}"
+                )
+                raise
+            except Exception as e:
+                self._logger.error(f"Failed to initialize recognition model: {e}")
+                raise
+    
     def extract(self, image: np.ndarray) -> OcrResult:
         """
         Extract text from an image using PaddleOCR.
@@ -144,8 +181,9 @@ def extract(self, image: np.ndarray) -> OcrResult:
             confidence scores, and bounding boxes
             
         Note:
-            PaddleOCR requires BGR input. Grayscale images are automatically
-            converted to BGR format.
+            PaddleOCR requires BGR input (see getAcceptedFormats()); the
+            orchestrator converts once before calling. Grayscale images
+            are still converted here as a fallback.
         """
         self._ensureOcrEngine()
         
@@ -214,3 +252,49 @@ def extract(self, image: np.ndarray) -> OcrResult:
         self._logger.info(f"OCR extracted {len(textBlocks)} text blocks")
         
         return OcrResult(textBlocks=textBlocks, rawResult=rawResult)
+    
+    def recognize(self, images: List[np.ndarray]) -> List[TextBlock]:
+        """
+        Recognize single-line strips with the recognition model only.
+        
+        All strips are sent in batches of recBatchSize; the text detector
+        is not run.
+        
+        Args:
+            images: Text line strips (BGR)
+            
+        Returns:
+            One TextBlock per strip, in input order (empty text when the
+            score is below textRecScoreThresh)
+        """
+        if not images:
+            return []
+        
+        self._ensureRecEngine()
+        
+        textBlocks = []
+        try:
+            results = self._recEngine.predict(input=list(images), batch_size=self._recBatchSize)
+            
+            for image, res in zip(images, results):
+                text = str(res.get('rec_text', ''))
+                score = float(res.get('rec_score', 0.0))
+                if score < self._recScoreThresh:
+                    text, score = '', 0.0
+                
+                h, w = image.shape[:2]
+                textBlocks.append(TextBlock(
+                    text=text,
+                    confidence=score,
+                    bbox=[[0, 0], [w, 0], [w, h], [0, h]]
+                ))
+                
+        except Exception as e:
+            self._logger.error(f"Error during OCR recognition: {e}", exc_info=True)
+            return [
+                TextBlock(text='', confidence=0.0, bbox=[[0, 0], [0, 0], [0, 0], [0, 0]])
+                for _ in images
+            ]
+        
+        self._logger.debug(f"OCR recognized {len(textBlocks)} strips")
+        return textBlocks
@@ -0,0 +1,523 @@
+"""
+PP-OCR Extractor Base Module.
+
+Shared pre- and postprocessing for exported PP-OCRv5 detection and
+recognition models (ONNX / OpenVINO IR). Subclasses only provide model
+loading and a single inference call for their runtime, so OCR runs without
+the Paddle runtime.
+
+    image ─► DB text detection ─► box crops ─► CTC recognition ─► TextBlocks
+             (prob. map → boxes)   (warp)       (batched, by aspect ratio)
+
+Pre/postprocessing mirrors the PaddleOCR 3.x defaults for PP-OCRv5:
+    Detection:   DetResizeForTest(limit_type, limit_side_len, /32) ->
+                 NormalizeImage(ImageNet mean/std, scale 1/255) -> DBPostProcess
+    Recognition: RecResizeImg(3 x 48 x W, W >= 320) -> (x/255 - 0.5)/0.5 ->
+                 CTCLabelDecode
+
+Follows SRP: Only handles tensor conversion, box and label decoding.
+"""
+
+import logging
+import math
+import os
+from abc import abstractmethod
+from typing import Any, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from core.interfaces.ocr_extractor_interface import (
+    IOcrExtractor,
+    OcrResult,
+    TextBlock
+)
+
+
+class PpOcrExtractor(IOcrExtractor):
+    """
+    Base class for runtime-specific PP-OCR extractors.
+
+    Models are loaded lazily on first use (like PaddleOcrExtractor);
+    loading errors are raised to the caller.
+    """
+
+    # Detection preprocessing
+    DET_MEAN = np.array([0.485, 0.456, 0.406], dtype=np.float32)
+    DET_STD = np.array([0.229, 0.224, 0.225], dtype=np.float32)
+
+    # DB postprocessing
+    DET_MAX_CANDIDATES = 1000
+    DET_MIN_SIZE = 3
+
+    # Recognition input
+    REC_HEIGHT = 48
+    REC_MIN_WIDTH = 320
+
+    def __init__(
+        self,
+        detModelPath: Optional[str],
+        recModelPath: Optional[str],
+        recCharDictPath: Optional[str] = None,
+        textDetThresh: float = 0.3,
+        textDetBoxThresh: float = 0.6,
+        textRecScoreThresh: float = 0.5,
+        textDetUnclipRatio: float = 1.5,
+        textDetLimitType: str = 'min',
+        textDetLimitSideLen: int = 736,
+        recBatchSize: int = 8,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize PpOcrExtractor.
+
+        Args:
+            detModelPath: Exported text detection model (e.g. PP-OCRv5_mobile_det).
+            recModelPath: Exported text recognition model (e.g. PP-OCRv5_mobile_rec).
+            recCharDictPath: Character dictionary of the recognition model, one
+                character per line. None reads PostProcess.character_dict from
+                the inference.yml next to the recognition model.
+            textDetThresh: Pixel threshold on the detection probability map
+            textDetBoxThresh: Minimum mean probability inside a box
+            textRecScoreThresh: Text recognition score threshold
+            textDetUnclipRatio: Text box unclip ratio for expansion
+            textDetLimitType: Image resize limit type ('min' or 'max')
+            textDetLimitSideLen: Side length limit for image resize
+            recBatchSize: Crops per recognition batch
+            logger: Logger instance for debug output
+        """
+        self._logger = logger or logging.getLogger(__name__)
+        self._detModelPath = detModelPath
+        self._recModelPath = recModelPath
+        self._recCharDictPath = recCharDictPath
+        self._detThresh = textDetThresh
+        self._detBoxThresh = textDetBoxThresh
+        self._recScoreThresh = textRecScoreThresh
+        self._unclipRatio = textDetUnclipRatio
+        self._limitType = textDetLimitType
+        self._limitSideLen = textDetLimitSideLen
+        self._recBatchSize = max(1, recBatchSize)
+
+        self._detModel: Any = None
+        self._recModel: Any = None
+        self._characters: List[str] = []
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # Runtime Hooks
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    @abstractmethod
+    def _loadModel(self, modelPath: str) -> Any:
+        """
+        Load one model for inference.
+
+        Args:
+            modelPath: Path to the model file.
+
+        Returns:
+            Runtime-specific model handle passed back to _infer().
+
+        Raises:
+            RuntimeError: If the runtime is missing or the model cannot be loaded.
+        """
+        pass
+
+    @abstractmethod
+    def _infer(self, model: Any, tensor: np.ndarray) -> np.ndarray:
+        """
+        Run a single inference.
+
+        Args:
+            model: Handle returned by _loadModel().
+            tensor: NCHW float32 input tensor.
+
+        Returns:
+            np.ndarray: First model output.
+        """
+        pass
+
+    @abstractmethod
+    def getBackendName(self) -> str:
+        """Get the name of the inference backend."""
+        pass
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # IOcrExtractor
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def extract(self, image: np.ndarray) -> OcrResult:
+        """
+        Extract text from an image (text detection + recognition).
+
+        Args:
+            image: Input image (BGR or grayscale)
+
+        Returns:
+            OcrResult with text blocks above textRecScoreThresh, sorted top to
+            bottom, left to right. rawResult holds the detected boxes.
+        """
+        if image is None or image.size == 0:
+            return OcrResult(textBlocks=[])
+
+        self._ensureDetModel()
+        self._ensureRecModel()
+        image = self._toBgr(image)
+
+        textBlocks = []
+        boxes = []
+        try:
+            boxes = self._detect(image)
+            crops = [self._cropBox(image, box) for box in boxes]
+            recognized = self._recognizeCrops(crops)
+
+            for box, (text, score) in zip(boxes, recognized):
+                if score < self._recScoreThresh:
+                    continue
+                textBlocks.append(TextBlock(
+                    text=text,
+                    confidence=score,
+                    bbox=box.tolist()
+                ))
+                self._logger.debug(f"OCR detected: '{text}' (confidence: {score:.3f})")
+
+        except Exception as e:
+            self._logger.error(f"Error during OCR extraction: {e}", exc_info=True)
+
+        self._logger.info(
+            f"OCR extracted {len(textBlocks)} text blocks ({len(boxes)} boxes)"
+        )
+        return OcrResult(textBlocks=textBlocks, rawResult={'dt_polys': boxes})
+
+    def recognize(self, images: List[np.ndarray]) -> List[TextBlock]:
+        """
+        Recognize single-line strips with the recognition model only.
+
+        Args:
+            images: Text line strips (BGR or grayscale)
+
+        Returns:
+            One TextBlock per strip, in input order (empty text when the
+            score is below textRecScoreThresh)
+        """
+        if not images:
+            return []
+
+        self._ensureRecModel()
+
+        try:
+            recognized = self._recognizeCrops([self._toBgr(image) for image in images])
+        except Exception as e:
+            self._logger.error(f"Error during OCR recognition: {e}", exc_info=True)
+            recognized = [('', 0.0)] * len(images)
+
+        textBlocks = []
+        for image, (text, score) in zip(images, recognized):
+            if score < self._recScoreThresh:
+                text, score = '', 0.0
+            h, w = image.shape[:2]
+            textBlocks.append(TextBlock(
+                text=text,
+                confidence=score,
+                bbox=[[0, 0], [w, 0], [w, h], [0, h]]
+            ))
+
+        self._logger.debug(f"OCR recognized {len(textBlocks)} strips")
+        return textBlocks
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # Model Loading
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def _ensureDetModel(self) -> None:
+        """Lazily load the detection model on first use."""
+        if self._detModel is None:
+            self._detModel = self._loadModel(self._checkPath(self._detModelPath, "detection"))
+            self._logger.info(
+                f"{self.getBackendName()} text detection model loaded from {self._detModelPath}"
+            )
+
+    def _ensureRecModel(self) -> None:
+        """Lazily load the recognition model and its dictionary on first use."""
+        if self._recModel is None:
+            self._characters = self._loadCharacters()
+            self._recModel = self._loadModel(self._checkPath(self._recModelPath, "recognition"))
+            self._logger.info(
+                f"{self.getBackendName()} text recognition model loaded from "
+                f"{self._recModelPath} ({len(self._characters)} classes, "
+                f"batchSize={self._recBatchSize})"
+            )
+
+    @staticmethod
+    def _checkPath(modelPath: Optional[str], kind: str) -> str:
+        """Return modelPath, or raise if it does not exist."""
+        if not modelPath or not os.path.exists(modelPath):
+            raise RuntimeError(f"Text {kind} model not found: {modelPath}")
+        return modelPath
+
+    def _loadCharacters(self) -> List[str]:
+        """
+        Load the CTC label list: blank, dictionary characters, space.
+
+        Returns:
+            List of characters indexed by model class.
+        """
+        if self._recCharDictPath:
+            with open(self._recCharDictPath, 'r', encoding='utf-8') as f:
+                characters = [line.rstrip('\r\n') for line in f]
+        else:
+            ymlPath = os.path.join(os.path.dirname(self._recModelPath or ''), 'inference.yml')
+            if not os.path.exists(ymlPath):
+                raise RuntimeError(
+                    f"No recognition dictionary: set recCharDictPath or provide {ymlPath}"
+                )
+            import yaml
+            with open(ymlPath, 'r', encoding='utf-8') as f:
+                modelConfig = yaml.safe_load(f)
+            characters = [str(c) for c in modelConfig['PostProcess']['character_dict']]
+
+        return ['blank'] + characters + [' ']
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # Text Detection (DB)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def _detect(self, image: np.ndarray) -> List[np.ndarray]:
+        """
+        Detect text boxes.
+
+        Args:
+            image: BGR image.
+
+        Returns:
+            List of 4x2 float32 boxes (clockwise from top-left) in image
+            coordinates, sorted top to bottom, left to right.
+        """
+        h, w = image.shape[:2]
+        tensor = self._preprocessDet(image)
+        probMap = self._infer(self._detModel, tensor).reshape(tensor.shape[2], tensor.shape[3])
+
+        boxes = self._boxesFromProbMap(probMap, w, h)
+        return self._sortBoxes(boxes)
+
+    def _preprocessDet(self, image: np.ndarray) -> np.ndarray:
+        """
+        Resize to the side limit (multiples of 32) and normalize to NCHW.
+
+        Args:
+            image: BGR image.
+
+        Returns:
+            np.ndarray: 1 x 3 x H x W float32 tensor.
+        """
+        h, w = image.shape[:2]
+        if self._limitType == 'max':
+            ratio = min(1.0, self._limitSideLen / float(max(h, w)))
+        else:
+            ratio = max(1.0, self._limitSideLen / float(min(h, w)))
+
+        resizeH = max(32, int(round(h * ratio / 32) * 32))
+        resizeW = max(32, int(round(w * ratio / 32) * 32))
+        resized = cv2.resize(image, (resizeW, resizeH))
+
+        normalized = (resized.astype(np.float32) / 255.0 - self.DET_MEAN) / self.DET_STD
+        return np.ascontiguousarray(normalized.transpose(2, 0, 1)[np.newaxis, ...])
+
+    def _boxesFromProbMap(
+        self,
+        probMap: np.ndarray,
+        destWidth: int,
+        destHeight: int
+    ) -> List[np.ndarray]:
+        """
+        DB postprocessing: threshold, contours, box score, unclip.
+
+        Args:
+            probMap: Text probability map (H x W).
+            destWidth: Width of the original image.
+            destHeight: Height of the original image.
+
+        Returns:
+            List of 4x2 float32 boxes in original image coordinates.
+        """
+        mapH, mapW = probMap.shape
+        bitmap = (probMap > self._detThresh).astype(np.uint8)
+        contours, _ = cv2.findContours(bitmap * 255, cv2.RETR_LIST, cv2.CHAIN_APPROX_SIMPLE)
+
+        scale = np.array([destWidth / float(mapW), destHeight / float(mapH)], dtype=np.float32)
+        boxes = []
+        for contour in contours[:self.DET_MAX_CANDIDATES]:
+            rect = cv2.minAreaRect(contour)
+            if min(rect[1]) < self.DET_MIN_SIZE:
+                continue
+
+            if self._boxScore(probMap, cv2.boxPoints(rect)) < self._detBoxThresh:
+                continue
+
+            rect = self._unclip(rect)
+            if min(rect[1]) < self.DET_MIN_SIZE + 2:
+                continue
+
+            box = self._orderPoints(cv2.boxPoints(rect)) * scale
+            box[:, 0] = np.clip(np.round(box[:, 0]), 0, destWidth - 1)
+            box[:, 1] = np.clip(np.round(box[:, 1]), 0, destHeight - 1)
+
+            boxW = int(np.linalg.norm(box[0] - box[1]))
+            boxH = int(np.linalg.norm(box[0] - box[3]))
+            if boxW <= 3 or boxH <= 3:
+                continue
+            boxes.append(box)
+
+        return boxes
+
+    @staticmethod
+    def _boxScore(probMap: np.ndarray, points: np.ndarray) -> float:
+        """Mean probability inside a polygon (box_score_fast)."""
+        h, w = probMap.shape
+        xmin = int(np.clip(np.floor(points[:, 0].min()), 0, w - 1))
+        xmax = int(np.clip(np.ceil(points[:, 0].max()), 0, w - 1))
+        ymin = int(np.clip(np.floor(points[:, 1].min()), 0, h - 1))
+        ymax = int(np.clip(np.ceil(points[:, 1].max()), 0, h - 1))
+
+        mask = np.zeros((ymax - ymin + 1, xmax - xmin + 1), dtype=np.uint8)
+        shifted = points - np.array([xmin, ymin], dtype=np.float32)
+        cv2.fillPoly(mask, [shifted.astype(np.int32)], 1)
+        return cv2.mean(probMap[ymin:ymax + 1, xmin:xmax + 1], mask)[0]
+
+    def _unclip(self, rect: Tuple) -> Tuple:
+        """
+        Expand a rotated rect by area * unclipRatio / perimeter on each side.
+
+        For a rectangle this equals the minAreaRect of the pyclipper offset
+        used by PaddleOCR, so pyclipper/shapely are not needed.
+        """
+        (cx, cy), (rw, rh), angle = rect
+        distance = rw * rh * self._unclipRatio / (2.0 * (rw + rh))
+        return (cx, cy), (rw + 2 * distance, rh + 2 * distance), angle
+
+    @staticmethod
+    def _orderPoints(points: np.ndarray) -> np.ndarray:
+        """Order 4 points clockwise starting at top-left."""
+        points = points[np.argsort(points[:, 0])]
+        left, right = points[:2], points[2:]
+        topLeft, bottomLeft = left[np.argsort(left[:, 1])]
+        topRight, bottomRight = right[np.argsort(right[:, 1])]
+        return np.array([topLeft, topRight, bottomRight, bottomLeft], dtype=np.float32)
+
+    @staticmethod
+    def _sortBoxes(boxes: List[np.ndarray]) -> List[np.ndarray]:
+        """Sort boxes top to bottom, then left to right within a 10px row."""
+        boxes = sorted(boxes, key=lambda b: (b[0][1], b[0][0]))
+        for i in range(len(boxes) - 1):
+            for j in range(i, -1, -1):
+                if (abs(boxes[j + 1][0][1] - boxes[j][0][1]) < 10
+                        and boxes[j + 1][0][0] < boxes[j][0][0]):
+                    boxes[j], boxes[j + 1] = boxes[j + 1], boxes[j]
+                else:
+                    break
+        return boxes
+
+    @staticmethod
+    def _cropBox(image: np.ndarray, box: np.ndarray) -> np.ndarray:
+        """Warp a box to an upright crop; tall crops are rotated 90 degrees."""
+        cropW = int(max(np.linalg.norm(box[0] - box[1]), np.linalg.norm(box[2] - box[3])))
+        cropH = int(max(np.linalg.norm(box[0] - box[3]), np.linalg.norm(box[1] - box[2])))
+        cropW, cropH = max(1, cropW), max(1, cropH)
+
+        target = np.array(
+            [[0, 0], [cropW, 0], [cropW, cropH], [0, cropH]], dtype=np.float32
+        )
+        matrix = cv2.getPerspectiveTransform(box.astype(np.float32), target)
+        crop = cv2.warpPerspective(
+            image, matrix, (cropW, cropH),
+            borderMode=cv2.BORDER_REPLICATE, flags=cv2.INTER_CUBIC
+        )
+
+        if cropH / float(cropW) >= 1.5:
+            crop = np.rot90(crop)
+        return crop
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # Text Recognition (CTC)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def _recognizeCrops(self, crops: List[np.ndarray]) -> List[Tuple[str, float]]:
+        """
+        Recognize crops in batches of similar aspect ratio.
+
+        Args:
+            crops: BGR text line images.
+
+        Returns:
+            (text, score) per crop, in input order.
+        """
+        results: List[Tuple[str, float]] = [('', 0.0)] * len(crops)
+        order = sorted(range(len(crops)), key=lambda i: crops[i].shape[1] / float(crops[i].shape[0]))
+
+        for start in range(0, len(order), self._recBatchSize):
+            batch = order[start:start + self._recBatchSize]
+            tensor = self._preprocessRec([crops[i] for i in batch])
+            output = self._infer(self._recModel, tensor)
+            for i, decoded in zip(batch, self._decodeCtc(output)):
+                results[i] = decoded
+
+        return results
+
+    def _preprocessRec(self, crops: List[np.ndarray]) -> np.ndarray:
+        """
+        Resize crops to height 48, normalize and right-pad to a common width.
+
+        Args:
+            crops: BGR text line images of one batch.
+
+        Returns:
+            np.ndarray: N x 3 x 48 x W float32 tensor.
+        """
+        maxRatio = max(
+            self.REC_MIN_WIDTH / float(self.REC_HEIGHT),
+            max(c.shape[1] / float(c.shape[0]) for c in crops)
+        )
+        batchW = int(self.REC_HEIGHT * maxRatio)
+
+        tensor = np.zeros((len(crops), 3, self.REC_HEIGHT, batchW), dtype=np.float32)
+        for i, crop in enumerate(crops):
+            h, w = crop.shape[:2]
+            resizedW = min(batchW, int(math.ceil(self.REC_HEIGHT * w / float(h))))
+            resized = cv2.resize(crop, (resizedW, self.REC_HEIGHT)).astype(np.float32)
+            tensor[i, :, :, :resizedW] = (resized.transpose(2, 0, 1) / 255.0 - 0.5) / 0.5
+
+        return tensor
+
+    def _decodeCtc(self, output: np.ndarray) -> List[Tuple[str, float]]:
+        """
+        Greedy CTC decoding: drop repeats and blanks, average kept scores.
+
+        Args:
+            output: Class probabilities (N x T x C).
+
+        Returns:
+            (text, score) per batch item.
+        """
+        indices = output.argmax(axis=2)
+        probs = output.max(axis=2)
+        numChars = len(self._characters)
+
+        decoded = []
+        for idx, prob in zip(indices, probs):
+            keep = np.ones(len(idx), dtype=bool)
+            keep[1:] = idx[1:] != idx[:-1]
+            keep &= idx != 0
+
+            text = ''.join(self._characters[i] for i in idx[keep] if i < numChars)
+            score = float(prob[keep].mean()) if keep.any() else 0.0
+            decoded.append((text, score))
+
+        return decoded
+
+    @staticmethod
+    def _toBgr(image: np.ndarray) -> np.ndarray:
+        """Convert grayscale input to BGR."""
+        if len(image.shape) == 2:
+            return cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+        if image.shape[2] == 1:
+            return cv2.cvtColor(image[:, :, 0], cv2.COLOR_GRAY2BGR)
+        return image
@@ -0,0 +1,299 @@
+"""
+Process Pool OCR Extractor Implementation.
+
+This module runs OCR in a pool of long-lived worker processes. Each worker
+owns one warmed-up OCR extractor (any backend), optionally pinned to its own CPU
+cores, so several images can be recognized in parallel without GIL or
+Paddle thread contention.
+
+Images are passed through multiprocessing.shared_memory (one copy into the
+segment, no pickling of pixel data); only TextBlock lists travel back.
+
+Worker failures are not turned into empty results: extract()/recognize()
+raise (S7 reports failure) and extractMany() returns None for the image.
+When a worker process dies (BrokenProcessPool) the pool is recreated.
+
+Follows the Single Responsibility Principle (SRP) from SOLID.
+"""
+
+import os
+import logging
+import threading
+import multiprocessing
+from contextlib import ExitStack
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from typing import Optional, List, Dict, Any, Tuple, Callable
+
+import numpy as np
+
+from core.interfaces.ocr_extractor_interface import (
+    IOcrExtractor,
+    OcrResult,
+    TextBlock
+)
+
+
+# (shared memory name, shape, dtype)
+SharedImageSpec = Tuple[str, Tuple[int, ...], str]
+
+
+class _SharedImage:
+    """Shared memory segment holding one image, unlinked on exit."""
+
+    def __init__(self, image: np.ndarray):
+        image = np.ascontiguousarray(image)
+        self._shm = shared_memory.SharedMemory(create=True, size=max(1, image.nbytes))
+        view = np.ndarray(image.shape, dtype=image.dtype, buffer=self._shm.buf)
+        view[...] = image
+        del view
+        self.spec: SharedImageSpec = (self._shm.name, image.shape, image.dtype.str)
+
+    def __enter__(self) -> "_SharedImage":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._shm.close()
+        self._shm.unlink()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Worker Process Side
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+_workerExtractor: Optional[IOcrExtractor] = None
+
+
+def _initWorker(
+    extractorKwargs: Dict[str, Any],
+    workerCounter,
+    coresPerWorker: int,
+    warmup: bool
+) -> None:
+    """Create the worker's extractor, pin it to its cores and warm it up."""
+    global _workerExtractor
+
+    with workerCounter.get_lock():
+        workerIndex = workerCounter.value
+        workerCounter.value += 1
+
+    logger = logging.getLogger(__name__)
+
+    if coresPerWorker > 0 and hasattr(os, "sched_setaffinity"):
+        cpuCount = os.cpu_count() or 1
+        first = (workerIndex * coresPerWorker) % cpuCount
+        cores = {(first + i) % cpuCount for i in range(coresPerWorker)}
+        try:
+            os.sched_setaffinity(0, cores)
+        except OSError as e:
+            logger.warning(f"OCR worker {workerIndex}: CPU pinning failed: {e}")
+
+    from core.ocr.ocr_extractor_factory import createOcrExtractor
+    _workerExtractor = createOcrExtractor(**extractorKwargs)
+
+    if warmup:
+        blank = np.full((48, 160, 3), 255, dtype=np.uint8)
+        _workerExtractor.extract(blank)
+
+    logger.info(f"OCR worker {workerIndex} ready (pid={os.getpid()})")
+
+
+def _attach(spec: SharedImageSpec) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+    """Map a shared image into this process (no copy)."""
+    name, shape, dtype = spec
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+
+def _workerExtract(spec: SharedImageSpec) -> List[TextBlock]:
+    """Full OCR of one shared image."""
+    shm, image = _attach(spec)
+    try:
+        return _workerExtractor.extract(image).textBlocks
+    finally:
+        del image
+        shm.close()
+
+
+def _workerRecognize(specs: List[SharedImageSpec]) -> List[TextBlock]:
+    """Recognition-only OCR of shared line strips."""
+    attached = [_attach(spec) for spec in specs]
+    try:
+        return _workerExtractor.recognize([image for _, image in attached])
+    finally:
+        for shm, image in attached:
+            del image
+            shm.close()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Parent Process Side
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class ProcessPoolOcrExtractor(IOcrExtractor):
+    """
+    IOcrExtractor running an OCR extractor in worker processes.
+
+    extract()/recognize() block until one worker is done; extractMany()
+    spreads several images over all workers.
+    """
+
+    def __init__(
+        self,
+        extractorKwargs: Dict[str, Any],
+        numWorkers: int = 2,
+        coresPerWorker: int = 0,
+        warmup: bool = True,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize ProcessPoolOcrExtractor.
+
+        Args:
+            extractorKwargs: createOcrExtractor() arguments for each worker.
+            numWorkers: Number of worker processes.
+            coresPerWorker: CPU cores pinned per worker (0 = no pinning).
+            warmup: Run one blank OCR in each worker at startup.
+            logger: Logger instance for debug output.
+        """
+        self._logger = logger or logging.getLogger(__name__)
+        self._numWorkers = max(1, numWorkers)
+
+        # Spawn: Paddle state must not be inherited through fork
+        self._context = multiprocessing.get_context("spawn")
+        workerCounter = self._context.Value("i", 0)
+        self._initArgs = (extractorKwargs, workerCounter, coresPerWorker, warmup)
+
+        self._executorLock = threading.Lock()
+        self._executor = self._createExecutor()
+        self._restarts = 0
+
+        self._logger.info(
+            f"ProcessPoolOcrExtractor initialized "
+            f"(workers={self._numWorkers}, coresPerWorker={coresPerWorker}, warmup={warmup})"
+        )
+
+    def extract(self, image: np.ndarray) -> OcrResult:
+        """
+        Extract text from an image in a worker process.
+
+        Args:
+            image: Input image (BGR)
+
+        Returns:
+            OcrResult with text blocks (rawResult is not transferred)
+
+        Raises:
+            Exception: The worker's error, or BrokenProcessPool if it died.
+        """
+        with _SharedImage(image) as shared:
+            return OcrResult(textBlocks=self._call(_workerExtract, shared.spec))
+
+    def extractMany(self, images: List[np.ndarray]) -> List[OcrResult]:
+        """
+        Extract text from several images in parallel.
+
+        Args:
+            images: Input images (BGR)
+
+        Returns:
+            One OcrResult per image, in input order (None where the
+            worker failed)
+
+        Raises:
+            BrokenProcessPool: If the pool was already broken (it is recreated).
+        """
+        executor = self._executor
+        with ExitStack() as stack:
+            sharedImages = [stack.enter_context(_SharedImage(image)) for image in images]
+            try:
+                futures = [
+                    executor.submit(_workerExtract, shared.spec)
+                    for shared in sharedImages
+                ]
+            except BrokenProcessPool:
+                self._restartExecutor(executor)
+                raise
+
+            results: List[Optional[OcrResult]] = []
+            broken = False
+            for future in futures:
+                try:
+                    results.append(OcrResult(textBlocks=future.result()))
+                except BrokenProcessPool as e:
+                    self._logger.error(f"OCR worker process died: {e}")
+                    broken = True
+                    results.append(None)
+                except Exception as e:
+                    self._logger.error(f"OCR worker failed: {e}")
+                    results.append(None)
+
+            if broken:
+                self._restartExecutor(executor)
+            return results
+
+    def recognize(self, images: List[np.ndarray]) -> List[TextBlock]:
+        """
+        Recognize line strips in one worker (one batch).
+
+        Args:
+            images: Text line strips (BGR)
+
+        Returns:
+            One TextBlock per strip, in input order
+
+        Raises:
+            Exception: The worker's error, or BrokenProcessPool if it died.
+        """
+        if not images:
+            return []
+
+        with ExitStack() as stack:
+            sharedImages = [stack.enter_context(_SharedImage(image)) for image in images]
+            return self._call(_workerRecognize, [shared.spec for shared in sharedImages])
+
+    def getRestartCount(self) -> int:
+        """Get how often the pool was recreated after a worker died."""
+        return self._restarts
+
+    def close(self) -> None:
+        """Stop the worker processes."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._logger.info("ProcessPoolOcrExtractor closed")
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # Helpers
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def _createExecutor(self) -> ProcessPoolExecutor:
+        """Create the worker pool."""
+        return ProcessPoolExecutor(
+            max_workers=self._numWorkers,
+            mp_context=self._context,
+            initializer=_initWorker,
+            initargs=self._initArgs
+        )
+
+    def _call(self, function: Callable, argument: Any) -> Any:
+        """Run function(argument) in a worker, recreating a broken pool."""
+        executor = self._executor
+        try:
+            return executor.submit(function, argument).result()
+        except BrokenProcessPool:
+            self._restartExecutor(executor)
+            raise
+
+    def _restartExecutor(self, broken: ProcessPoolExecutor) -> None:
+        """Replace a broken pool (once, even if several calls saw it fail)."""
+        with self._executorLock:
+            if self._executor is not broken:
+                return
+            broken.shutdown(wait=False, cancel_futures=True)
+            self._executor = self._createExecutor()
+            self._restarts += 1
+
+        self._logger.warning(
+            f"OCR worker process died, pool recreated (restarts={self._restarts})"
+        )
@@ -7,10 +7,20 @@
 from core.preprocessor.geometric_transformer import GeometricTransformer
 from core.preprocessor.orientation_corrector import OrientationCorrector
 from core.preprocessor.document_preprocessor import DocumentPreprocessor
+from core.preprocessor.qr_anchored_cropper import QrAnchoredCropper
+from core.preprocessor.orientation_classifier_factory import (
+    createOrientationClassifier,
+    getSupportedOrientationBackends,
+    isOrientationBackendAvailable
+)
 
 
 __all__ = [
     'GeometricTransformer',
     'OrientationCorrector',
     'DocumentPreprocessor',
+    'QrAnchoredCropper',
+    'createOrientationClassifier',
+    'getSupportedOrientationBackends',
+    'isOrientationBackendAvailable',
 ]
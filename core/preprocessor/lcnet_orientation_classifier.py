@@ -0,0 +1,127 @@
+"""
+LCNet Orientation Classifier Base Module
+
+Shared preprocessing and postprocessing for the exported PP-LCNet
+doc-orientation model (ONNX / OpenVINO IR). Subclasses only provide
+model loading and a single inference call for their runtime.
+
+Preprocessing mirrors the model's inference.yml:
+    ResizeImage(resize_short=256) -> CropImage(224) ->
+    NormalizeImage(ImageNet mean/std, scale 1/255) -> ToCHWImage
+
+Follows SRP: Only handles tensor conversion and label decoding.
+"""
+
+import logging
+from abc import abstractmethod
+from typing import List, Optional
+import numpy as np
+import cv2
+
+from core.interfaces.orientation_classifier_interface import (
+    IOrientationClassifier,
+    OrientationPrediction
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+class LcnetOrientationClassifier(IOrientationClassifier):
+    """
+    Base class for runtime-specific PP-LCNet orientation classifiers.
+
+    Handles the preprocessing defined by the Paddle model config and
+    decodes the 4-class output into an OrientationPrediction.
+    """
+
+    LABELS: List[str] = ['0', '90', '180', '270']
+    RESIZE_SHORT = 256
+    CROP_SIZE = 224
+    MEAN = np.array([0.485, 0.456, 0.406], dtype=np.float32)
+    STD = np.array([0.229, 0.224, 0.225], dtype=np.float32)
+
+    def classify(self, image: np.ndarray) -> Optional[OrientationPrediction]:
+        """
+        Classify the orientation of an image.
+
+        Args:
+            image: Input image (BGR or grayscale).
+
+        Returns:
+            OrientationPrediction or None if the model is not loaded.
+        """
+        if not self.isLoaded():
+            return None
+
+        tensor = self._preprocess(image)
+        output = self._infer(tensor)
+        return self._postprocess(output)
+
+    def _preprocess(self, image: np.ndarray) -> np.ndarray:
+        """
+        Convert an image to the model input tensor (1 x 3 x 224 x 224, float32).
+
+        Args:
+            image: Input image (BGR or grayscale).
+
+        Returns:
+            np.ndarray: Normalized NCHW tensor.
+        """
+        if image.ndim == 2:
+            rgb = cv2.cvtColor(image, cv2.COLOR_GRAY2RGB)
+        else:
+            # Paddle reads images as RGB before classification
+            rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+
+        # Resize so the short side equals RESIZE_SHORT
+        h, w = rgb.shape[:2]
+        scale = self.RESIZE_SHORT / float(min(h, w))
+        newW = max(self.CROP_SIZE, int(round(w * scale)))
+        newH = max(self.CROP_SIZE, int(round(h * scale)))
+        resized = cv2.resize(rgb, (newW, newH), interpolation=cv2.INTER_LINEAR)
+
+        # Center crop
+        top = (newH - self.CROP_SIZE) // 2
+        left = (newW - self.CROP_SIZE) // 2
+        cropped = resized[top:top + self.CROP_SIZE, left:left + self.CROP_SIZE]
+
+        # Normalize and convert HWC -> NCHW
+        normalized = (cropped.astype(np.float32) / 255.0 - self.MEAN) / self.STD
+        return np.ascontiguousarray(normalized.transpose(2, 0, 1)[np.newaxis, ...])
+
+    def _postprocess(self, output: np.ndarray) -> Optional[OrientationPrediction]:
+        """
+        Decode model output into the top-1 orientation label.
+
+        Args:
+            output: Raw model output of shape (1, 4) or (4,).
+
+        Returns:
+            OrientationPrediction or None if the output is empty.
+        """
+        scores = np.asarray(output, dtype=np.float32).reshape(-1)
+        if scores.size == 0:
+            return None
+
+        # Exported models usually include softmax; apply it if they don't
+        if scores.min() < 0.0 or abs(float(scores.sum()) - 1.0) > 1e-3:
+            exp = np.exp(scores - scores.max())
+            scores = exp / exp.sum()
+
+        index = int(np.argmax(scores))
+        label = self.LABELS[index] if index < len(self.LABELS) else str(index)
+        return OrientationPrediction(label=label, score=float(scores[index]))
+
+    @abstractmethod
+    def _infer(self, tensor: np.ndarray) -> np.ndarray:
+        """
+        Run a single inference on the preprocessed tensor.
+
+        Args:
+            tensor: NCHW float32 input tensor.
+
+        Returns:
+            np.ndarray: Raw class scores.
+        """
+        pass
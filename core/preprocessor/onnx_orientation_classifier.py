@@ -0,0 +1,97 @@
+"""
+ONNX Orientation Classifier Module
+
+Implements IOrientationClassifier using ONNX Runtime for the exported
+PP-LCNet_x1_0_doc_ori model (e.g. converted with paddle2onnx).
+
+Follows SRP: Only handles ONNX Runtime session management and inference.
+"""
+
+import logging
+import os
+from typing import Optional
+import numpy as np
+
+try:
+    import onnxruntime as ort
+except ImportError:
+    ort = None
+
+from core.preprocessor.lcnet_orientation_classifier import LcnetOrientationClassifier
+
+
+logger = logging.getLogger(__name__)
+
+
+class OnnxOrientationClassifier(LcnetOrientationClassifier):
+    """
+    PP-LCNet doc-orientation classifier running on ONNX Runtime (CPU).
+    """
+
+    def __init__(self, numThreads: int = 0):
+        """
+        Initialize OnnxOrientationClassifier.
+
+        Args:
+            numThreads: Number of intra-op CPU threads (0 = ONNX Runtime default).
+        """
+        self._numThreads = numThreads
+        self._session = None
+        self._inputName: str = ""
+
+    def loadModel(self, modelPath: Optional[str] = None) -> bool:
+        """
+        Load ONNX model from file.
+
+        Args:
+            modelPath: Path to the .onnx model file.
+
+        Returns:
+            bool: True if model loaded successfully.
+        """
+        if ort is None:
+            logger.error("ONNX Runtime is not installed")
+            logger.error("Install with: pip install onnxruntime>=1.16.0")
+            return False
+
+        if not modelPath or not os.path.exists(modelPath):
+            logger.warning(f"Orientation model not found: {modelPath}")
+            return False
+
+        try:
+            sessionOptions = ort.SessionOptions()
+            sessionOptions.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            sessionOptions.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+            sessionOptions.inter_op_num_threads = 1
+            if self._numThreads > 0:
+                sessionOptions.intra_op_num_threads = self._numThreads
+
+            self._session = ort.InferenceSession(
+                modelPath,
+                sess_options=sessionOptions,
+                providers=['CPUExecutionProvider']
+            )
+            self._inputName = self._session.get_inputs()[0].name
+
+            logger.info(
+                f"ONNX orientation classifier loaded from {modelPath} "
+                f"(threads={self._numThreads or 'auto'})"
+            )
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to load ONNX orientation model: {e}")
+            self._session = None
+            return False
+
+    def isLoaded(self) -> bool:
+        """Check if the classifier is ready for inference."""
+        return self._session is not None
+
+    def getBackendName(self) -> str:
+        """Get the name of the inference backend."""
+        return "onnx"
+
+    def _infer(self, tensor: np.ndarray) -> np.ndarray:
+        """Run ONNX Runtime inference and return the first output."""
+        return self._session.run(None, {self._inputName: tensor})[0]
@@ -0,0 +1,142 @@
+"""
+OpenVINO Orientation Classifier Module
+
+Implements IOrientationClassifier using OpenVINO Runtime for the exported
+PP-LCNet_x1_0_doc_ori model (.onnx or OpenVINO IR .xml).
+
+Uses the same performance settings as the S2 OpenVINO detector
+(threads, streams, hint, hyper-threading, CPU pinning).
+
+Follows SRP: Only handles OpenVINO model compilation and inference.
+"""
+
+import logging
+import os
+from typing import Dict, Optional
+import numpy as np
+
+try:
+    from openvino.runtime import Core
+    import openvino.properties as props
+    import openvino.properties.hint as hints
+except ImportError:
+    Core = None
+    props = None
+    hints = None
+
+from core.preprocessor.lcnet_orientation_classifier import LcnetOrientationClassifier
+
+
+logger = logging.getLogger(__name__)
+
+
+class OpenVINOOrientationClassifier(LcnetOrientationClassifier):
+    """
+    PP-LCNet doc-orientation classifier running on OpenVINO Runtime (CPU).
+    """
+
+    def __init__(
+        self,
+        numThreads: int = 0,
+        numStreams: int = 0,
+        performanceHint: str = "LATENCY",
+        enableHyperThreading: bool = False,
+        enableCpuPinning: bool = True
+    ):
+        """
+        Initialize OpenVINOOrientationClassifier.
+
+        Args:
+            numThreads: Number of CPU threads for inference (0 = auto/all cores).
+            numStreams: Number of inference streams (0 = auto based on hint).
+            performanceHint: Performance mode - 'LATENCY' (default) or 'THROUGHPUT'.
+            enableHyperThreading: Enable hyper-threading.
+            enableCpuPinning: Pin threads to CPU cores.
+        """
+        self._numThreads = numThreads
+        self._numStreams = numStreams
+        self._performanceHint = performanceHint.upper()
+        self._enableHyperThreading = enableHyperThreading
+        self._enableCpuPinning = enableCpuPinning
+        self._compiledModel = None
+        self._inferRequest = None
+
+    def loadModel(self, modelPath: Optional[str] = None) -> bool:
+        """
+        Load and compile the orientation model.
+
+        Args:
+            modelPath: Path to the model file (.xml or .onnx).
+
+        Returns:
+            bool: True if model loaded successfully.
+        """
+        if Core is None:
+            logger.error("OpenVINO Runtime is not installed")
+            logger.error("Install with: pip install openvino>=2024.0.0")
+            return False
+
+        if not modelPath or not os.path.exists(modelPath):
+            logger.warning(f"Orientation model not found: {modelPath}")
+            return False
+
+        try:
+            core = Core()
+            model = core.read_model(model=modelPath)
+
+            config = self._buildCompileConfig()
+            self._compiledModel = core.compile_model(model, "CPU", config)
+            self._inferRequest = self._compiledModel.create_infer_request()
+
+            logger.info(
+                f"OpenVINO orientation classifier loaded from {modelPath} "
+                f"(config={config})"
+            )
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to load OpenVINO orientation model: {e}")
+            self._compiledModel = None
+            self._inferRequest = None
+            return False
+
+    def _buildCompileConfig(self) -> Dict:
+        """
+        Build OpenVINO compile configuration (same keys as the S2 detector).
+
+        Returns:
+            Dict: Configuration dictionary for compile_model.
+        """
+        config = {}
+
+        if props is None or hints is None:
+            return config
+
+        if self._performanceHint == "THROUGHPUT":
+            config[hints.performance_mode] = hints.PerformanceMode.THROUGHPUT
+        else:
+            config[hints.performance_mode] = hints.PerformanceMode.LATENCY
+
+        if self._numThreads > 0:
+            config[props.inference_num_threads] = self._numThreads
+
+        if self._numStreams > 0:
+            config[props.num_streams] = self._numStreams
+
+        config[hints.enable_hyper_threading] = self._enableHyperThreading
+        config[hints.enable_cpu_pinning] = self._enableCpuPinning
+
+        return config
+
+    def isLoaded(self) -> bool:
+        """Check if the classifier is ready for inference."""
+        return self._inferRequest is not None
+
+    def getBackendName(self) -> str:
+        """Get the name of the inference backend."""
+        return "openvino"
+
+    def _infer(self, tensor: np.ndarray) -> np.ndarray:
+        """Run OpenVINO inference and return the first output."""
+        self._inferRequest.infer({0: tensor})
+        return self._inferRequest.get_output_tensor(0).data.copy()
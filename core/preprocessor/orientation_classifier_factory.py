@@ -0,0 +1,154 @@
+"""
+Orientation Classifier Factory Module
+
+Factory function for creating document orientation classifiers based on
+backend selection. Supports PaddleOCR, ONNX Runtime and OpenVINO Runtime.
+
+Follows:
+- OCP (Open/Closed Principle): Easy to extend with new backends
+- DIP (Dependency Inversion): Returns IOrientationClassifier interface
+- Factory Pattern: Encapsulates object creation logic
+"""
+
+import logging
+from typing import Optional, List
+
+from core.interfaces.orientation_classifier_interface import IOrientationClassifier
+
+
+logger = logging.getLogger(__name__)
+
+
+def createOrientationClassifier(
+    backend: str = "paddle",
+    modelPath: Optional[str] = None,
+    cpuThreads: int = 4,
+    enableMkldnn: bool = True,
+    openvinoConfig: Optional[dict] = None
+) -> IOrientationClassifier:
+    """
+    Factory function to create an orientation classifier based on backend.
+
+    Supports:
+    - "paddle": PaddleOCR DocImgOrientationClassification (model directory)
+    - "onnx": ONNX Runtime with an exported PP-LCNet model (.onnx)
+    - "openvino": OpenVINO Runtime with an exported PP-LCNet model (.xml or .onnx)
+
+    The model is loaded before returning. If loading fails, the returned
+    classifier reports isLoaded() == False and AI orientation is disabled.
+
+    Args:
+        backend: Backend name ("paddle", "onnx" or "openvino").
+        modelPath: Path to model directory (paddle) or model file (onnx/openvino).
+        cpuThreads: CPU threads for the Paddle backend.
+        enableMkldnn: Enable MKL-DNN for the Paddle backend.
+        openvinoConfig: Thread settings shared with S2 detection, with keys:
+            - numThreads: Number of CPU threads (0 = auto)
+            - numStreams: Number of inference streams (0 = auto)
+            - performanceHint: 'LATENCY' or 'THROUGHPUT'
+            - enableHyperThreading: Enable hyper-threading
+            - enableCpuPinning: Pin threads to CPU cores
+            ONNX Runtime only uses numThreads (as intra-op threads).
+
+    Returns:
+        IOrientationClassifier: Classifier instance.
+
+    Raises:
+        ValueError: If backend is invalid or not supported.
+    """
+    # Normalize backend name
+    backend = backend.lower().strip()
+
+    # Validate backend
+    supportedBackends = getSupportedOrientationBackends()
+    if backend not in supportedBackends:
+        errorMsg = (
+            f"Invalid orientation backend: '{backend}'. "
+            f"Supported backends: {supportedBackends}"
+        )
+        logger.error(errorMsg)
+        raise ValueError(errorMsg)
+
+    config = openvinoConfig or {}
+
+    if backend == "openvino":
+        from core.preprocessor.openvino_orientation_classifier import (
+            OpenVINOOrientationClassifier
+        )
+        classifier = OpenVINOOrientationClassifier(
+            numThreads=config.get("numThreads", 0),
+            numStreams=config.get("numStreams", 0),
+            performanceHint=config.get("performanceHint", "LATENCY"),
+            enableHyperThreading=config.get("enableHyperThreading", False),
+            enableCpuPinning=config.get("enableCpuPinning", True)
+        )
+
+    elif backend == "onnx":
+        from core.preprocessor.onnx_orientation_classifier import OnnxOrientationClassifier
+        classifier = OnnxOrientationClassifier(
+            numThreads=config.get("numThreads", 0)
+        )
+
+    else:
+        from core.preprocessor.paddle_orientation_classifier import (
+            PaddleOrientationClassifier
+        )
+        classifier = PaddleOrientationClassifier(
+            cpuThreads=cpuThreads,
+            enableMkldnn=enableMkldnn
+        )
+
+    logger.info(f"Creating orientation classifier (backend={backend}, model={modelPath})")
+    if not classifier.loadModel(modelPath):
+        logger.warning(
+            f"Orientation classifier not loaded (backend={backend}). "
+            "AI orientation correction will be disabled."
+        )
+
+    return classifier
+
+
+def getSupportedOrientationBackends() -> List[str]:
+    """
+    Get list of supported orientation backend names.
+
+    Returns:
+        List[str]: List of backend names ["paddle", "onnx", "openvino"].
+    """
+    return ["paddle", "onnx", "openvino"]
+
+
+def isOrientationBackendAvailable(backend: str) -> bool:
+    """
+    Check if an orientation backend is available (library installed).
+
+    Args:
+        backend: Backend name ("paddle", "onnx" or "openvino").
+
+    Returns:
+        bool: True if backend library is installed and available.
+    """
+    backend = backend.lower().strip()
+
+    if backend == "paddle":
+        try:
+            import paddleocr
+            return True
+        except ImportError:
+            return False
+
+    elif backend == "onnx":
+        try:
+            import onnxruntime
+            return True
+        except ImportError:
+            return False
+
+    elif backend == "openvino":
+        try:
+            from openvino.runtime import Core
+            return True
+        except ImportError:
+            return False
+
+    return False
@@ -8,25 +8,14 @@
 """
 
 import logging
-import os
 from typing import Optional, Tuple
 import numpy as np
 import cv2
 
-
-logger = logging.getLogger(__name__)
+from core.interfaces.orientation_classifier_interface import IOrientationClassifier
 
 
-# Check and import PaddleOCR library
-try:
-    from paddleocr import DocImgOrientationClassification
-    PADDLE_AVAILABLE = True
-except ImportError:
-    PADDLE_AVAILABLE = False
-    logger.warning(
-        "PaddleOCR not installed. AI orientation correction will be disabled. "
-        "Run: pip install paddleocr paddlepaddle --upgrade"
-    )
+logger = logging.getLogger(__name__)
 
 
 class OrientationCorrector:
@@ -37,7 +26,8 @@ class OrientationCorrector:
     - Forcing landscape orientation (width >= height)
     - AI-based 180-degree rotation detection and correction
     
-    Uses PaddleOCR's DocImgOrientationClassification for AI detection.
+    AI detection is delegated to an injected IOrientationClassifier
+    (PaddleOCR, ONNX Runtime or OpenVINO backend).
     
     Follows SRP: Only responsible for orientation correction.
     """
@@ -45,49 +35,19 @@ class OrientationCorrector:
     def __init__(
         self, 
         aiConfidenceThreshold: float = 0.6,
-        modelPath: Optional[str] = None,
-        cpuThreads: int = 4,
-        enableMkldnn: bool = True
+        classifier: Optional[IOrientationClassifier] = None
     ):
         """
         Initialize OrientationCorrector.
         
         Args:
             aiConfidenceThreshold: Minimum confidence score to apply AI rotation fix.
-            modelPath: Path to local model directory. If None, uses default download.
-            cpuThreads: Number of CPU threads for orientation classification (default: 4).
-            enableMkldnn: Enable MKL-DNN acceleration (default: True).
+            classifier: Orientation classifier (see createOrientationClassifier).
+                        If None, AI orientation correction is disabled.
         """
         self._aiConfidenceThreshold = aiConfidenceThreshold
-        self._angleClassifier = None
-        self._aiAvailable = False
-        self._cpuThreads = cpuThreads
-        self._enableMkldnn = enableMkldnn
-        
-        if PADDLE_AVAILABLE:
-            try:
-                # Initialize the orientation classifier with CPU optimization
-                if modelPath and os.path.exists(modelPath):
-                    # Load from local model directory
-                    self._angleClassifier = DocImgOrientationClassification(
-                        model_dir=modelPath,
-                        cpu_threads=cpuThreads,
-                        enable_mkldnn=enableMkldnn
-                    )
-                    logger.info(f"PaddleOCR classifier loaded from local: {modelPath} (threads={cpuThreads}, mkldnn={enableMkldnn})")
-                else:
-                    # Fallback to downloading model
-                    self._angleClassifier = DocImgOrientationClassification(
-                        model_name="PP-LCNet_x1_0_doc_ori",
-                        cpu_threads=cpuThreads,
-                        enable_mkldnn=enableMkldnn
-                    )
-                    logger.info(f"PaddleOCR classifier loaded from cache/download (threads={cpuThreads}, mkldnn={enableMkldnn})")
-                
-                self._aiAvailable = True
-            except Exception as e:
-                logger.warning(f"Failed to initialize PaddleOCR classifier: {e}")
-                self._aiAvailable = False
+        self._angleClassifier = classifier
+        self._aiAvailable = classifier is not None and classifier.isLoaded()
     
     @property
     def isAiAvailable(self) -> bool:
@@ -136,7 +96,7 @@ def correctOrientationWithAi(
                 - Status message describing the action taken.
                 
         Logic:
-            1. Checks if the PaddleOCR classifier is initialized.
+            1. Checks if the orientation classifier is loaded.
             2. Resizes the image to maxWidth for faster inference (preserving aspect ratio).
             3. Runs the classifier to predict the orientation label and confidence score.
             4. If the label indicates '180' degrees and confidence > threshold:
@@ -162,22 +122,13 @@ def correctOrientationWithAi(
                 checkImg = image
             
             # Run classification
-            results = self._angleClassifier.predict(checkImg)
+            prediction = self._angleClassifier.classify(checkImg)
             
-            if not results:
+            if prediction is None:
                 return image, "No classification result"
             
-            res = results[0]
-            label = ""
-            score = 0.0
-            
-            # Handle different result formats
-            if isinstance(res, dict) and 'label_names' in res:
-                label = res['label_names'][0]
-                score = res['scores'][0]
-            elif hasattr(res, 'label_names'):
-                label = res.label_names[0]
-                score = res.scores[0]
+            label = prediction.label
+            score = prediction.score
             
             if not label:
                 return image, "No label detected"
@@ -0,0 +1,134 @@
+"""
+Paddle Orientation Classifier Module
+
+Implements IOrientationClassifier using PaddleOCR's DocImgOrientationClassification.
+PaddleOCR is imported lazily in loadModel() so that the Paddle runtime is only
+pulled in when this backend is actually selected.
+
+Follows SRP: Only handles orientation classification with PaddleOCR.
+"""
+
+import logging
+import os
+from typing import Optional
+import numpy as np
+
+from core.interfaces.orientation_classifier_interface import (
+    IOrientationClassifier,
+    OrientationPrediction
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+class PaddleOrientationClassifier(IOrientationClassifier):
+    """
+    Document orientation classifier backed by PaddleOCR.
+
+    Uses the PP-LCNet_x1_0_doc_ori model through DocImgOrientationClassification.
+    """
+
+    DEFAULT_MODEL_NAME = "PP-LCNet_x1_0_doc_ori"
+
+    def __init__(self, cpuThreads: int = 4, enableMkldnn: bool = True):
+        """
+        Initialize PaddleOrientationClassifier.
+
+        Args:
+            cpuThreads: Number of CPU threads for classification (default: 4).
+            enableMkldnn: Enable MKL-DNN acceleration (default: True).
+        """
+        self._cpuThreads = cpuThreads
+        self._enableMkldnn = enableMkldnn
+        self._classifier = None
+
+    def loadModel(self, modelPath: Optional[str] = None) -> bool:
+        """
+        Load the PaddleOCR orientation classifier.
+
+        Args:
+            modelPath: Path to local model directory. If None or missing,
+                       the model is loaded from cache or downloaded.
+
+        Returns:
+            bool: True if the classifier is loaded.
+        """
+        try:
+            from paddleocr import DocImgOrientationClassification
+        except ImportError:
+            logger.warning(
+                "PaddleOCR not installed. AI orientation correction will be disabled. "
+                "Run: pip install paddleocr paddlepaddle --upgrade"
+            )
+            return False
+
+        try:
+            if modelPath and os.path.exists(modelPath):
+                # Load from local model directory
+                self._classifier = DocImgOrientationClassification(
+                    model_dir=modelPath,
+                    cpu_threads=self._cpuThreads,
+                    enable_mkldnn=self._enableMkldnn
+                )
+                logger.info(
+                    f"PaddleOCR classifier loaded from local: {modelPath} "
+                    f"(threads={self._cpuThreads}, mkldnn={self._enableMkldnn})"
+                )
+            else:
+                # Fallback to downloading model
+                self._classifier = DocImgOrientationClassification(
+                    model_name=self.DEFAULT_MODEL_NAME,
+                    cpu_threads=self._cpuThreads,
+                    enable_mkldnn=self._enableMkldnn
+                )
+                logger.info(
+                    f"PaddleOCR classifier loaded from cache/download "
+                    f"(threads={self._cpuThreads}, mkldnn={self._enableMkldnn})"
+                )
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to initialize PaddleOCR classifier: {e}")
+            self._classifier = None
+            return False
+
+    def isLoaded(self) -> bool:
+        """Check if the classifier is ready for inference."""
+        return self._classifier is not None
+
+    def classify(self, image: np.ndarray) -> Optional[OrientationPrediction]:
+        """
+        Classify the orientation of an image.
+
+        Args:
+            image: Input image (BGR format).
+
+        Returns:
+            OrientationPrediction or None if no result is available.
+        """
+        if self._classifier is None:
+            return None
+
+        results = self._classifier.predict(image)
+        if not results:
+            return None
+
+        res = results[0]
+
+        # Handle different result formats
+        if isinstance(res, dict) and 'label_names' in res:
+            return OrientationPrediction(
+                label=str(res['label_names'][0]),
+                score=float(res['scores'][0])
+            )
+        if hasattr(res, 'label_names'):
+            return OrientationPrediction(
+                label=str(res.label_names[0]),
+                score=float(res.scores[0])
+            )
+
+        return None
+
+    def getBackendName(self) -> str:
+        """Get the name of the inference backend."""
+        return "paddle"
@@ -0,0 +1,129 @@
+"""
+QR Anchored Cropper Module
+
+Crops an upright label from the camera frame using only the decoded QR
+polygon. The label layout is fixed, so the label rectangle is known relative
+to the QR code (margins measured in QR side lengths), and the corner order
+reported by the decoder gives the label orientation directly.
+
+This replaces mask contouring, minAreaRect cropping and the orientation
+classifier when the QR code was already decoded on the full frame.
+
+Follows SRP: Only handles QR-anchored geometric transformation.
+"""
+
+import logging
+from typing import Optional, Tuple, List
+import numpy as np
+import cv2
+
+
+logger = logging.getLogger(__name__)
+
+
+class QrAnchoredCropper:
+    """
+    Crops the label around a decoded QR code.
+
+    Margins are expressed in QR side lengths, measured along the QR axes:
+
+        ┌──────────────────────────────────────────┐  ↑ topRatio
+        │                                ┌───┐     │
+        │  ←──────── leftRatio ────────→ │QR │ ←→  │  rightRatio
+        │                                └───┘     │
+        └──────────────────────────────────────────┘  ↓ bottomRatio
+    """
+
+    def __init__(
+        self,
+        leftRatio: float = 4.0,
+        rightRatio: float = 0.6,
+        topRatio: float = 1.0,
+        bottomRatio: float = 0.8
+    ):
+        """
+        Initialize QrAnchoredCropper.
+
+        Args:
+            leftRatio: Label width left of the QR, in QR side lengths.
+            rightRatio: Label width right of the QR, in QR side lengths.
+            topRatio: Label height above the QR, in QR side lengths.
+            bottomRatio: Label height below the QR, in QR side lengths.
+        """
+        self._leftRatio = leftRatio
+        self._rightRatio = rightRatio
+        self._topRatio = topRatio
+        self._bottomRatio = bottomRatio
+
+    def crop(
+        self,
+        image: np.ndarray,
+        qrPolygon: List[Tuple[int, int]]
+    ) -> Tuple[Optional[np.ndarray], Optional[np.ndarray], str]:
+        """
+        Crop the upright label around the QR code.
+
+        Args:
+            image: Source frame (BGR).
+            qrPolygon: QR corners in decoder order [TL, TR, BR, BL] of the
+                QR symbol (frame coordinates).
+
+        Returns:
+            Tuple of:
+                - Cropped upright label, or None if failed.
+                - 2x3 affine matrix mapping frame to crop coordinates, or None.
+                - Status message.
+        """
+        if qrPolygon is None or len(qrPolygon) < 4:
+            return None, None, "QR polygon needs 4 corners"
+
+        try:
+            pts = np.array(qrPolygon[:4], dtype=np.float32)
+            tl, tr, br, bl = pts
+
+            # QR axes (orientation of the symbol = orientation of the label)
+            xAxis = ((tr - tl) + (br - bl)) / 2.0
+            yAxis = ((bl - tl) + (br - tr)) / 2.0
+            qrWidth = float(np.linalg.norm(xAxis))
+            qrHeight = float(np.linalg.norm(yAxis))
+            if qrWidth < 1.0 or qrHeight < 1.0:
+                return None, None, "Degenerate QR polygon"
+
+            u = xAxis / qrWidth
+            v = yAxis / qrHeight
+
+            # Label rectangle in frame coordinates
+            origin = tl - self._leftRatio * qrWidth * u - self._topRatio * qrHeight * v
+            labelWidth = (self._leftRatio + 1.0 + self._rightRatio) * qrWidth
+            labelHeight = (self._topRatio + 1.0 + self._bottomRatio) * qrHeight
+
+            outWidth = int(round(labelWidth))
+            outHeight = int(round(labelHeight))
+            if outWidth <= 0 or outHeight <= 0:
+                return None, None, "Invalid label dimensions"
+
+            srcPts = np.array([
+                origin,
+                origin + labelWidth * u,
+                origin + labelWidth * u + labelHeight * v
+            ], dtype=np.float32)
+            dstPts = np.array([
+                [0, 0],
+                [outWidth - 1, 0],
+                [outWidth - 1, outHeight - 1]
+            ], dtype=np.float32)
+
+            matrix = cv2.getAffineTransform(srcPts, dstPts)
+            warped = cv2.warpAffine(
+                image,
+                matrix,
+                (outWidth, outHeight),
+                flags=cv2.INTER_LINEAR,
+                borderMode=cv2.BORDER_REPLICATE
+            )
+
+            return warped, matrix, f"Success: {outWidth}x{outHeight} (QR anchored)"
+
+        except Exception as e:
+            logger.error(f"Error in QR anchored crop: {e}")
+            return None, None, f"Error: {str(e)}"
@@ -1,6 +1,23 @@
 """Text Processor module."""
 
 from core.processor.fuzzy_matcher import FuzzyMatcher
+from core.processor.fuzzy_match_index import FuzzyMatchIndex
 from core.processor.label_text_processor import LabelTextProcessor
+from core.processor.label_result_cache import LabelResultCache
+from core.processor.python_similarity_backend import PythonSimilarityBackend
+from core.processor.similarity_backend_factory import (
+    createSimilarityBackend,
+    getSupportedSimilarityBackends,
+    isSimilarityBackendAvailable
+)
 
-__all__ = ['FuzzyMatcher', 'LabelTextProcessor']
+__all__ = [
+    'FuzzyMatcher',
+    'FuzzyMatchIndex',
+    'LabelTextProcessor',
+    'LabelResultCache',
+    'PythonSimilarityBackend',
+    'createSimilarityBackend',
+    'getSupportedSimilarityBackends',
+    'isSimilarityBackendAvailable',
+]
@@ -0,0 +1,228 @@
+"""
+Catalog Index Store.
+
+This module compiles catalog JSON files (products, sizes, colors) into
+index files holding the prebuilt FuzzyMatchIndex tables: normalized keys,
+exact and OCR-confusion order, length buckets and character postings as
+flat integer arrays. Loading a file slices the arrays out of its bytes
+(memoryview, no copy) and rebuilds nothing.
+
+Files are data only (a JSON header line followed by raw arrays, never
+pickle), so a writable cache directory can not inject code. Each file
+records the SHA-256 of its source JSON and of its array data; a changed
+catalog or a damaged file is recompiled automatically on the next load.
+
+    data/colors.json  ──sha256──►  <indexDir>/colors_name.catalog.idx
+                                   {version, sourceHash, ..., tables}\n
+                                   exactOrder | lengths | postingKeys | ...
+
+Follows the Single Responsibility Principle (SRP) from SOLID.
+"""
+
+import os
+import sys
+import json
+import hashlib
+import logging
+from array import array
+from pathlib import Path
+from typing import Dict, Optional
+
+from core.processor.fuzzy_match_index import FuzzyMatchIndex, TABLE_TYPECODES
+
+
+# Bump when the index file format, the FuzzyMatchIndex tables or value
+# extraction change (old files are then rebuilt)
+CATALOG_INDEX_VERSION = 4
+
+# Array sections start on multiples of this many bytes
+_SECTION_ALIGNMENT = 8
+
+
+class CatalogIndexStore:
+    """
+    Loads catalog indexes from compiled files, rebuilding stale ones.
+    """
+
+    def __init__(self, indexDir: str, logger: Optional[logging.Logger] = None):
+        """
+        Initialize CatalogIndexStore.
+
+        Args:
+            indexDir: Directory of the compiled index files.
+            logger: Logger instance for debug output.
+        """
+        self._indexDir = Path(indexDir)
+        self._logger = logger or logging.getLogger(__name__)
+
+    def load(
+        self,
+        jsonPath: str,
+        field: str,
+        upper: bool = False,
+        confusionMap: Optional[Dict[str, str]] = None,
+        rebuild: bool = False
+    ) -> Optional[FuzzyMatchIndex]:
+        """
+        Load the index of a catalog, compiling it if missing or stale.
+
+        Args:
+            jsonPath: Catalog JSON file (list of objects).
+            field: Field holding the catalog value ("Code", "name").
+            upper: Uppercase values (as LabelTextProcessor does for sizes
+                and colors).
+            confusionMap: OCR-confusion map passed to FuzzyMatchIndex.
+            rebuild: Compile even if the index file is up to date.
+
+        Returns:
+            FuzzyMatchIndex, or None if the catalog can not be read.
+        """
+        try:
+            source = Path(jsonPath).read_bytes()
+        except OSError as e:
+            self._logger.warning(f"Catalog not readable: {jsonPath}: {e}")
+            return None
+
+        sourceHash = hashlib.sha256(source).hexdigest()
+        indexPath = self.getIndexPath(jsonPath, field)
+        header = {
+            "version": CATALOG_INDEX_VERSION,
+            "sourceHash": sourceHash,
+            "field": field,
+            "upper": upper,
+            "confusionMap": confusionMap,
+            "byteOrder": sys.byteorder,
+            "itemSizes": {
+                typecode: array(typecode).itemsize
+                for typecode in sorted(set(TABLE_TYPECODES.values()))
+            },
+        }
+
+        if not rebuild:
+            index = self._read(indexPath, header, confusionMap)
+            if index is not None:
+                self._logger.debug(f"Catalog index loaded: {indexPath} ({len(index)} values)")
+                return index
+
+        try:
+            data = json.loads(source.decode('utf-8'))
+        except ValueError as e:
+            self._logger.warning(f"Failed to parse catalog {jsonPath}: {e}")
+            return None
+
+        values = [
+            str(item.get(field, '')).strip()
+            for item in data
+            if item.get(field)
+        ]
+        if upper:
+            values = [value.upper() for value in values]
+
+        index = FuzzyMatchIndex(values, confusionMap)
+        self._write(indexPath, header, index)
+        self._logger.info(f"Catalog index compiled: {jsonPath} → {indexPath} ({len(values)} values)")
+        return index
+
+    def getIndexPath(self, jsonPath: str, field: str) -> Path:
+        """
+        Get the index file path of a catalog.
+
+        Args:
+            jsonPath: Catalog JSON file.
+            field: Field holding the catalog value.
+
+        Returns:
+            Path of the compiled index file.
+        """
+        return self._indexDir / f"{Path(jsonPath).stem}_{field}.catalog.idx"
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # Helpers
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def _read(
+        self,
+        indexPath: Path,
+        header: dict,
+        confusionMap: Optional[Dict[str, str]]
+    ) -> Optional[FuzzyMatchIndex]:
+        """Load an index file if it matches the header (else None)."""
+        if not indexPath.exists():
+            return None
+
+        try:
+            content = indexPath.read_bytes()
+            headerEnd = content.index(b'\n')
+            stored = json.loads(content[:headerEnd].decode('utf-8'))
+        except (OSError, ValueError) as e:
+            self._logger.warning(f"Catalog index unreadable, rebuilding: {indexPath}: {e}")
+            return None
+
+        if not isinstance(stored, dict) or any(
+            stored.get(key) != value for key, value in header.items()
+        ):
+            self._logger.info(f"Catalog index stale, rebuilding: {indexPath}")
+            return None
+
+        data = memoryview(content)[headerEnd + 1:]
+        try:
+            if hashlib.sha256(data).hexdigest() != stored["dataHash"]:
+                raise ValueError("array data does not match its hash")
+
+            normalized = stored["normalized"]
+            candidates = stored["candidates"] if stored["candidates"] is not None else normalized
+            confusionKeys = stored["confusionKeys"]
+            tables = {}
+            for name, typecode in TABLE_TYPECODES.items():
+                offset, count = stored["tables"][name]
+                size = count * header["itemSizes"][typecode]
+                if offset < 0 or offset + size > len(data):
+                    raise ValueError(f"table {name} out of range")
+                tables[name] = data[offset:offset + size].cast(typecode)
+
+            if not (
+                len(candidates) == len(normalized) == len(tables["exactOrder"])
+                and len(tables["postingOffsets"]) == len(tables["postingKeys"]) + 1
+                and len(tables["confusionIndex"]) == len(confusionKeys)
+            ):
+                raise ValueError("table sizes do not match")
+        except (KeyError, TypeError, ValueError) as e:
+            self._logger.warning(f"Catalog index malformed, rebuilding: {indexPath}: {e}")
+            return None
+
+        return FuzzyMatchIndex.fromTables(
+            candidates, normalized, confusionKeys, tables, confusionMap
+        )
+
+    def _write(self, indexPath: Path, header: dict, index: FuzzyMatchIndex) -> None:
+        """Write an index file atomically (failures only logged)."""
+        normalized, confusionKeys, tables = index.getTables()
+
+        # Array sections, each aligned to _SECTION_ALIGNMENT bytes
+        data = bytearray()
+        sections = {}
+        for name in TABLE_TYPECODES:
+            data.extend(b'\0' * (-len(data) % _SECTION_ALIGNMENT))
+            sections[name] = [len(data), len(tables[name])]
+            data.extend(tables[name].tobytes())
+
+        content = dict(
+            header,
+            candidates=index.candidates if index.candidates != normalized else None,
+            normalized=normalized,
+            confusionKeys=confusionKeys,
+            tables=sections,
+            dataHash=hashlib.sha256(data).hexdigest()
+        )
+
+        tmpPath = indexPath.with_name(f"{indexPath.name}.{os.getpid()}.tmp")
+        try:
+            indexPath.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmpPath, 'wb') as f:
+                f.write(json.dumps(content, ensure_ascii=False).encode('utf-8'))
+                f.write(b'\n')
+                f.write(data)
+            os.replace(tmpPath, indexPath)
+        except OSError as e:
+            self._logger.warning(f"Failed to write catalog index {indexPath}: {e}")
+            tmpPath.unlink(missing_ok=True)
@@ -0,0 +1,566 @@
+"""
+Fuzzy Match Index.
+
+This module prebuilds a per-catalog index for FuzzyMatcher.bestMatch() so
+that only a few candidates reach full Levenshtein / Jaro-Winkler scoring.
+
+Pruning uses upper bounds of combinedSimilarity() that never undershoot the
+real score, so results (match and score) are identical to a linear scan:
+
+    Levenshtein:   dist >= max(la, lb) - overlap
+                   → levSim <= overlap / max(la, lb)
+    Jaro:          matches <= overlap
+                   → jaro <= (overlap/la + overlap/lb + 1) / 3
+    Jaro-Winkler:  jw = jaro + prefix * 0.1 * (1 - jaro), increasing in jaro
+
+where overlap is the size of the character multiset intersection.
+
+Lookup:
+1. Exact hit: binary search over the candidates sorted by normalized key
+   (optional confusionMatch(): binary search on an OCR-confusion key, e.g.
+   "5OOOL" and "5000L" both map to "5000L" under O/0, I/1/L, S/5, B/8)
+2. Length buckets: whole buckets skipped using overlap <= min(la, lb)
+3. Prefix filtering on character tokens ("A" twice = tokens A#1, A#2, so
+   token intersection = multiset overlap): a candidate needs an overlap of
+   at least m to reach minScore, so it holds at least need = min(m, 4) of
+   any (la - m + need) query tokens. Only the postings of the rarest such
+   tokens of the bucket are walked (counted in C by Counter), and only
+   candidates with enough hits are bounded. m is taken without prefix bonus for all
+   candidates and with the full bonus for those sharing the query's first
+   character (second posting family keyed by first character)
+4. Full scoring in decreasing bound order with the bounded kernel of the
+   similarity backend (ISimilarityBackend, FuzzyMatcher by default),
+   stopping once the bound falls below the best score (ties resolved by
+   catalog order, like bestMatch)
+
+All lookup structures are flat arrays (getTables() / fromTables()), so a
+compiled index file is loaded without rebuilding anything.
+
+Follows the Single Responsibility Principle (SRP) from SOLID.
+"""
+
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from core.interfaces.similarity_backend_interface import ISimilarityBackend
+from core.processor.python_similarity_backend import PythonSimilarityBackend
+
+
+# Characters OCR systematically confuses, mapped to one canonical character
+OCR_CONFUSION_MAP = {
+    'O': '0',
+    'I': '1',
+    'L': '1',
+    'S': '5',
+    'B': '8',
+}
+
+
+# Shorter confusion keys are too ambiguous to look up ("5" would read as
+# size "S", "1" as "L")
+_MIN_CONFUSION_KEY_LENGTH = 2
+
+
+# Bounds are compared with this slack so float rounding never prunes a
+# candidate whose real score equals the threshold
+_BOUND_EPSILON = 1e-9
+
+
+# Posting key: length (8 bits) | first character + 1, 0 = any (22 bits) |
+# character (21 bits) | occurrence (8 bits). Longer candidates are kept out
+# of the postings and always bounded directly
+_MAX_INDEXED_LENGTH = 255
+
+
+# Posting hits a candidate needs before its bound is computed (one more
+# posting list walked per extra hit)
+_MIN_PREFIX_HITS = 4
+_FIRST_SHIFT = 29
+_LENGTH_SHIFT = 51
+
+
+# Array typecodes of the lookup tables (see getTables())
+TABLE_TYPECODES = {
+    "exactOrder": "i",
+    "lengths": "i",
+    "postingKeys": "q",
+    "postingOffsets": "q",
+    "postingIds": "i",
+    "longIndexes": "i",
+    "confusionIndex": "i",
+}
+
+
+class FuzzyMatchIndex:
+    """
+    Prebuilt catalog index returning the same results as FuzzyMatcher.bestMatch.
+    """
+
+    def __init__(
+        self,
+        candidates: List[str],
+        confusionMap: Optional[Dict[str, str]] = None,
+        backend: Optional[ISimilarityBackend] = None
+    ):
+        """
+        Build the index.
+
+        Args:
+            candidates: Valid catalog values, in priority order (earlier
+                candidates win ties, as in FuzzyMatcher.bestMatch)
+            confusionMap: Character -> canonical character for the
+                OCR-confusion key index (None = no confusion lookup)
+            backend: Similarity backend for full scoring (None = Python)
+        """
+        candidates = list(candidates)
+        normalized = [self.normalize(c) for c in candidates]
+        confusionKeys, tables = self._buildTables(normalized, confusionMap)
+        self._setTables(candidates, normalized, confusionKeys, tables, confusionMap, backend)
+
+    @classmethod
+    def fromTables(
+        cls,
+        candidates: List[str],
+        normalized: List[str],
+        confusionKeys: List[str],
+        tables: Dict[str, Iterable[int]],
+        confusionMap: Optional[Dict[str, str]] = None,
+        backend: Optional[ISimilarityBackend] = None
+    ) -> 'FuzzyMatchIndex':
+        """
+        Create an index from the tables of getTables(), without rebuilding.
+
+        Args:
+            candidates: Catalog values, in priority order
+            normalized: Normalized candidates (same order)
+            confusionKeys: Sorted OCR-confusion keys
+            tables: Lookup tables by name (arrays or memoryviews, see
+                TABLE_TYPECODES)
+            confusionMap: Confusion map the tables were built with
+            backend: Similarity backend for full scoring (None = Python)
+
+        Returns:
+            FuzzyMatchIndex using the given tables as they are
+        """
+        index = cls.__new__(cls)
+        index._setTables(candidates, normalized, confusionKeys, tables, confusionMap, backend)
+        return index
+
+    def getTables(self) -> Tuple[List[str], List[str], Dict[str, Iterable[int]]]:
+        """
+        Get the lookup structures, e.g. to write a compiled index file.
+
+        Returns:
+            Tuple of (normalized candidates, sorted confusion keys, tables
+            by name with the typecodes of TABLE_TYPECODES)
+        """
+        return (self._normalized, self._confusionKeys, dict(self._tables))
+
+    @property
+    def candidates(self) -> List[str]:
+        """Get the catalog values, in priority order."""
+        return self._candidates
+
+    @property
+    def backend(self) -> ISimilarityBackend:
+        """Get the similarity backend used for full scoring."""
+        return self._backend
+
+    @backend.setter
+    def backend(self, backend: ISimilarityBackend) -> None:
+        """Set the similarity backend (e.g. after loading a compiled index)."""
+        self._backend = backend
+
+    def __len__(self) -> int:
+        return len(self._candidates)
+
+    def __contains__(self, text: str) -> bool:
+        """Check if text is a catalog value (raw, not normalized)."""
+        normalized = self.normalize(text)
+        position = bisect_left(self._exactOrder, normalized, key=self._normalized.__getitem__)
+        while position < len(self._exactOrder):
+            index = self._exactOrder[position]
+            if self._normalized[index] != normalized:
+                break
+            if self._candidates[index] == text:
+                return True
+            position += 1
+        return False
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Normalize text as FuzzyMatcher.combinedSimilarity does."""
+        return (text or '').strip().upper()
+
+    def confusionMatch(self, text: str) -> Optional[str]:
+        """
+        Look up a text by its OCR-confusion key.
+
+        Args:
+            text: Text to look up
+
+        Returns:
+            The single candidate sharing the text's confusion key, or None
+            (no confusion map, key shorter than 2 characters or without a
+            letter/digit, no candidate, or an ambiguous key)
+        """
+        if self._confusionTable is None or not text:
+            return None
+
+        key = self.normalize(text).translate(self._confusionTable)
+        if not self._isConfusionKey(key):
+            return None
+
+        self._confusionLookups += 1
+        position = bisect_left(self._confusionKeys, key)
+        if position == len(self._confusionKeys) or self._confusionKeys[position] != key:
+            return None
+        index = self._confusionIndex[position]
+        if index < 0:
+            return None
+
+        self._confusionHits += 1
+        return self._candidates[index]
+
+    def bestMatch(self, text: str, minScore: float = 0.0) -> Tuple[str, float]:
+        """
+        Find the best matching candidate for a given text.
+
+        Args:
+            text: Text to match
+            minScore: Minimum score to consider a match (default: 0.0)
+
+        Returns:
+            Tuple of (best_match, score). Returns ("", 0.0) if no match found.
+        """
+        if not text or not self._candidates:
+            return ("", 0.0)
+
+        self._queries += 1
+        query = self.normalize(text)
+
+        exactIndex = self._exactIndex(query)
+        if exactIndex >= 0 and 1.0 > minScore:
+            self._exactHits += 1
+            return (self._candidates[exactIndex], 1.0)
+
+        queryLength = len(query)
+        queryBag = Counter(query)
+
+        # Candidates that may share enough characters to beat minScore;
+        # candidates without a common character score 0.0 and never win
+        visited: Set[int] = set(self._longIndexes)
+        families = ((None, 0), (query[0], 4)) if query else ()
+        for length in self._lengths:
+            shorter = min(queryLength, length)
+            if self._upperBound(queryLength, length, shorter, 4) + _BOUND_EPSILON <= minScore:
+                continue
+            # Any candidate (no prefix bonus) and candidates sharing the
+            # first character (full prefix bonus)
+            for first, prefix in families:
+                minOverlap = self._minOverlap(queryLength, length, prefix, minScore)
+                if minOverlap is not None:
+                    self._collectCandidates(
+                        visited, queryBag, queryLength, minOverlap, length, first
+                    )
+        self._visited += len(visited)
+
+        # (bound, index) of candidates that may beat minScore
+        bounded = []
+        for index in visited:
+            candidate = self._normalized[index]
+            overlap = sum(
+                min(count, candidate.count(char)) for char, count in queryBag.items()
+            )
+            bound = self._upperBound(
+                queryLength, len(candidate), overlap, self._commonPrefix(query, candidate)
+            )
+            if bound + _BOUND_EPSILON > minScore:
+                bounded.append((bound, index))
+
+        # Highest bound first; equal bounds in catalog order
+        bounded.sort(key=lambda item: (-item[0], item[1]))
+
+        bestIndex = -1
+        bestScore = minScore
+        for bound, index in bounded:
+            if bestIndex >= 0 and bound + _BOUND_EPSILON < bestScore:
+                break
+            self._scored += 1
+            score = self._backend.boundedCombinedSimilarity(
+                query, self._normalized[index], bestScore
+            )
+            if score is None:
+                continue
+            if score > bestScore or (score == bestScore and 0 <= index < bestIndex):
+                bestScore = score
+                bestIndex = index
+
+        if bestIndex < 0:
+            return ("", minScore)
+        return (self._candidates[bestIndex], bestScore)
+
+    def bestMatches(self, texts: List[str], minScore: float = 0.0) -> List[Tuple[str, float]]:
+        """
+        Find the best candidate for several texts in one call.
+
+        Batch API of S8 catalog matching (all OCR blocks of a frame against
+        one catalog); texts that normalize to the same string are matched once.
+
+        Args:
+            texts: Texts to match (e.g. OCR blocks of one frame)
+            minScore: Minimum score to consider a match (default: 0.0)
+
+        Returns:
+            One (best_match, score) per text, as bestMatch() returns
+        """
+        results: Dict[Optional[str], Tuple[str, float]] = {}
+        matches = []
+        for text in texts:
+            key = self.normalize(text) if text else None
+            if key not in results:
+                results[key] = self.bestMatch(text, minScore)
+            matches.append(results[key])
+        return matches
+
+    def getStatistics(self) -> dict:
+        """
+        Get lookup statistics.
+
+        Returns:
+            Dict with candidates, queries, exactHits, visited (candidates
+            whose bound was computed), scored (candidates that reached full
+            scoring), confusionLookups and confusionHits
+        """
+        return {
+            "candidates": len(self._candidates),
+            "queries": self._queries,
+            "exactHits": self._exactHits,
+            "visited": self._visited,
+            "scored": self._scored,
+            "confusionLookups": self._confusionLookups,
+            "confusionHits": self._confusionHits
+        }
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # Helpers
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def _buildTables(
+        self,
+        normalized: List[str],
+        confusionMap: Optional[Dict[str, str]]
+    ) -> Tuple[List[str], Dict[str, array]]:
+        """Build the confusion keys and lookup tables of normalized candidates."""
+        # Exact hits: candidates sorted by normalized key, then catalog order
+        exactOrder = sorted(range(len(normalized)), key=lambda index: (normalized[index], index))
+
+        # Postings: token key -> candidate indexes (ascending), for any
+        # first character and for the candidate's own first character
+        postings: Dict[int, List[int]] = {}
+        lengths = set()
+        longIndexes = []
+        for index, text in enumerate(normalized):
+            length = len(text)
+            if length > _MAX_INDEXED_LENGTH:
+                longIndexes.append(index)
+                continue
+            if length == 0:
+                continue
+            lengths.add(length)
+            anyBase = self._postingKey(length, None, '\0', 0)
+            firstBase = self._postingKey(length, text[0], '\0', 0)
+            for char, count in Counter(text).items():
+                code = ord(char) << 8
+                for occurrence in range(1, count + 1):
+                    token = code | occurrence
+                    postings.setdefault(anyBase | token, []).append(index)
+                    postings.setdefault(firstBase | token, []).append(index)
+
+        postingKeys = sorted(postings)
+        postingOffsets = [0]
+        postingIds = []
+        for key in postingKeys:
+            postingIds.extend(postings[key])
+            postingOffsets.append(len(postingIds))
+
+        # Confusion keys: canonical key -> candidate index (-1 if several
+        # candidates share the key, which makes the lookup ambiguous)
+        confusion: Dict[str, int] = {}
+        if confusionMap:
+            table = str.maketrans(confusionMap)
+            for index, text in enumerate(normalized):
+                key = text.translate(table)
+                if not self._isConfusionKey(key):
+                    continue
+                existing = confusion.get(key)
+                if existing is None:
+                    confusion[key] = index
+                elif existing >= 0 and normalized[existing] != text:
+                    confusion[key] = -1
+        confusionKeys = sorted(confusion)
+
+        values = {
+            "exactOrder": exactOrder,
+            "lengths": sorted(lengths),
+            "postingKeys": postingKeys,
+            "postingOffsets": postingOffsets,
+            "postingIds": postingIds,
+            "longIndexes": longIndexes,
+            "confusionIndex": [confusion[key] for key in confusionKeys],
+        }
+        return confusionKeys, {
+            name: array(TABLE_TYPECODES[name], values[name]) for name in TABLE_TYPECODES
+        }
+
+    def _setTables(
+        self,
+        candidates: List[str],
+        normalized: List[str],
+        confusionKeys: List[str],
+        tables: Dict[str, Iterable[int]],
+        confusionMap: Optional[Dict[str, str]],
+        backend: Optional[ISimilarityBackend]
+    ) -> None:
+        """Attach candidates and lookup tables, and reset the statistics."""
+        self._backend = backend or PythonSimilarityBackend()
+        self._candidates = candidates
+        self._normalized = normalized
+        self._confusionKeys = confusionKeys
+        self._confusionTable = str.maketrans(confusionMap) if confusionMap else None
+
+        self._tables = tables
+        self._exactOrder = tables["exactOrder"]
+        self._lengths = tables["lengths"]
+        self._postingKeys = tables["postingKeys"]
+        self._postingOffsets = tables["postingOffsets"]
+        self._postingIds = tables["postingIds"]
+        self._longIndexes = tables["longIndexes"]
+        self._confusionIndex = tables["confusionIndex"]
+
+        self._queries = 0
+        self._exactHits = 0
+        self._visited = 0
+        self._scored = 0
+        self._confusionLookups = 0
+        self._confusionHits = 0
+
+    def _exactIndex(self, normalized: str) -> int:
+        """First candidate index with this normalized key, or -1."""
+        position = bisect_left(self._exactOrder, normalized, key=self._normalized.__getitem__)
+        if position < len(self._exactOrder):
+            index = self._exactOrder[position]
+            if self._normalized[index] == normalized:
+                return index
+        return -1
+
+    def _collectCandidates(
+        self,
+        visited: Set[int],
+        queryBag: Counter,
+        queryLength: int,
+        minOverlap: int,
+        length: int,
+        first: Optional[str]
+    ) -> None:
+        """Add the bucket's candidates that may share minOverlap query tokens."""
+        keys = self._postingKeys
+        offsets = self._postingOffsets
+        base = self._postingKey(length, first, '\0', 0)
+        low = bisect_left(keys, base)
+        high = bisect_left(keys, base + (1 << _FIRST_SHIFT), low)
+        if low == high:
+            return
+
+        # (posting size, start) per query token; tokens the bucket lacks
+        # (or too many occurrences to be indexed) have size 0
+        postings = []
+        for char, count in queryBag.items():
+            for occurrence in range(1, count + 1):
+                if occurrence > _MAX_INDEXED_LENGTH:
+                    postings.append((0, 0))
+                    continue
+                key = self._postingKey(length, first, char, occurrence)
+                position = bisect_left(keys, key, low, high)
+                if position < high and keys[position] == key:
+                    start = offsets[position]
+                    postings.append((offsets[position + 1] - start, start))
+                else:
+                    postings.append((0, 0))
+
+        # At most (queryLength - minOverlap) query tokens are missing, so
+        # the rarest (queryLength - minOverlap + need) tokens give need hits
+        need = min(minOverlap, _MIN_PREFIX_HITS)
+        postings.sort()
+        hits: Counter = Counter()
+        for size, start in postings[:queryLength - minOverlap + need]:
+            if size:
+                hits.update(self._postingIds[start:start + size])
+        if need == 1:
+            visited.update(hits)
+        else:
+            visited.update(index for index, count in hits.items() if count >= need)
+
+    @classmethod
+    def _minOverlap(
+        cls,
+        queryLength: int,
+        length: int,
+        prefix: int,
+        minScore: float
+    ) -> Optional[int]:
+        """Smallest overlap (>= 1) whose upper bound beats minScore, or None."""
+        for overlap in range(1, min(queryLength, length) + 1):
+            if cls._upperBound(queryLength, length, overlap, prefix) + _BOUND_EPSILON > minScore:
+                return overlap
+        return None
+
+    @staticmethod
+    def _postingKey(length: int, first: Optional[str], char: str, occurrence: int) -> int:
+        """Posting key of a token in a length bucket (first=None: any first character)."""
+        firstCode = 0 if first is None else ord(first) + 1
+        return (
+            (length << _LENGTH_SHIFT)
+            | (firstCode << _FIRST_SHIFT)
+            | (ord(char) << 8)
+            | occurrence
+        )
+
+    @staticmethod
+    def _upperBound(
+        queryLength: int,
+        length: int,
+        overlap: int,
+        prefix: int
+    ) -> float:
+        """Upper bound of combinedSimilarity() from lengths, overlap and prefix."""
+        longer = max(queryLength, length)
+        if longer == 0:
+            return 1.0
+
+        levBound = overlap / longer
+        if overlap == 0 or queryLength == 0 or length == 0:
+            return levBound
+
+        jaroBound = (overlap / queryLength + overlap / length + 1) / 3
+        prefix = min(prefix, 4, queryLength, length)
+        jwBound = jaroBound + prefix * 0.1 * (1 - jaroBound)
+
+        return max(levBound, jwBound)
+
+    @staticmethod
+    def _isConfusionKey(key: str) -> bool:
+        """Check if a confusion key is specific enough to look up."""
+        return len(key) >= _MIN_CONFUSION_KEY_LENGTH and any(c.isalnum() for c in key)
+
+    @staticmethod
+    def _commonPrefix(a: str, b: str) -> int:
+        """Length of the common prefix, up to 4 characters."""
+        prefix = 0
+        for x, y in zip(a[:4], b[:4]):
+            if x != y:
+                break
+            prefix += 1
+        return prefix
@@ -4,9 +4,19 @@
 This module provides fuzzy string matching utilities using
 Levenshtein distance and Jaro-Winkler similarity algorithms.
 Used for matching OCR results against known valid values.
+
+Bounded variants let bestMatch() abandon candidates that cannot beat the
+running best score:
+- boundedLevenshteinDistance: banded (Ukkonen) DP with a max-distance cutoff
+- jaroWinklerUpperBound: bound from character-count overlap, no matching pass
 """
 
-from typing import List, Tuple
+from collections import Counter
+from typing import List, Optional, Tuple
+
+
+# Slack for comparing float upper bounds against thresholds
+_BOUND_EPSILON = 1e-9
 
 
 class FuzzyMatcher:
@@ -51,6 +61,54 @@ def levenshteinDistance(a: str, b: str) -> int:
         
         return prev[len(b)]
     
+    @staticmethod
+    def boundedLevenshteinDistance(a: str, b: str, maxDistance: int) -> int:
+        """
+        Calculate Levenshtein distance, abandoning once it exceeds maxDistance.
+        
+        Only the diagonal band |i - j| <= maxDistance of the DP table is
+        filled (Ukkonen), and the scan stops as soon as a whole row
+        exceeds maxDistance.
+        
+        Args:
+            a: First string
+            b: Second string
+            maxDistance: Largest distance of interest
+            
+        Returns:
+            Exact distance if <= maxDistance, otherwise maxDistance + 1
+        """
+        cutoff = maxDistance + 1
+        if maxDistance < 0 or abs(len(a) - len(b)) > maxDistance:
+            return max(cutoff, 0)
+        if not a or not b:
+            return max(len(a), len(b))
+        
+        prev = [j if j <= maxDistance else cutoff for j in range(len(b) + 1)]
+        
+        for i in range(1, len(a) + 1):
+            curr = [cutoff] * (len(b) + 1)
+            curr[0] = i if i <= maxDistance else cutoff
+            rowMin = curr[0]
+            
+            for j in range(max(1, i - maxDistance), min(len(b), i + maxDistance) + 1):
+                cost = 0 if a[i - 1] == b[j - 1] else 1
+                value = min(
+                    prev[j] + 1,      # Deletion
+                    curr[j - 1] + 1,  # Insertion
+                    prev[j - 1] + cost,  # Substitution
+                    cutoff
+                )
+                curr[j] = value
+                if value < rowMin:
+                    rowMin = value
+            
+            if rowMin > maxDistance:
+                return cutoff
+            prev = curr
+        
+        return prev[len(b)]
+    
     @staticmethod
     def levenshteinSimilarity(a: str, b: str) -> float:
         """
@@ -149,6 +207,44 @@ def jaroWinklerSimilarity(s: str, t: str, prefixScale: float = 0.1) -> float:
         # Jaro-Winkler with prefix bonus
         return jaro + prefix * prefixScale * (1 - jaro)
     
+    @staticmethod
+    def jaroWinklerUpperBound(s: str, t: str, prefixScale: float = 0.1) -> float:
+        """
+        Calculate an upper bound of jaroWinklerSimilarity() without matching.
+        
+        Jaro matches can not exceed the character-count overlap m of the two
+        strings, so jaro <= (m/|s| + m/|t| + 1) / 3; the Winkler bonus grows
+        with jaro for a fixed common prefix.
+        
+        Args:
+            s: First string
+            t: Second string
+            prefixScale: Scaling factor for prefix bonus (default: 0.1)
+            
+        Returns:
+            Value >= jaroWinklerSimilarity(s, t)
+        """
+        if not s or not t:
+            return 1.0 if not s and not t else 0.0
+        
+        tCounts = Counter(t)
+        overlap = sum(
+            min(count, tCounts[char]) for char, count in Counter(s).items() if char in tCounts
+        )
+        if overlap == 0:
+            return 0.0
+        
+        jaro = (overlap / len(s) + overlap / len(t) + 1) / 3
+        
+        prefix = 0
+        for i in range(min(4, len(s), len(t))):
+            if s[i] == t[i]:
+                prefix += 1
+            else:
+                break
+        
+        return jaro + prefix * prefixScale * (1 - jaro)
+    
     @staticmethod
     def combinedSimilarity(a: str, b: str) -> float:
         """
@@ -170,6 +266,65 @@ def combinedSimilarity(a: str, b: str) -> float:
         
         return max(lev, jw)
     
+    @staticmethod
+    def boundedCombinedSimilarity(a: str, b: str, minScore: float) -> Optional[float]:
+        """
+        Calculate combinedSimilarity() only if it can reach minScore.
+        
+        Jaro-Winkler is skipped when its upper bound is below minScore, and
+        Levenshtein runs banded with the largest distance that could still
+        beat max(minScore, Jaro-Winkler).
+        
+        Args:
+            a: First string
+            b: Second string
+            minScore: Score of interest (inclusive)
+            
+        Returns:
+            combinedSimilarity(a, b) if it is >= minScore, otherwise None
+        """
+        na = (a or '').strip().upper()
+        nb = (b or '').strip().upper()
+        
+        if not na or not nb:
+            score = FuzzyMatcher.combinedSimilarity(na, nb)
+            return score if score >= minScore else None
+        
+        jw = -1.0
+        if FuzzyMatcher.jaroWinklerUpperBound(na, nb) + _BOUND_EPSILON >= minScore:
+            jw = FuzzyMatcher.jaroWinklerSimilarity(na, nb)
+        
+        maxLen = max(len(na), len(nb))
+        maxDistance = FuzzyMatcher.maxEditDistance(maxLen, max(minScore, jw))
+        
+        score = jw
+        if maxDistance >= 0:
+            dist = FuzzyMatcher.boundedLevenshteinDistance(na, nb, maxDistance)
+            if dist <= maxDistance:
+                score = max(1.0 - dist / maxLen, jw)
+        
+        return score if score >= minScore else None
+    
+    @staticmethod
+    def maxEditDistance(maxLen: int, target: float) -> int:
+        """
+        Largest Levenshtein distance whose similarity still reaches target.
+        
+        Uses the same formula as levenshteinSimilarity(), so the cutoff is
+        exact for the float comparisons done by the bounded kernels.
+        
+        Args:
+            maxLen: Length of the longer (non-empty) string
+            target: Similarity of interest (inclusive)
+            
+        Returns:
+            Distance cutoff, or -1 if no distance reaches target
+        """
+        maxDistance = min(maxLen, int(maxLen * (1.0 - target)) + 1)
+        while maxDistance >= 0 and 1.0 - maxDistance / maxLen < target:
+            maxDistance -= 1
+        return maxDistance
+    
     @staticmethod
     def bestMatch(
         text: str, 
@@ -194,8 +349,9 @@ def bestMatch(
         bestScore = minScore
         
         for candidate in candidates:
-            score = FuzzyMatcher.combinedSimilarity(text, candidate)
-            if score > bestScore:
+            # None: can not reach the running best, abandoned early
+            score = FuzzyMatcher.boundedCombinedSimilarity(text, candidate, bestScore)
+            if score is not None and score > bestScore:
                 bestScore = score
                 best = candidate
         
@@ -0,0 +1,299 @@
+"""
+Label Field Accumulator Module.
+
+This module fuses S8 results of the same label across frames. Each frame
+votes for the values it read, weighted by fieldConfidences; a field is
+settled once its best value leads the runner-up by minVoteScore, and then
+ignores further votes. The position only settles on the value that matches
+the QR position. A label is complete when every field is settled.
+
+    frame 1: product=340 (0.97)  size=3T (0.95)  color=--
+    frame 2: product=--          size=3T (0.60)  color=MIDNIGHT (0.93)
+    ─────────────────────────────────────────────────────────────
+    fused:   product=340 ✔       size=3T ✔        color=MIDNIGHT ✔
+
+The pipeline asks getPendingRegions() which S6 regions still hold open
+fields and only OCRs those.
+
+Follows the Single Responsibility Principle (SRP) from SOLID.
+"""
+
+import time
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from typing import Optional, List, Dict, Tuple
+
+from core.interfaces.text_processor_interface import LabelData
+
+
+# Fused fields, in label reading order
+FIELD_POSITION_QUANTITY = "positionQuantity"
+FIELD_PRODUCT = "productCode"
+FIELD_SIZE = "size"
+FIELD_COLOR = "color"
+
+LABEL_FIELDS = [FIELD_POSITION_QUANTITY, FIELD_PRODUCT, FIELD_SIZE, FIELD_COLOR]
+
+# S6 regions and the fields printed in them
+REGION_ABOVE_QR = "aboveQr"
+REGION_BELOW_QR = "belowQr"
+
+FIELD_REGIONS = {
+    FIELD_POSITION_QUANTITY: REGION_ABOVE_QR,
+    FIELD_PRODUCT: REGION_BELOW_QR,
+    FIELD_SIZE: REGION_BELOW_QR,
+    FIELD_COLOR: REGION_BELOW_QR,
+}
+
+
+@dataclass
+class FieldVotes:
+    """
+    Votes of one field across frames.
+
+    Attributes:
+        totals: Summed confidence per value.
+        best: Highest single-frame confidence per value.
+        settledValue: Value fixed once the field passed the threshold.
+    """
+    totals: Dict[str, float] = field(default_factory=dict)
+    best: Dict[str, float] = field(default_factory=dict)
+    settledValue: Optional[str] = None
+
+    def leader(self) -> Tuple[str, float, float]:
+        """Get (value, total, margin over the runner-up); ("", 0, 0) if no vote."""
+        if not self.totals:
+            return "", 0.0, 0.0
+        ranked = sorted(self.totals.items(), key=lambda item: item[1], reverse=True)
+        runnerUp = ranked[1][1] if len(ranked) > 1 else 0.0
+        return ranked[0][0], ranked[0][1], ranked[0][1] - runnerUp
+
+
+@dataclass
+class LabelVotes:
+    """
+    Accumulated votes of one label.
+
+    Attributes:
+        fields: Votes per field name.
+        latest: Most recent S8 result (QR fields are taken from it).
+        frames: Number of frames merged.
+        lastSeenAt: Time of the last update (time.monotonic()).
+    """
+    fields: Dict[str, FieldVotes]
+    latest: LabelData
+    frames: int = 0
+    lastSeenAt: float = 0.0
+
+
+class LabelFieldAccumulator:
+    """
+    Per-label, per-field voting across frames, keyed by QR text.
+    """
+
+    def __init__(
+        self,
+        minVoteScore: float = 0.9,
+        ttlMs: float = 10000.0,
+        maxEntries: int = 64,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize LabelFieldAccumulator.
+
+        Args:
+            minVoteScore: Lead in summed confidence over the runner-up value
+                needed to settle a field (one confident frame, or several
+                agreeing weaker ones).
+            ttlMs: Time after the last update before a label is dropped.
+            maxEntries: Maximum number of labels tracked (LRU eviction).
+            logger: Logger instance for debug output.
+        """
+        self._minVoteScore = minVoteScore
+        self._ttlSec = ttlMs / 1000.0
+        self._maxEntries = max(1, maxEntries)
+        self._logger = logger or logging.getLogger(__name__)
+        self._labels: "OrderedDict[str, LabelVotes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._logger.info(
+            f"LabelFieldAccumulator initialized "
+            f"(minVoteScore={minVoteScore}, ttlMs={ttlMs}, maxEntries={maxEntries})"
+        )
+
+    def update(self, qrText: str, labelData: LabelData) -> LabelData:
+        """
+        Merge one frame's S8 result and return the fused label.
+
+        Args:
+            qrText: Decoded QR text (label key).
+            labelData: S8 result of this frame.
+
+        Returns:
+            Fused LabelData (best value per field, isValid recomputed).
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            votes = self._labels.get(qrText)
+            if votes is None:
+                votes = LabelVotes(
+                    fields={name: FieldVotes() for name in LABEL_FIELDS},
+                    latest=labelData
+                )
+                self._labels[qrText] = votes
+
+            votes.latest = labelData
+            votes.frames += 1
+            votes.lastSeenAt = now
+            self._labels.move_to_end(qrText)
+
+            for name in LABEL_FIELDS:
+                value = getattr(labelData, name)
+                confidence = labelData.fieldConfidences.get(name)
+                fieldVotes = votes.fields[name]
+                if not value or confidence is None or fieldVotes.settledValue is not None:
+                    continue
+
+                fieldVotes.totals[value] = fieldVotes.totals.get(value, 0.0) + confidence
+                fieldVotes.best[value] = max(fieldVotes.best.get(value, 0.0), confidence)
+
+                leader, _, margin = fieldVotes.leader()
+                if margin >= self._minVoteScore and self._agreesWithQr(name, leader, labelData):
+                    fieldVotes.settledValue = leader
+                    self._logger.debug(
+                        f"Field settled after {votes.frames} frame(s): {name}={leader} ({qrText})"
+                    )
+
+            while len(self._labels) > self._maxEntries:
+                self._labels.popitem(last=False)
+
+            return self._fuse(votes)
+
+    def getPendingFields(self, qrText: str) -> List[str]:
+        """
+        Get the fields of a label that are not settled yet.
+
+        Args:
+            qrText: Decoded QR text (label key).
+
+        Returns:
+            Unsettled field names (all fields for an unknown label).
+        """
+        with self._lock:
+            votes = self._labels.get(qrText)
+            if votes is None or time.monotonic() - votes.lastSeenAt > self._ttlSec:
+                return list(LABEL_FIELDS)
+            return [
+                name for name in LABEL_FIELDS
+                if votes.fields[name].settledValue is None
+            ]
+
+    def getPendingRegions(self, qrText: str) -> List[str]:
+        """
+        Get the S6 regions that still contain unsettled fields.
+
+        Args:
+            qrText: Decoded QR text (label key).
+
+        Returns:
+            Region names (REGION_ABOVE_QR, REGION_BELOW_QR) in label order.
+        """
+        pending = {FIELD_REGIONS[name] for name in self.getPendingFields(qrText)}
+        return [r for r in (REGION_ABOVE_QR, REGION_BELOW_QR) if r in pending]
+
+    def getFusedLabel(self, qrText: str) -> Optional[LabelData]:
+        """
+        Get the current fused label.
+
+        Args:
+            qrText: Decoded QR text (label key).
+
+        Returns:
+            Fused LabelData, or None for an unknown label.
+        """
+        with self._lock:
+            votes = self._labels.get(qrText)
+            return self._fuse(votes) if votes is not None else None
+
+    def isComplete(self, qrText: str) -> bool:
+        """
+        Check if every field of a label is settled and the positions match.
+
+        Args:
+            qrText: Decoded QR text (label key).
+
+        Returns:
+            True if the label needs no more OCR.
+        """
+        if self.getPendingFields(qrText):
+            return False
+        fused = self.getFusedLabel(qrText)
+        return fused is not None and fused.isValid
+
+    def getPositionHint(self, qrText: str) -> Optional[Tuple[int, int]]:
+        """
+        Get the settled position/quantity of a label.
+
+        Args:
+            qrText: Decoded QR text (label key).
+
+        Returns:
+            (position, quantity), or None if not settled.
+        """
+        with self._lock:
+            votes = self._labels.get(qrText)
+            value = votes.fields[FIELD_POSITION_QUANTITY].settledValue if votes else None
+        return self._parsePositionQuantity(value) if value else None
+
+    def clear(self) -> None:
+        """Drop all accumulated labels."""
+        with self._lock:
+            self._labels.clear()
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # Helpers
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def _fuse(self, votes: LabelVotes) -> LabelData:
+        """Build the fused LabelData from the votes (lock held)."""
+        fused = replace(votes.latest, fieldConfidences={})
+
+        for name in LABEL_FIELDS:
+            fieldVotes = votes.fields[name]
+            value = fieldVotes.settledValue or fieldVotes.leader()[0]
+            setattr(fused, name, value)
+            if value:
+                fused.fieldConfidences[name] = fieldVotes.best.get(value, 0.0)
+
+        position = self._parsePositionQuantity(fused.positionQuantity)
+        fused.ocrPosition, fused.quantity = position if position else (0, 0)
+        fused.isValid = fused.ocrPosition > 0 and fused.ocrPosition == fused.qrPosition
+        return fused
+
+    def _agreesWithQr(self, name: str, value: str, labelData: LabelData) -> bool:
+        """Check that a position/quantity value matches the QR position."""
+        if name != FIELD_POSITION_QUANTITY:
+            return True
+        position = self._parsePositionQuantity(value)
+        return position is not None and position[0] == labelData.qrPosition
+
+    def _expire(self, now: float) -> None:
+        """Drop labels not updated within the TTL (lock held)."""
+        expired = [
+            key for key, votes in self._labels.items()
+            if now - votes.lastSeenAt > self._ttlSec
+        ]
+        for key in expired:
+            del self._labels[key]
+
+    @staticmethod
+    def _parsePositionQuantity(value: Optional[str]) -> Optional[Tuple[int, int]]:
+        """Parse "position/quantity" into integers."""
+        try:
+            position, quantity = value.split("/")
+            return int(position), int(quantity)
+        except (AttributeError, ValueError):
+            return None
@@ -0,0 +1,185 @@
+"""
+Label Result Cache Module.
+
+This module keeps fully validated LabelData keyed by QR text. The QR code
+identifies one order position (e.g. "110125-VA-M-000002-2/1"), so once a
+label has been read and validated, later frames of the same label can skip
+S6 (component extraction), S7 (OCR) and S8 (postprocessing).
+
+Expiry:
+- ttlMs: an entry expires ttlMs after the label was last seen (sliding), so
+  a label that stays in view stays cached and a label that left is dropped
+- reverifyIntervalMs: one lookup per interval is handed back to the full
+  pipeline (0 = never); other lookups keep hitting the cached result, and
+  a new validated result refreshes it
+- maxEntries: least recently used entries are evicted first
+
+Follows the Single Responsibility Principle (SRP) from SOLID.
+"""
+
+import time
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from core.interfaces.text_processor_interface import LabelData
+
+
+@dataclass
+class LabelCacheEntry:
+    """
+    Cached label result.
+
+    Attributes:
+        labelData: Validated label data.
+        verifiedAt: Time of the last full pipeline run, or of the last
+            lookup handed back for re-verification (time.monotonic()).
+        lastSeenAt: Time the label was last looked up or stored.
+    """
+    labelData: LabelData
+    verifiedAt: float
+    lastSeenAt: float
+
+
+class LabelResultCache:
+    """
+    LRU cache of validated LabelData keyed by QR text, with TTL.
+    """
+
+    def __init__(
+        self,
+        ttlMs: float = 10000.0,
+        maxEntries: int = 64,
+        reverifyIntervalMs: float = 0.0,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize LabelResultCache.
+
+        Args:
+            ttlMs: Time after the last sighting before an entry expires.
+            maxEntries: Maximum number of cached labels (LRU eviction).
+            reverifyIntervalMs: Run the full pipeline again for a cached label
+                once per interval (0 = never).
+            logger: Logger instance for debug output.
+        """
+        self._ttlSec = ttlMs / 1000.0
+        self._maxEntries = max(1, maxEntries)
+        self._reverifySec = reverifyIntervalMs / 1000.0
+        self._logger = logger or logging.getLogger(__name__)
+        self._entries: "OrderedDict[str, LabelCacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._reverifications = 0
+
+        self._logger.info(
+            f"LabelResultCache initialized "
+            f"(ttlMs={ttlMs}, maxEntries={maxEntries}, reverifyIntervalMs={reverifyIntervalMs})"
+        )
+
+    def lookup(self, qrText: str) -> Optional[LabelData]:
+        """
+        Get the cached result for a QR code.
+
+        Args:
+            qrText: Decoded QR text.
+
+        Returns:
+            Cached LabelData, or None on miss, expiry or when the entry is
+            due for re-verification.
+        """
+        if not qrText:
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(qrText)
+
+            if entry is None or now - entry.lastSeenAt > self._ttlSec:
+                self._entries.pop(qrText, None)
+                self._misses += 1
+                return None
+
+            entry.lastSeenAt = now
+            self._entries.move_to_end(qrText)
+
+            if self._reverifySec > 0 and now - entry.verifiedAt >= self._reverifySec:
+                # One frame re-verifies; the next ones hit until the next interval
+                entry.verifiedAt = now
+                self._reverifications += 1
+                self._logger.debug(f"Label cache re-verify: {qrText}")
+                return None
+
+            self._hits += 1
+            return entry.labelData
+
+    def store(self, qrText: str, labelData: Optional[LabelData]) -> bool:
+        """
+        Cache a result of the full pipeline if it is fully validated.
+
+        Args:
+            qrText: Decoded QR text.
+            labelData: Result of S8 postprocessing.
+
+        Returns:
+            True if the result was cached.
+        """
+        if not qrText or not self.isComplete(labelData):
+            return False
+
+        now = time.monotonic()
+        with self._lock:
+            self._entries[qrText] = LabelCacheEntry(
+                labelData=labelData,
+                verifiedAt=now,
+                lastSeenAt=now
+            )
+            self._entries.move_to_end(qrText)
+            while len(self._entries) > self._maxEntries:
+                self._entries.popitem(last=False)
+
+        self._logger.debug(f"Label cached: {qrText}")
+        return True
+
+    @staticmethod
+    def isComplete(labelData: Optional[LabelData]) -> bool:
+        """
+        Check if a result is fully validated (worth caching).
+
+        Args:
+            labelData: Result of S8 postprocessing.
+
+        Returns:
+            True if the QR/OCR positions match and product, size and color
+            were all matched.
+        """
+        return (
+            labelData is not None
+            and labelData.isValid
+            and bool(labelData.productCode)
+            and bool(labelData.size)
+            and bool(labelData.color)
+        )
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
+
+    def getStatistics(self) -> dict:
+        """
+        Get cache hit statistics.
+
+        Returns:
+            Dict with hits, misses, reverifications and entries.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "reverifications": self._reverifications,
+                "entries": len(self._entries)
+            }
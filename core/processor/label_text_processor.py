@@ -2,7 +2,8 @@
 Label Text Processor Implementation.
 
 This module post-processes OCR results by:
-1. Identifying field types (position/quantity, product, size, color)
+1. Identifying field types (position/quantity, product, size, color),
+   classifying each block once into a BlockFeatures record
 2. Applying fuzzy matching against known valid values
 3. Validating against QR code data
 4. Sequential field extraction with index tracking
@@ -14,8 +15,9 @@
 import re
 import json
 import logging
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from core.interfaces.text_processor_interface import (
     ITextProcessor, 
@@ -23,7 +25,51 @@
 )
 from core.interfaces.ocr_extractor_interface import TextBlock
 from core.interfaces.qr_detector_interface import QrDetectionResult
-from core.processor.fuzzy_matcher import FuzzyMatcher
+from core.processor.fuzzy_match_index import FuzzyMatchIndex, OCR_CONFUSION_MAP
+from core.processor.catalog_index_store import CatalogIndexStore
+from core.interfaces.similarity_backend_interface import ISimilarityBackend
+from core.processor.python_similarity_backend import PythonSimilarityBackend
+
+
+@dataclass
+class BlockFeatures:
+    """
+    One OCR block, normalized and classified once per frame.
+    
+    Attributes:
+        index: Index in the sorted blocks
+        text: Stripped text
+        upper: Stripped, uppercased text
+        confidence: OCR confidence
+        positionQuantity: (position, quantity) if "N/M" format
+        isProduct: Passes PRODUCT_PATTERN
+        productExact: Catalog product on exact hit
+        productConfusion: Catalog product on OCR-confusion key hit
+        productMatch: Fuzzy (match, score) against the product catalog
+        isSize: Passes SIZE_PATTERN
+        sizeExact: Exact hit in the size catalog
+        sizeConfusion: Catalog size on OCR-confusion key hit
+        sizeMatch: Fuzzy (match, score) against the size catalog
+        isColor: Passes COLOR_PATTERN (3+ chars)
+        colorExact: Exact hit in the color catalog
+        colorMatch: Fuzzy (match, score) against the color catalog
+    """
+    index: int
+    text: str
+    upper: str
+    confidence: float
+    positionQuantity: Optional[Tuple[int, int]] = None
+    isProduct: bool = False
+    productExact: Optional[str] = None
+    productConfusion: Optional[str] = None
+    productMatch: Tuple[str, float] = ("", 0.0)
+    isSize: bool = False
+    sizeExact: bool = False
+    sizeConfusion: Optional[str] = None
+    sizeMatch: Tuple[str, float] = ("", 0.0)
+    isColor: bool = False
+    colorExact: bool = False
+    colorMatch: Tuple[str, float] = ("", 0.0)
 
 
 class LabelTextProcessor(ITextProcessor):
@@ -58,6 +104,9 @@ class LabelTextProcessor(ITextProcessor):
     # Color: 3+ chars, letters with spaces and "/" only, no digits (e.g., "RED", "SOLID PREMIUM HEATHER")
     COLOR_PATTERN = re.compile(r'^[A-Za-z /]{3,}$')
     
+    # Confidence factor for OCR-confusion key hits ("5OOO" → "5000")
+    CONFUSION_CONFIDENCE = 0.9
+    
     def __init__(
         self,
         validProducts: Optional[List[str]] = None,
@@ -67,6 +116,8 @@ def __init__(
         sizesJsonPath: Optional[str] = None,
         colorsJsonPath: Optional[str] = None,
         minFuzzyScore: float = 0.90,  # Updated from 0.80 to 0.90
+        catalogIndexDir: Optional[str] = None,
+        similarityBackend: Optional[ISimilarityBackend] = None,
         logger: Optional[logging.Logger] = None
     ):
         """
@@ -80,6 +131,11 @@ def __init__(
             sizesJsonPath: Path to sizes JSON file
             colorsJsonPath: Path to colors JSON file
             minFuzzyScore: Minimum fuzzy match score (default: 0.90)
+            catalogIndexDir: Directory of compiled catalog index files; JSON
+                catalogs are then loaded from (and compiled into) index files
+                instead of being parsed (None = parse JSON on every start)
+            similarityBackend: String similarity backend for fuzzy matching
+                (None = pure-Python FuzzyMatcher)
             logger: Logger instance for debug output
         """
         self._logger = logger or logging.getLogger(__name__)
@@ -90,18 +146,56 @@ def __init__(
         self._validSizes = validSizes or []
         self._validColors = validColors or []
         
-        # Load from JSON files if paths provided
-        if productsJsonPath:
+        # Precompiled index files (rebuilt when the JSON hash changes)
+        store = CatalogIndexStore(catalogIndexDir, self._logger) if catalogIndexDir else None
+        productIndex = sizeIndex = colorIndex = None
+        if store and productsJsonPath:
+            productIndex = store.load(productsJsonPath, 'Code', confusionMap=OCR_CONFUSION_MAP)
+        if store and sizesJsonPath:
+            sizeIndex = store.load(sizesJsonPath, 'name', upper=True, confusionMap=OCR_CONFUSION_MAP)
+        if store and colorsJsonPath:
+            colorIndex = store.load(colorsJsonPath, 'name', upper=True)
+        
+        # Load from JSON files if paths provided (and no index file was loaded)
+        if productsJsonPath and productIndex is None:
             self._loadProducts(productsJsonPath)
-        if sizesJsonPath:
+        if sizesJsonPath and sizeIndex is None:
             self._loadSizes(sizesJsonPath)
-        if colorsJsonPath:
+        if colorsJsonPath and colorIndex is None:
             self._loadColors(colorsJsonPath)
         
+        # Prebuilt indexes: exact-hit hashing and pruned fuzzy matching;
+        # products and sizes also by OCR-confusion key (O/0, I/1/L, S/5, B/8)
+        if productIndex is None:
+            productIndex = FuzzyMatchIndex(self._validProducts, OCR_CONFUSION_MAP)
+        if sizeIndex is None:
+            sizeIndex = FuzzyMatchIndex(self._validSizes, OCR_CONFUSION_MAP)
+        if colorIndex is None:
+            colorIndex = FuzzyMatchIndex(self._validColors)
+        
+        # Backend is a runtime choice (not stored in compiled index files)
+        self._similarityBackend = similarityBackend or PythonSimilarityBackend()
+        for index in (productIndex, sizeIndex, colorIndex):
+            index.backend = self._similarityBackend
+        
+        self._productIndex = productIndex
+        self._sizeIndex = sizeIndex
+        self._colorIndex = colorIndex
+        self._validProducts = self._productIndex.candidates
+        self._validSizes = self._sizeIndex.candidates
+        self._validColors = self._colorIndex.candidates
+        
+        # Per-field lookup outcome counters (S8 debug output)
+        self._matchCounts = {
+            field: {"lookups": 0, "exactHits": 0, "confusionHits": 0, "fuzzyHits": 0}
+            for field in ('productCode', 'size', 'color')
+        }
+        
         self._logger.info(
             f"LabelTextProcessor initialized with {len(self._validProducts)} products, "
             f"{len(self._validSizes)} sizes, {len(self._validColors)} colors, "
-            f"minFuzzyScore={minFuzzyScore}"
+            f"minFuzzyScore={minFuzzyScore}, "
+            f"similarityBackend={self._similarityBackend.getBackendName()}"
         )
     
     def _loadProducts(self, jsonPath: str) -> None:
@@ -158,7 +252,8 @@ def _loadColors(self, jsonPath: str) -> None:
     def process(
         self, 
         textBlocks: List[TextBlock], 
-        qrResult: QrDetectionResult
+        qrResult: QrDetectionResult,
+        positionHint: Optional[Tuple[int, int]] = None
     ) -> LabelData:
         """
         Process OCR text blocks and create structured label data.
@@ -173,6 +268,9 @@ def process(
         Args:
             textBlocks: List of text blocks from OCR
             qrResult: QR detection result for validation
+            positionHint: Known (position, quantity) used when no block
+                contains it; product/size/color are then searched from
+                the first block
             
         Returns:
             LabelData with structured and validated label information
@@ -197,31 +295,44 @@ def process(
         # Track used indexes to avoid reusing blocks
         usedIndexes = set()
         
+        # Normalize, regex-classify and fuzzy-match every block once; the
+        # phases below only select from these records
+        features = self._classifyBlocks(sortedBlocks)
+        
         # PHASE 1: Extract Position/Quantity (REQUIRED)
         indexPosition, position, quantity, posConfidence = self._extractPositionQuantity(
-            sortedBlocks, qrResult
+            features, qrResult
         )
         
-        if indexPosition == -1:
+        if indexPosition == -1 and positionHint is not None:
+            # Known from earlier frames: search the other fields from block 0
+            position, quantity = positionHint
+            result.positionQuantity = f"{position}/{quantity}"
+            result.ocrPosition = position
+            result.quantity = quantity
+            self._logger.info(f"Phase 1: Position/quantity from hint: {result.positionQuantity}")
+        
+        elif indexPosition == -1:
             # Position/quantity NOT found → STOP processing
             self._logger.warning("Position/quantity not found - stopping processing")
             result.isValid = False
             return result
         
-        # Position/quantity found
-        result.positionQuantity = f"{position}/{quantity}"
-        result.ocrPosition = position
-        result.quantity = quantity
-        result.fieldConfidences['positionQuantity'] = posConfidence
-        usedIndexes.add(indexPosition)
-        
-        self._logger.info(
-            f"Phase 1: Position/quantity found at index {indexPosition}: {result.positionQuantity}"
-        )
+        else:
+            # Position/quantity found
+            result.positionQuantity = f"{position}/{quantity}"
+            result.ocrPosition = position
+            result.quantity = quantity
+            result.fieldConfidences['positionQuantity'] = posConfidence
+            usedIndexes.add(indexPosition)
+            
+            self._logger.info(
+                f"Phase 1: Position/quantity found at index {indexPosition}: {result.positionQuantity}"
+            )
         
         # PHASE 2: Extract Product (from position_index + 1)
         indexProduct = self._extractProduct(
-            sortedBlocks, startIndex=indexPosition + 1, usedIndexes=usedIndexes, result=result
+            features, startIndex=indexPosition + 1, usedIndexes=usedIndexes, result=result
         )
         
         if indexProduct != -1:
@@ -233,7 +344,7 @@ def process(
         # PHASE 3: Extract Size (from max(product_index + 1, position_index + 1))
         startIndex = max(indexProduct + 1, indexPosition + 1) if indexProduct != -1 else indexPosition + 1
         indexSize = self._extractSize(
-            sortedBlocks, startIndex=startIndex, usedIndexes=usedIndexes, result=result
+            features, startIndex=startIndex, usedIndexes=usedIndexes, result=result
         )
         
         if indexSize != -1:
@@ -249,7 +360,7 @@ def process(
             indexPosition + 1
         )
         indexColor = self._extractColor(
-            sortedBlocks, startIndex=startIndex, usedIndexes=usedIndexes, result=result
+            features, startIndex=startIndex, usedIndexes=usedIndexes, result=result
         )
         
         if indexColor != -1:
@@ -261,15 +372,15 @@ def process(
         # PHASE 5: Fallback for unmatched fields (excluding used indexes)
         if not result.productCode:
             self._logger.debug("Phase 5: Trying fallback for Product")
-            self._fallbackExtractProduct(sortedBlocks, usedIndexes, result)
+            self._fallbackExtractProduct(features, usedIndexes, result)
         
         if not result.size:
             self._logger.debug("Phase 5: Trying fallback for Size")
-            self._fallbackExtractSize(sortedBlocks, usedIndexes, result)
+            self._fallbackExtractSize(features, usedIndexes, result)
         
         if not result.color:
             self._logger.debug("Phase 5: Trying fallback for Color")
-            self._fallbackExtractColor(sortedBlocks, usedIndexes, result)
+            self._fallbackExtractColor(features, usedIndexes, result)
         
         # Validate: qrPosition should match ocrPosition
         result.isValid = (
@@ -285,9 +396,106 @@ def process(
         return result
     
     
+    def getMatchStatistics(self) -> Dict[str, dict]:
+        """
+        Get per-field catalog lookup outcomes since start.
+        
+        Returns:
+            Dict of field name -> lookups (blocks passing the field regex),
+            exactHits, confusionHits, fuzzyHits and the matching rates
+        """
+        statistics = {}
+        for field, counts in self._matchCounts.items():
+            lookups = max(1, counts["lookups"])
+            statistics[field] = dict(
+                counts,
+                exactHitRate=counts["exactHits"] / lookups,
+                confusionHitRate=counts["confusionHits"] / lookups,
+                fuzzyHitRate=counts["fuzzyHits"] / lookups
+            )
+        return statistics
+    
+    def _classifyBlocks(self, sortedBlocks: List[TextBlock]) -> List[BlockFeatures]:
+        """
+        Normalize and classify every block once.
+        
+        Applies the position/quantity, product, size and color regexes,
+        resolves exact catalog hits and batch-matches each catalog over the
+        blocks that pass its regex, so every extraction phase only selects
+        from the resulting records.
+        
+        Args:
+            sortedBlocks: List of sorted text blocks
+            
+        Returns:
+            One BlockFeatures per block, in the same order
+        """
+        features = []
+        for i, block in enumerate(sortedBlocks):
+            text = block.text.strip()
+            upper = text.upper()
+            
+            record = BlockFeatures(
+                index=i,
+                text=text,
+                upper=upper,
+                confidence=block.confidence
+            )
+            
+            match = self.POSITION_QUANTITY_PATTERN.match(text)
+            if match:
+                record.positionQuantity = (int(match.group(1)), int(match.group(2)))
+            
+            record.isProduct = bool(self.PRODUCT_PATTERN.match(text))
+            if record.isProduct and (text in self._productIndex or upper in self._productIndex):
+                record.productExact = upper if upper in self._productIndex else text
+            elif record.isProduct:
+                record.productConfusion = self._productIndex.confusionMatch(upper)
+            
+            record.isSize = bool(self.SIZE_PATTERN.match(upper))
+            record.sizeExact = record.isSize and upper in self._sizeIndex
+            if record.isSize and not record.sizeExact:
+                record.sizeConfusion = self._sizeIndex.confusionMatch(upper)
+            
+            record.isColor = bool(self.COLOR_PATTERN.match(upper)) and len(upper) >= 3
+            record.colorExact = record.isColor and upper in self._colorIndex
+            
+            features.append(record)
+        
+        # Fuzzy matches only for blocks without an exact or confusion hit:
+        # one batch call per catalog, shared by all phases
+        for field, accepts, exact, confusion, attribute, index in (
+            ('productCode', 'isProduct', 'productExact', 'productConfusion',
+             'productMatch', self._productIndex),
+            ('size', 'isSize', 'sizeExact', 'sizeConfusion', 'sizeMatch', self._sizeIndex),
+            ('color', 'isColor', 'colorExact', None, 'colorMatch', self._colorIndex),
+        ):
+            records = [record for record in features if getattr(record, accepts)]
+            exactHits = [record for record in records if getattr(record, exact)]
+            confusionHits = [
+                record for record in records
+                if confusion and not getattr(record, exact) and getattr(record, confusion)
+            ]
+            pending = [
+                record for record in records
+                if not getattr(record, exact) and not (confusion and getattr(record, confusion))
+            ]
+            
+            matches = index.bestMatches([record.upper for record in pending], self._minFuzzyScore)
+            for record, matched in zip(pending, matches):
+                setattr(record, attribute, matched)
+            
+            counts = self._matchCounts[field]
+            counts["lookups"] += len(records)
+            counts["exactHits"] += len(exactHits)
+            counts["confusionHits"] += len(confusionHits)
+            counts["fuzzyHits"] += sum(1 for matched, _ in matches if matched)
+        
+        return features
+    
     def _extractPositionQuantity(
         self,
-        sortedBlocks: List[TextBlock],
+        features: List[BlockFeatures],
         qrResult: QrDetectionResult
     ) -> Tuple[int, int, int, float]:
         """
@@ -302,7 +510,7 @@ def _extractPositionQuantity(
         All cases MUST satisfy: quantity >= position
         
         Args:
-            sortedBlocks: List of sorted text blocks
+            features: Classified blocks from _classifyBlocks()
             qrResult: QR detection result for validation
             
         Returns:
@@ -314,15 +522,14 @@ def _extractPositionQuantity(
         
         self._logger.debug(f"Extracting position/quantity (QR position: {qrPosition})")
         
-        for i, block in enumerate(sortedBlocks):
-            text = block.text.strip()
-            confidence = block.confidence
+        for record in features:
+            i = record.index
+            text = record.text
+            confidence = record.confidence
             
             # Case 1: Standard format "3/5"
-            match = self.POSITION_QUANTITY_PATTERN.match(text)
-            if match:
-                position = int(match.group(1))
-                quantity = int(match.group(2))
+            if record.positionQuantity:
+                position, quantity = record.positionQuantity
                 
                 # Validate: quantity >= position
                 if quantity < position:
@@ -390,24 +597,21 @@ def _extractPositionQuantity(
         # Fallback: Scan all remaining blocks for strict "number/number" format
         self._logger.debug("Position/quantity not found in first pass - trying fallback")
         
-        for i, block in enumerate(sortedBlocks):
-            text = block.text.strip()
-            confidence = block.confidence
+        for record in features:
+            if not record.positionQuantity:
+                continue
             
-            match = self.POSITION_QUANTITY_PATTERN.match(text)
-            if match:
-                position = int(match.group(1))
-                quantity = int(match.group(2))
-                
-                # Validate: quantity >= position
-                if quantity < position:
-                    self._logger.debug(
-                        f"[Fallback] Invalid: {text} (quantity {quantity} < position {position})"
-                    )
-                    continue
-                
-                self._logger.info(f"[Fallback] Found position/quantity at index {i}: {text}")
-                return (i, position, quantity, confidence * 0.8)
+            position, quantity = record.positionQuantity
+            
+            # Validate: quantity >= position
+            if quantity < position:
+                self._logger.debug(
+                    f"[Fallback] Invalid: {record.text} (quantity {quantity} < position {position})"
+                )
+                continue
+            
+            self._logger.info(f"[Fallback] Found position/quantity at index {record.index}: {record.text}")
+            return (record.index, position, quantity, record.confidence * 0.8)
         
         # Not found
         self._logger.warning("Position/quantity NOT found after all attempts")
@@ -415,7 +619,7 @@ def _extractPositionQuantity(
     
     def _extractProduct(
         self,
-        sortedBlocks: List[TextBlock],
+        features: List[BlockFeatures],
         startIndex: int,
         usedIndexes: set,
         result: LabelData
@@ -426,10 +630,11 @@ def _extractProduct(
         Uses:
         1. Regex pattern validation
         2. Exact match in valid products
-        3. Fuzzy match with threshold 0.9
+        3. OCR-confusion key lookup (O/0, I/1/L, S/5, B/8)
+        4. Fuzzy match with threshold 0.9
         
         Args:
-            sortedBlocks: List of sorted text blocks
+            features: Classified blocks from _classifyBlocks()
             startIndex: Index to start searching from
             usedIndexes: Set of already used indexes
             result: LabelData to update
@@ -437,35 +642,34 @@ def _extractProduct(
         Returns:
             Index where product was found, or -1 if not found
         """
-        for i in range(startIndex, len(sortedBlocks)):
-            if i in usedIndexes:
-                continue
-            
-            text = sortedBlocks[i].text.strip()
-            confidence = sortedBlocks[i].confidence
-            
-            # Check regex pattern first
-            if not self.PRODUCT_PATTERN.match(text):
+        for record in features[startIndex:]:
+            i = record.index
+            if i in usedIndexes or not record.isProduct:
                 continue
             
             # Try exact match
-            if text in self._validProducts or text.upper() in self._validProducts:
-                result.productCode = text.upper() if text.upper() in self._validProducts else text
-                result.fieldConfidences['productCode'] = confidence
-                self._logger.debug(f"[Product] Exact match at index {i}: {text}")
+            if record.productExact:
+                result.productCode = record.productExact
+                result.fieldConfidences['productCode'] = record.confidence
+                self._logger.debug(f"[Product] Exact match at index {i}: {record.text}")
+                return i
+            
+            # Try OCR-confusion key lookup ("5OOO" → "5000")
+            if record.productConfusion:
+                result.productCode = record.productConfusion
+                result.fieldConfidences['productCode'] = record.confidence * self.CONFUSION_CONFIDENCE
+                self._logger.debug(
+                    f"[Product] Confusion match at index {i}: {record.text} → {record.productConfusion}"
+                )
                 return i
             
             # Try fuzzy match
-            matched, score = FuzzyMatcher.bestMatch(
-                text.upper(), 
-                self._validProducts, 
-                self._minFuzzyScore
-            )
+            matched, score = record.productMatch
             if matched:
                 result.productCode = matched
-                result.fieldConfidences['productCode'] = confidence * score
+                result.fieldConfidences['productCode'] = record.confidence * score
                 self._logger.debug(
-                    f"[Product] Fuzzy match at index {i}: {text} → {matched} (score: {score:.3f})"
+                    f"[Product] Fuzzy match at index {i}: {record.text} → {matched} (score: {score:.3f})"
                 )
                 return i
         
@@ -473,7 +677,7 @@ def _extractProduct(
     
     def _extractSize(
         self,
-        sortedBlocks: List[TextBlock],
+        features: List[BlockFeatures],
         startIndex: int,
         usedIndexes: set,
         result: LabelData
@@ -484,10 +688,11 @@ def _extractSize(
         Uses:
         1. Regex pattern validation
         2. Exact match in valid sizes
-        3. Fuzzy match with threshold 0.9
+        3. OCR-confusion key lookup (O/0, I/1/L, S/5, B/8)
+        4. Fuzzy match with threshold 0.9
         
         Args:
-            sortedBlocks: List of sorted text blocks
+            features: Classified blocks from _classifyBlocks()
             startIndex: Index to start searching from
             usedIndexes: Set of already used indexes
             result: LabelData to update
@@ -495,35 +700,34 @@ def _extractSize(
         Returns:
             Index where size was found, or -1 if not found
         """
-        for i in range(startIndex, len(sortedBlocks)):
-            if i in usedIndexes:
-                continue
-            
-            text = sortedBlocks[i].text.strip().upper()
-            confidence = sortedBlocks[i].confidence
-            
-            # Check regex pattern first
-            if not self.SIZE_PATTERN.match(text):
+        for record in features[startIndex:]:
+            i = record.index
+            if i in usedIndexes or not record.isSize:
                 continue
             
             # Try exact match
-            if text in self._validSizes:
-                result.size = text
-                result.fieldConfidences['size'] = confidence
-                self._logger.debug(f"[Size] Exact match at index {i}: {text}")
+            if record.sizeExact:
+                result.size = record.upper
+                result.fieldConfidences['size'] = record.confidence
+                self._logger.debug(f"[Size] Exact match at index {i}: {record.upper}")
+                return i
+            
+            # Try OCR-confusion key lookup ("5OOO" → "5000")
+            if record.sizeConfusion:
+                result.size = record.sizeConfusion
+                result.fieldConfidences['size'] = record.confidence * self.CONFUSION_CONFIDENCE
+                self._logger.debug(
+                    f"[Size] Confusion match at index {i}: {record.upper} → {record.sizeConfusion}"
+                )
                 return i
             
             # Try fuzzy match
-            matched, score = FuzzyMatcher.bestMatch(
-                text, 
-                self._validSizes, 
-                self._minFuzzyScore
-            )
+            matched, score = record.sizeMatch
             if matched:
                 result.size = matched
-                result.fieldConfidences['size'] = confidence * score
+                result.fieldConfidences['size'] = record.confidence * score
                 self._logger.debug(
-                    f"[Size] Fuzzy match at index {i}: {text} → {matched} (score: {score:.3f})"
+                    f"[Size] Fuzzy match at index {i}: {record.upper} → {matched} (score: {score:.3f})"
                 )
                 return i
         
@@ -531,7 +735,7 @@ def _extractSize(
     
     def _extractColor(
         self,
-        sortedBlocks: List[TextBlock],
+        features: List[BlockFeatures],
         startIndex: int,
         usedIndexes: set,
         result: LabelData
@@ -545,7 +749,7 @@ def _extractColor(
         3. Fuzzy match with threshold 0.9
         
         Args:
-            sortedBlocks: List of sorted text blocks
+            features: Classified blocks from _classifyBlocks()
             startIndex: Index to start searching from
             usedIndexes: Set of already used indexes
             result: LabelData to update
@@ -553,35 +757,25 @@ def _extractColor(
         Returns:
             Index where color was found, or -1 if not found
         """
-        for i in range(startIndex, len(sortedBlocks)):
-            if i in usedIndexes:
-                continue
-            
-            text = sortedBlocks[i].text.strip().upper()
-            confidence = sortedBlocks[i].confidence
-            
-            # Check regex pattern first (min 3 chars, no digits)
-            if not self.COLOR_PATTERN.match(text) or len(text) < 3:
+        for record in features[startIndex:]:
+            i = record.index
+            if i in usedIndexes or not record.isColor:
                 continue
             
             # Try exact match
-            if text in self._validColors:
-                result.color = text
-                result.fieldConfidences['color'] = confidence
-                self._logger.debug(f"[Color] Exact match at index {i}: {text}")
+            if record.colorExact:
+                result.color = record.upper
+                result.fieldConfidences['color'] = record.confidence
+                self._logger.debug(f"[Color] Exact match at index {i}: {record.upper}")
                 return i
             
             # Try fuzzy match
-            matched, score = FuzzyMatcher.bestMatch(
-                text, 
-                self._validColors, 
-                self._minFuzzyScore
-            )
+            matched, score = record.colorMatch
             if matched:
                 result.color = matched
-                result.fieldConfidences['color'] = confidence * score
+                result.fieldConfidences['color'] = record.confidence * score
                 self._logger.debug(
-                    f"[Color] Fuzzy match at index {i}: {text} → {matched} (score: {score:.3f})"
+                    f"[Color] Fuzzy match at index {i}: {record.upper} → {matched} (score: {score:.3f})"
                 )
                 return i
         
@@ -589,99 +783,111 @@ def _extractColor(
     
     def _fallbackExtractProduct(
         self,
-        sortedBlocks: List[TextBlock],
+        features: List[BlockFeatures],
         usedIndexes: set,
         result: LabelData
     ) -> None:
         """
         Fallback: scan all unused blocks for product.
         
+        OCR-confusion hits are taken only when no block has an exact or
+        fuzzy match, so they never override a block the scan would accept.
+        
         Args:
-            sortedBlocks: List of sorted text blocks
+            features: Classified blocks from _classifyBlocks()
             usedIndexes: Set of already used indexes
             result: LabelData to update
         """
-        for i, block in enumerate(sortedBlocks):
-            if i in usedIndexes:
-                continue
-            
-            text = block.text.strip()
-            confidence = block.confidence
-            
-            # Check regex pattern first
-            if not self.PRODUCT_PATTERN.match(text):
+        confusionRecord = None
+        for record in features:
+            i = record.index
+            if i in usedIndexes or not record.isProduct:
                 continue
             
             # Try exact match
-            if text in self._validProducts or text.upper() in self._validProducts:
-                result.productCode = text.upper() if text.upper() in self._validProducts else text
-                result.fieldConfidences['productCode'] = confidence * 0.8
-                self._logger.info(f"[Fallback Product] Exact match at index {i}: {text}")
+            if record.productExact:
+                result.productCode = record.productExact
+                result.fieldConfidences['productCode'] = record.confidence * 0.8
+                self._logger.info(f"[Fallback Product] Exact match at index {i}: {record.text}")
                 return
             
+            # Remember the first OCR-confusion hit ("5OOO" → "5000")
+            if record.productConfusion and confusionRecord is None:
+                confusionRecord = record
+            
             # Try fuzzy match
-            matched, score = FuzzyMatcher.bestMatch(
-                text.upper(), 
-                self._validProducts, 
-                self._minFuzzyScore
-            )
+            matched, score = record.productMatch
             if matched:
                 result.productCode = matched
-                result.fieldConfidences['productCode'] = confidence * score * 0.8
+                result.fieldConfidences['productCode'] = record.confidence * score * 0.8
                 self._logger.info(
-                    f"[Fallback Product] Fuzzy match at index {i}: {text} → {matched} (score: {score:.3f})"
+                    f"[Fallback Product] Fuzzy match at index {i}: {record.text} → {matched} (score: {score:.3f})"
                 )
                 return
+        
+        if confusionRecord is not None:
+            result.productCode = confusionRecord.productConfusion
+            result.fieldConfidences['productCode'] = confusionRecord.confidence * self.CONFUSION_CONFIDENCE * 0.8
+            self._logger.info(
+                f"[Fallback Product] Confusion match at index {confusionRecord.index}: "
+                f"{confusionRecord.text} → {confusionRecord.productConfusion}"
+            )
     
     def _fallbackExtractSize(
         self,
-        sortedBlocks: List[TextBlock],
+        features: List[BlockFeatures],
         usedIndexes: set,
         result: LabelData
     ) -> None:
         """
         Fallback: scan all unused blocks for size.
         
+        OCR-confusion hits are taken only when no block has an exact or
+        fuzzy match, so they never override a block the scan would accept.
+        
         Args:
-            sortedBlocks: List of sorted text blocks
+            features: Classified blocks from _classifyBlocks()
             usedIndexes: Set of already used indexes
             result: LabelData to update
         """
-        for i, block in enumerate(sortedBlocks):
-            if i in usedIndexes:
-                continue
-            
-            text = block.text.strip().upper()
-            confidence = block.confidence
-            
-            # Check regex pattern first
-            if not self.SIZE_PATTERN.match(text):
+        confusionRecord = None
+        for record in features:
+            i = record.index
+            if i in usedIndexes or not record.isSize:
                 continue
             
             # Try exact match
-            if text in self._validSizes:
-                result.size = text
-                result.fieldConfidences['size'] = confidence * 0.8
-                self._logger.info(f"[Fallback Size] Exact match at index {i}: {text}")
+            if record.sizeExact:
+                result.size = record.upper
+                result.fieldConfidences['size'] = record.confidence * 0.8
+                self._logger.info(f"[Fallback Size] Exact match at index {i}: {record.upper}")
                 return
             
+            # Remember the first OCR-confusion hit ("5OOO" → "5000")
+            if record.sizeConfusion and confusionRecord is None:
+                confusionRecord = record
+            
             # Try fuzzy match
-            matched, score = FuzzyMatcher.bestMatch(
-                text, 
-                self._validSizes, 
-                self._minFuzzyScore
-            )
+            matched, score = record.sizeMatch
             if matched:
                 result.size = matched
-                result.fieldConfidences['size'] = confidence * score * 0.8
+                result.fieldConfidences['size'] = record.confidence * score * 0.8
                 self._logger.info(
-                    f"[Fallback Size] Fuzzy match at index {i}: {text} → {matched} (score: {score:.3f})"
+                    f"[Fallback Size] Fuzzy match at index {i}: {record.upper} → {matched} (score: {score:.3f})"
                 )
                 return
+        
+        if confusionRecord is not None:
+            result.size = confusionRecord.sizeConfusion
+            result.fieldConfidences['size'] = confusionRecord.confidence * self.CONFUSION_CONFIDENCE * 0.8
+            self._logger.info(
+                f"[Fallback Size] Confusion match at index {confusionRecord.index}: "
+                f"{confusionRecord.upper} → {confusionRecord.sizeConfusion}"
+            )
     
     def _fallbackExtractColor(
         self,
-        sortedBlocks: List[TextBlock],
+        features: List[BlockFeatures],
         usedIndexes: set,
         result: LabelData
     ) -> None:
@@ -689,38 +895,28 @@ def _fallbackExtractColor(
         Fallback: scan all unused blocks for color.
         
         Args:
-            sortedBlocks: List of sorted text blocks
+            features: Classified blocks from _classifyBlocks()
             usedIndexes: Set of already used indexes
             result: LabelData to update
         """
-        for i, block in enumerate(sortedBlocks):
-            if i in usedIndexes:
-                continue
-            
-            text = block.text.strip().upper()
-            confidence = block.confidence
-            
-            # Check regex pattern first (min 3 chars, no digits)
-            if not self.COLOR_PATTERN.match(text) or len(text) < 3:
+        for record in features:
+            i = record.index
+            if i in usedIndexes or not record.isColor:
                 continue
             
             # Try exact match
-            if text in self._validColors:
-                result.color = text
-                result.fieldConfidences['color'] = confidence * 0.8
-                self._logger.info(f"[Fallback Color] Exact match at index {i}: {text}")
+            if record.colorExact:
+                result.color = record.upper
+                result.fieldConfidences['color'] = record.confidence * 0.8
+                self._logger.info(f"[Fallback Color] Exact match at index {i}: {record.upper}")
                 return
             
             # Try fuzzy match
-            matched, score = FuzzyMatcher.bestMatch(
-                text, 
-                self._validColors, 
-                self._minFuzzyScore
-            )
+            matched, score = record.colorMatch
             if matched:
                 result.color = matched
-                result.fieldConfidences['color'] = confidence * score * 0.8
+                result.fieldConfidences['color'] = record.confidence * score * 0.8
                 self._logger.info(
-                    f"[Fallback Color] Fuzzy match at index {i}: {text} → {matched} (score: {score:.3f})"
+                    f"[Fallback Color] Fuzzy match at index {i}: {record.upper} → {matched} (score: {score:.3f})"
                 )
                 return
@@ -0,0 +1,28 @@
+"""
+Python Similarity Backend.
+
+Pure-Python ISimilarityBackend delegating to the FuzzyMatcher static
+methods. Always available; reference implementation for other backends.
+
+Follows the Single Responsibility Principle (SRP) from SOLID.
+"""
+
+from typing import Optional
+
+from core.interfaces.similarity_backend_interface import ISimilarityBackend
+from core.processor.fuzzy_matcher import FuzzyMatcher
+
+
+class PythonSimilarityBackend(ISimilarityBackend):
+    """
+    Similarity backend running the FuzzyMatcher kernels.
+    """
+
+    def combinedSimilarity(self, a: str, b: str) -> float:
+        return FuzzyMatcher.combinedSimilarity(a, b)
+
+    def boundedCombinedSimilarity(self, a: str, b: str, minScore: float) -> Optional[float]:
+        return FuzzyMatcher.boundedCombinedSimilarity(a, b, minScore)
+
+    def getBackendName(self) -> str:
+        return "python"
@@ -0,0 +1,107 @@
+"""
+Similarity Backend Factory Module
+
+Factory function for creating the string similarity backend of S8 catalog
+matching. Supports the pure-Python FuzzyMatcher kernels and RapidFuzz.
+
+Backends return identical scores; "auto" picks RapidFuzz when installed
+and falls back to Python otherwise (as does "rapidfuzz" when missing).
+"python" is the default: FuzzyMatchIndex leaves about one candidate per
+query to full scoring, so the compiled kernel does not shorten S8.
+
+Follows:
+- OCP (Open/Closed Principle): Easy to extend with new backends
+- DIP (Dependency Inversion): Returns ISimilarityBackend interface
+- Factory Pattern: Encapsulates object creation logic
+"""
+
+import logging
+from typing import List
+
+from core.interfaces.similarity_backend_interface import ISimilarityBackend
+from core.processor.python_similarity_backend import PythonSimilarityBackend
+
+
+logger = logging.getLogger(__name__)
+
+
+def createSimilarityBackend(backend: str = "python") -> ISimilarityBackend:
+    """
+    Factory function to create a similarity backend.
+
+    Supports:
+    - "python": FuzzyMatcher kernels (always available, default)
+    - "rapidfuzz": Compiled Levenshtein from RapidFuzz
+    - "auto": RapidFuzz if installed, else Python
+
+    Args:
+        backend: Backend name ("auto", "python" or "rapidfuzz").
+
+    Returns:
+        ISimilarityBackend: Backend instance.
+
+    Raises:
+        ValueError: If backend is invalid or not supported.
+    """
+    # Normalize backend name
+    backend = backend.lower().strip()
+
+    # Validate backend
+    supportedBackends = getSupportedSimilarityBackends()
+    if backend not in supportedBackends:
+        errorMsg = (
+            f"Invalid similarity backend: '{backend}'. "
+            f"Supported backends: {supportedBackends}"
+        )
+        logger.error(errorMsg)
+        raise ValueError(errorMsg)
+
+    if backend in ("auto", "rapidfuzz"):
+        try:
+            from core.processor.rapidfuzz_similarity_backend import RapidFuzzSimilarityBackend
+            logger.info("Creating similarity backend (backend=rapidfuzz)")
+            return RapidFuzzSimilarityBackend()
+        except ImportError as e:
+            if backend == "rapidfuzz":
+                logger.warning(
+                    f"RapidFuzz is not installed ({e}), falling back to the Python "
+                    "similarity backend. Install with: pip install rapidfuzz"
+                )
+
+    logger.info("Creating similarity backend (backend=python)")
+    return PythonSimilarityBackend()
+
+
+def getSupportedSimilarityBackends() -> List[str]:
+    """
+    Get list of supported similarity backend names.
+
+    Returns:
+        List[str]: List of backend names ["auto", "python", "rapidfuzz"].
+    """
+    return ["auto", "python", "rapidfuzz"]
+
+
+def isSimilarityBackendAvailable(backend: str) -> bool:
+    """
+    Check if a similarity backend is available (library installed).
+
+    Args:
+        backend: Backend name ("auto", "python" or "rapidfuzz").
+
+    Returns:
+        bool: True if backend library is installed and available.
+    """
+    backend = backend.lower().strip()
+
+    if backend in ("auto", "python"):
+        return True
+
+    elif backend == "rapidfuzz":
+        try:
+            import rapidfuzz
+            return True
+        except ImportError:
+            return False
+
+    return False
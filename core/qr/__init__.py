@@ -2,18 +2,35 @@
 
 from core.qr.zxing_qr_detector import ZxingQrDetector
 from core.qr.wechat_qr_detector import WechatQrDetector
+from core.qr.cascade_qr_detector import CascadeQrDetector
+from core.qr.concurrent_qr_detector import ConcurrentQrDetector
+from core.qr.multi_scale_qr_detector import MultiScaleQrDetector
+from core.qr.thread_local_qr_detector import ThreadLocalQrDetector
 from core.qr.qr_detector_factory import (
     createQrDetector,
     getSupportedQrBackends,
     isQrBackendAvailable
 )
 from core.qr.qr_image_preprocessor import QrImagePreprocessor
+from core.qr.qr_geometry import QrImageTransform, mapQrResultToOriginal, mapQrResultAffine
+from core.qr.qr_roi_locator import QrRoiLocator, QrSearchRegion
+from core.qr.qr_result_cache import QrResultCache
 
 __all__ = [
     'ZxingQrDetector',
     'WechatQrDetector',
+    'CascadeQrDetector',
+    'ConcurrentQrDetector',
+    'MultiScaleQrDetector',
+    'ThreadLocalQrDetector',
     'createQrDetector',
     'getSupportedQrBackends',
     'isQrBackendAvailable',
-    'QrImagePreprocessor'
+    'QrImagePreprocessor',
+    'QrImageTransform',
+    'mapQrResultToOriginal',
+    'mapQrResultAffine',
+    'QrRoiLocator',
+    'QrSearchRegion',
+    'QrResultCache'
 ]
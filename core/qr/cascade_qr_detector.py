@@ -0,0 +1,230 @@
+"""
+Cascade QR Code Detector Implementation.
+
+This module provides a QR detector that tries a sequence of
+(backend, preprocessing) stages and stops at the first successful decode,
+e.g. zxing minimal → zxing full → wechat.
+
+Per-stage success-rate and latency statistics are kept so that, once every
+stage has enough samples, the stage with the lowest expected cost
+(average latency / success rate) runs first. Every explorationInterval
+frames the least-sampled stage runs first instead, so stages that fell
+behind keep fresh statistics and can win back their place.
+
+Follows the Single Responsibility Principle (SRP) from SOLID.
+"""
+
+import time
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Optional, List, Dict, Any
+
+import numpy as np
+
+from core.interfaces.qr_detector_interface import IQrDetector, QrDetectionResult
+from core.qr.qr_image_preprocessor import QrImagePreprocessor
+from core.qr.qr_geometry import mapQrResultToOriginal
+
+
+@dataclass
+class QrCascadeStage:
+    """
+    One stage of the QR cascade.
+
+    Attributes:
+        name: Stage name used in logs and statistics (e.g. "zxing/minimal").
+        detector: Backend detector for this stage.
+        preprocessor: Optional preprocessor applied before detection.
+    """
+    name: str
+    detector: IQrDetector
+    preprocessor: Optional[QrImagePreprocessor] = None
+
+
+@dataclass
+class QrStageStatistics:
+    """
+    Running statistics for a cascade stage.
+
+    Attributes:
+        name: Stage name.
+        attempts: Number of times the stage was run.
+        successes: Number of successful decodes.
+        totalTimeMs: Accumulated latency in milliseconds.
+    """
+    name: str
+    attempts: int = 0
+    successes: int = 0
+    totalTimeMs: float = 0.0
+
+    @property
+    def successRate(self) -> float:
+        """Fraction of attempts that decoded a QR code."""
+        return self.successes / self.attempts if self.attempts > 0 else 0.0
+
+    @property
+    def avgTimeMs(self) -> float:
+        """Average latency per attempt in milliseconds."""
+        return self.totalTimeMs / self.attempts if self.attempts > 0 else 0.0
+
+    @property
+    def expectedCost(self) -> float:
+        """Expected latency per successful decode (lower runs first)."""
+        return self.avgTimeMs / max(self.successRate, 1e-3)
+
+
+class CascadeQrDetector(IQrDetector):
+    """
+    QR code detector that runs several backends in sequence.
+
+    Each stage returns coordinates in the coordinate system of the image
+    passed to detect(), regardless of the stage's own preprocessing.
+
+    Ordering:
+    - Configured order until every stage has minAttempts samples
+    - Then sorted by expectedCost when adaptiveOrdering is enabled
+    - Every explorationInterval frames, least-sampled stage first
+    """
+
+    def __init__(
+        self,
+        stages: List[QrCascadeStage],
+        adaptiveOrdering: bool = True,
+        minAttempts: int = 20,
+        explorationInterval: int = 50,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize CascadeQrDetector.
+
+        Args:
+            stages: Stages in configured order.
+            adaptiveOrdering: Reorder stages by measured cost.
+            minAttempts: Samples required per stage before reordering.
+            explorationInterval: Frames between runs with the least-sampled
+                stage first (0 = never explore once reordered).
+            logger: Logger instance for debug output.
+        """
+        if not stages:
+            raise ValueError("CascadeQrDetector requires at least one stage")
+
+        self._stages = list(stages)
+        self._adaptiveOrdering = adaptiveOrdering
+        self._minAttempts = minAttempts
+        self._explorationInterval = max(0, explorationInterval)
+        self._detectCount = 0
+        self._logger = logger or logging.getLogger(__name__)
+        self._stats: Dict[str, QrStageStatistics] = {
+            stage.name: QrStageStatistics(name=stage.name) for stage in self._stages
+        }
+        self._statsLock = threading.Lock()
+
+        self._logger.info(
+            f"CascadeQrDetector initialized "
+            f"(stages={[s.name for s in self._stages]}, "
+            f"adaptiveOrdering={adaptiveOrdering}, minAttempts={minAttempts}, "
+            f"explorationInterval={explorationInterval})"
+        )
+
+    def detect(self, image: np.ndarray) -> Optional[QrDetectionResult]:
+        """
+        Run stages in order and return the first successful decode.
+
+        Args:
+            image: Input image (BGR or grayscale)
+
+        Returns:
+            QrDetectionResult if any stage decodes a QR code, None otherwise
+        """
+        for stage in self._getExecutionOrder():
+            startTime = time.perf_counter()
+            result = self._runStage(stage, image)
+            elapsedMs = (time.perf_counter() - startTime) * 1000
+
+            self._recordAttempt(stage.name, result is not None, elapsedMs)
+
+            if result is not None:
+                self._logger.debug(f"Cascade: decoded by {stage.name} ({elapsedMs:.2f}ms)")
+                return result
+
+            self._logger.debug(f"Cascade: {stage.name} failed ({elapsedMs:.2f}ms)")
+
+        return None
+
+    def getStatistics(self) -> List[Dict[str, Any]]:
+        """
+        Get per-stage statistics in current execution order.
+
+        Returns:
+            List of dicts with name, attempts, successes, successRate, avgTimeMs.
+        """
+        with self._statsLock:
+            return [
+                {
+                    "name": stats.name,
+                    "attempts": stats.attempts,
+                    "successes": stats.successes,
+                    "successRate": round(stats.successRate, 4),
+                    "avgTimeMs": round(stats.avgTimeMs, 3)
+                }
+                for stats in (self._stats[s.name] for s in self._getOrderedStages())
+            ]
+
+    def resetStatistics(self) -> None:
+        """Clear statistics and fall back to configured order."""
+        with self._statsLock:
+            for name in self._stats:
+                self._stats[name] = QrStageStatistics(name=name)
+
+    def _runStage(
+        self,
+        stage: QrCascadeStage,
+        image: np.ndarray
+    ) -> Optional[QrDetectionResult]:
+        """Preprocess, detect and map coordinates back for one stage."""
+        if stage.preprocessor is None:
+            return stage.detector.detect(image)
+
+        processedImage, transform = stage.preprocessor.preprocess(image)
+        result = stage.detector.detect(processedImage)
+
+        if result is not None:
+            result = mapQrResultToOriginal(result, transform)
+        return result
+
+    def _getOrderedStages(self) -> List[QrCascadeStage]:
+        """Get stages in execution order (configured or cost-sorted)."""
+        if not self._adaptiveOrdering:
+            return self._stages
+
+        stats = self._stats
+        if any(stats[s.name].attempts < self._minAttempts for s in self._stages):
+            return self._stages
+
+        # Stable sort keeps configured order for equal costs
+        return sorted(self._stages, key=lambda s: stats[s.name].expectedCost)
+
+    def _getExecutionOrder(self) -> List[QrCascadeStage]:
+        """Get stages for one detect() call, with periodic exploration."""
+        ordered = self._getOrderedStages()
+        if not self._adaptiveOrdering or self._explorationInterval == 0:
+            return ordered
+
+        with self._statsLock:
+            self._detectCount += 1
+            if self._detectCount % self._explorationInterval != 0:
+                return ordered
+            explored = min(ordered, key=lambda s: self._stats[s.name].attempts)
+
+        self._logger.debug(f"Cascade: exploring {explored.name}")
+        return [explored] + [stage for stage in ordered if stage is not explored]
+
+    def _recordAttempt(self, name: str, success: bool, elapsedMs: float) -> None:
+        """Update statistics for a stage attempt."""
+        with self._statsLock:
+            stats = self._stats[name]
+            stats.attempts += 1
+            stats.totalTimeMs += elapsedMs
+            if success:
+                stats.successes += 1
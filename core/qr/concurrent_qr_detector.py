@@ -0,0 +1,122 @@
+"""
+Concurrent QR Code Detector Implementation.
+
+This module provides a QR detector that submits the same image to several
+backends on a thread pool and returns the first valid decode. zxing-cpp and
+OpenCV WeChat QRCode run native code that releases the GIL, so the backends
+genuinely run in parallel.
+
+An overall deadline bounds the wait. Backends that are still running when a
+winner is found (or the deadline passes) are ignored; a backend whose
+previous task has not finished is skipped for the next frame so that a
+detector instance is never used by two threads at once.
+
+Follows the Single Responsibility Principle (SRP) from SOLID.
+"""
+
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import Optional, Dict
+
+import numpy as np
+
+from core.interfaces.qr_detector_interface import IQrDetector, QrDetectionResult
+
+
+class ConcurrentQrDetector(IQrDetector):
+    """
+    First-wins QR detector running several backends concurrently.
+
+    S5 tail latency is bounded by the fastest successful backend,
+    or by timeoutMs when none succeeds.
+    """
+
+    def __init__(
+        self,
+        detectors: Dict[str, IQrDetector],
+        timeoutMs: float = 200.0,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize ConcurrentQrDetector.
+
+        Args:
+            detectors: Backend detectors keyed by name (e.g. {"zxing": ..., "wechat": ...}).
+            timeoutMs: Overall deadline per detect() call in milliseconds.
+            logger: Logger instance for debug output.
+        """
+        if not detectors:
+            raise ValueError("ConcurrentQrDetector requires at least one detector")
+
+        self._detectors = dict(detectors)
+        self._timeoutMs = timeoutMs
+        self._logger = logger or logging.getLogger(__name__)
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(self._detectors),
+            thread_name_prefix="qr-decode"
+        )
+        self._pending: Dict[str, Future] = {}
+        self._pendingLock = threading.Lock()
+
+        self._logger.info(
+            f"ConcurrentQrDetector initialized "
+            f"(backends={list(self._detectors)}, timeoutMs={timeoutMs})"
+        )
+
+    def detect(self, image: np.ndarray) -> Optional[QrDetectionResult]:
+        """
+        Submit the image to all idle backends and return the first decode.
+
+        Args:
+            image: Input image (BGR or grayscale)
+
+        Returns:
+            QrDetectionResult from the first successful backend, None if no
+            backend succeeds before the deadline
+        """
+        deadline = time.perf_counter() + self._timeoutMs / 1000.0
+
+        futures: Dict[Future, str] = {}
+        with self._pendingLock:
+            for name, detector in self._detectors.items():
+                previous = self._pending.get(name)
+                if previous is not None and not previous.done():
+                    # Detector still busy with an older frame
+                    self._logger.debug(f"Concurrent: {name} busy, skipped")
+                    continue
+                future = self._executor.submit(detector.detect, image)
+                self._pending[name] = future
+                futures[future] = name
+
+        remaining = set(futures)
+        while remaining:
+            timeout = deadline - time.perf_counter()
+            if timeout <= 0:
+                break
+
+            done, remaining = wait(remaining, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    result = future.result()
+                except Exception as e:
+                    self._logger.error(f"Concurrent: {futures[future]} failed: {e}")
+                    continue
+
+                if result is not None:
+                    self._logger.debug(f"Concurrent: decoded by {futures[future]}")
+                    for other in remaining:
+                        other.cancel()
+                    return result
+
+        if remaining:
+            self._logger.debug(
+                f"Concurrent: deadline {self._timeoutMs}ms reached, "
+                f"ignoring {[futures[f] for f in remaining]}"
+            )
+        return None
+
+    def close(self) -> None:
+        """Shut down the worker threads without waiting for running decodes."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,240 @@
+"""
+Multi-Scale QR Code Detector Implementation.
+
+This module provides a QR detector that chooses the decode scale from the
+expected QR module size instead of a fixed target width:
+
+    moduleSize = qrWidthRatio * imageWidth / qrModules
+    scale      = targetModuleSize / moduleSize
+
+The QR width ratio starts at the configured expectation and follows the QR
+codes actually decoded (exponential moving average). Regions of an image
+(ROI crops) are decoded with detectRegion(): the module size is estimated
+from the full image width and the ratio estimate is left unchanged.
+
+When the QR is already large (native module size >= largeModuleSize) the
+"large" detector is used, e.g. a WeChat instance without super-resolution.
+If the first attempt fails, a small image pyramid is tried while the
+per-frame time budget allows.
+
+Follows the Single Responsibility Principle (SRP) from SOLID.
+"""
+
+import time
+import logging
+import threading
+from dataclasses import dataclass, asdict
+from typing import Optional, List, Dict, Any
+
+import cv2
+import numpy as np
+
+from core.interfaces.qr_detector_interface import IQrDetector, QrDetectionResult
+from core.qr.qr_geometry import QrImageTransform, mapQrResultToOriginal
+
+
+@dataclass
+class QrDecodeAttempt:
+    """
+    Timing of one decode attempt.
+
+    Attributes:
+        scale: Scale applied to the input image.
+        detector: Detector used ("default" or "large").
+        timeMs: Resize + decode time in milliseconds.
+        success: Whether the attempt decoded a QR code.
+    """
+    scale: float
+    detector: str
+    timeMs: float
+    success: bool
+
+
+class MultiScaleQrDetector(IQrDetector):
+    """
+    QR detector with module-size-driven scale and pyramid retry.
+
+    getLastAttempts() returns the attempts of the calling thread's last
+    detect() call, so S5 can record them per frame.
+    """
+
+    DETECTOR_DEFAULT = "default"
+    DETECTOR_LARGE = "large"
+
+    # Clamp for the computed decode scale
+    MIN_SCALE = 0.25
+    MAX_SCALE = 3.0
+
+    # Weight of the newest decode in the QR width ratio estimate
+    RATIO_EMA_ALPHA = 0.2
+
+    def __init__(
+        self,
+        detector: IQrDetector,
+        largeDetector: Optional[IQrDetector] = None,
+        qrModules: int = 25,
+        expectedQrWidthRatio: float = 0.2,
+        targetModuleSize: float = 4.0,
+        largeModuleSize: float = 4.0,
+        pyramidFactors: Optional[List[float]] = None,
+        timeBudgetMs: float = 80.0,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize MultiScaleQrDetector.
+
+        Args:
+            detector: Detector used for small QR codes (e.g. WeChat with SR).
+            largeDetector: Detector used for large QR codes (e.g. WeChat without SR).
+                None uses detector for all sizes.
+            qrModules: Modules per QR side (21 for version 1, 25 for version 2, ...).
+            expectedQrWidthRatio: Initial QR width as ratio of the image width.
+            targetModuleSize: Module size in pixels to scale to.
+            largeModuleSize: Native module size from which largeDetector is used.
+            pyramidFactors: Scale factors (relative to the first scale) tried on failure.
+            timeBudgetMs: No new attempt starts after this time in milliseconds.
+            logger: Logger instance for debug output.
+        """
+        self._detector = detector
+        self._largeDetector = largeDetector
+        self._qrModules = qrModules
+        self._qrWidthRatio = expectedQrWidthRatio
+        self._targetModuleSize = targetModuleSize
+        self._largeModuleSize = largeModuleSize
+        self._pyramidFactors = list(pyramidFactors) if pyramidFactors is not None else [1.5, 0.6]
+        self._timeBudgetMs = timeBudgetMs
+        self._logger = logger or logging.getLogger(__name__)
+        self._ratioLock = threading.Lock()
+        self._local = threading.local()
+
+        self._logger.info(
+            f"MultiScaleQrDetector initialized "
+            f"(qrModules={qrModules}, expectedQrWidthRatio={expectedQrWidthRatio}, "
+            f"targetModuleSize={targetModuleSize}, largeModuleSize={largeModuleSize}, "
+            f"pyramidFactors={self._pyramidFactors}, timeBudgetMs={timeBudgetMs})"
+        )
+
+    def detect(self, image: np.ndarray) -> Optional[QrDetectionResult]:
+        """
+        Decode at the module-size scale, then the pyramid within the budget.
+
+        Args:
+            image: Input image (BGR or grayscale)
+
+        Returns:
+            QrDetectionResult in input image coordinates, None otherwise
+        """
+        return self._detect(image, image.shape[1], updateRatio=True)
+
+    def detectRegion(
+        self,
+        image: np.ndarray,
+        referenceWidth: int
+    ) -> Optional[QrDetectionResult]:
+        """
+        Decode an unscaled region (ROI crop) of a larger image.
+
+        The QR width ratio refers to the full image, so the module size is
+        estimated from referenceWidth, and the decoded QR (which fills most
+        of the region) is not blended into the ratio estimate.
+
+        Args:
+            image: Region of the full image (same scale)
+            referenceWidth: Width of the full image in pixels
+
+        Returns:
+            QrDetectionResult in region coordinates, None otherwise
+        """
+        return self._detect(image, referenceWidth, updateRatio=False)
+
+    def _detect(
+        self,
+        image: np.ndarray,
+        referenceWidth: int,
+        updateRatio: bool
+    ) -> Optional[QrDetectionResult]:
+        """Decode at the module-size scale of referenceWidth, then the pyramid."""
+        startTime = time.perf_counter()
+        attempts: List[QrDecodeAttempt] = []
+        self._local.attempts = attempts
+
+        h, w = image.shape[:2]
+        moduleSize = self._estimateModuleSize(referenceWidth)
+        baseScale = self._clampScale(self._targetModuleSize / moduleSize)
+
+        useLarge = self._largeDetector is not None and moduleSize >= self._largeModuleSize
+        detectorName = self.DETECTOR_LARGE if useLarge else self.DETECTOR_DEFAULT
+        detector = self._largeDetector if useLarge else self._detector
+
+        scales = [baseScale]
+        for factor in self._pyramidFactors:
+            scale = self._clampScale(baseScale * factor)
+            if all(abs(scale - s) > 0.05 for s in scales):
+                scales.append(scale)
+
+        for scale in scales:
+            if attempts and (time.perf_counter() - startTime) * 1000 >= self._timeBudgetMs:
+                self._logger.debug(
+                    f"MultiScale: budget {self._timeBudgetMs}ms reached "
+                    f"after {len(attempts)} attempts"
+                )
+                break
+
+            attemptStart = time.perf_counter()
+            if abs(scale - 1.0) < 0.01:
+                scale = 1.0
+                decodeImage = image
+            else:
+                interpolation = cv2.INTER_CUBIC if scale > 1.0 else cv2.INTER_AREA
+                decodeImage = cv2.resize(
+                    image,
+                    (max(1, int(w * scale)), max(1, int(h * scale))),
+                    interpolation=interpolation
+                )
+
+            result = detector.detect(decodeImage)
+            attempts.append(QrDecodeAttempt(
+                scale=round(scale, 3),
+                detector=detectorName,
+                timeMs=round((time.perf_counter() - attemptStart) * 1000, 3),
+                success=result is not None
+            ))
+
+            if result is not None:
+                result = mapQrResultToOriginal(result, QrImageTransform(scale=scale))
+                if updateRatio:
+                    self._updateWidthRatio(result.rect[2] / float(w))
+                return result
+
+        return None
+
+    def getLastAttempts(self) -> List[Dict[str, Any]]:
+        """
+        Get attempts of the calling thread's last detect() call.
+
+        Returns:
+            List of dicts with scale, detector, timeMs and success.
+        """
+        return [asdict(a) for a in getattr(self._local, "attempts", [])]
+
+    @property
+    def qrWidthRatio(self) -> float:
+        """Current QR width estimate as ratio of the image width."""
+        return self._qrWidthRatio
+
+    def _estimateModuleSize(self, imageWidth: int) -> float:
+        """Expected module size in pixels of the input image."""
+        with self._ratioLock:
+            ratio = self._qrWidthRatio
+        return max(1e-3, ratio * imageWidth / self._qrModules)
+
+    def _updateWidthRatio(self, observedRatio: float) -> None:
+        """Blend the observed QR width ratio into the estimate."""
+        if observedRatio <= 0:
+            return
+        with self._ratioLock:
+            self._qrWidthRatio += self.RATIO_EMA_ALPHA * (observedRatio - self._qrWidthRatio)
+
+    def _clampScale(self, scale: float) -> float:
+        """Clamp the decode scale to a sensible range."""
+        return min(self.MAX_SCALE, max(self.MIN_SCALE, scale))
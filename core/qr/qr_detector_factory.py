@@ -2,7 +2,8 @@
 QR Detector Factory Module.
 
 Factory function for creating QR detector instances based on backend selection.
-Supports ZXing-cpp and WeChat QRCode backends.
+Supports ZXing-cpp and WeChat QRCode backends, plus cascade (sequential),
+concurrent (first-wins) and multi-scale (module-size driven) wrappers.
 
 Follows:
 - OCP (Open/Closed Principle): Easy to extend with new backends
@@ -11,7 +12,7 @@
 """
 
 import logging
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 
 from core.interfaces.qr_detector_interface import IQrDetector
 
@@ -19,13 +20,38 @@
 logger = logging.getLogger(__name__)
 
 
+# Default cascade: cheap zxing first, WeChat CNN only when zxing fails
+DEFAULT_CASCADE_STAGES = [
+    {"backend": "zxing", "preprocessingMode": "minimal"},
+    {"backend": "zxing", "preprocessingMode": "full"},
+    {"backend": "wechat", "preprocessingMode": "none"}
+]
+
+
 def createQrDetector(
     backend: str = "zxing",
     # ZXing params (prefixed with 'zxing')
     zxingTryRotate: bool = True,
     zxingTryDownscale: bool = True,
     # WeChat params (prefixed with 'wechat')
-    wechatModelDir: str = "models/wechat"
+    wechatModelDir: str = "models/wechat",
+    # Cascade params (prefixed with 'cascade')
+    cascadeStages: Optional[List[Dict[str, Any]]] = None,
+    cascadeAdaptiveOrdering: bool = True,
+    cascadeMinAttempts: int = 20,
+    cascadeExplorationInterval: int = 50,
+    cascadeTargetWidth: int = 480,
+    # Concurrent params (prefixed with 'concurrent')
+    concurrentBackends: Optional[List[str]] = None,
+    concurrentTimeoutMs: float = 200.0,
+    # Multi-scale params (prefixed with 'multiscale')
+    multiscaleBackend: str = "wechat",
+    multiscaleQrModules: int = 25,
+    multiscaleExpectedQrWidthRatio: float = 0.2,
+    multiscaleTargetModuleSize: float = 4.0,
+    multiscaleLargeModuleSize: float = 4.0,
+    multiscalePyramidFactors: Optional[List[float]] = None,
+    multiscaleTimeBudgetMs: float = 80.0
 ) -> IQrDetector:
     """
     Factory function to create QR detector based on backend.
@@ -33,12 +59,33 @@ def createQrDetector(
     Supports:
     - "zxing": ZXing-cpp backend (fast, cross-platform)
     - "wechat": OpenCV WeChat QRCode backend (deep learning based)
+    - "cascade": Sequence of (backend, preprocessing) stages with early exit
+    - "concurrent": Several backends on a thread pool, first valid decode wins
+    - "multiscale": One backend at a module-size driven scale, pyramid retry on failure
     
     Args:
-        backend: Backend name ("zxing" or "wechat").
+        backend: Backend name ("zxing", "wechat", "cascade", "concurrent" or "multiscale").
         zxingTryRotate: (zxing) Try rotated barcodes (90/270 degrees).
         zxingTryDownscale: (zxing) Try downscaled versions for better detection.
         wechatModelDir: (wechat) Directory containing WeChat QR model files.
+        cascadeStages: (cascade) List of stage dicts with keys:
+            - backend: "zxing" or "wechat"
+            - preprocessingMode: "none", "minimal" or "full"
+        cascadeAdaptiveOrdering: (cascade) Reorder stages by measured cost.
+        cascadeMinAttempts: (cascade) Samples per stage before reordering.
+        cascadeExplorationInterval: (cascade) Frames between runs with the
+            least-sampled stage first (0 = never).
+        cascadeTargetWidth: (cascade) Target width for stage preprocessing.
+        concurrentBackends: (concurrent) Backend names to race (default: zxing, wechat).
+        concurrentTimeoutMs: (concurrent) Overall deadline per frame in milliseconds.
+        multiscaleBackend: (multiscale) Wrapped backend ("zxing" or "wechat").
+        multiscaleQrModules: (multiscale) Modules per QR side.
+        multiscaleExpectedQrWidthRatio: (multiscale) Initial QR width / image width.
+        multiscaleTargetModuleSize: (multiscale) Module size in pixels to scale to.
+        multiscaleLargeModuleSize: (multiscale) Native module size from which
+            WeChat runs without super-resolution.
+        multiscalePyramidFactors: (multiscale) Relative scales tried on failure.
+        multiscaleTimeBudgetMs: (multiscale) Per-frame budget for pyramid attempts.
         
     Returns:
         IQrDetector: QR detector instance implementing IQrDetector interface.
@@ -60,6 +107,16 @@ def createQrDetector(
         ...     backend="wechat",
         ...     wechatModelDir="models/wechat"
         ... )
+        
+        >>> # Create cascade: zxing minimal -> zxing full -> wechat
+        >>> detector = createQrDetector(
+        ...     backend="cascade",
+        ...     cascadeStages=[
+        ...         {"backend": "zxing", "preprocessingMode": "minimal"},
+        ...         {"backend": "zxing", "preprocessingMode": "full"},
+        ...         {"backend": "wechat", "preprocessingMode": "none"}
+        ...     ]
+        ... )
     """
     # Normalize backend name
     backend = backend.lower().strip()
@@ -75,7 +132,42 @@ def createQrDetector(
         raise ValueError(errorMsg)
     
     # Create detector based on backend
-    if backend == "wechat":
+    if backend == "multiscale":
+        return _createMultiScaleDetector(
+            multiscaleBackend=multiscaleBackend,
+            multiscaleQrModules=multiscaleQrModules,
+            multiscaleExpectedQrWidthRatio=multiscaleExpectedQrWidthRatio,
+            multiscaleTargetModuleSize=multiscaleTargetModuleSize,
+            multiscaleLargeModuleSize=multiscaleLargeModuleSize,
+            multiscalePyramidFactors=multiscalePyramidFactors,
+            multiscaleTimeBudgetMs=multiscaleTimeBudgetMs,
+            zxingTryRotate=zxingTryRotate,
+            zxingTryDownscale=zxingTryDownscale,
+            wechatModelDir=wechatModelDir
+        )
+    
+    elif backend == "concurrent":
+        return _createConcurrentDetector(
+            concurrentBackends=concurrentBackends or ["zxing", "wechat"],
+            concurrentTimeoutMs=concurrentTimeoutMs,
+            zxingTryRotate=zxingTryRotate,
+            zxingTryDownscale=zxingTryDownscale,
+            wechatModelDir=wechatModelDir
+        )
+    
+    elif backend == "cascade":
+        return _createCascadeDetector(
+            cascadeStages=cascadeStages or DEFAULT_CASCADE_STAGES,
+            cascadeAdaptiveOrdering=cascadeAdaptiveOrdering,
+            cascadeMinAttempts=cascadeMinAttempts,
+            cascadeExplorationInterval=cascadeExplorationInterval,
+            cascadeTargetWidth=cascadeTargetWidth,
+            zxingTryRotate=zxingTryRotate,
+            zxingTryDownscale=zxingTryDownscale,
+            wechatModelDir=wechatModelDir
+        )
+    
+    elif backend == "wechat":
         return _createWechatDetector(
             wechatModelDir=wechatModelDir
         )
@@ -133,30 +225,41 @@ def _createZxingDetector(
 
 
 def _createWechatDetector(
-    wechatModelDir: str
+    wechatModelDir: str,
+    wechatSuperResolution: bool = True
 ) -> IQrDetector:
     """
     Create WeChat QR detector instance.
     
+    The WeChat CNN detector is not thread-safe, so it is wrapped in a
+    ThreadLocalQrDetector: each decode thread lazily gets its own instance.
+    
     Args:
         wechatModelDir: Directory containing model files.
+        wechatSuperResolution: Load the super-resolution CNN.
         
     Returns:
-        IQrDetector: WeChat QR detector instance.
+        IQrDetector: WeChat QR detector instance (one per thread).
         
     Raises:
         ImportError: If opencv-contrib-python is not installed.
     """
     try:
         from core.qr.wechat_qr_detector import WechatQrDetector
+        from core.qr.thread_local_qr_detector import ThreadLocalQrDetector
         
         logger.info(
             f"Creating WeChat QR detector "
-            f"(modelDir={wechatModelDir})"
+            f"(modelDir={wechatModelDir}, superResolution={wechatSuperResolution}, "
+            f"perThread=True)"
         )
         
-        detector = WechatQrDetector(
-            modelDir=wechatModelDir
+        detector = ThreadLocalQrDetector(
+            detectorFactory=lambda: WechatQrDetector(
+                modelDir=wechatModelDir,
+                useSuperResolution=wechatSuperResolution
+            ),
+            name="wechat" if wechatSuperResolution else "wechat-nosr"
         )
         
         return detector
@@ -171,14 +274,215 @@ def _createWechatDetector(
         raise ImportError(errorMsg) from e
 
 
+def _createCascadeDetector(
+    cascadeStages: List[Dict[str, Any]],
+    cascadeAdaptiveOrdering: bool,
+    cascadeMinAttempts: int,
+    cascadeExplorationInterval: int,
+    cascadeTargetWidth: int,
+    zxingTryRotate: bool,
+    zxingTryDownscale: bool,
+    wechatModelDir: str
+) -> IQrDetector:
+    """
+    Create cascade QR detector instance.
+    
+    Backend detectors are shared between stages that use the same backend.
+    
+    Args:
+        cascadeStages: Stage dicts (backend, preprocessingMode).
+        cascadeAdaptiveOrdering: Reorder stages by measured cost.
+        cascadeMinAttempts: Samples per stage before reordering.
+        cascadeExplorationInterval: Frames between exploration runs.
+        cascadeTargetWidth: Target width for stage preprocessing.
+        zxingTryRotate: Try rotated barcodes (zxing stages).
+        zxingTryDownscale: Try downscaled versions (zxing stages).
+        wechatModelDir: Directory containing model files (wechat stages).
+        
+    Returns:
+        IQrDetector: Cascade QR detector instance.
+        
+    Raises:
+        ValueError: If a stage uses an unsupported backend or mode.
+    """
+    from core.qr.cascade_qr_detector import CascadeQrDetector, QrCascadeStage
+    from core.qr.qr_image_preprocessor import QrImagePreprocessor
+    
+    detectors: Dict[str, IQrDetector] = {}
+    stages: List[QrCascadeStage] = []
+    
+    for stageConfig in cascadeStages:
+        stageBackend = str(stageConfig.get("backend", "zxing")).lower().strip()
+        mode = str(stageConfig.get("preprocessingMode", "none")).lower().strip()
+        
+        if stageBackend not in ("zxing", "wechat"):
+            raise ValueError(f"Invalid cascade stage backend: '{stageBackend}'")
+        if mode != "none" and mode not in QrImagePreprocessor.SUPPORTED_MODES:
+            raise ValueError(f"Invalid cascade stage preprocessing mode: '{mode}'")
+        
+        if stageBackend not in detectors:
+            detectors[stageBackend] = createQrDetector(
+                backend=stageBackend,
+                zxingTryRotate=zxingTryRotate,
+                zxingTryDownscale=zxingTryDownscale,
+                wechatModelDir=wechatModelDir
+            )
+        
+        preprocessor = None
+        if mode != "none":
+            preprocessor = QrImagePreprocessor(
+                enabled=True,
+                mode=mode,
+                targetWidth=cascadeTargetWidth
+            )
+        
+        name = f"{stageBackend}/{mode}"
+        if any(stage.name == name for stage in stages):
+            name = f"{name}#{len(stages)}"
+        
+        stages.append(QrCascadeStage(
+            name=name,
+            detector=detectors[stageBackend],
+            preprocessor=preprocessor
+        ))
+    
+    logger.info(f"Creating cascade QR detector (stages={[s.name for s in stages]})")
+    
+    return CascadeQrDetector(
+        stages=stages,
+        adaptiveOrdering=cascadeAdaptiveOrdering,
+        minAttempts=cascadeMinAttempts,
+        explorationInterval=cascadeExplorationInterval
+    )
+
+
+def _createConcurrentDetector(
+    concurrentBackends: List[str],
+    concurrentTimeoutMs: float,
+    zxingTryRotate: bool,
+    zxingTryDownscale: bool,
+    wechatModelDir: str
+) -> IQrDetector:
+    """
+    Create concurrent first-wins QR detector instance.
+    
+    Args:
+        concurrentBackends: Backend names to run in parallel.
+        concurrentTimeoutMs: Overall deadline per frame in milliseconds.
+        zxingTryRotate: Try rotated barcodes (zxing).
+        zxingTryDownscale: Try downscaled versions (zxing).
+        wechatModelDir: Directory containing model files (wechat).
+        
+    Returns:
+        IQrDetector: Concurrent QR detector instance.
+        
+    Raises:
+        ValueError: If a backend is not "zxing" or "wechat".
+    """
+    from core.qr.concurrent_qr_detector import ConcurrentQrDetector
+    
+    detectors: Dict[str, IQrDetector] = {}
+    for name in concurrentBackends:
+        name = name.lower().strip()
+        if name not in ("zxing", "wechat"):
+            raise ValueError(f"Invalid concurrent backend: '{name}'")
+        if name not in detectors:
+            detectors[name] = createQrDetector(
+                backend=name,
+                zxingTryRotate=zxingTryRotate,
+                zxingTryDownscale=zxingTryDownscale,
+                wechatModelDir=wechatModelDir
+            )
+    
+    logger.info(
+        f"Creating concurrent QR detector "
+        f"(backends={list(detectors)}, timeoutMs={concurrentTimeoutMs})"
+    )
+    
+    return ConcurrentQrDetector(
+        detectors=detectors,
+        timeoutMs=concurrentTimeoutMs
+    )
+
+
+def _createMultiScaleDetector(
+    multiscaleBackend: str,
+    multiscaleQrModules: int,
+    multiscaleExpectedQrWidthRatio: float,
+    multiscaleTargetModuleSize: float,
+    multiscaleLargeModuleSize: float,
+    multiscalePyramidFactors: Optional[List[float]],
+    multiscaleTimeBudgetMs: float,
+    zxingTryRotate: bool,
+    zxingTryDownscale: bool,
+    wechatModelDir: str
+) -> IQrDetector:
+    """
+    Create multi-scale QR detector instance.
+    
+    For the WeChat backend a second instance without super-resolution is
+    created and used when QR codes are already large.
+    
+    Args:
+        multiscaleBackend: Wrapped backend ("zxing" or "wechat").
+        multiscaleQrModules: Modules per QR side.
+        multiscaleExpectedQrWidthRatio: Initial QR width / image width.
+        multiscaleTargetModuleSize: Module size in pixels to scale to.
+        multiscaleLargeModuleSize: Native module size from which WeChat skips SR.
+        multiscalePyramidFactors: Relative scales tried on failure.
+        multiscaleTimeBudgetMs: Per-frame budget for pyramid attempts.
+        zxingTryRotate: Try rotated barcodes (zxing).
+        zxingTryDownscale: Try downscaled versions (zxing).
+        wechatModelDir: Directory containing model files (wechat).
+        
+    Returns:
+        IQrDetector: Multi-scale QR detector instance.
+        
+    Raises:
+        ValueError: If the wrapped backend is not "zxing" or "wechat".
+    """
+    from core.qr.multi_scale_qr_detector import MultiScaleQrDetector
+    
+    multiscaleBackend = multiscaleBackend.lower().strip()
+    largeDetector = None
+    
+    if multiscaleBackend == "wechat":
+        detector = _createWechatDetector(wechatModelDir=wechatModelDir)
+        largeDetector = _createWechatDetector(
+            wechatModelDir=wechatModelDir,
+            wechatSuperResolution=False
+        )
+    elif multiscaleBackend == "zxing":
+        detector = _createZxingDetector(
+            zxingTryRotate=zxingTryRotate,
+            zxingTryDownscale=zxingTryDownscale
+        )
+    else:
+        raise ValueError(f"Invalid multiscale backend: '{multiscaleBackend}'")
+    
+    logger.info(f"Creating multi-scale QR detector (backend={multiscaleBackend})")
+    
+    return MultiScaleQrDetector(
+        detector=detector,
+        largeDetector=largeDetector,
+        qrModules=multiscaleQrModules,
+        expectedQrWidthRatio=multiscaleExpectedQrWidthRatio,
+        targetModuleSize=multiscaleTargetModuleSize,
+        largeModuleSize=multiscaleLargeModuleSize,
+        pyramidFactors=multiscalePyramidFactors,
+        timeBudgetMs=multiscaleTimeBudgetMs
+    )
+
+
 def getSupportedQrBackends() -> List[str]:
     """
     Get list of supported QR backend names.
     
     Returns:
-        List[str]: List of backend names ["zxing", "wechat"].
+        List[str]: List of backend names
+            ["zxing", "wechat", "cascade", "concurrent", "multiscale"].
     """
-    return ["zxing", "wechat"]
+    return ["zxing", "wechat", "cascade", "concurrent", "multiscale"]
 
 
 def isQrBackendAvailable(backend: str) -> bool:
@@ -186,13 +490,16 @@ def isQrBackendAvailable(backend: str) -> bool:
     Check if a QR backend is available (library installed).
     
     Args:
-        backend: Backend name ("zxing" or "wechat").
+        backend: Backend name ("zxing", "wechat", "cascade", "concurrent" or "multiscale").
         
     Returns:
         bool: True if backend library is installed and available.
     """
     backend = backend.lower().strip()
     
+    if backend in ("cascade", "concurrent", "multiscale"):
+        return isQrBackendAvailable("zxing") or isQrBackendAvailable("wechat")
+    
     if backend == "zxing":
         try:
             import zxingcpp
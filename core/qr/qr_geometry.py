@@ -0,0 +1,115 @@
+"""
+QR Geometry Helpers.
+
+Coordinate helpers shared by QR detectors and S5: describing how a decode
+input was derived from the original image (QrImageTransform) and mapping a
+QrDetectionResult back to the coordinate system of the original image, or
+through an affine crop (frame → label crop).
+"""
+
+from dataclasses import dataclass, replace
+
+import numpy as np
+
+from core.interfaces.qr_detector_interface import QrDetectionResult
+
+
+@dataclass(frozen=True)
+class QrImageTransform:
+    """
+    Mapping from original image coordinates to decode-input coordinates.
+
+    decodeX = (originalX - offsetX) * scale
+    decodeY = (originalY - offsetY) * scale
+
+    Attributes:
+        scale: Resize factor applied to the image (1.0 = no resize).
+        offsetX: Left of the cropped region in original coordinates.
+        offsetY: Top of the cropped region in original coordinates.
+    """
+    scale: float = 1.0
+    offsetX: float = 0.0
+    offsetY: float = 0.0
+
+    @property
+    def isIdentity(self) -> bool:
+        """Check if the transform leaves coordinates unchanged."""
+        return self.scale == 1.0 and self.offsetX == 0.0 and self.offsetY == 0.0
+
+    def then(self, other: "QrImageTransform") -> "QrImageTransform":
+        """
+        Compose with a transform applied after this one.
+
+        Args:
+            other: Transform applied to the output of this transform.
+
+        Returns:
+            QrImageTransform equivalent to applying self, then other.
+        """
+        return QrImageTransform(
+            scale=self.scale * other.scale,
+            offsetX=self.offsetX + other.offsetX / self.scale,
+            offsetY=self.offsetY + other.offsetY / self.scale
+        )
+
+
+def mapQrResultToOriginal(
+    qrResult: QrDetectionResult,
+    transform: QrImageTransform
+) -> QrDetectionResult:
+    """
+    Map QR coordinates from decode-input space back to the original image.
+
+    Args:
+        qrResult: QR detection result with coordinates on the decode input.
+        transform: Transform that produced the decode input.
+
+    Returns:
+        New QrDetectionResult with coordinates in original image space.
+    """
+    if transform.isIdentity:
+        return qrResult
+
+    scale = transform.scale
+    offsetX = transform.offsetX
+    offsetY = transform.offsetY
+
+    mappedPolygon = [
+        (int(x / scale + offsetX), int(y / scale + offsetY))
+        for (x, y) in qrResult.polygon
+    ]
+
+    # Map rect (x, y, w, h)
+    mappedRect = (
+        int(qrResult.rect[0] / scale + offsetX),
+        int(qrResult.rect[1] / scale + offsetY),
+        int(qrResult.rect[2] / scale),
+        int(qrResult.rect[3] / scale)
+    )
+
+    return replace(qrResult, polygon=mappedPolygon, rect=mappedRect)
+
+
+def mapQrResultAffine(
+    qrResult: QrDetectionResult,
+    matrix: np.ndarray
+) -> QrDetectionResult:
+    """
+    Map QR coordinates through a 2x3 affine matrix (e.g. frame → label crop).
+
+    Args:
+        qrResult: QR detection result in source coordinates.
+        matrix: 2x3 affine matrix from source to destination coordinates.
+
+    Returns:
+        New QrDetectionResult with polygon and bounding rect in destination space.
+    """
+    points = np.array(qrResult.polygon, dtype=np.float64).reshape(-1, 2)
+    mapped = points @ matrix[:, :2].T + matrix[:, 2]
+
+    mappedPolygon = [(int(round(x)), int(round(y))) for (x, y) in mapped]
+    xs = [p[0] for p in mappedPolygon]
+    ys = [p[1] for p in mappedPolygon]
+    mappedRect = (min(xs), min(ys), max(xs) - min(xs), max(ys) - min(ys))
+
+    return replace(qrResult, polygon=mappedPolygon, rect=mappedRect)
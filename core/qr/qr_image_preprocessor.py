@@ -11,15 +11,22 @@
 Note: This preprocessor expects GRAYSCALE input from S4 Enhancement Service.
 Enhancement (CLAHE + Sharpen) is already applied in S4, so not included here.
 
+The preprocessor is stateless per call: preprocess() returns the image
+together with the QrImageTransform that produced it, so one instance can be
+shared by several decode threads.
+
 Follows the Single Responsibility Principle (SRP) from SOLID.
 """
 
 import logging
-from typing import Optional
+from typing import Optional, Tuple
 
 import cv2
 import numpy as np
 
+from core.interfaces.image_context import ImageContext
+from core.qr.qr_geometry import QrImageTransform
+
 
 class QrImagePreprocessor:
     """
@@ -60,13 +67,12 @@ def __init__(
             mode: Preprocessing mode ("minimal" or "full").
             targetWidth: Target width for scaling (default: 480).
                         Image will be resized to this width, maintaining aspect ratio.
-                        Scale factor is computed dynamically based on input image width.
+                        Scale factor is computed per call based on input image width.
             logger: Logger instance for debug output.
         """
         self._enabled = enabled
         self._mode = mode if mode in self.SUPPORTED_MODES else self.MODE_FULL
         self._targetWidth = targetWidth
-        self._scaleFactor = 1.0  # Will be computed dynamically in _applyScale()
         self._logger = logger or logging.getLogger(__name__)
         
         self._logger.info(
@@ -79,26 +85,16 @@ def mode(self) -> str:
         """Get current preprocessing mode."""
         return self._mode
     
-    @property
-    def scaleFactor(self) -> float:
-        """
-        Get computed scale factor.
-        
-        This value is computed dynamically during preprocess() based on
-        the input image width and targetWidth. Use this value to scale
-        back QR coordinates to original image size.
-        
-        Returns:
-            float: Scale factor (targetWidth / originalWidth)
-        """
-        return self._scaleFactor
-    
     @property
     def targetWidth(self) -> int:
         """Get target width for scaling."""
         return self._targetWidth
     
-    def preprocess(self, image: np.ndarray) -> np.ndarray:
+    def preprocess(
+        self,
+        image: np.ndarray,
+        context: Optional[ImageContext] = None
+    ) -> Tuple[np.ndarray, QrImageTransform]:
         """
         Preprocess image for QR detection.
         
@@ -106,30 +102,34 @@ def preprocess(self, image: np.ndarray) -> np.ndarray:
         - Minimal: Scale only
         - Full: Scale → Denoise
         
-        After calling this method, use the scaleFactor property to get
-        the computed scale factor for scaling back QR coordinates.
+        Use the returned transform (e.g. mapQrResultToOriginal) to map
+        QR coordinates back to the original image size.
         
         Args:
             image: Input image (Grayscale from S4).
+            context: Optional frame context of image; the scaled image is
+                taken from (and memoized in) the context.
             
         Returns:
-            Single preprocessed image.
+            Tuple of (preprocessed image, transform from input to output coordinates).
         """
         if not self._enabled:
-            self._scaleFactor = 1.0
-            return image
+            return image, QrImageTransform()
         
         if image is None or image.size == 0:
             self._logger.warning("Input image is None or empty")
-            self._scaleFactor = 1.0
-            return image
+            return image, QrImageTransform()
         
         if self._mode == self.MODE_MINIMAL:
-            return self._applyMinimalPipeline(image)
+            return self._applyMinimalPipeline(image, context)
         else:  # MODE_FULL
-            return self._applyFullPipeline(image)
+            return self._applyFullPipeline(image, context)
     
-    def _applyMinimalPipeline(self, image: np.ndarray) -> np.ndarray:
+    def _applyMinimalPipeline(
+        self,
+        image: np.ndarray,
+        context: Optional[ImageContext] = None
+    ) -> Tuple[np.ndarray, QrImageTransform]:
         """
         Apply minimal preprocessing pipeline.
         
@@ -137,14 +137,20 @@ def _applyMinimalPipeline(self, image: np.ndarray) -> np.ndarray:
         
         Args:
             image: Input grayscale image.
+            context: Optional frame context of image.
             
         Returns:
-            Scaled image.
+            Tuple of (scaled image, transform).
         """
         self._logger.debug("Applying minimal pipeline (scale only)")
-        return self._applyScale(image)
+        scaled, scaleFactor = self._applyScale(image, context)
+        return scaled, QrImageTransform(scale=scaleFactor)
     
-    def _applyFullPipeline(self, image: np.ndarray) -> np.ndarray:
+    def _applyFullPipeline(
+        self,
+        image: np.ndarray,
+        context: Optional[ImageContext] = None
+    ) -> Tuple[np.ndarray, QrImageTransform]:
         """
         Apply full preprocessing pipeline.
         
@@ -152,65 +158,70 @@ def _applyFullPipeline(self, image: np.ndarray) -> np.ndarray:
         
         Args:
             image: Input grayscale image.
+            context: Optional frame context of image.
             
         Returns:
-            Fully preprocessed image.
+            Tuple of (fully preprocessed image, transform).
         """
         self._logger.debug("Applying full pipeline (scale → denoise)")
         
-        result = image
-        
         # Step 1: Scale to target width
-        result = self._applyScale(result)
+        result, scaleFactor = self._applyScale(image, context)
         
         # Step 2: Denoise (reduce noise for cleaner QR detection)
         result = self._applyDenoise(result)
         
-        return result
+        return result, QrImageTransform(scale=scaleFactor)
     
-    def _applyScale(self, image: np.ndarray) -> np.ndarray:
+    def _applyScale(
+        self,
+        image: np.ndarray,
+        context: Optional[ImageContext] = None
+    ) -> Tuple[np.ndarray, float]:
         """
         Scale image to target width, maintaining aspect ratio.
         
-        Computes scale factor dynamically based on input image width
-        and stores it in self._scaleFactor for later use (e.g., scaling
-        back QR coordinates to original image size).
+        Computes the scale factor from the input image width and returns it
+        with the image (no per-call state is stored on the instance).
         
         Args:
             image: Input image (grayscale or BGR).
+            context: Optional frame context of image, shared with other
+                stages that need the same size.
             
         Returns:
-            Scaled image.
+            Tuple of (scaled image, scale factor applied).
         """
         try:
+            if context is not None and context.image is image:
+                return context.scaledToWidth(self._targetWidth)
+            
             h, w = image.shape[:2]
             
             # Compute scale factor based on target width
-            self._scaleFactor = self._targetWidth / w
+            scaleFactor = self._targetWidth / w
             
             # If scale factor is very close to 1.0, skip scaling
-            if abs(self._scaleFactor - 1.0) < 0.01:
-                self._scaleFactor = 1.0
+            if abs(scaleFactor - 1.0) < 0.01:
                 self._logger.debug(f"Scale: skipped (width {w} ≈ target {self._targetWidth})")
-                return image
+                return image, 1.0
             
             newW = self._targetWidth
-            newH = int(h * self._scaleFactor)
+            newH = int(h * scaleFactor)
             
             # Use appropriate interpolation method
-            if self._scaleFactor > 1.0:
+            if scaleFactor > 1.0:
                 interpolation = cv2.INTER_CUBIC  # Better for enlarging
             else:
                 interpolation = cv2.INTER_AREA   # Better for shrinking
             
             scaled = cv2.resize(image, (newW, newH), interpolation=interpolation)
-            self._logger.debug(f"Scale: {w}x{h} → {newW}x{newH} ({self._scaleFactor:.3f}x)")
-            return scaled
+            self._logger.debug(f"Scale: {w}x{h} → {newW}x{newH} ({scaleFactor:.3f}x)")
+            return scaled, scaleFactor
             
         except Exception as e:
             self._logger.error(f"Scale failed: {e}")
-            self._scaleFactor = 1.0
-            return image
+            return image, 1.0
     
     def _applyDenoise(self, image: np.ndarray) -> np.ndarray:
         """
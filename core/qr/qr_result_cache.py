@@ -0,0 +1,274 @@
+"""
+QR Result Cache Module.
+
+This module keeps recent QR decode results so that a label which stays under
+the camera is not decoded again on every frame.
+
+A cached result is reused when:
+- The label bounding box from S2 overlaps the cached one (IoU >= minIou),
+  i.e. the label has not moved, or no bounding box is given
+- The perceptual hash (dHash) of the QR region in the new crop is close to
+  the cached hash (Hamming distance <= maxHashDistance), i.e. it is still
+  the same QR code
+- The entry is younger than ttlMs (forces a periodic re-decode)
+
+The cached polygon is stored normalized to the crop size and mapped to the
+size of the new crop.
+
+Follows the Single Responsibility Principle (SRP) from SOLID.
+"""
+
+import time
+import logging
+import threading
+from dataclasses import dataclass, replace
+from typing import Optional, List, Tuple
+
+import cv2
+import numpy as np
+
+from core.interfaces.qr_detector_interface import QrDetectionResult
+
+
+@dataclass
+class QrCacheEntry:
+    """
+    Cached QR decode result.
+
+    Attributes:
+        result: Decoded QR result (coordinates of the crop it was decoded on).
+        bbox: Label bounding box in frame coordinates (x1, y1, x2, y2), or None.
+        cropSize: (width, height) of the crop the result refers to.
+        qrHash: dHash of the QR region (64 bits).
+        createdAt: Decode time (time.monotonic()).
+    """
+    result: QrDetectionResult
+    bbox: Optional[Tuple[int, int, int, int]]
+    cropSize: Tuple[int, int]
+    qrHash: int
+    createdAt: float
+
+
+class QrResultCache:
+    """
+    Short-lived cache of QR results keyed by label track and QR hash.
+    """
+
+    # dHash grid (HASH_SIZE x HASH_SIZE bits)
+    HASH_SIZE = 8
+
+    def __init__(
+        self,
+        ttlMs: float = 1500.0,
+        minIou: float = 0.85,
+        maxHashDistance: int = 8,
+        maxEntries: int = 8,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize QrResultCache.
+
+        Args:
+            ttlMs: Maximum age of a cached result in milliseconds.
+            minIou: Minimum bbox IoU for the label to count as stationary.
+            maxHashDistance: Maximum Hamming distance between QR hashes.
+            maxEntries: Maximum number of cached labels.
+            logger: Logger instance for debug output.
+        """
+        self._ttlSec = ttlMs / 1000.0
+        self._minIou = minIou
+        self._maxHashDistance = maxHashDistance
+        self._maxEntries = max(1, maxEntries)
+        self._logger = logger or logging.getLogger(__name__)
+        self._entries: List[QrCacheEntry] = []
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+        self._logger.info(
+            f"QrResultCache initialized "
+            f"(ttlMs={ttlMs}, minIou={minIou}, maxHashDistance={maxHashDistance})"
+        )
+
+    def lookup(
+        self,
+        image: np.ndarray,
+        bbox: Optional[Tuple[int, int, int, int]] = None
+    ) -> Optional[QrDetectionResult]:
+        """
+        Find a cached result for the label in image.
+
+        Args:
+            image: S5 input image (label crop).
+            bbox: Label bounding box in frame coordinates, or None to match
+                by QR hash only.
+
+        Returns:
+            Cached QrDetectionResult mapped to image size, None on miss.
+        """
+        now = time.monotonic()
+        h, w = image.shape[:2]
+
+        with self._lock:
+            self._entries = [e for e in self._entries if now - e.createdAt <= self._ttlSec]
+            candidates = self._findCandidates(bbox)
+
+        for entry in candidates:
+            mapped = self._mapToSize(entry.result, entry.cropSize, (w, h))
+            qrHash = self._computeHash(image, mapped.rect)
+            if qrHash is None:
+                continue
+
+            distance = bin(qrHash ^ entry.qrHash).count("1")
+            if distance <= self._maxHashDistance:
+                with self._lock:
+                    self._hits += 1
+                self._logger.debug(f"QR cache hit: {mapped.text} (hashDistance={distance})")
+                return mapped
+
+            # Same place, different QR: the label was replaced
+            self._logger.debug(f"QR cache invalidated (hashDistance={distance})")
+            self._remove(entry)
+
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def store(
+        self,
+        image: np.ndarray,
+        result: QrDetectionResult,
+        bbox: Optional[Tuple[int, int, int, int]] = None
+    ) -> None:
+        """
+        Cache a freshly decoded result.
+
+        Args:
+            image: S5 input image the result was decoded on.
+            result: Decoded QR result in image coordinates.
+            bbox: Label bounding box in frame coordinates, or None.
+        """
+        qrHash = self._computeHash(image, result.rect)
+        if qrHash is None:
+            return
+
+        h, w = image.shape[:2]
+        entry = QrCacheEntry(
+            result=result,
+            bbox=tuple(bbox) if bbox is not None else None,
+            cropSize=(w, h),
+            qrHash=qrHash,
+            createdAt=time.monotonic()
+        )
+
+        with self._lock:
+            # Replace the entry of the same label (same place or same QR text)
+            self._entries = [
+                e for e in self._entries
+                if e.result.text != result.text
+                and (bbox is None or e.bbox is None or self._iou(e.bbox, bbox) < self._minIou)
+            ]
+            self._entries.append(entry)
+            if len(self._entries) > self._maxEntries:
+                self._entries.pop(0)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
+
+    def getStatistics(self) -> dict:
+        """
+        Get cache hit statistics.
+
+        Returns:
+            Dict with hits, misses and entries.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "entries": len(self._entries)
+            }
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # Helpers
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def _findCandidates(
+        self,
+        bbox: Optional[Tuple[int, int, int, int]]
+    ) -> List[QrCacheEntry]:
+        """Entries to verify by hash, best bbox overlap first (lock held)."""
+        if bbox is None:
+            return list(reversed(self._entries))
+
+        scored = [
+            (self._iou(e.bbox, bbox), e)
+            for e in self._entries if e.bbox is not None
+        ]
+        scored = [item for item in scored if item[0] >= self._minIou]
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [e for _, e in scored]
+
+    def _remove(self, entry: QrCacheEntry) -> None:
+        """Remove an entry if still cached."""
+        with self._lock:
+            self._entries = [e for e in self._entries if e is not entry]
+
+    def _computeHash(
+        self,
+        image: np.ndarray,
+        rect: Tuple[int, int, int, int]
+    ) -> Optional[int]:
+        """dHash of the QR rectangle (None if the rectangle is empty)."""
+        h, w = image.shape[:2]
+        x, y, rw, rh = rect
+        x1, y1 = max(0, x), max(0, y)
+        x2, y2 = min(w, x + rw), min(h, y + rh)
+        if x2 - x1 < 2 or y2 - y1 < 2:
+            return None
+
+        roi = image[y1:y2, x1:x2]
+        if len(roi.shape) == 3:
+            roi = cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY)
+
+        small = cv2.resize(
+            roi,
+            (self.HASH_SIZE + 1, self.HASH_SIZE),
+            interpolation=cv2.INTER_AREA
+        )
+        bits = (small[:, 1:] > small[:, :-1]).ravel()
+        return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+    @staticmethod
+    def _mapToSize(
+        result: QrDetectionResult,
+        fromSize: Tuple[int, int],
+        toSize: Tuple[int, int]
+    ) -> QrDetectionResult:
+        """Scale result coordinates from one crop size to another."""
+        if fromSize == toSize:
+            return result
+
+        sx = toSize[0] / float(fromSize[0])
+        sy = toSize[1] / float(fromSize[1])
+        polygon = [(int(px * sx), int(py * sy)) for (px, py) in result.polygon]
+        x, y, rw, rh = result.rect
+        rect = (int(x * sx), int(y * sy), int(rw * sx), int(rh * sy))
+        return replace(result, polygon=polygon, rect=rect)
+
+    @staticmethod
+    def _iou(
+        a: Tuple[int, int, int, int],
+        b: Tuple[int, int, int, int]
+    ) -> float:
+        """Intersection over union of two (x1, y1, x2, y2) boxes."""
+        ix1, iy1 = max(a[0], b[0]), max(a[1], b[1])
+        ix2, iy2 = min(a[2], b[2]), min(a[3], b[3])
+        inter = max(0, ix2 - ix1) * max(0, iy2 - iy1)
+        if inter == 0:
+            return 0.0
+        areaA = (a[2] - a[0]) * (a[3] - a[1])
+        areaB = (b[2] - b[0]) * (b[3] - b[1])
+        return inter / float(areaA + areaB - inter)
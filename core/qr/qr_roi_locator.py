@@ -0,0 +1,328 @@
+"""
+QR Region Locator Module.
+
+This module predicts where the QR code sits inside a label crop so that S5
+can decode a small region before falling back to the whole crop.
+
+Search order:
+1. "recent": Union of the QR rectangles found on recent labels (the label
+   layout is fixed, so the QR stays at roughly the same relative position)
+2. "finder": Fast finder-pattern search (three nested dark squares) on a
+   downscaled copy of the crop
+3. Caller falls back to the full crop when neither region decodes
+
+Regions are stored normalized to the crop size, so they remain valid when
+crops differ in resolution. A decode outside the recent region restarts the
+history, so a layout change is picked up after one frame.
+
+Follows the Single Responsibility Principle (SRP) from SOLID.
+"""
+
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional, List, Tuple, Dict
+
+import cv2
+import numpy as np
+
+from core.interfaces.image_context import ImageContext
+
+
+@dataclass
+class QrSearchRegion:
+    """
+    Candidate region for QR decoding.
+
+    Attributes:
+        source: How the region was predicted ("recent" or "finder").
+        rect: Region in image coordinates (left, top, width, height).
+    """
+    source: str
+    rect: Tuple[int, int, int, int]
+
+
+class QrRoiLocator:
+    """
+    Predicts QR regions inside label crops.
+
+    Regions covering more than maxRegionRatio of the crop area are dropped,
+    since decoding them would cost about as much as the full crop.
+    """
+
+    SOURCE_RECENT = "recent"
+    SOURCE_FINDER = "finder"
+    SOURCE_FULL = "full"
+
+    # Finder-pattern filters (on the downscaled search image)
+    MIN_FINDER_SIZE = 5
+    MAX_FINDER_ASPECT = 1.6
+    MIN_FINDER_FILL = 0.6
+    FINDER_SIZE_TOLERANCE = 0.5
+
+    def __init__(
+        self,
+        historySize: int = 8,
+        padding: float = 0.25,
+        finderSearch: bool = True,
+        finderSearchWidth: int = 320,
+        maxRegionRatio: float = 0.6,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize QrRoiLocator.
+
+        Args:
+            historySize: Number of recent QR rectangles kept.
+            padding: Margin added around predicted regions (ratio of region size).
+            finderSearch: Enable finder-pattern search.
+            finderSearchWidth: Width of the downscaled image used for finder search.
+            maxRegionRatio: Maximum region area as ratio of the crop area.
+            logger: Logger instance for debug output.
+        """
+        self._history: deque = deque(maxlen=max(1, historySize))
+        self._padding = padding
+        self._finderSearch = finderSearch
+        self._finderSearchWidth = finderSearchWidth
+        self._maxRegionRatio = maxRegionRatio
+        self._logger = logger or logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._hits: Dict[str, int] = {
+            self.SOURCE_RECENT: 0,
+            self.SOURCE_FINDER: 0,
+            self.SOURCE_FULL: 0
+        }
+
+        self._logger.info(
+            f"QrRoiLocator initialized "
+            f"(historySize={historySize}, padding={padding}, "
+            f"finderSearch={finderSearch}, maxRegionRatio={maxRegionRatio})"
+        )
+
+    def getSearchRegions(
+        self,
+        image: np.ndarray,
+        context: Optional[ImageContext] = None
+    ) -> List[QrSearchRegion]:
+        """
+        Get candidate QR regions in decode order.
+
+        Args:
+            image: Image that will be decoded (grayscale or BGR).
+            context: Optional frame context of the image image was derived
+                from (same aspect ratio); the finder search then downscales
+                the frame image once instead of the already resized image.
+
+        Returns:
+            List of QrSearchRegion (may be empty).
+        """
+        h, w = image.shape[:2]
+        regions: List[QrSearchRegion] = []
+
+        recentRect = self._getRecentRegion(w, h)
+        if recentRect is not None:
+            regions.append(QrSearchRegion(self.SOURCE_RECENT, recentRect))
+
+        if self._finderSearch:
+            finderRect = self._findFinderRegion(image, context)
+            if finderRect is not None and not self._isCovered(finderRect, recentRect):
+                regions.append(QrSearchRegion(self.SOURCE_FINDER, finderRect))
+
+        return regions
+
+    def recordDetection(
+        self,
+        rect: Tuple[int, int, int, int],
+        imageShape: Tuple[int, ...],
+        source: str
+    ) -> None:
+        """
+        Record where a QR code was decoded.
+
+        Args:
+            rect: QR rectangle in image coordinates (left, top, width, height).
+            imageShape: Shape of the image the rectangle refers to.
+            source: Region source that decoded the QR ("recent", "finder" or "full").
+        """
+        h, w = imageShape[:2]
+        if w <= 0 or h <= 0:
+            return
+
+        x, y, rw, rh = rect
+        normalized = (x / w, y / h, (x + rw) / w, (y + rh) / h)
+
+        with self._lock:
+            if source != self.SOURCE_RECENT:
+                # Recent region missed (or was absent): restart history
+                self._history.clear()
+            self._history.append(normalized)
+            self._hits[source] = self._hits.get(source, 0) + 1
+
+    def getStatistics(self) -> Dict[str, int]:
+        """
+        Get number of successful decodes per region source.
+
+        Returns:
+            Dict mapping source to hit count.
+        """
+        with self._lock:
+            return dict(self._hits)
+
+    def reset(self) -> None:
+        """Clear history and statistics."""
+        with self._lock:
+            self._history.clear()
+            for source in self._hits:
+                self._hits[source] = 0
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # Region Prediction
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def _getRecentRegion(self, w: int, h: int) -> Optional[Tuple[int, int, int, int]]:
+        """Union of recent QR rectangles, padded and scaled to the image size."""
+        with self._lock:
+            if not self._history:
+                return None
+            x1 = min(r[0] for r in self._history)
+            y1 = min(r[1] for r in self._history)
+            x2 = max(r[2] for r in self._history)
+            y2 = max(r[3] for r in self._history)
+
+        return self._toPaddedRect(x1 * w, y1 * h, x2 * w, y2 * h, w, h)
+
+    def _findFinderRegion(
+        self,
+        image: np.ndarray,
+        context: Optional[ImageContext] = None
+    ) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Locate the QR code from its finder patterns.
+
+        A finder pattern is a dark square containing a light square containing
+        a dark square, i.e. a contour with a child and a grandchild in the
+        contour hierarchy of the binarized image.
+        """
+        try:
+            h, w = image.shape[:2]
+
+            if context is not None:
+                # Search image shared with other stages; scale maps it to image
+                if context.width > self._finderSearchWidth:
+                    gray, _ = context.scaledToWidth(self._finderSearchWidth, gray=True)
+                else:
+                    gray = context.gray()
+                scale = gray.shape[1] / float(w)
+            else:
+                gray = image if len(image.shape) == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+                scale = 1.0
+
+            if context is None and w > self._finderSearchWidth:
+                scale = self._finderSearchWidth / float(w)
+                gray = cv2.resize(
+                    gray,
+                    (self._finderSearchWidth, max(1, int(h * scale))),
+                    interpolation=cv2.INTER_AREA
+                )
+
+            # Dark modules become foreground
+            _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+            contours, hierarchy = cv2.findContours(binary, cv2.RETR_TREE, cv2.CHAIN_APPROX_SIMPLE)
+            if hierarchy is None:
+                return None
+            hierarchy = hierarchy[0]
+
+            candidates = []
+            for i, contour in enumerate(contours):
+                child = hierarchy[i][2]
+                if child < 0 or hierarchy[child][2] < 0:
+                    continue
+
+                x, y, cw, ch = cv2.boundingRect(contour)
+                if cw < self.MIN_FINDER_SIZE or ch < self.MIN_FINDER_SIZE:
+                    continue
+                if max(cw, ch) > self.MAX_FINDER_ASPECT * min(cw, ch):
+                    continue
+                if cv2.contourArea(contour) < self.MIN_FINDER_FILL * cw * ch:
+                    continue
+                candidates.append((x, y, cw, ch))
+
+            patterns = self._selectFinderGroup(candidates)
+            if len(patterns) < 2:
+                return None
+
+            x1 = min(p[0] for p in patterns)
+            y1 = min(p[1] for p in patterns)
+            x2 = max(p[0] + p[2] for p in patterns)
+            y2 = max(p[1] + p[3] for p in patterns)
+
+            if len(patterns) == 2:
+                # Third corner unknown: grow the short side into a square
+                side = max(x2 - x1, y2 - y1)
+                cx, cy = (x1 + x2) / 2.0, (y1 + y2) / 2.0
+                x1, x2 = cx - side, cx + side
+                y1, y2 = cy - side, cy + side
+
+            self._logger.debug(f"Finder search: {len(patterns)} patterns found")
+            return self._toPaddedRect(
+                x1 / scale, y1 / scale, x2 / scale, y2 / scale, w, h
+            )
+
+        except Exception as e:
+            self._logger.error(f"Finder search failed: {e}")
+            return None
+
+    def _selectFinderGroup(
+        self,
+        candidates: List[Tuple[int, int, int, int]]
+    ) -> List[Tuple[int, int, int, int]]:
+        """Pick the largest group of candidates with similar size (up to 3)."""
+        bestGroup: List[Tuple[int, int, int, int]] = []
+        for ref in candidates:
+            refSize = max(ref[2], ref[3])
+            group = [
+                c for c in candidates
+                if abs(max(c[2], c[3]) - refSize) <= self.FINDER_SIZE_TOLERANCE * refSize
+            ]
+            if len(group) > len(bestGroup):
+                bestGroup = group
+
+        # Prefer the largest patterns when more than three match (e.g. nested text)
+        bestGroup.sort(key=lambda c: c[2] * c[3], reverse=True)
+        return bestGroup[:3]
+
+    def _toPaddedRect(
+        self,
+        x1: float,
+        y1: float,
+        x2: float,
+        y2: float,
+        w: int,
+        h: int
+    ) -> Optional[Tuple[int, int, int, int]]:
+        """Pad, clip to the image and drop regions too large to be worth it."""
+        padX = (x2 - x1) * self._padding
+        padY = (y2 - y1) * self._padding
+        left = max(0, int(x1 - padX))
+        top = max(0, int(y1 - padY))
+        right = min(w, int(x2 + padX + 0.5))
+        bottom = min(h, int(y2 + padY + 0.5))
+
+        if right <= left or bottom <= top:
+            return None
+        if (right - left) * (bottom - top) > self._maxRegionRatio * w * h:
+            return None
+        return (left, top, right - left, bottom - top)
+
+    @staticmethod
+    def _isCovered(
+        rect: Tuple[int, int, int, int],
+        container: Optional[Tuple[int, int, int, int]]
+    ) -> bool:
+        """Check if rect lies inside container (already tried)."""
+        if container is None:
+            return False
+        x, y, w, h = rect
+        cx, cy, cw, ch = container
+        return x >= cx and y >= cy and x + w <= cx + cw and y + h <= cy + ch
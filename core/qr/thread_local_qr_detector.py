@@ -0,0 +1,79 @@
+"""
+Thread-Local QR Code Detector Wrapper.
+
+This module provides an IQrDetector that lazily creates one backend detector
+instance per calling thread. Backends with internal mutable state (e.g. the
+OpenCV WeChat QRCode CNN detector) are not safe to share between threads;
+wrapping them gives each decode worker its own instance.
+
+Follows the Single Responsibility Principle (SRP) from SOLID.
+"""
+
+import logging
+import threading
+from typing import Callable, Optional
+
+import numpy as np
+
+from core.interfaces.qr_detector_interface import IQrDetector, QrDetectionResult
+
+
+class ThreadLocalQrDetector(IQrDetector):
+    """
+    QR detector holding one backend instance per thread.
+
+    Single-threaded callers only ever create one instance, so the wrapper
+    costs a thread-local lookup per call.
+    """
+
+    def __init__(
+        self,
+        detectorFactory: Callable[[], IQrDetector],
+        name: str = "",
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize ThreadLocalQrDetector.
+
+        Args:
+            detectorFactory: Callable creating a new backend detector.
+            name: Backend name for log messages.
+            logger: Logger instance for debug output.
+        """
+        self._detectorFactory = detectorFactory
+        self._name = name
+        self._logger = logger or logging.getLogger(__name__)
+        self._local = threading.local()
+        self._instanceCount = 0
+        self._countLock = threading.Lock()
+
+    @property
+    def instanceCount(self) -> int:
+        """Number of backend instances created so far (one per thread)."""
+        return self._instanceCount
+
+    def detect(self, image: np.ndarray) -> Optional[QrDetectionResult]:
+        """
+        Detect QR code with the calling thread's backend instance.
+
+        Args:
+            image: Input image (BGR or grayscale)
+
+        Returns:
+            QrDetectionResult if QR code found, None otherwise
+        """
+        return self._getDetector().detect(image)
+
+    def _getDetector(self) -> IQrDetector:
+        """Get or create the backend instance for the calling thread."""
+        detector = getattr(self._local, "detector", None)
+        if detector is None:
+            detector = self._detectorFactory()
+            self._local.detector = detector
+            with self._countLock:
+                self._instanceCount += 1
+            self._logger.debug(
+                f"Created {self._name or 'QR'} detector for thread "
+                f"{threading.current_thread().name} (total={self._instanceCount})"
+            )
+        return detector
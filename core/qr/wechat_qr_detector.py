@@ -37,11 +37,16 @@ class WechatQrDetector(IQrDetector):
     - Deep learning based detection
     - Super-resolution for small QR codes
     - High accuracy on various conditions
+    
+    With useSuperResolution=False only the detector CNN is loaded; the
+    super-resolution CNN is skipped, which is cheaper when QR codes are
+    already large in the input image.
     """
     
     def __init__(
         self,
         modelDir: str = "models/wechat",
+        useSuperResolution: bool = True,
         logger: Optional[logging.Logger] = None
     ):
         """
@@ -53,14 +58,17 @@ def __init__(
                 - detect.caffemodel
                 - sr.prototxt
                 - sr.caffemodel
+            useSuperResolution: Load the super-resolution CNN (sr.* files).
             logger: Logger instance for debug output
         """
         self._modelDir = modelDir
+        self._useSuperResolution = useSuperResolution
         self._logger = logger or logging.getLogger(__name__)
         self._detector = None
         
         self._logger.info(
-            f"WechatQrDetector initialized (modelDir={modelDir})"
+            f"WechatQrDetector initialized "
+            f"(modelDir={modelDir}, superResolution={useSuperResolution})"
         )
     
     def _ensureDetector(self) -> None:
@@ -75,9 +83,14 @@ def _ensureDetector(self) -> None:
                 srProtoPath = os.path.join(self._modelDir, "sr.prototxt")
                 srModelPath = os.path.join(self._modelDir, "sr.caffemodel")
                 
+                # Empty SR paths disable super-resolution in OpenCV
+                if not self._useSuperResolution:
+                    srProtoPath = ""
+                    srModelPath = ""
+                
                 # Validate model files exist
                 for path in [detectProtoPath, detectModelPath, srProtoPath, srModelPath]:
-                    if not os.path.exists(path):
+                    if path and not os.path.exists(path):
                         raise FileNotFoundError(f"WeChat QR model file not found: {path}")
                 
                 # Initialize WeChat QRCode detector
@@ -94,7 +107,10 @@ def _ensureDetector(self) -> None:
                     srModelPath
                 )
                 
-                self._logger.info("WeChat QRCode detector loaded successfully")
+                self._logger.info(
+                    f"WeChat QRCode detector loaded successfully "
+                    f"(superResolution={self._useSuperResolution})"
+                )
                 
             except AttributeError as e:
                 self._logger.error(
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Catalog Index Build Script.
+
+Compiles the S8 catalogs (products, sizes, colors) into index files holding
+the prebuilt FuzzyMatchIndex tables, so the application starts without
+parsing the catalog JSON or rebuilding the index.
+S8 also recompiles stale files by itself on startup; this script moves that
+work to deployment time.
+
+Usage:
+    python scripts/build_catalog_index.py
+    python scripts/build_catalog_index.py --force
+    python scripts/build_catalog_index.py --output models/cache/catalog
+
+Paths are read from the s8_postprocessing section of the config.
+"""
+
+import sys
+import time
+import logging
+import argparse
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from services.impl.config_service import ConfigService
+from core.processor.catalog_index_store import CatalogIndexStore
+from core.processor.fuzzy_match_index import OCR_CONFUSION_MAP
+
+
+def parseArgs() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Compile S8 catalogs into index files",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python scripts/build_catalog_index.py
+  python scripts/build_catalog_index.py --force
+        """
+    )
+
+    parser.add_argument(
+        "--config", "-c",
+        type=str,
+        default="config/application_config.json",
+        help="Path to configuration file"
+    )
+
+    parser.add_argument(
+        "--output", "-o",
+        type=str,
+        default=None,
+        help="Index directory (default: s8_postprocessing.catalogIndexDir)"
+    )
+
+    parser.add_argument(
+        "--force", "-f",
+        action="store_true",
+        help="Recompile even if the index files are up to date"
+    )
+
+    return parser.parse_args()
+
+
+def main():
+    """Main entry point."""
+    args = parseArgs()
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+
+    configService = ConfigService(args.config)
+    indexDir = args.output or configService.getCatalogIndexDir()
+    if not indexDir:
+        print("No index directory: set s8_postprocessing.catalogIndexDir or pass --output")
+        sys.exit(1)
+
+    store = CatalogIndexStore(indexDir)
+
+    # (JSON path, value field, uppercase, OCR-confusion keys), as LabelTextProcessor
+    catalogs = [
+        (configService.getProductsJsonPath(), "Code", False, OCR_CONFUSION_MAP),
+        (configService.getSizesJsonPath(), "name", True, OCR_CONFUSION_MAP),
+        (configService.getColorsJsonPath(), "name", True, None),
+    ]
+
+    failures = 0
+    for jsonPath, field, upper, confusionMap in catalogs:
+        if not jsonPath:
+            continue
+
+        startTime = time.perf_counter()
+        index = store.load(jsonPath, field, upper, confusionMap, rebuild=args.force)
+        elapsedMs = (time.perf_counter() - startTime) * 1000
+
+        if index is None:
+            print(f"FAILED  {jsonPath}")
+            failures += 1
+            continue
+
+        print(f"OK      {jsonPath} → {store.getIndexPath(jsonPath, field)} "
+              f"({len(index)} values, {elapsedMs:.1f} ms)")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@
     python scripts/detection.py
     python scripts/detection.py --input samples/ --debug
     python scripts/detection.py --debug --limit 10
+    python scripts/detection.py --batch-size 4
 
 Pipeline Steps (S2-S8):
     S2: Detection       - Detect label using YOLO
@@ -37,7 +38,7 @@
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import cv2
 
@@ -108,8 +109,73 @@ def processImage(orchestrator: PipelineOrchestrator, image, frameId: str) -> dic
     Returns:
         Dictionary with processing results and timing.
     """
-    logger = logging.getLogger(__name__)
     startTime = time.time()
+    result, qrData, mergedImage = prepareImage(orchestrator, image, frameId, startTime)
+    if mergedImage is None:
+        return result
+    
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # S7: OCR
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    ocrResult = orchestrator.ocrService.extractText(mergedImage, frameId)
+    
+    return finishImage(orchestrator, result, qrData, ocrResult, startTime)
+
+
+def processBatch(orchestrator: PipelineOrchestrator, frames: List[Tuple[str, object]]) -> List[dict]:
+    """
+    Process several images, recognizing all merged images in one S7 call.
+    
+    S2-S6 run per image, then IOcrService.extractTextBatch() recognizes the
+    merged images together (in parallel on the worker pool when
+    s7_ocr.executionMode is "process"), then S8 runs per image.
+    
+    Args:
+        orchestrator: Pipeline orchestrator with all services.
+        frames: (frameId, OpenCV image) pairs.
+        
+    Returns:
+        One result dictionary per frame, in input order. s7_ocr holds the
+        time of the whole batch call.
+    """
+    prepared = []
+    for frameId, image in frames:
+        startTime = time.time()
+        prepared.append(
+            prepareImage(orchestrator, image, frameId, startTime) + (startTime,)
+        )
+    
+    pending = [item for item in prepared if item[2] is not None]
+    if pending:
+        ocrResults = orchestrator.ocrService.extractTextBatch(
+            [mergedImage for _, _, mergedImage, _ in pending],
+            pending[0][0]["frameId"]
+        )
+        for (result, qrData, _, startTime), ocrResult in zip(pending, ocrResults):
+            finishImage(orchestrator, result, qrData, ocrResult, startTime)
+    
+    return [result for result, _, _, _ in prepared]
+
+
+def prepareImage(
+    orchestrator: PipelineOrchestrator,
+    image,
+    frameId: str,
+    startTime: float
+) -> Tuple[dict, object, object]:
+    """
+    Run pipeline S2-S6 on one image.
+    
+    Args:
+        orchestrator: Pipeline orchestrator with all services.
+        image: OpenCV image (BGR format).
+        frameId: Unique frame identifier (used for debug output naming).
+        startTime: Processing start time of the image.
+        
+    Returns:
+        (result, qrData, mergedImage). mergedImage is None when a step
+        failed; result then holds the error and total time.
+    """
     timing = {}
     
     result = {
@@ -128,8 +194,6 @@ def processImage(orchestrator: PipelineOrchestrator, image, frameId: str) -> dic
     enhancementService = orchestrator.enhancementService
     qrDetectionService = orchestrator.qrDetectionService
     componentExtractionService = orchestrator.componentExtractionService
-    ocrService = orchestrator.ocrService
-    postprocessingService = orchestrator.postprocessingService
     
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # S2: Detection
@@ -140,7 +204,7 @@ def processImage(orchestrator: PipelineOrchestrator, image, frameId: str) -> dic
     if not detectionResult.success or not detectionResult.detections:
         result["error"] = "No label detected"
         result["timing"]["total"] = (time.time() - startTime) * 1000
-        return result
+        return result, None, None
     
     result["detection"] = True
     firstDetection = detectionResult.detections[0]
@@ -151,7 +215,7 @@ def processImage(orchestrator: PipelineOrchestrator, image, frameId: str) -> dic
     if not preprocessingService.isEnabled():
         result["error"] = "Preprocessing disabled"
         result["timing"]["total"] = (time.time() - startTime) * 1000
-        return result
+        return result, None, None
     
     preprocessResult = preprocessingService.preprocess(image, firstDetection, frameId)
     timing["s3_preprocessing"] = preprocessResult.processingTimeMs
@@ -159,7 +223,7 @@ def processImage(orchestrator: PipelineOrchestrator, image, frameId: str) -> dic
     if not preprocessResult.success or preprocessResult.croppedImage is None:
         result["error"] = "Preprocessing failed"
         result["timing"]["total"] = (time.time() - startTime) * 1000
-        return result
+        return result, None, None
     
     processedImage = preprocessResult.croppedImage
     
@@ -182,7 +246,7 @@ def processImage(orchestrator: PipelineOrchestrator, image, frameId: str) -> dic
     if not qrResult.success or qrResult.qrData is None:
         result["error"] = "No QR code detected"
         result["timing"]["total"] = (time.time() - startTime) * 1000
-        return result
+        return result, None, None
     
     result["qrCode"] = qrResult.qrData.text
     
@@ -199,12 +263,35 @@ def processImage(orchestrator: PipelineOrchestrator, image, frameId: str) -> dic
     if not componentResult.success or componentResult.mergedImage is None:
         result["error"] = "Component extraction failed"
         result["timing"]["total"] = (time.time() - startTime) * 1000
-        return result
+        return result, None, None
+    
+    return result, qrResult.qrData, componentResult.mergedImage
+
+
+def finishImage(
+    orchestrator: PipelineOrchestrator,
+    result: dict,
+    qrData,
+    ocrResult,
+    startTime: float
+) -> dict:
+    """
+    Record the S7 result of one image and run S8.
+    
+    Args:
+        orchestrator: Pipeline orchestrator with all services.
+        result: Result dictionary from prepareImage().
+        qrData: QR data from S5.
+        ocrResult: OcrServiceResult of the merged image.
+        startTime: Processing start time of the image.
+        
+    Returns:
+        The completed result dictionary.
+    """
+    timing = result["timing"]
+    frameId = result["frameId"]
+    postprocessingService = orchestrator.postprocessingService
     
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    # S7: OCR
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    ocrResult = ocrService.extractText(componentResult.mergedImage, frameId)
     timing["s7_ocr"] = ocrResult.processingTimeMs
     
     textBlocks = []
@@ -214,7 +301,7 @@ def processImage(orchestrator: PipelineOrchestrator, image, frameId: str) -> dic
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # S8: Postprocessing
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    postResult = postprocessingService.process(textBlocks, qrResult.qrData, frameId)
+    postResult = postprocessingService.process(textBlocks, qrData, frameId)
     timing["s8_postprocessing"] = postResult.processingTimeMs
     
     if postResult.success and postResult.labelData:
@@ -243,7 +330,8 @@ def processImage(orchestrator: PipelineOrchestrator, image, frameId: str) -> dic
 def processAll(
     orchestrator: PipelineOrchestrator,
     inputDir: str,
-    limit: Optional[int] = None
+    limit: Optional[int] = None,
+    batchSize: int = 1
 ) -> List[dict]:
     """
     Process all images in a directory.
@@ -252,6 +340,8 @@ def processAll(
         orchestrator: Pipeline orchestrator with all services.
         inputDir: Input directory containing images.
         limit: Maximum number of images to process (None = all).
+        batchSize: Images per S7 call; above 1 the merged images are
+            recognized together by processBatch().
         
     Returns:
         List of result dictionaries for each processed image.
@@ -278,6 +368,7 @@ def processAll(
     logger.info(f"Starting batch processing of {totalCount} images...")
     batchStartTime = time.time()
     
+    pendingFrames = []
     for idx, imagePath in enumerate(imageFiles, 1):
         # Calculate relative path for display and frameId
         try:
@@ -295,32 +386,49 @@ def processAll(
         image = cv2.imread(str(imagePath))
         if image is None:
             logger.error(f"  ✗ Failed to read image")
-            results.append({
-                "frameId": frameId,
-                "success": False,
-                "error": "Failed to read image"
-            })
+        pendingFrames.append((frameId, image))
+        
+        if len(pendingFrames) < batchSize and idx < totalCount:
             continue
         
-        # Process image
-        result = processImage(orchestrator, image, frameId)
-        results.append(result)
-        
-        # Log result
-        if result["success"]:
-            successCount += 1
-            ocrData = result.get("ocrResult", {})
-            logger.info(
-                f"  ✓ ProductCode: {ocrData.get('productCode', 'N/A')}, "
-                f"Size: {ocrData.get('size', 'N/A')}, "
-                f"Color: {ocrData.get('color', 'N/A')}"
-            )
+        # Process image(s); unreadable images keep their place in the results
+        loadedFrames = [frame for frame in pendingFrames if frame[1] is not None]
+        if batchSize > 1 and loadedFrames:
+            logger.info(f"  Batch: {len(loadedFrames)} images")
+            processed = iter(processBatch(orchestrator, loadedFrames))
         else:
-            logger.warning(f"  ✗ {result.get('error', 'Unknown error')}")
+            processed = iter(processImage(orchestrator, image, frameId) for frameId, image in loadedFrames)
+        batchResults = [
+            next(processed) if image is not None else {
+                "frameId": frameId,
+                "success": False,
+                "error": "Failed to read image"
+            }
+            for frameId, image in pendingFrames
+        ]
+        pendingFrames = []
         
-        # Log timing
-        timing = result.get("timing", {})
-        logger.info(f"  Time: {timing.get('total', 0):.1f}ms")
+        for result in batchResults:
+            results.append(result)
+            if "timing" not in result:
+                continue
+            prefix = f"  [{result['frameId']}]" if batchSize > 1 else " "
+            
+            # Log result
+            if result["success"]:
+                successCount += 1
+                ocrData = result.get("ocrResult", {})
+                logger.info(
+                    f"{prefix} ✓ ProductCode: {ocrData.get('productCode', 'N/A')}, "
+                    f"Size: {ocrData.get('size', 'N/A')}, "
+                    f"Color: {ocrData.get('color', 'N/A')}"
+                )
+            else:
+                logger.warning(f"{prefix} ✗ {result.get('error', 'Unknown error')}")
+            
+            # Log timing
+            timing = result.get("timing", {})
+            logger.info(f"{prefix} Time: {timing.get('total', 0):.1f}ms")
     
     # Summary
     batchTotalTime = (time.time() - batchStartTime) * 1000
@@ -462,6 +570,7 @@ def parseArgs() -> argparse.Namespace:
   python scripts/detection.py
   python scripts/detection.py --input samples/ --debug
   python scripts/detection.py --debug --limit 10
+  python scripts/detection.py --batch-size 4
 
 Output:
   When --debug is enabled, results are saved to output/debug/
@@ -496,6 +605,14 @@ def parseArgs() -> argparse.Namespace:
         help="Enable debug mode (saves output to output/debug/)"
     )
     
+    parser.add_argument(
+        "--batch-size", "-b",
+        type=int,
+        default=1,
+        help="Images per OCR call via extractTextBatch (default: 1 = one call per image); "
+             "parallel with s7_ocr.executionMode = \"process\""
+    )
+    
     return parser.parse_args()
 
 
@@ -515,6 +632,8 @@ def main():
     logger.info(f"Debug:  {args.debug}")
     if args.limit:
         logger.info(f"Limit:  {args.limit}")
+    if args.batch_size > 1:
+        logger.info(f"Batch:  {args.batch_size} images per OCR call")
     logger.info("=" * 60)
     
     # Check input directory
@@ -551,7 +670,8 @@ def main():
         results = processAll(
             orchestrator=orchestrator,
             inputDir=args.input,
-            limit=args.limit
+            limit=args.limit,
+            batchSize=args.batch_size
         )
         
         # Shutdown
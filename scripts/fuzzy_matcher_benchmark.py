@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+Fuzzy Matcher Parity and Benchmark Script.
+
+Checks the bounded matching kernels against the reference (full DP)
+implementations, then times catalog matching on a real catalog.
+
+Parity checks:
+    - boundedLevenshteinDistance == min(levenshteinDistance, maxDistance + 1)
+    - jaroWinklerUpperBound      >= jaroWinklerSimilarity
+    - boundedCombinedSimilarity  == combinedSimilarity when >= minScore, else None
+    - FuzzyMatcher.bestMatch     == linear scan with combinedSimilarity
+    - FuzzyMatchIndex.bestMatch  == linear scan with combinedSimilarity
+
+Benchmark (same OCR-like queries for every matcher):
+    - reference: linear scan, full combinedSimilarity per candidate
+    - bounded:   FuzzyMatcher.bestMatch (early-abandon kernels)
+    - index:     FuzzyMatchIndex.bestMatch (pruned candidates)
+
+Usage:
+    python scripts/fuzzy_matcher_benchmark.py
+    python scripts/fuzzy_matcher_benchmark.py --catalog data/products.json --field Code
+    python scripts/fuzzy_matcher_benchmark.py --queries 500 --min-score 0.9
+    python scripts/fuzzy_matcher_benchmark.py --skip-parity --scaling 5000 20000 50000
+
+Exit code is 1 if any parity check fails.
+"""
+
+import sys
+import json
+import time
+import random
+import argparse
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.processor.fuzzy_matcher import FuzzyMatcher
+from core.processor.fuzzy_match_index import FuzzyMatchIndex
+
+
+# Characters OCR typically confuses on labels
+OCR_CONFUSIONS = {
+    'O': '0Q', '0': 'OD', 'I': '1L', '1': 'IL', 'L': '1I', 'S': '5', '5': 'S',
+    'B': '8', '8': 'B', 'Z': '2', '2': 'Z', 'G': '6', '6': 'G', 'E': 'F', 'M': 'N'
+}
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 /-"
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Data
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def loadCatalog(jsonPath: str, field: str, upper: bool = True) -> List[str]:
+    """
+    Load catalog values as LabelTextProcessor does.
+
+    Args:
+        jsonPath: Path to catalog JSON file
+        field: Field holding the value ("name" or "Code")
+        upper: Uppercase values (sizes and colors)
+
+    Returns:
+        List of catalog values
+    """
+    with open(jsonPath, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    values = [str(item.get(field, '')).strip() for item in data if item.get(field)]
+    return [value.upper() for value in values] if upper else values
+
+
+def perturb(text: str, rng: random.Random, maxEdits: int = 2) -> str:
+    """
+    Misread a text as OCR would: confused, dropped and inserted characters.
+
+    Args:
+        text: Original text
+        rng: Random generator
+        maxEdits: Maximum number of edits
+
+    Returns:
+        Perturbed text
+    """
+    chars = list(text)
+    for _ in range(rng.randint(0, maxEdits)):
+        op = rng.random()
+        pos = rng.randrange(len(chars)) if chars else 0
+        if op < 0.5 and chars:
+            chars[pos] = rng.choice(OCR_CONFUSIONS.get(chars[pos].upper(), ALPHABET))
+        elif op < 0.75 and chars:
+            del chars[pos]
+        else:
+            chars.insert(pos, rng.choice(ALPHABET))
+    return ''.join(chars)
+
+
+def makeQueries(catalog: List[str], count: int, rng: random.Random) -> List[str]:
+    """
+    Build OCR-like queries with perturb().
+
+    Args:
+        catalog: Catalog values to perturb
+        count: Number of queries
+        rng: Random generator
+
+    Returns:
+        List of query strings (about 1 in 10 unrelated noise)
+    """
+    queries = []
+    for _ in range(count):
+        if rng.random() < 0.1:
+            queries.append(''.join(rng.choice(ALPHABET) for _ in range(rng.randint(1, 12))))
+            continue
+
+        queries.append(perturb(rng.choice(catalog), rng, maxEdits=3))
+    return queries
+
+
+def makeSyntheticCatalog(base: List[str], size: int, rng: random.Random) -> List[str]:
+    """
+    Build a larger catalog from the words of a real one (e.g. 20k colors).
+
+    Args:
+        base: Real catalog values providing the vocabulary
+        size: Number of distinct values
+        rng: Random generator
+
+    Returns:
+        List of size distinct values of 1-3 words, some with a numeric suffix
+    """
+    words = sorted({word for value in base for word in value.split() if word})
+    values = dict.fromkeys(base[:size])
+    while len(values) < size:
+        value = ' '.join(rng.choice(words) for _ in range(rng.randint(1, 3)))
+        if rng.random() < 0.3:
+            value += f" {rng.randint(1, 99)}"
+        values.setdefault(value)
+    return list(values)
+
+
+def referenceBestMatch(text: str, candidates: List[str], minScore: float) -> Tuple[str, float]:
+    """Linear scan with full combinedSimilarity (pre-bounded bestMatch)."""
+    if not text or not candidates:
+        return ("", 0.0)
+
+    best = ""
+    bestScore = minScore
+    for candidate in candidates:
+        score = FuzzyMatcher.combinedSimilarity(text, candidate)
+        if score > bestScore:
+            bestScore = score
+            best = candidate
+    return (best, bestScore)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Parity
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def checkParity(
+    catalog: List[str],
+    queries: List[str],
+    minScore: float,
+    rng: random.Random,
+    pairCount: int
+) -> int:
+    """
+    Compare bounded kernels and matchers with the reference implementations.
+
+    Args:
+        catalog: Catalog values
+        queries: Query strings
+        minScore: Threshold used for bestMatch
+        rng: Random generator
+        pairCount: Number of random (query, candidate) pairs for kernel checks
+
+    Returns:
+        Number of failures
+    """
+    failures = 0
+
+    def fail(message: str) -> None:
+        nonlocal failures
+        failures += 1
+        if failures <= 10:
+            print(f"  FAIL {message}")
+
+    for _ in range(pairCount):
+        a = rng.choice(queries).strip().upper()
+        b = rng.choice(catalog)
+
+        dist = FuzzyMatcher.levenshteinDistance(a, b)
+        for maxDistance in range(0, max(len(a), len(b)) + 2):
+            bounded = FuzzyMatcher.boundedLevenshteinDistance(a, b, maxDistance)
+            if bounded != min(dist, maxDistance + 1):
+                fail(f"boundedLevenshteinDistance({a!r}, {b!r}, {maxDistance}) = {bounded}, full = {dist}")
+
+        jw = FuzzyMatcher.jaroWinklerSimilarity(a, b)
+        if FuzzyMatcher.jaroWinklerUpperBound(a, b) + 1e-9 < jw:
+            fail(f"jaroWinklerUpperBound({a!r}, {b!r}) below {jw}")
+
+        combined = FuzzyMatcher.combinedSimilarity(a, b)
+        for threshold in (0.0, 0.5, 0.8, minScore, combined, 1.0):
+            bounded = FuzzyMatcher.boundedCombinedSimilarity(a, b, threshold)
+            expected = combined if combined >= threshold else None
+            if bounded != expected:
+                fail(f"boundedCombinedSimilarity({a!r}, {b!r}, {threshold}) = {bounded}, expected {expected}")
+
+    index = FuzzyMatchIndex(catalog)
+    for threshold in (0.0, minScore):
+        for query in queries:
+            expected = referenceBestMatch(query, catalog, threshold)
+            for name, result in (
+                ("FuzzyMatcher.bestMatch", FuzzyMatcher.bestMatch(query, catalog, threshold)),
+                ("FuzzyMatchIndex.bestMatch", index.bestMatch(query, threshold))
+            ):
+                if result != expected:
+                    fail(f"{name}({query!r}, {threshold}) = {result}, expected {expected}")
+
+    return failures
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Benchmark
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def timeMatcher(match: Callable[[str], Tuple[str, float]], queries: List[str]) -> float:
+    """
+    Time a matcher over all queries.
+
+    Args:
+        match: Function matching one query
+        queries: Query strings
+
+    Returns:
+        Average time per query in milliseconds
+    """
+    start = time.perf_counter()
+    for query in queries:
+        match(query)
+    return (time.perf_counter() - start) * 1000 / max(1, len(queries))
+
+
+def runBenchmark(catalog: List[str], queries: List[str], minScore: float) -> None:
+    """
+    Print average time per query for each matcher.
+
+    Args:
+        catalog: Catalog values
+        queries: Query strings
+        minScore: Threshold used for bestMatch
+    """
+    buildStart = time.perf_counter()
+    index = FuzzyMatchIndex(catalog)
+    buildMs = (time.perf_counter() - buildStart) * 1000
+
+    timings = [
+        ("reference", timeMatcher(lambda q: referenceBestMatch(q, catalog, minScore), queries)),
+        ("bounded", timeMatcher(lambda q: FuzzyMatcher.bestMatch(q, catalog, minScore), queries)),
+        ("index", timeMatcher(lambda q: index.bestMatch(q, minScore), queries)),
+    ]
+
+    referenceMs = timings[0][1]
+    print(f"{'Matcher':<12}{'ms/query':>12}{'speedup':>10}")
+    for name, ms in timings:
+        print(f"{name:<12}{ms:>12.3f}{referenceMs / ms if ms > 0 else 0:>9.1f}x")
+
+    stats = index.getStatistics()
+    scoredPerQuery = stats["scored"] / max(1, stats["queries"])
+    print(f"Index build: {buildMs:.1f} ms, candidates scored per query: "
+          f"{scoredPerQuery:.1f} / {stats['candidates']}")
+
+
+def runScaling(
+    base: List[str],
+    sizes: List[int],
+    queryCount: int,
+    minScore: float,
+    rng: random.Random
+) -> int:
+    """
+    Print index build and query time on synthetic catalogs of several sizes.
+
+    Parity with FuzzyMatcher.bestMatch is checked on the first 20 queries of
+    each size (a linear scan of large catalogs is slow).
+
+    Args:
+        base: Real catalog values providing the vocabulary
+        sizes: Catalog sizes to run
+        queryCount: Queries per size
+        minScore: Threshold used for bestMatch
+        rng: Random generator
+
+    Returns:
+        Number of parity failures
+    """
+    failures = 0
+    print(f"{'Size':>8}{'build ms':>10}{'ms/query':>10}{'visited':>10}{'scored':>8}")
+    for size in sizes:
+        catalog = makeSyntheticCatalog(base, size, rng)
+        queries = makeQueries(catalog, queryCount, rng)
+
+        buildStart = time.perf_counter()
+        index = FuzzyMatchIndex(catalog)
+        buildMs = (time.perf_counter() - buildStart) * 1000
+
+        queryMs = timeMatcher(lambda q: index.bestMatch(q, minScore), queries)
+        stats = index.getStatistics()
+        perQuery = max(1, stats["queries"])
+        print(f"{size:>8}{buildMs:>10.1f}{queryMs:>10.3f}"
+              f"{stats['visited'] / perQuery:>10.1f}{stats['scored'] / perQuery:>8.1f}")
+
+        for query in queries[:20]:
+            expected = FuzzyMatcher.bestMatch(query, catalog, minScore)
+            result = index.bestMatch(query, minScore)
+            if result != expected:
+                failures += 1
+                print(f"  FAIL FuzzyMatchIndex.bestMatch({query!r}) = {result}, expected {expected}")
+
+    return failures
+
+
+def parseArgs() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Fuzzy matcher parity check and micro-benchmark",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python scripts/fuzzy_matcher_benchmark.py
+  python scripts/fuzzy_matcher_benchmark.py --catalog data/products.json --field Code
+  python scripts/fuzzy_matcher_benchmark.py --skip-parity --scaling
+        """
+    )
+
+    parser.add_argument(
+        "--catalog",
+        type=str,
+        default="data/colors.json",
+        help="Catalog JSON file (default: data/colors.json)"
+    )
+
+    parser.add_argument(
+        "--field",
+        type=str,
+        default="name",
+        help="Catalog field holding the value (default: name)"
+    )
+
+    parser.add_argument(
+        "--queries", "-n",
+        type=int,
+        default=300,
+        help="Number of OCR-like queries (default: 300)"
+    )
+
+    parser.add_argument(
+        "--min-score",
+        type=float,
+        default=0.9,
+        help="bestMatch threshold, as minFuzzyScore (default: 0.9)"
+    )
+
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=42,
+        help="Random seed (default: 42)"
+    )
+
+    parser.add_argument(
+        "--scaling",
+        type=int,
+        nargs="*",
+        default=None,
+        metavar="SIZE",
+        help="Also time the index on synthetic catalogs of these sizes "
+             "(default with no value: 5000 20000 50000)"
+    )
+
+    parser.add_argument(
+        "--skip-parity",
+        action="store_true",
+        help="Only run the benchmark"
+    )
+
+    return parser.parse_args()
+
+
+def main():
+    """Main entry point."""
+    args = parseArgs()
+    rng = random.Random(args.seed)
+
+    catalog = loadCatalog(args.catalog, args.field)
+    queries = makeQueries(catalog, args.queries, rng)
+    print(f"Catalog: {args.catalog} ({len(catalog)} values), {len(queries)} queries, "
+          f"minScore={args.min_score}")
+
+    failures = 0
+    if not args.skip_parity:
+        print("\n=== Parity ===")
+        failures = checkParity(catalog, queries, args.min_score, rng, pairCount=len(queries))
+        print(f"  {'OK' if failures == 0 else f'{failures} failure(s)'}")
+
+    print("\n=== Benchmark ===")
+    runBenchmark(catalog, queries, args.min_score)
+
+    if args.scaling is not None:
+        print("\n=== Scaling (synthetic catalogs) ===")
+        failures += runScaling(
+            catalog, args.scaling or [5000, 20000, 50000], args.queries, args.min_score, rng
+        )
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
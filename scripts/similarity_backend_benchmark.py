@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""
+Similarity Backend Parity and Benchmark Script.
+
+Checks every installed similarity backend against the pure-Python
+FuzzyMatcher, then times S8 postprocessing (LabelTextProcessor.process)
+per label with each backend.
+
+Parity checks (per backend, OCR-like queries against the S8 catalogs):
+    - combinedSimilarity         == FuzzyMatcher.combinedSimilarity (identical float)
+    - boundedCombinedSimilarity  == combinedSimilarity when >= minScore, else None
+    - FuzzyMatchIndex.bestMatch  == linear scan with FuzzyMatcher.combinedSimilarity
+    - LabelTextProcessor.process == same LabelData as the Python backend
+
+Benchmark (same synthetic labels for every backend):
+    - kernel:  combinedSimilarity per (query, catalog value) pair
+    - S8:      LabelTextProcessor.process per label (OCR blocks with
+               position, product, size and color, some misread)
+
+Usage:
+    python scripts/similarity_backend_benchmark.py
+    python scripts/similarity_backend_benchmark.py --labels 500
+    python scripts/similarity_backend_benchmark.py --backends python rapidfuzz
+
+Catalog paths are read from the s8_postprocessing section of the config.
+Exit code is 1 if any parity check fails.
+"""
+
+import sys
+import time
+import random
+import logging
+import argparse
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from services.impl.config_service import ConfigService
+from core.interfaces.ocr_extractor_interface import TextBlock
+from core.interfaces.qr_detector_interface import QrDetectionResult
+from core.interfaces.similarity_backend_interface import ISimilarityBackend
+from core.processor.fuzzy_matcher import FuzzyMatcher
+from core.processor.fuzzy_match_index import FuzzyMatchIndex
+from core.processor.label_text_processor import LabelTextProcessor
+from core.processor.similarity_backend_factory import (
+    createSimilarityBackend,
+    isSimilarityBackendAvailable
+)
+from scripts.fuzzy_matcher_benchmark import (
+    ALPHABET,
+    loadCatalog,
+    perturb,
+    referenceBestMatch
+)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Data
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def loadProcessor(
+    configService: ConfigService,
+    backend: ISimilarityBackend,
+    minScore: float
+) -> LabelTextProcessor:
+    """
+    Create a LabelTextProcessor on the configured catalogs.
+
+    Args:
+        configService: Config with s8_postprocessing catalog paths
+        backend: Similarity backend
+        minScore: Minimum fuzzy score (as minFuzzyScore)
+
+    Returns:
+        LabelTextProcessor using the backend
+    """
+    return LabelTextProcessor(
+        productsJsonPath=configService.getProductsJsonPath(),
+        sizesJsonPath=configService.getSizesJsonPath(),
+        colorsJsonPath=configService.getColorsJsonPath(),
+        minFuzzyScore=minScore,
+        similarityBackend=backend
+    )
+
+
+def makeQueries(catalogs: List[List[str]], count: int, rng: random.Random) -> List[str]:
+    """
+    Build OCR-like queries from all catalogs (about 1 in 10 unrelated noise).
+
+    Args:
+        catalogs: Catalog value lists
+        count: Number of queries
+        rng: Random generator
+
+    Returns:
+        List of raw query strings (mixed case, padded)
+    """
+    queries = []
+    for _ in range(count):
+        if rng.random() < 0.1:
+            queries.append(''.join(rng.choice(ALPHABET) for _ in range(rng.randint(1, 12))))
+            continue
+        text = perturb(rng.choice(rng.choice(catalogs)), rng, maxEdits=3)
+        queries.append(rng.choice([text, text.lower(), f" {text} "]))
+    return queries
+
+
+def makeLabels(
+    catalogs: List[List[str]],
+    count: int,
+    rng: random.Random
+) -> List[Tuple[List[TextBlock], QrDetectionResult]]:
+    """
+    Build synthetic S8 inputs: sorted OCR blocks and the decoded QR.
+
+    Args:
+        catalogs: Product, size and color values
+        count: Number of labels
+        rng: Random generator
+
+    Returns:
+        List of (textBlocks, qrResult)
+    """
+    products, sizes, colors = catalogs
+    labels = []
+    for n in range(count):
+        position = rng.randint(1, 5)
+        quantity = rng.randint(position, 9)
+        texts = [
+            f"{position}/{quantity}",
+            perturb(rng.choice(products), rng),
+            perturb(rng.choice(sizes), rng, maxEdits=1),
+            perturb(rng.choice(colors), rng),
+        ]
+        if rng.random() < 0.3:
+            texts.insert(rng.randint(1, len(texts)), perturb("MADE IN USA", rng))
+
+        blocks = [
+            TextBlock(
+                text=text,
+                confidence=0.9,
+                bbox=[[0, i * 20], [100, i * 20], [100, i * 20 + 15], [0, i * 20 + 15]]
+            )
+            for i, text in enumerate(texts)
+        ]
+        qrResult = QrDetectionResult(
+            text=f"110125-VA-M-{n:06d}-{position}",
+            polygon=[],
+            rect=(0, 0, 0, 0),
+            confidence=1.0,
+            dateCode="110125",
+            facility="VA",
+            orderType="M",
+            orderNumber=f"{n:06d}",
+            position=position
+        )
+        labels.append((blocks, qrResult))
+    return labels
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Parity
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def checkParity(
+    backend: ISimilarityBackend,
+    processor: LabelTextProcessor,
+    reference: LabelTextProcessor,
+    catalogs: List[List[str]],
+    queries: List[str],
+    labels: List[Tuple[List[TextBlock], QrDetectionResult]],
+    minScore: float,
+    rng: random.Random
+) -> int:
+    """
+    Compare a backend with the pure-Python FuzzyMatcher.
+
+    Args:
+        backend: Backend under test
+        processor: LabelTextProcessor using the backend
+        reference: LabelTextProcessor using the Python backend
+        catalogs: Product, size and color values
+        queries: Query strings
+        labels: Synthetic S8 inputs
+        minScore: Threshold used for bestMatch
+        rng: Random generator
+
+    Returns:
+        Number of failures
+    """
+    failures = 0
+
+    def fail(message: str) -> None:
+        nonlocal failures
+        failures += 1
+        if failures <= 10:
+            print(f"  FAIL {message}")
+
+    for a in queries:
+        b = rng.choice(rng.choice(catalogs))
+
+        expected = FuzzyMatcher.combinedSimilarity(a, b)
+        score = backend.combinedSimilarity(a, b)
+        if score != expected:
+            fail(f"combinedSimilarity({a!r}, {b!r}) = {score!r}, expected {expected!r}")
+
+        for threshold in (0.0, 0.5, 0.8, minScore, expected, 1.0):
+            bounded = backend.boundedCombinedSimilarity(a, b, threshold)
+            want = expected if expected >= threshold else None
+            if bounded != want:
+                fail(f"boundedCombinedSimilarity({a!r}, {b!r}, {threshold}) = {bounded!r}, expected {want!r}")
+
+    for catalog in catalogs:
+        index = FuzzyMatchIndex(catalog, backend=backend)
+        for query in queries:
+            expected = referenceBestMatch(query, catalog, minScore)
+            result = index.bestMatch(query, minScore)
+            if result != expected:
+                fail(f"FuzzyMatchIndex.bestMatch({query!r}) = {result}, expected {expected}")
+
+    for blocks, qrResult in labels:
+        result = asdict(processor.process(blocks, qrResult))
+        expected = asdict(reference.process(blocks, qrResult))
+        if result != expected:
+            fail(f"process({[b.text for b in blocks]}) = {result}, expected {expected}")
+
+    return failures
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Benchmark
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def timeBackend(
+    backend: ISimilarityBackend,
+    processor: LabelTextProcessor,
+    pairs: List[Tuple[str, str]],
+    labels: List[Tuple[List[TextBlock], QrDetectionResult]]
+) -> Tuple[float, float]:
+    """
+    Time the similarity kernel and S8 postprocessing with one backend.
+
+    Args:
+        backend: Backend under test
+        processor: LabelTextProcessor using the backend
+        pairs: (query, catalog value) pairs
+        labels: Synthetic S8 inputs
+
+    Returns:
+        (microseconds per pair, milliseconds per label)
+    """
+    start = time.perf_counter()
+    for a, b in pairs:
+        backend.combinedSimilarity(a, b)
+    pairUs = (time.perf_counter() - start) * 1e6 / max(1, len(pairs))
+
+    start = time.perf_counter()
+    for blocks, qrResult in labels:
+        processor.process(blocks, qrResult)
+    labelMs = (time.perf_counter() - start) * 1000 / max(1, len(labels))
+
+    return (pairUs, labelMs)
+
+
+def parseArgs() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Similarity backend parity check and S8 per-label benchmark",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python scripts/similarity_backend_benchmark.py
+  python scripts/similarity_backend_benchmark.py --backends python rapidfuzz --labels 500
+        """
+    )
+
+    parser.add_argument(
+        "--config", "-c",
+        type=str,
+        default="config/application_config.json",
+        help="Path to configuration file"
+    )
+
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        choices=["python", "rapidfuzz"],
+        default=["python", "rapidfuzz"],
+        help="Backends to compare (default: python rapidfuzz; missing ones are skipped)"
+    )
+
+    parser.add_argument(
+        "--queries", "-n",
+        type=int,
+        default=300,
+        help="Number of OCR-like queries (default: 300)"
+    )
+
+    parser.add_argument(
+        "--labels", "-l",
+        type=int,
+        default=200,
+        help="Number of synthetic labels (default: 200)"
+    )
+
+    parser.add_argument(
+        "--min-score",
+        type=float,
+        default=0.9,
+        help="Fuzzy threshold, as minFuzzyScore (default: 0.9)"
+    )
+
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=42,
+        help="Random seed (default: 42)"
+    )
+
+    parser.add_argument(
+        "--skip-parity",
+        action="store_true",
+        help="Only run the benchmark"
+    )
+
+    return parser.parse_args()
+
+
+def main():
+    """Main entry point."""
+    args = parseArgs()
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
+    rng = random.Random(args.seed)
+
+    configService = ConfigService(args.config)
+
+    backends: Dict[str, ISimilarityBackend] = {}
+    for name in args.backends:
+        if not isSimilarityBackendAvailable(name):
+            print(f"Skipping {name}: not installed")
+            continue
+        backends[name] = createSimilarityBackend(name)
+
+    reference = loadProcessor(configService, createSimilarityBackend("python"), args.min_score)
+    processors = {
+        name: loadProcessor(configService, backend, args.min_score)
+        for name, backend in backends.items()
+    }
+
+    catalogs = [
+        loadCatalog(configService.getProductsJsonPath(), "Code", upper=False),
+        loadCatalog(configService.getSizesJsonPath(), "name", upper=True),
+        loadCatalog(configService.getColorsJsonPath(), "name", upper=True)
+    ]
+    queries = makeQueries(catalogs, args.queries, rng)
+    labels = makeLabels(catalogs, args.labels, rng)
+    pairs = [(query, rng.choice(rng.choice(catalogs))) for query in queries]
+    print(f"Catalogs: {len(catalogs[0])} products, {len(catalogs[1])} sizes, "
+          f"{len(catalogs[2])} colors; {len(queries)} queries, {len(labels)} labels, "
+          f"minScore={args.min_score}")
+
+    failures = 0
+    if not args.skip_parity:
+        print("\n=== Parity (against FuzzyMatcher) ===")
+        for name, backend in backends.items():
+            backendFailures = checkParity(
+                backend, processors[name], reference, catalogs, queries, labels,
+                args.min_score, rng
+            )
+            failures += backendFailures
+            print(f"  {name:<12}{'OK' if backendFailures == 0 else f'{backendFailures} failure(s)'}")
+
+    print("\n=== Benchmark ===")
+    timings = {
+        name: timeBackend(backend, processors[name], pairs, labels)
+        for name, backend in backends.items()
+    }
+
+    baseline = timings.get("python")
+    print(f"{'Backend':<12}{'us/pair':>10}{'S8 ms/label':>14}{'speedup':>10}")
+    for name, (pairUs, labelMs) in timings.items():
+        speedup = baseline[1] / labelMs if baseline and labelMs > 0 else 0
+        print(f"{name:<12}{pairUs:>10.1f}{labelMs:>14.3f}{speedup:>9.1f}x")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -144,6 +144,71 @@ def getAppConfig(self) -> Dict[str, Any]:
         """Get app-level configuration."""
         return self.getServiceConfig("app")
     
+    def getOutputMode(self) -> str:
+        """
+        Get pipeline output mode.
+        
+        Returns:
+            "full" (QR + OCR fields) or "qr_only" (skip S6/S7 OCR)
+        """
+        return self.get("app.outputMode", "full")
+    
+    def isLabelCacheEnabled(self) -> bool:
+        """Check if validated label results are cached by QR text."""
+        return self.get("app.labelCache.enabled", False)
+    
+    def getLabelCacheTtlMs(self) -> float:
+        """Get label cache entry lifetime after the label was last seen (ms)."""
+        return self.get("app.labelCache.ttlMs", 10000.0)
+    
+    def getLabelCacheMaxEntries(self) -> int:
+        """Get maximum number of cached labels."""
+        return self.get("app.labelCache.maxEntries", 64)
+    
+    def getLabelCacheReverifyIntervalMs(self) -> float:
+        """Get interval of full re-runs for cached labels (ms, 0 = never)."""
+        return self.get("app.labelCache.reverifyIntervalMs", 0.0)
+    
+    def isFieldFusionEnabled(self) -> bool:
+        """Check if OCR fields are voted across frames per label."""
+        return self.get("app.fieldFusion.enabled", False)
+    
+    def getFieldFusionMinVoteScore(self) -> float:
+        """Get confidence lead over the runner-up needed to settle a field."""
+        return self.get("app.fieldFusion.minVoteScore", 0.9)
+    
+    def getFieldFusionTtlMs(self) -> float:
+        """Get time after the last frame before a label's votes are dropped (ms)."""
+        return self.get("app.fieldFusion.ttlMs", 10000.0)
+    
+    def getFieldFusionMaxEntries(self) -> int:
+        """Get maximum number of labels with accumulated votes."""
+        return self.get("app.fieldFusion.maxEntries", 64)
+    
+    def isBestFrameEnabled(self) -> bool:
+        """Check if only the best-quality frame of a label is sent to S6-S8."""
+        return self.get("app.bestFrame.enabled", False)
+    
+    def getBestFrameBufferSize(self) -> int:
+        """Get maximum frames buffered per label before the best is released."""
+        return self.get("app.bestFrame.bufferSize", 5)
+    
+    def getBestFrameWindowMs(self) -> float:
+        """Get maximum time a label's frames are buffered (ms)."""
+        return self.get("app.bestFrame.windowMs", 300.0)
+    
+    def getBestFrameReleaseScore(self) -> float:
+        """Get quality score at which a frame is released immediately."""
+        return self.get("app.bestFrame.releaseScore", 0.8)
+    
+    def getBestFrameThumbnailWidth(self) -> int:
+        """Get thumbnail width used for frame quality scoring."""
+        return self.get("app.bestFrame.thumbnailWidth", 160)
+    
+    def getBestFrameSharpnessReference(self) -> float:
+        """Get Laplacian variance scored as half sharpness."""
+        return self.get("app.bestFrame.sharpnessReference", 200.0)
+    
     def getCaptureDirectory(self) -> str:
         """Get capture directory path."""
         return self.get("app.captureDirectory", "output/captures")
@@ -313,6 +378,27 @@ def getOrientationCpuThreads(self) -> int:
     def getOrientationEnableMkldnn(self) -> bool:
         """Check if MKL-DNN is enabled for orientation classifier."""
         return self.get("s3_preprocessing.orientationEnableMkldnn", True)
+    
+    def getOrientationBackend(self) -> str:
+        """
+        Get orientation classifier backend (paddle, onnx or openvino).
+        
+        Returns:
+            str: Backend name, default "paddle".
+        """
+        backend = self.get("s3_preprocessing.orientationBackend", "paddle")
+        return backend.lower()
+    
+    def getOrientationModelPath(self) -> Optional[str]:
+        """Get exported orientation model path (onnx/openvino backends)."""
+        return self.get("s3_preprocessing.orientationModelPath")
+    
+    def getQrAnchorMargins(self) -> Dict[str, float]:
+        """Get label margins around the QR (in QR side lengths) for QR-anchored crops."""
+        return self.get(
+            "s3_preprocessing.qrAnchorMargins",
+            {"left": 4.0, "right": 0.6, "top": 1.0, "bottom": 0.8}
+        )
 
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # S4 Enhancement Settings
@@ -346,6 +432,30 @@ def getSharpnessAmount(self) -> float:
         """Get sharpness amount."""
         return self.get("s4_enhancement.sharpnessAmount", 1.5)
     
+    def isAdaptiveEnhancementEnabled(self) -> bool:
+        """Check if quality-gated adaptive enhancement is enabled."""
+        return self.get("s4_enhancement.adaptive.enabled", False)
+    
+    def getAdaptiveThumbnailWidth(self) -> int:
+        """Get thumbnail width used by the quality probe."""
+        return self.get("s4_enhancement.adaptive.thumbnailWidth", 160)
+    
+    def getAdaptiveMinContrastSpread(self) -> float:
+        """Get contrast spread (p95 - p5) below which CLAHE is applied."""
+        return self.get("s4_enhancement.adaptive.minContrastSpread", 80.0)
+    
+    def getAdaptiveMinMeanBrightness(self) -> float:
+        """Get mean brightness below which CLAHE is applied."""
+        return self.get("s4_enhancement.adaptive.minMeanBrightness", 70.0)
+    
+    def getAdaptiveMaxMeanBrightness(self) -> float:
+        """Get mean brightness above which CLAHE is applied."""
+        return self.get("s4_enhancement.adaptive.maxMeanBrightness", 200.0)
+    
+    def getAdaptiveMinSharpness(self) -> float:
+        """Get Laplacian variance below which sharpening is applied."""
+        return self.get("s4_enhancement.adaptive.minSharpness", 100.0)
+    
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # S5 QR Detection Settings
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -359,7 +469,7 @@ def isQrDetectionEnabled(self) -> bool:
         return self.get("s5_qr_detection.enabled", True)
     
     def getQrBackend(self) -> str:
-        """Get QR detection backend: 'zxing' or 'wechat'."""
+        """Get QR detection backend: 'zxing', 'wechat', 'cascade' or 'concurrent'."""
         return self.get("s5_qr_detection.backend", "zxing")
     
     # ZXing settings (prefixed with 'Zxing')
@@ -413,6 +523,118 @@ def getQrPreprocessingTargetWidth(self) -> int:
             int: Target width in pixels (default: 480)
         """
         return self.get("s5_qr_detection.preprocessing.targetWidth", 480)
+    
+    # Cascade settings (prefixed with 'Cascade')
+    def getQrCascadeStages(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get cascade stages.
+        
+        Returns:
+            List of dicts with 'backend' and 'preprocessingMode',
+            or None to use the default zxing minimal → zxing full → wechat.
+        """
+        return self.get("s5_qr_detection.cascade.stages")
+    
+    def isQrCascadeAdaptiveOrdering(self) -> bool:
+        """Check if cascade stages are reordered by measured cost."""
+        return self.get("s5_qr_detection.cascade.adaptiveOrdering", True)
+    
+    def getQrCascadeMinAttempts(self) -> int:
+        """Get samples per stage required before reordering."""
+        return self.get("s5_qr_detection.cascade.minAttempts", 20)
+    
+    def getQrCascadeExplorationInterval(self) -> int:
+        """Get frames between cascade runs with the least-sampled stage first."""
+        return self.get("s5_qr_detection.cascade.explorationInterval", 50)
+    
+    # Concurrent settings (prefixed with 'Concurrent')
+    def getQrConcurrentBackends(self) -> List[str]:
+        """Get backends decoded in parallel in concurrent mode."""
+        return self.get("s5_qr_detection.concurrent.backends", ["zxing", "wechat"])
+    
+    def getQrConcurrentTimeoutMs(self) -> float:
+        """Get overall decode deadline per frame in concurrent mode."""
+        return self.get("s5_qr_detection.concurrent.timeoutMs", 200.0)
+    
+    # Multi-scale settings (prefixed with 'Multiscale')
+    def getQrMultiscaleBackend(self) -> str:
+        """Get backend wrapped by the multi-scale detector: 'zxing' or 'wechat'."""
+        return self.get("s5_qr_detection.multiscale.backend", "wechat")
+    
+    def getQrMultiscaleQrModules(self) -> int:
+        """Get number of modules per QR side (21 = version 1, 25 = version 2)."""
+        return self.get("s5_qr_detection.multiscale.qrModules", 25)
+    
+    def getQrMultiscaleExpectedQrWidthRatio(self) -> float:
+        """Get initial QR width as ratio of the S5 input width."""
+        return self.get("s5_qr_detection.multiscale.expectedQrWidthRatio", 0.2)
+    
+    def getQrMultiscaleTargetModuleSize(self) -> float:
+        """Get module size in pixels the image is scaled to before decoding."""
+        return self.get("s5_qr_detection.multiscale.targetModuleSize", 4.0)
+    
+    def getQrMultiscaleLargeModuleSize(self) -> float:
+        """Get native module size from which WeChat runs without super-resolution."""
+        return self.get("s5_qr_detection.multiscale.largeModuleSize", 4.0)
+    
+    def getQrMultiscalePyramidFactors(self) -> List[float]:
+        """Get relative scales tried when the first decode fails."""
+        return self.get("s5_qr_detection.multiscale.pyramidFactors", [1.5, 0.6])
+    
+    def getQrMultiscaleTimeBudgetMs(self) -> float:
+        """Get per-frame time budget for pyramid attempts."""
+        return self.get("s5_qr_detection.multiscale.timeBudgetMs", 80.0)
+    
+    # QR-first settings (prefixed with 'QrFirst')
+    def isQrFirstEnabled(self) -> bool:
+        """Check if a full-frame QR pass runs in parallel with S2."""
+        return self.get("s5_qr_detection.qrFirst.enabled", False)
+    
+    def getQrFirstBackend(self) -> str:
+        """Get backend for the full-frame QR pass: 'zxing' or 'wechat'."""
+        return self.get("s5_qr_detection.qrFirst.backend", "zxing")
+    
+    def getQrFirstMaxWidth(self) -> int:
+        """Get maximum frame width for the full-frame QR pass."""
+        return self.get("s5_qr_detection.qrFirst.maxWidth", 1280)
+    
+    # Result cache settings (prefixed with 'Cache')
+    def isQrCacheEnabled(self) -> bool:
+        """Check if QR results are reused for labels that have not moved."""
+        return self.get("s5_qr_detection.cache.enabled", False)
+    
+    def getQrCacheTtlMs(self) -> float:
+        """Get maximum age of a cached QR result in milliseconds."""
+        return self.get("s5_qr_detection.cache.ttlMs", 1500.0)
+    
+    def getQrCacheMinIou(self) -> float:
+        """Get minimum S2 bbox IoU for a label to count as stationary."""
+        return self.get("s5_qr_detection.cache.minIou", 0.85)
+    
+    def getQrCacheMaxHashDistance(self) -> int:
+        """Get maximum Hamming distance between QR region hashes."""
+        return self.get("s5_qr_detection.cache.maxHashDistance", 8)
+    
+    # ROI localization settings (prefixed with 'Roi')
+    def isQrRoiEnabled(self) -> bool:
+        """Check if predicted QR regions are decoded before the full image."""
+        return self.get("s5_qr_detection.roi.enabled", False)
+    
+    def getQrRoiHistorySize(self) -> int:
+        """Get number of recent QR rectangles used to predict the region."""
+        return self.get("s5_qr_detection.roi.historySize", 8)
+    
+    def getQrRoiPadding(self) -> float:
+        """Get margin around predicted regions (ratio of region size)."""
+        return self.get("s5_qr_detection.roi.padding", 0.25)
+    
+    def isQrRoiFinderSearchEnabled(self) -> bool:
+        """Check if finder-pattern search is used to locate the QR."""
+        return self.get("s5_qr_detection.roi.finderSearch", True)
+    
+    def getQrRoiMaxRegionRatio(self) -> float:
+        """Get maximum predicted region area as ratio of the image area."""
+        return self.get("s5_qr_detection.roi.maxRegionRatio", 0.6)
 
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # S6 Component Extraction Settings
@@ -530,6 +752,68 @@ def getTextDetUnclipRatio(self) -> float:
         """Get text detection unclip ratio."""
         return self.get("s7_ocr.textDetUnclipRatio", 1.5)
     
+    def getOcrMode(self) -> str:
+        """Get OCR mode ('full' or 'recognition')."""
+        return self.get("s7_ocr.mode", "full")
+    
+    def getOcrRecBatchSize(self) -> int:
+        """Get number of line strips per recognition batch."""
+        return self.get("s7_ocr.recognition.batchSize", 8)
+    
+    def getOcrLineMinHeight(self) -> int:
+        """Get minimum text line height for line segmentation."""
+        return self.get("s7_ocr.recognition.lineMinHeight", 6)
+    
+    def getOcrLineInkThreshold(self) -> float:
+        """Get minimum dark-pixel ratio of a text row for line segmentation."""
+        return self.get("s7_ocr.recognition.lineInkThreshold", 0.02)
+    
+    def getOcrLinePadding(self) -> int:
+        """Get margin around each line strip in pixels."""
+        return self.get("s7_ocr.recognition.linePadding", 3)
+    
+    def getOcrBackend(self) -> str:
+        """
+        Get OCR backend (paddle, onnx or openvino).
+        
+        Returns:
+            str: Backend name, default "paddle".
+        """
+        backend = self.get("s7_ocr.backend", "paddle")
+        return backend.lower()
+    
+    def getOcrDetModelPath(self) -> Optional[str]:
+        """Get exported text detection model path (onnx/openvino backends)."""
+        return self.get("s7_ocr.exportedModels.detModelPath")
+    
+    def getOcrRecModelPath(self) -> Optional[str]:
+        """Get exported text recognition model path (onnx/openvino backends)."""
+        return self.get("s7_ocr.exportedModels.recModelPath")
+    
+    def getOcrRecCharDictPath(self) -> Optional[str]:
+        """Get recognition dictionary path (None = read from inference.yml)."""
+        return self.get("s7_ocr.exportedModels.recCharDictPath")
+    
+    def getOcrModelCacheDir(self) -> Optional[str]:
+        """Get compiled/optimized OCR model cache directory (None = no cache)."""
+        return self.get("s7_ocr.exportedModels.modelCacheDir")
+    
+    def getOcrExecutionMode(self) -> str:
+        """Get OCR execution mode ('inline' or 'process')."""
+        return self.get("s7_ocr.executionMode", "inline")
+    
+    def getOcrProcessWorkers(self) -> int:
+        """Get number of OCR worker processes."""
+        return self.get("s7_ocr.process.workers", 2)
+    
+    def getOcrProcessCoresPerWorker(self) -> int:
+        """Get CPU cores pinned per OCR worker (0 = no pinning)."""
+        return self.get("s7_ocr.process.coresPerWorker", 0)
+    
+    def isOcrProcessWarmup(self) -> bool:
+        """Check if OCR workers run a warm-up inference at startup."""
+        return self.get("s7_ocr.process.warmup", True)
+    
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # S8 Postprocessing Settings
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -554,6 +838,14 @@ def getColorsJsonPath(self) -> str:
         """Get colors JSON file path."""
         return self.get("s8_postprocessing.colorsJsonPath")
     
+    def getCatalogIndexDir(self) -> Optional[str]:
+        """Get compiled catalog index directory (None = parse JSON on every start)."""
+        return self.get("s8_postprocessing.catalogIndexDir")
+    
+    def getSimilarityBackend(self) -> str:
+        """Get string similarity backend for S8 ("auto", "python" or "rapidfuzz")."""
+        return self.get("s8_postprocessing.similarityBackend", "python")
+    
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # Performance Logging Settings
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -12,15 +12,18 @@
 
 import time
 import logging
-from typing import Optional, List
+from typing import Optional, List, Dict, Any, Tuple
 
 import cv2
 import numpy as np
 
 from core.interfaces.preprocessor_interface import IImagePreprocessor
 from core.interfaces.detector_interface import Detection
+from core.interfaces.image_format import FORMAT_BGR
 from core.preprocessor.document_preprocessor import DocumentPreprocessor
 from core.preprocessor.orientation_corrector import OrientationCorrector
+from core.preprocessor.orientation_classifier_factory import createOrientationClassifier
+from core.preprocessor.qr_anchored_cropper import QrAnchoredCropper
 from services.interfaces.preprocessing_service_interface import (
     IPreprocessingService,
     PreprocessingServiceResult
@@ -36,6 +39,9 @@ class S3PreprocessingService(IPreprocessingService, BaseService):
     and applies AI-based orientation correction (180° fix).
     
     Creates DocumentPreprocessor internally with provided parameters.
+    
+    preprocessFromQr() is the QR-first shortcut: the label is cropped around
+    a QR code decoded on the full frame, without mask or orientation model.
     """
     
     SERVICE_NAME = "s3_preprocessing"
@@ -49,6 +55,10 @@ def __init__(
         paddleModelPath: Optional[str] = None,
         orientationCpuThreads: int = 4,
         orientationEnableMkldnn: bool = True,
+        orientationBackend: str = "paddle",
+        orientationModelPath: Optional[str] = None,
+        openvinoConfig: Optional[Dict[str, Any]] = None,
+        qrAnchorMargins: Optional[Dict[str, float]] = None,
         debugBasePath: str = "output/debug",
         debugEnabled: bool = False
     ):
@@ -63,6 +73,11 @@ def __init__(
             paddleModelPath: Path to Paddle orientation model.
             orientationCpuThreads: Number of CPU threads for orientation classifier.
             orientationEnableMkldnn: Enable MKL-DNN for orientation classifier.
+            orientationBackend: Orientation backend ("paddle", "onnx" or "openvino").
+            orientationModelPath: Exported model file for onnx/openvino backends.
+            openvinoConfig: Thread settings shared with S2 (onnx/openvino backends).
+            qrAnchorMargins: Label margins around the QR in QR side lengths
+                (keys: left, right, top, bottom) for preprocessFromQr().
             debugBasePath: Base path for debug output.
             debugEnabled: Whether to save debug output.
         """
@@ -73,12 +88,20 @@ def __init__(
             debugEnabled=debugEnabled
         )
         
+        # Create orientation classifier for the selected backend
+        # (paddle uses a model directory, onnx/openvino an exported model file)
+        orientationClassifier = createOrientationClassifier(
+            backend=orientationBackend,
+            modelPath=paddleModelPath if orientationBackend == "paddle" else orientationModelPath,
+            cpuThreads=orientationCpuThreads,
+            enableMkldnn=orientationEnableMkldnn,
+            openvinoConfig=openvinoConfig
+        )
+        
         # Create core preprocessor implementation
         orientationCorrector = OrientationCorrector(
             aiConfidenceThreshold=aiConfidenceThreshold,
-            modelPath=paddleModelPath,
-            cpuThreads=orientationCpuThreads,
-            enableMkldnn=orientationEnableMkldnn
+            classifier=orientationClassifier
         )
         
         self._preprocessor: IImagePreprocessor = DocumentPreprocessor(
@@ -86,13 +109,22 @@ def __init__(
             aiConfidenceThreshold=aiConfidenceThreshold
         )
         
+        margins = qrAnchorMargins or {}
+        self._qrAnchoredCropper = QrAnchoredCropper(
+            leftRatio=margins.get("left", 4.0),
+            rightRatio=margins.get("right", 0.6),
+            topRatio=margins.get("top", 1.0),
+            bottomRatio=margins.get("bottom", 0.8)
+        )
+        
         self._enabled = enabled
         self._forceLandscape = forceLandscape
         self._aiOrientationFix = aiOrientationFix
         
         self._logger.info(
             f"S3PreprocessingService initialized "
-            f"(forceLandscape={forceLandscape}, aiOrientationFix={aiOrientationFix})"
+            f"(forceLandscape={forceLandscape}, aiOrientationFix={aiOrientationFix}, "
+            f"orientationBackend={orientationBackend})"
         )
     
     def preprocess(
@@ -189,7 +221,8 @@ def preprocess(
                 contourPoints=contourPoints,
                 frameId=frameId,
                 success=True,
-                processingTimeMs=processingTimeMs
+                processingTimeMs=processingTimeMs,
+                imageFormat=FORMAT_BGR
             )
             
         except Exception as e:
@@ -204,6 +237,59 @@ def preprocess(
                 processingTimeMs=self._measureTime(startTime)
             )
     
+    def preprocessFromQr(
+        self,
+        frame: np.ndarray,
+        qrPolygon: List[Tuple[int, int]],
+        frameId: str
+    ) -> PreprocessingServiceResult:
+        """Crop the upright label around a QR code decoded on the full frame."""
+        startTime = time.time()
+        
+        if not self._enabled:
+            return PreprocessingServiceResult(
+                croppedImage=None,
+                rotationAngle=0.0,
+                orientationFixed=False,
+                contourPoints=None,
+                frameId=frameId,
+                success=False,
+                processingTimeMs=self._measureTime(startTime)
+            )
+        
+        croppedImage, matrix, message = self._qrAnchoredCropper.crop(frame, qrPolygon)
+        processingTimeMs = self._measureTime(startTime)
+        
+        if croppedImage is None:
+            self._logger.warning(f"[{frameId}] QR anchored crop failed: {message}")
+            return PreprocessingServiceResult(
+                croppedImage=None,
+                rotationAngle=0.0,
+                orientationFixed=False,
+                contourPoints=None,
+                frameId=frameId,
+                success=False,
+                processingTimeMs=processingTimeMs
+            )
+        
+        contourPoints = [[int(x), int(y)] for (x, y) in qrPolygon]
+        self._saveDebugOutput(frameId, croppedImage, 0.0, False, contourPoints)
+        
+        self._logTiming(frameId, processingTimeMs)
+        self._logger.debug(f"[{frameId}] Preprocessed from QR: {message}")
+        
+        return PreprocessingServiceResult(
+            croppedImage=croppedImage,
+            rotationAngle=0.0,
+            orientationFixed=False,
+            contourPoints=contourPoints,
+            frameId=frameId,
+            success=True,
+            processingTimeMs=processingTimeMs,
+            transformMatrix=matrix,
+            imageFormat=FORMAT_BGR
+        )
+    
     def setEnabled(self, enabled: bool) -> None:
         """Enable or disable preprocessing."""
         self._enabled = enabled
@@ -12,14 +12,17 @@
 
 import time
 import logging
+from dataclasses import asdict
 from typing import Optional, Tuple
 
 import numpy as np
 
-from core.interfaces.enhancer_interface import IImageEnhancer
+from core.interfaces.enhancer_interface import IImageEnhancer, QualityAssessment
+from core.interfaces.image_format import ImageFormat, FORMAT_GRAY
 from core.enhancer.image_enhancer import ImageEnhancer
 from core.enhancer.brightness_enhancer import BrightnessEnhancer
 from core.enhancer.sharpness_enhancer import SharpnessEnhancer
+from core.enhancer.quality_probe import ImageQualityProbe
 from services.interfaces.enhancement_service_interface import (
     IEnhancementService,
     EnhancementServiceResult
@@ -36,6 +39,9 @@ class S4EnhancementService(IEnhancementService, BaseService):
     
     Creates ImageEnhancer internally with provided parameters.
     Output is grayscale for downstream processing (S5, S6, S7).
+    
+    When adaptive mode is enabled, an ImageQualityProbe decides per frame
+    whether the (configured) brightness and sharpness steps actually run.
     """
     
     SERVICE_NAME = "s4_enhancement"
@@ -49,6 +55,12 @@ def __init__(
         sharpnessEnabled: bool = True,
         sharpnessSigma: float = 1.0,
         sharpnessAmount: float = 1.5,
+        adaptiveEnabled: bool = False,
+        adaptiveThumbnailWidth: int = 160,
+        adaptiveMinContrastSpread: float = 80.0,
+        adaptiveMinMeanBrightness: float = 70.0,
+        adaptiveMaxMeanBrightness: float = 200.0,
+        adaptiveMinSharpness: float = 100.0,
         debugBasePath: str = "output/debug",
         debugEnabled: bool = False
     ):
@@ -63,6 +75,12 @@ def __init__(
             sharpnessEnabled: Whether sharpness enhancement is enabled.
             sharpnessSigma: Sigma for sharpness Gaussian blur.
             sharpnessAmount: Sharpen coefficient.
+            adaptiveEnabled: Gate enhancement per frame with a quality probe.
+            adaptiveThumbnailWidth: Thumbnail width used by the quality probe.
+            adaptiveMinContrastSpread: Contrast spread below which CLAHE runs.
+            adaptiveMinMeanBrightness: Mean brightness below which CLAHE runs.
+            adaptiveMaxMeanBrightness: Mean brightness above which CLAHE runs.
+            adaptiveMinSharpness: Laplacian variance below which sharpening runs.
             debugBasePath: Base path for debug output.
             debugEnabled: Whether to save debug output.
         """
@@ -88,14 +106,23 @@ def __init__(
             sharpnessEnhancer=sharpnessEnhancer
         )
         
+        self._qualityProbe = ImageQualityProbe(
+            thumbnailWidth=adaptiveThumbnailWidth,
+            minContrastSpread=adaptiveMinContrastSpread,
+            minMeanBrightness=adaptiveMinMeanBrightness,
+            maxMeanBrightness=adaptiveMaxMeanBrightness,
+            minSharpness=adaptiveMinSharpness
+        )
+        
         self._enabled = enabled
         self._brightnessEnabled = brightnessEnabled
         self._sharpnessEnabled = sharpnessEnabled
+        self._adaptiveEnabled = adaptiveEnabled
         
         self._logger.info(
             f"S4EnhancementService initialized "
             f"(brightness={brightnessEnabled}, sharpness={sharpnessEnabled}, "
-            f"output=grayscale)"
+            f"adaptive={adaptiveEnabled}, output=grayscale)"
         )
     
     def enhance(
@@ -117,12 +144,13 @@ def enhance(
         # Check if enhancement is enabled
         if not self._enabled:
             return EnhancementServiceResult(
-                enhancedImage=image.copy() if image is not None else None,
+                enhancedImage=image,
                 brightnessApplied=False,
                 sharpnessApplied=False,
                 frameId=frameId,
                 success=True,
-                processingTimeMs=self._measureTime(startTime)
+                processingTimeMs=self._measureTime(startTime),
+                imageFormat=ImageFormat.of(image) if image is not None else None
             )
         
         if image is None:
@@ -137,11 +165,21 @@ def enhance(
             )
         
         try:
+            applyBrightness = self._brightnessEnabled
+            applySharpness = self._sharpnessEnabled
+            
+            # Quality gate: only run configured steps the frame actually needs
+            quality: Optional[QualityAssessment] = None
+            if self._adaptiveEnabled and (applyBrightness or applySharpness):
+                quality = self._qualityProbe.assess(image)
+                applyBrightness = applyBrightness and quality.needsBrightness
+                applySharpness = applySharpness and quality.needsSharpness
+            
             # Apply enhancement - returns EnhancementResult
             enhanceResult = self._enhancer.enhance(
                 image=image,
-                applyBrightness=self._brightnessEnabled,
-                applySharpness=self._sharpnessEnabled
+                applyBrightness=applyBrightness,
+                applySharpness=applySharpness
             )
             
             processingTimeMs = self._measureTime(startTime)
@@ -151,7 +189,8 @@ def enhance(
                 frameId,
                 enhanceResult.image,
                 enhanceResult.brightnessApplied,
-                enhanceResult.sharpnessApplied
+                enhanceResult.sharpnessApplied,
+                quality
             )
             
             # Log timing
@@ -167,7 +206,8 @@ def enhance(
                 sharpnessApplied=enhanceResult.sharpnessApplied,
                 frameId=frameId,
                 success=True,
-                processingTimeMs=processingTimeMs
+                processingTimeMs=processingTimeMs,
+                imageFormat=FORMAT_GRAY
             )
             
         except Exception as e:
@@ -208,12 +248,22 @@ def isSharpnessEnabled(self) -> bool:
         """Check if sharpness enhancement is enabled."""
         return self._sharpnessEnabled
     
+    def setAdaptiveEnabled(self, enabled: bool) -> None:
+        """Enable or disable quality-gated adaptive enhancement."""
+        self._adaptiveEnabled = enabled
+        self._logger.debug(f"Adaptive enhancement: {enabled}")
+    
+    def isAdaptiveEnabled(self) -> bool:
+        """Check if quality-gated adaptive enhancement is enabled."""
+        return self._adaptiveEnabled
+    
     def _saveDebugOutput(
         self,
         frameId: str,
         enhancedImage: np.ndarray,
         brightnessApplied: bool,
-        sharpnessApplied: bool
+        sharpnessApplied: bool,
+        quality: Optional[QualityAssessment] = None
     ) -> None:
         """Save debug output for enhancement step."""
         if not self._debugEnabled:
@@ -227,6 +277,8 @@ def _saveDebugOutput(
             "frameId": frameId,
             "brightnessApplied": brightnessApplied,
             "sharpnessApplied": sharpnessApplied,
-            "imageShape": list(enhancedImage.shape) if enhancedImage is not None else None
+            "imageShape": list(enhancedImage.shape) if enhancedImage is not None else None,
+            "adaptive": self._adaptiveEnabled,
+            "quality": asdict(quality) if quality is not None else None
         }
         self._saveDebugJson(frameId, info, "enhancement")
@@ -14,13 +14,23 @@
 import os
 import time
 import logging
-from typing import Optional
+from typing import Optional, List, Dict, Any, Tuple
 
 import cv2
 import numpy as np
 
 from core.interfaces.qr_detector_interface import IQrDetector, QrDetectionResult
-from core.qr import createQrDetector, QrImagePreprocessor
+from core.interfaces.image_context import ImageContext
+from core.qr import (
+    createQrDetector,
+    QrImagePreprocessor,
+    CascadeQrDetector,
+    ConcurrentQrDetector,
+    MultiScaleQrDetector
+)
+from core.qr.qr_geometry import QrImageTransform, mapQrResultToOriginal, mapQrResultAffine
+from core.qr.qr_roi_locator import QrRoiLocator
+from core.qr.qr_result_cache import QrResultCache
 from services.interfaces.qr_detection_service_interface import (
     IQrDetectionService,
     QrDetectionServiceResult
@@ -35,8 +45,31 @@ class S5QrDetectionService(IQrDetectionService, BaseService):
     Detects and decodes QR codes from label images.
     The QR code contains order information used for validation.
     
-    Supports multiple backends (ZXing, WeChat) via factory pattern.
+    Supports multiple backends (ZXing, WeChat, cascade, concurrent) via factory pattern.
     Optionally applies preprocessing to improve detection rate.
+    In cascade mode each stage applies its own preprocessing.
+    In concurrent mode the preprocessed image is decoded by several backends
+    in parallel and the first valid result wins (bounded by a deadline).
+    
+    detectQr() is reentrant: preprocessing returns its coordinate transform
+    instead of storing it, and WeChat detectors are created per thread, so
+    several labels can be decoded from different threads at once.
+    
+    In multiscale mode the decode scale follows the expected QR module size
+    (S5 preprocessing is skipped) and a small pyramid is tried on failure.
+    Every decode attempt is timed and written to the debug JSON.
+    
+    With the QR-first path enabled, detectQrInFrame() runs a cheap decode on
+    the raw camera frame (in parallel with S2); on success the label crop is
+    anchored on the QR polygon and S3/S5 work is skipped.
+    
+    With the result cache enabled, a label that has not moved since its QR
+    was decoded (same S2 bbox, same QR hash, within the TTL) reuses the
+    previous result without decoding.
+    
+    With ROI localization enabled, the region where the QR was found on
+    recent labels (or located by a finder-pattern search) is decoded first;
+    the full image is decoded only when those regions fail.
     
     Preprocessing modes:
     - "minimal": Scale only (fast)
@@ -65,6 +98,43 @@ def __init__(
         preprocessingMode: str = "full",
         preprocessingTargetWidth: int = 480,
         
+        # Cascade params (prefixed with 'cascade')
+        cascadeStages: Optional[List[Dict[str, Any]]] = None,
+        cascadeAdaptiveOrdering: bool = True,
+        cascadeMinAttempts: int = 20,
+        cascadeExplorationInterval: int = 50,
+        
+        # Concurrent params (prefixed with 'concurrent')
+        concurrentBackends: Optional[List[str]] = None,
+        concurrentTimeoutMs: float = 200.0,
+        
+        # Multi-scale params (prefixed with 'multiscale')
+        multiscaleBackend: str = "wechat",
+        multiscaleQrModules: int = 25,
+        multiscaleExpectedQrWidthRatio: float = 0.2,
+        multiscaleTargetModuleSize: float = 4.0,
+        multiscaleLargeModuleSize: float = 4.0,
+        multiscalePyramidFactors: Optional[List[float]] = None,
+        multiscaleTimeBudgetMs: float = 80.0,
+        
+        # ROI localization params (prefixed with 'roi')
+        roiEnabled: bool = False,
+        roiHistorySize: int = 8,
+        roiPadding: float = 0.25,
+        roiFinderSearch: bool = True,
+        roiMaxRegionRatio: float = 0.6,
+        
+        # Result cache params (prefixed with 'cache')
+        cacheEnabled: bool = False,
+        cacheTtlMs: float = 1500.0,
+        cacheMinIou: float = 0.85,
+        cacheMaxHashDistance: int = 8,
+        
+        # QR-first params (prefixed with 'qrFirst')
+        qrFirstEnabled: bool = False,
+        qrFirstBackend: str = "zxing",
+        qrFirstMaxWidth: int = 1280,
+        
         # Debug settings
         debugBasePath: str = "output/debug",
         debugEnabled: bool = False
@@ -74,13 +144,41 @@ def __init__(
         
         Args:
             enabled: Whether QR detection is enabled.
-            backend: QR detection backend ("zxing" or "wechat").
+            backend: QR detection backend
+                ("zxing", "wechat", "cascade", "concurrent" or "multiscale").
             zxingTryRotate: (ZXing) Try rotated barcodes (90/270 degrees).
             zxingTryDownscale: (ZXing) Try downscaled versions for better detection.
             wechatModelDir: (WeChat) Directory containing model files.
             preprocessingEnabled: Enable image preprocessing before detection.
             preprocessingMode: Preprocessing mode ("minimal" or "full").
             preprocessingTargetWidth: Target width for preprocessing (default: 480).
+            cascadeStages: (Cascade) Stage dicts with backend and preprocessingMode.
+            cascadeAdaptiveOrdering: (Cascade) Reorder stages by measured cost.
+            cascadeMinAttempts: (Cascade) Samples per stage before reordering.
+            cascadeExplorationInterval: (Cascade) Frames between runs with the
+                least-sampled stage first (0 = never).
+            concurrentBackends: (Concurrent) Backends decoded in parallel.
+            concurrentTimeoutMs: (Concurrent) Overall deadline per frame in milliseconds.
+            multiscaleBackend: (Multiscale) Wrapped backend ("zxing" or "wechat").
+            multiscaleQrModules: (Multiscale) Modules per QR side.
+            multiscaleExpectedQrWidthRatio: (Multiscale) Initial QR width / image width.
+            multiscaleTargetModuleSize: (Multiscale) Module size in pixels to scale to.
+            multiscaleLargeModuleSize: (Multiscale) Native module size from which
+                WeChat runs without super-resolution.
+            multiscalePyramidFactors: (Multiscale) Relative scales tried on failure.
+            multiscaleTimeBudgetMs: (Multiscale) Per-frame budget for pyramid attempts.
+            roiEnabled: Decode predicted QR regions before the full image.
+            roiHistorySize: (ROI) Number of recent QR rectangles kept.
+            roiPadding: (ROI) Margin around predicted regions (ratio of region size).
+            roiFinderSearch: (ROI) Locate the QR by finder patterns when history misses.
+            roiMaxRegionRatio: (ROI) Skip regions larger than this ratio of the image area.
+            cacheEnabled: Reuse results for labels that have not moved.
+            cacheTtlMs: (Cache) Maximum age of a cached result in milliseconds.
+            cacheMinIou: (Cache) Minimum S2 bbox IoU for a label to count as stationary.
+            cacheMaxHashDistance: (Cache) Maximum QR dHash Hamming distance.
+            qrFirstEnabled: Create the detector used by detectQrInFrame().
+            qrFirstBackend: (QR-first) Backend for the full-frame pass ("zxing" or "wechat").
+            qrFirstMaxWidth: (QR-first) Frames wider than this are downscaled first.
             debugBasePath: Base path for debug output.
             debugEnabled: Whether to save debug output.
         """
@@ -96,19 +194,65 @@ def __init__(
             backend=backend,
             zxingTryRotate=zxingTryRotate,
             zxingTryDownscale=zxingTryDownscale,
-            wechatModelDir=wechatModelDir
+            wechatModelDir=wechatModelDir,
+            cascadeStages=cascadeStages,
+            cascadeAdaptiveOrdering=cascadeAdaptiveOrdering,
+            cascadeMinAttempts=cascadeMinAttempts,
+            cascadeExplorationInterval=cascadeExplorationInterval,
+            cascadeTargetWidth=preprocessingTargetWidth,
+            concurrentBackends=concurrentBackends,
+            concurrentTimeoutMs=concurrentTimeoutMs,
+            multiscaleBackend=multiscaleBackend,
+            multiscaleQrModules=multiscaleQrModules,
+            multiscaleExpectedQrWidthRatio=multiscaleExpectedQrWidthRatio,
+            multiscaleTargetModuleSize=multiscaleTargetModuleSize,
+            multiscaleLargeModuleSize=multiscaleLargeModuleSize,
+            multiscalePyramidFactors=multiscalePyramidFactors,
+            multiscaleTimeBudgetMs=multiscaleTimeBudgetMs
         )
         
-        # Create preprocessor (optional)
+        # Create preprocessor (optional, cascade stages preprocess themselves
+        # and multiscale chooses its own scale)
         self._preprocessor: Optional[QrImagePreprocessor] = None
         self._preprocessingMode = preprocessingMode
-        if preprocessingEnabled:
+        selfScaling = isinstance(self._qrDetector, (CascadeQrDetector, MultiScaleQrDetector))
+        if preprocessingEnabled and not selfScaling:
             self._preprocessor = QrImagePreprocessor(
                 enabled=preprocessingEnabled,
                 mode=preprocessingMode,
                 targetWidth=preprocessingTargetWidth
             )
         
+        # Create ROI locator (optional)
+        self._roiLocator: Optional[QrRoiLocator] = None
+        if roiEnabled:
+            self._roiLocator = QrRoiLocator(
+                historySize=roiHistorySize,
+                padding=roiPadding,
+                finderSearch=roiFinderSearch,
+                maxRegionRatio=roiMaxRegionRatio
+            )
+        
+        # Create result cache (optional)
+        self._resultCache: Optional[QrResultCache] = None
+        if cacheEnabled:
+            self._resultCache = QrResultCache(
+                ttlMs=cacheTtlMs,
+                minIou=cacheMinIou,
+                maxHashDistance=cacheMaxHashDistance
+            )
+        
+        # Create full-frame detector for the QR-first path (optional)
+        self._frameDetector: Optional[IQrDetector] = None
+        self._qrFirstMaxWidth = qrFirstMaxWidth
+        if qrFirstEnabled:
+            self._frameDetector = createQrDetector(
+                backend=qrFirstBackend,
+                zxingTryRotate=zxingTryRotate,
+                zxingTryDownscale=zxingTryDownscale,
+                wechatModelDir=wechatModelDir
+            )
+        
         self._enabled = enabled
         self._backend = backend
         
@@ -120,13 +264,16 @@ def __init__(
         self._logger.info(
             f"S5QrDetectionService initialized "
             f"(backend={backend}, preprocessing={preprocessingEnabled}, "
-            f"mode={preprocessingMode if preprocessingEnabled else 'none'})"
+            f"mode={preprocessingMode if preprocessingEnabled else 'none'}, "
+            f"roi={roiEnabled}, cache={cacheEnabled}, qrFirst={qrFirstEnabled})"
         )
     
     def detectQr(
         self,
         image: np.ndarray,
-        frameId: str
+        frameId: str,
+        bbox: Optional[Tuple[int, int, int, int]] = None,
+        context: Optional[ImageContext] = None
     ) -> QrDetectionServiceResult:
         """
         Detect and decode QR code from an image.
@@ -137,6 +284,9 @@ def detectQr(
         Args:
             image: Input image (grayscale from S4).
             frameId: Frame identifier.
+            bbox: Optional S2 bounding box of the label (x1, y1, x2, y2)
+                for the result cache.
+            context: Optional frame context of image (shared resizes).
             
         Returns:
             QrDetectionServiceResult with detection result.
@@ -162,24 +312,38 @@ def detectQr(
             )
         
         try:
+            # Step 0: Result cache (label has not moved since last decode)
+            if self._resultCache is not None:
+                cachedResult = self._resultCache.lookup(image, bbox)
+                if cachedResult is not None:
+                    processingTimeMs = self._measureTime(startTime)
+                    self._saveDebugOutput(frameId, cachedResult, "cache", [])
+                    self._logger.debug(
+                        f"[{frameId}] QR from cache: {cachedResult.text} "
+                        f"(time={processingTimeMs:.2f}ms)"
+                    )
+                    return QrDetectionServiceResult(
+                        qrData=cachedResult,
+                        frameId=frameId,
+                        success=True,
+                        processingTimeMs=processingTimeMs
+                    )
+            
             # Step 1: Preprocessing (included in timing)
             if self._preprocessor is not None:
-                processedImage = self._preprocessor.preprocess(image)
+                processedImage, transform = self._preprocessor.preprocess(image, context)
             else:
-                processedImage = image
+                processedImage, transform = image, QrImageTransform()
             
             # Step 2: QR Detection (included in timing)
-            qrResult = self._qrDetector.detect(processedImage)
+            # Step 3: Map coordinates back to original image size
+            qrResult, searchRegion, attempts = self._decode(processedImage, transform, context)
             
-            # Step 3: Scale back coordinates if preprocessing was applied
-            # QR coordinates are detected on scaled image, need to convert back to original size
-            if qrResult is not None and self._preprocessor is not None:
-                scaleFactor = self._preprocessor.scaleFactor
-                if scaleFactor != 1.0:
-                    qrResult = self._scaleBackCoordinates(qrResult, scaleFactor)
-                    self._logger.debug(
-                        f"[{frameId}] Scaled back QR coordinates by 1/{scaleFactor}"
-                    )
+            if qrResult is not None and self._roiLocator is not None:
+                self._roiLocator.recordDetection(qrResult.rect, image.shape, searchRegion)
+            
+            if qrResult is not None and self._resultCache is not None:
+                self._resultCache.store(image, qrResult, bbox)
             
             # Measure time BEFORE debug saving
             processingTimeMs = self._measureTime(startTime)
@@ -188,10 +352,12 @@ def detectQr(
             self._saveDebugInput(frameId, processedImage)
             
             if qrResult is None:
+                self._saveDebugOutput(frameId, None, None, attempts)
                 self._logger.warning(
                     f"[{frameId}] No QR code detected "
                     f"(preprocessing={self._preprocessor is not None}, "
                     f"mode={self._preprocessingMode if self._preprocessor else 'none'}, "
+                    f"attempts={len(attempts)}, "
                     f"time={processingTimeMs:.2f}ms)"
                 )
                 return QrDetectionServiceResult(
@@ -202,7 +368,7 @@ def detectQr(
                 )
             
             # Save debug output (NOT included in timing)
-            self._saveDebugOutput(frameId, qrResult)
+            self._saveDebugOutput(frameId, qrResult, searchRegion, attempts)
             
             # Log timing and result
             self._logTiming(frameId, processingTimeMs)
@@ -210,6 +376,7 @@ def detectQr(
                 f"[{frameId}] QR detected: {qrResult.text} "
                 f"(preprocessing={self._preprocessor is not None}, "
                 f"mode={self._preprocessingMode if self._preprocessor else 'none'}, "
+                f"region={searchRegion}, "
                 f"time={processingTimeMs:.2f}ms)"
             )
             
@@ -229,6 +396,162 @@ def detectQr(
                 processingTimeMs=self._measureTime(startTime)
             )
     
+    def detectQrInFrame(
+        self,
+        frame: np.ndarray,
+        frameId: str
+    ) -> QrDetectionServiceResult:
+        """
+        Cheap QR pass on the full camera frame (QR-first path).
+        
+        Args:
+            frame: Camera frame from S1 (BGR format).
+            frameId: Frame identifier.
+            
+        Returns:
+            QrDetectionServiceResult with coordinates in frame space
+            (success=False when the QR-first path is disabled).
+        """
+        startTime = time.time()
+        
+        if not self._enabled or self._frameDetector is None or frame is None:
+            return QrDetectionServiceResult(
+                qrData=None,
+                frameId=frameId,
+                success=False,
+                processingTimeMs=self._measureTime(startTime)
+            )
+        
+        try:
+            h, w = frame.shape[:2]
+            transform = QrImageTransform()
+            decodeImage = frame
+            if w > self._qrFirstMaxWidth:
+                scale = self._qrFirstMaxWidth / float(w)
+                decodeImage = cv2.resize(
+                    frame,
+                    (self._qrFirstMaxWidth, max(1, int(h * scale))),
+                    interpolation=cv2.INTER_AREA
+                )
+                transform = QrImageTransform(scale=scale)
+            
+            qrResult = self._frameDetector.detect(decodeImage)
+            if qrResult is not None:
+                qrResult = mapQrResultToOriginal(qrResult, transform)
+            
+            processingTimeMs = self._measureTime(startTime)
+            self._logger.debug(
+                f"[{frameId}] QR-first pass: "
+                f"{qrResult.text if qrResult else 'miss'} ({processingTimeMs:.2f}ms)"
+            )
+            
+            return QrDetectionServiceResult(
+                qrData=qrResult,
+                frameId=frameId,
+                success=qrResult is not None,
+                processingTimeMs=processingTimeMs
+            )
+            
+        except Exception as e:
+            self._logger.error(f"[{frameId}] QR-first pass failed: {e}")
+            return QrDetectionServiceResult(
+                qrData=None,
+                frameId=frameId,
+                success=False,
+                processingTimeMs=self._measureTime(startTime)
+            )
+    
+    def mapToLabelCrop(
+        self,
+        qrData: QrDetectionResult,
+        transformMatrix: np.ndarray
+    ) -> QrDetectionResult:
+        """
+        Map a full-frame QR result into the coordinates of the label crop.
+        
+        Args:
+            qrData: QR result from detectQrInFrame() (frame coordinates).
+            transformMatrix: 2x3 affine matrix from frame to crop (S3 preprocessFromQr).
+            
+        Returns:
+            QrDetectionResult with polygon and rect in crop coordinates.
+        """
+        return mapQrResultAffine(qrData, transformMatrix)
+    
+    def isQrFirstEnabled(self) -> bool:
+        """Check if the full-frame QR-first pass is available."""
+        return self._frameDetector is not None
+    
+    def _decode(
+        self,
+        processedImage: np.ndarray,
+        transform: QrImageTransform,
+        context: Optional[ImageContext] = None
+    ) -> Tuple[Optional[QrDetectionResult], str, List[Dict[str, Any]]]:
+        """
+        Decode predicted regions first, then the full image.
+        
+        Args:
+            processedImage: Image passed to the detector.
+            transform: Transform from the S5 input image to processedImage.
+            context: Optional frame context of the S5 input image.
+            
+        Returns:
+            Tuple of (QR result in S5 input coordinates or None,
+            region source that decoded it: "recent", "finder" or "full",
+            per-attempt timing records).
+        """
+        attempts: List[Dict[str, Any]] = []
+        
+        if self._roiLocator is not None:
+            for region in self._roiLocator.getSearchRegions(processedImage, context):
+                x, y, w, h = region.rect
+                roiImage = np.ascontiguousarray(processedImage[y:y + h, x:x + w])
+                qrResult = self._timedDetect(
+                    roiImage, region.source, attempts, referenceWidth=processedImage.shape[1]
+                )
+                if qrResult is not None:
+                    roiTransform = transform.then(QrImageTransform(offsetX=x, offsetY=y))
+                    return mapQrResultToOriginal(qrResult, roiTransform), region.source, attempts
+                self._logger.debug(f"ROI {region.source} {region.rect} missed")
+        
+        qrResult = self._timedDetect(processedImage, QrRoiLocator.SOURCE_FULL, attempts)
+        if qrResult is not None:
+            qrResult = mapQrResultToOriginal(qrResult, transform)
+        return qrResult, QrRoiLocator.SOURCE_FULL, attempts
+    
+    def _timedDetect(
+        self,
+        image: np.ndarray,
+        region: str,
+        attempts: List[Dict[str, Any]],
+        referenceWidth: Optional[int] = None
+    ) -> Optional[QrDetectionResult]:
+        """
+        Run the detector once and append its timing to attempts.
+        
+        referenceWidth is the width of the image an ROI was cut from; the
+        multi-scale detector then sizes modules from it and does not learn
+        the QR width ratio from the ROI.
+        """
+        startTime = time.perf_counter()
+        if referenceWidth is not None and isinstance(self._qrDetector, MultiScaleQrDetector):
+            qrResult = self._qrDetector.detectRegion(image, referenceWidth)
+        else:
+            qrResult = self._qrDetector.detect(image)
+        
+        attempts.append({
+            "region": region,
+            "size": [int(image.shape[1]), int(image.shape[0])],
+            "timeMs": round((time.perf_counter() - startTime) * 1000, 3),
+            "success": qrResult is not None,
+            "scales": (
+                self._qrDetector.getLastAttempts()
+                if isinstance(self._qrDetector, MultiScaleQrDetector) else None
+            )
+        })
+        return qrResult
+    
     def setEnabled(self, enabled: bool) -> None:
         """Enable or disable QR detection."""
         self._enabled = enabled
@@ -242,10 +565,28 @@ def getBackend(self) -> str:
         """Get current QR detection backend."""
         return self._backend
     
+    def release(self) -> None:
+        """Release background decode workers (concurrent mode)."""
+        if isinstance(self._qrDetector, ConcurrentQrDetector):
+            self._qrDetector.close()
+    
     def isPreprocessingEnabled(self) -> bool:
         """Check if preprocessing is enabled."""
         return self._preprocessor is not None and self._preprocessor.isEnabled()
     
+    def isCacheEnabled(self) -> bool:
+        """Check if the result cache is enabled."""
+        return self._resultCache is not None
+    
+    def clearCache(self) -> None:
+        """Drop cached QR results (e.g. after a camera or config change)."""
+        if self._resultCache is not None:
+            self._resultCache.clear()
+    
+    def isRoiEnabled(self) -> bool:
+        """Check if ROI localization is enabled."""
+        return self._roiLocator is not None
+    
     def getPreprocessingMode(self) -> str:
         """Get current preprocessing mode."""
         if self._preprocessor is not None:
@@ -288,72 +629,46 @@ def _saveDebugInput(
         except Exception as e:
             self._logger.error(f"[{frameId}] Failed to save debug input: {e}")
     
-    def _scaleBackCoordinates(
-        self,
-        qrResult: QrDetectionResult,
-        scaleFactor: float
-    ) -> QrDetectionResult:
-        """
-        Scale QR coordinates back to original image size.
-        
-        When preprocessing scales the image, QR detection returns coordinates
-        relative to the scaled image. This method converts them back to the
-        original image coordinate system for use by S6 Component Extraction.
-        
-        Args:
-            qrResult: QR detection result with coordinates on scaled image.
-            scaleFactor: The scale factor that was applied during preprocessing.
-            
-        Returns:
-            New QrDetectionResult with coordinates scaled back to original size.
-        """
-        # Scale polygon coordinates back
-        scaledPolygon = [
-            (int(x / scaleFactor), int(y / scaleFactor))
-            for (x, y) in qrResult.polygon
-        ]
-        
-        # Scale rect (x, y, w, h) back
-        scaledRect = (
-            int(qrResult.rect[0] / scaleFactor),
-            int(qrResult.rect[1] / scaleFactor),
-            int(qrResult.rect[2] / scaleFactor),
-            int(qrResult.rect[3] / scaleFactor)
-        )
-        
-        # Return new QrDetectionResult with adjusted coordinates
-        return QrDetectionResult(
-            text=qrResult.text,
-            polygon=scaledPolygon,
-            rect=scaledRect,
-            confidence=qrResult.confidence,
-            dateCode=qrResult.dateCode,
-            facility=qrResult.facility,
-            orderType=qrResult.orderType,
-            orderNumber=qrResult.orderNumber,
-            position=qrResult.position,
-            revisionCount=qrResult.revisionCount
-        )
-    
     def _saveDebugOutput(
         self,
         frameId: str,
-        qrResult: QrDetectionResult
+        qrResult: Optional[QrDetectionResult],
+        searchRegion: Optional[str],
+        attempts: List[Dict[str, Any]]
     ) -> None:
-        """Save debug output for QR detection step."""
+        """
+        Save debug output for QR detection step.
+        
+        Also saved when no QR is decoded (qrResult=None), so that the
+        per-attempt timing of failed frames can be used to tune the policy.
+        """
         if not self._debugEnabled:
             return
         
         # Save QR data as JSON
         data = {
             "frameId": frameId,
-            "text": qrResult.text,
-            "polygon": qrResult.polygon,
-            "rect": qrResult.rect,
-            "confidence": qrResult.confidence,
+            "text": qrResult.text if qrResult else None,
+            "polygon": qrResult.polygon if qrResult else None,
+            "rect": qrResult.rect if qrResult else None,
+            "confidence": qrResult.confidence if qrResult else None,
             "backend": self._backend,
             "preprocessingEnabled": self._preprocessor is not None,
             "preprocessingMode": self._preprocessingMode if self._preprocessor else None,
+            "searchRegion": searchRegion,
+            "attempts": attempts,
+            "roiStatistics": (
+                self._roiLocator.getStatistics()
+                if self._roiLocator is not None else None
+            ),
+            "cacheStatistics": (
+                self._resultCache.getStatistics()
+                if self._resultCache is not None else None
+            ),
+            "cascadeStatistics": (
+                self._qrDetector.getStatistics()
+                if isinstance(self._qrDetector, CascadeQrDetector) else None
+            ),
             "parsed": {
                 "dateCode": qrResult.dateCode,
                 "facility": qrResult.facility,
@@ -361,6 +676,6 @@ def _saveDebugOutput(
                 "orderNumber": qrResult.orderNumber,
                 "position": qrResult.position,
                 "revisionCount": qrResult.revisionCount
-            }
+            } if qrResult else None
         }
         self._saveDebugJson(frameId, data, "qr")
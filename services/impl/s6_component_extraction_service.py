@@ -20,6 +20,7 @@
     IComponentExtractor,
     ComponentResult
 )
+from core.interfaces.image_format import ImageFormat
 from core.extractor.label_component_extractor import LabelComponentExtractor
 from services.interfaces.component_extraction_service_interface import (
     IComponentExtractionService,
@@ -89,8 +90,7 @@ def __init__(
             f"S6ComponentExtractionService initialized "
             f"(aboveQr={aboveQrWidthRatio}x{aboveQrHeightRatio}, "
             f"belowQr={belowQrWidthRatio}x{belowQrHeightRatio}, "
-            f"scale={aboveQrScaleFactor}x, "
-            f"input=grayscale)"
+            f"scale={aboveQrScaleFactor}x)"
         )
     
     def extractComponents(
@@ -99,15 +99,17 @@ def extractComponents(
         qrPolygon: List[List[int]],
         frameId: str
     ) -> ComponentExtractionServiceResult:
-        """Extract and merge text components from a grayscale image.
+        """Extract and merge text components from an image.
         
         Args:
-            image: Grayscale image from S4 enhancement (H, W)
+            image: Grayscale image from S4 enhancement (H, W), or BGR
+                when S4 is disabled
             qrPolygon: QR code polygon coordinates
             frameId: Frame identifier
             
         Returns:
-            ComponentExtractionServiceResult with grayscale merged image
+            ComponentExtractionServiceResult with merged image in the
+            input format
         """
         startTime = time.time()
         
@@ -175,7 +177,8 @@ def extractComponents(
                 mergedImage=componentResult.mergedImage,
                 frameId=frameId,
                 success=True,
-                processingTimeMs=processingTimeMs
+                processingTimeMs=processingTimeMs,
+                imageFormat=ImageFormat.of(componentResult.mergedImage)
             )
             
         except Exception as e:
@@ -197,6 +200,10 @@ def isEnabled(self) -> bool:
         """Check if component extraction is enabled."""
         return self._enabled
     
+    def getInputFormats(self) -> List[ImageFormat]:
+        """Get the image formats accepted without conversion."""
+        return self._componentExtractor.getAcceptedFormats()
+    
     def _saveDebugOutput(
         self,
         frameId: str,
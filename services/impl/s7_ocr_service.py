@@ -2,7 +2,8 @@
 S7 OCR Service Implementation.
 
 Step 7 of the pipeline: OCR text extraction.
-Creates and manages PaddleOcrExtractor from core layer.
+Creates and manages the OCR extractor (PaddleOCR, ONNX Runtime or
+OpenVINO backend) from core layer.
 
 Follows:
 - SRP: Only handles OCR operations
@@ -12,12 +13,15 @@
 
 import time
 import logging
-from typing import Optional
+from typing import Optional, List, Dict, Any
 
 import numpy as np
 
-from core.interfaces.ocr_extractor_interface import IOcrExtractor, OcrResult
-from core.ocr.paddle_ocr_extractor import PaddleOcrExtractor
+from core.interfaces.ocr_extractor_interface import IOcrExtractor, OcrResult, TextBlock
+from core.interfaces.image_format import ImageFormat, convertImage
+from core.ocr.ocr_extractor_factory import createOcrExtractor
+from core.ocr.process_pool_ocr_extractor import ProcessPoolOcrExtractor
+from core.ocr.text_line_segmenter import TextLineSegmenter
 from services.interfaces.ocr_service_interface import (
     IOcrService,
     OcrServiceResult
@@ -32,11 +36,20 @@ class S7OcrService(IOcrService, BaseService):
     Extracts text from images using PaddleOCR.
     Returns structured text blocks with positions and confidence.
     
-    Creates PaddleOcrExtractor internally with provided parameters.
+    Creates the OCR extractor for the selected backend internally with
+    provided parameters.
     """
     
     SERVICE_NAME = "s7_ocr"
     
+    # OCR modes
+    MODE_FULL = "full"                  # Detection + recognition on the merged image
+    MODE_RECOGNITION = "recognition"    # Recognition only on line strips of S6 regions
+    
+    # Execution modes
+    EXECUTION_INLINE = "inline"         # OCR on the calling thread
+    EXECUTION_PROCESS = "process"       # OCR in a pool of worker processes
+    
     def __init__(
         self,
         enabled: bool = True,
@@ -55,6 +68,21 @@ def __init__(
         mkldnnCacheCapacity: int = 10,
         cpuThreads: int = 8,
         device: str = "cpu",
+        mode: str = "full",
+        recBatchSize: int = 8,
+        lineMinHeight: int = 6,
+        lineInkThreshold: float = 0.02,
+        linePadding: int = 3,
+        executionMode: str = "inline",
+        processWorkers: int = 2,
+        processCoresPerWorker: int = 0,
+        processWarmup: bool = True,
+        backend: str = "paddle",
+        detModelPath: Optional[str] = None,
+        recModelPath: Optional[str] = None,
+        recCharDictPath: Optional[str] = None,
+        modelCacheDir: Optional[str] = None,
+        openvinoConfig: Optional[Dict[str, Any]] = None,
         debugBasePath: str = "output/debug",
         debugEnabled: bool = False
     ):
@@ -78,6 +106,30 @@ def __init__(
             mkldnnCacheCapacity: MKL-DNN cache capacity.
             cpuThreads: Number of CPU threads.
             device: Device for inference ('cpu' or 'gpu').
+            mode: 'full' (text detection + recognition on the merged image) or
+                'recognition' (recognition only on line strips cut from the
+                S6 regions by projection profile).
+            recBatchSize: Strips per recognition batch (recognition mode).
+            lineMinHeight: Minimum text line height in pixels (recognition mode).
+            lineInkThreshold: Minimum dark-pixel ratio of a text row (recognition mode).
+            linePadding: Margin around each line strip in pixels (recognition mode).
+            executionMode: 'inline' (OCR on the calling thread) or 'process'
+                (pool of long-lived worker processes, images passed through
+                shared memory).
+            processWorkers: Number of OCR worker processes (process mode).
+            processCoresPerWorker: CPU cores pinned per worker, 0 = no pinning
+                (process mode).
+            processWarmup: Run one blank OCR in each worker at startup (process mode).
+            backend: OCR backend: 'paddle' (PaddleOCR), 'onnx' (ONNX Runtime) or
+                'openvino' (OpenVINO Runtime) with exported PP-OCR models.
+            detModelPath: Exported detection model (onnx/openvino backends).
+            recModelPath: Exported recognition model (onnx/openvino backends).
+            recCharDictPath: Recognition dictionary file (onnx/openvino backends,
+                None = read from inference.yml next to the recognition model).
+            modelCacheDir: Compiled/optimized model cache directory
+                (onnx/openvino backends, None = no cache).
+            openvinoConfig: Thread/stream settings shared with S2 detection
+                (onnx/openvino backends).
             debugBasePath: Base path for debug output.
             debugEnabled: Whether to save debug output.
         """
@@ -88,8 +140,13 @@ def __init__(
             debugEnabled=debugEnabled
         )
         
-        # Create core OCR extractor implementation
-        self._ocrExtractor: IOcrExtractor = PaddleOcrExtractor(
+        # Each worker runs inference on its own pinned cores
+        openvinoConfig = dict(openvinoConfig or {})
+        if executionMode == self.EXECUTION_PROCESS and processCoresPerWorker > 0:
+            cpuThreads = processCoresPerWorker
+            openvinoConfig["numThreads"] = processCoresPerWorker
+        
+        extractorKwargs = dict(
             lang=lang,
             useTextlineOrientation=useTextlineOrientation,
             textDetThresh=textDetThresh,
@@ -104,34 +161,66 @@ def __init__(
             enableMkldnn=enableMkldnn,
             mkldnnCacheCapacity=mkldnnCacheCapacity,
             cpuThreads=cpuThreads,
-            device=device
+            device=device,
+            recBatchSize=recBatchSize
+        )
+        factoryKwargs = dict(
+            backend=backend,
+            extractorKwargs=extractorKwargs,
+            detModelPath=detModelPath,
+            recModelPath=recModelPath,
+            recCharDictPath=recCharDictPath,
+            modelCacheDir=modelCacheDir,
+            openvinoConfig=openvinoConfig
+        )
+        
+        # Create core OCR extractor implementation
+        self._executionMode = executionMode
+        if executionMode == self.EXECUTION_PROCESS:
+            self._ocrExtractor: IOcrExtractor = ProcessPoolOcrExtractor(
+                extractorKwargs=factoryKwargs,
+                numWorkers=processWorkers,
+                coresPerWorker=processCoresPerWorker,
+                warmup=processWarmup
+            )
+        else:
+            self._executionMode = self.EXECUTION_INLINE
+            self._ocrExtractor = createOcrExtractor(**factoryKwargs)
+        
+        self._lineSegmenter = TextLineSegmenter(
+            minLineHeight=lineMinHeight,
+            inkThreshold=lineInkThreshold,
+            padding=linePadding
         )
         
         self._enabled = enabled
+        self._mode = mode if mode in (self.MODE_FULL, self.MODE_RECOGNITION) else self.MODE_FULL
         
         self._logger.info(
             f"S7OcrService initialized "
-            f"(lang={lang}, device={device}, limit_type={textDetLimitType}, "
-            f"limit_side_len={textDetLimitSideLen})"
+            f"(backend={backend}, lang={lang}, device={device}, mode={self._mode}, "
+            f"execution={self._executionMode}, "
+            f"limit_type={textDetLimitType}, limit_side_len={textDetLimitSideLen})"
         )
     
     def extractText(
         self,
         image: np.ndarray,
-        frameId: str
+        frameId: str,
+        regions: Optional[List[np.ndarray]] = None
     ) -> OcrServiceResult:
-        """Extract text from a grayscale image.
+        """Extract text from the merged component image.
         
         Args:
-            image: Grayscale merged image from S6 (H, W)
+            image: Merged image from S6, already converted by the
+                orchestrator to one of getInputFormats()
             frameId: Frame identifier
+            regions: S6 text regions (above QR, below QR). In recognition
+                mode they are cut into line strips and only the recognition
+                model runs; image is used when no strip is found.
             
         Returns:
             OcrServiceResult with text blocks
-            
-        Note:
-            PaddleOCR requires BGR input. Automatic conversion from grayscale
-            to BGR is handled internally by the core PaddleOcrExtractor.
         """
         startTime = time.time()
         
@@ -155,7 +244,11 @@ def extractText(
         
         try:
             # Run OCR
-            ocrResult = self._ocrExtractor.extract(image)
+            ocrResult = None
+            if self._mode == self.MODE_RECOGNITION and regions:
+                ocrResult = self._recognizeRegions(regions)
+            if ocrResult is None:
+                ocrResult = self._ocrExtractor.extract(image)
             
             processingTimeMs = self._measureTime(startTime)
             
@@ -206,6 +299,109 @@ def isEnabled(self) -> bool:
         """Check if OCR is enabled."""
         return self._enabled
     
+    def getInputFormats(self) -> List[ImageFormat]:
+        """Get the image formats accepted without conversion."""
+        return self._ocrExtractor.getAcceptedFormats()
+    
+    def extractTextBatch(
+        self,
+        images: List[np.ndarray],
+        frameId: str
+    ) -> List[OcrServiceResult]:
+        """Extract text from several images (e.g. all labels of a frame).
+        
+        In process execution mode the images are recognized in parallel
+        by the worker pool; otherwise one after another.
+        
+        Args:
+            images: Merged images from S6 (one per label)
+            frameId: Frame identifier
+            
+        Returns:
+            One OcrServiceResult per image, in input order
+        """
+        if not self._enabled or not isinstance(self._ocrExtractor, ProcessPoolOcrExtractor):
+            return [self.extractText(image, frameId) for image in images]
+        
+        startTime = time.time()
+        try:
+            ocrResults = self._ocrExtractor.extractMany(images)
+        except Exception as e:
+            self._logger.error(f"[{frameId}] Batch OCR failed: {e}")
+            ocrResults = [None] * len(images)
+        
+        processingTimeMs = self._measureTime(startTime)
+        self._logTiming(frameId, processingTimeMs)
+        self._logger.info(
+            f"[{frameId}] Batch OCR: {len(images)} images in {processingTimeMs:.1f}ms"
+        )
+        
+        return [
+            OcrServiceResult(
+                ocrData=ocrResult,
+                frameId=frameId,
+                success=ocrResult is not None,
+                processingTimeMs=processingTimeMs
+            )
+            for ocrResult in ocrResults
+        ]
+    
+    def getExecutionMode(self) -> str:
+        """Get OCR execution mode ('inline' or 'process')."""
+        return self._executionMode
+    
+    def release(self) -> None:
+        """Stop OCR worker processes (process execution mode)."""
+        if isinstance(self._ocrExtractor, ProcessPoolOcrExtractor):
+            self._ocrExtractor.close()
+    
+    def getMode(self) -> str:
+        """Get OCR mode ('full' or 'recognition')."""
+        return self._mode
+    
+    def _recognizeRegions(self, regions: List[np.ndarray]) -> Optional[OcrResult]:
+        """
+        Recognition-only OCR over line strips of the given regions.
+        
+        Regions are stacked top to bottom in a virtual coordinate system, so
+        block bboxes keep the reading order S8 sorts by.
+        
+        Returns:
+            OcrResult, or None when no strip was found (caller falls back
+            to full OCR).
+        """
+        acceptedFormats = self._ocrExtractor.getAcceptedFormats()
+        strips = []
+        offsets = []
+        offsetY = 0
+        
+        for region in regions:
+            if region is None or region.size == 0:
+                continue
+            for strip in self._lineSegmenter.split(region):
+                strips.append(np.ascontiguousarray(
+                    convertImage(strip.image, None, acceptedFormats)
+                ))
+                x, y, _, _ = strip.rect
+                offsets.append((x, y + offsetY))
+            offsetY += region.shape[0]
+        
+        if not strips:
+            self._logger.debug("Recognition mode: no line strips, using full OCR")
+            return None
+        
+        textBlocks = []
+        for block, (dx, dy) in zip(self._ocrExtractor.recognize(strips), offsets):
+            if not block.text:
+                continue
+            textBlocks.append(TextBlock(
+                text=block.text,
+                confidence=block.confidence,
+                bbox=[[px + dx, py + dy] for (px, py) in block.bbox]
+            ))
+        
+        return OcrResult(textBlocks=textBlocks, rawResult={"strips": len(strips)})
+    
     def _saveDebugOutput(
         self,
         frameId: str,
@@ -218,6 +414,11 @@ def _saveDebugOutput(
         # Save OCR data as JSON
         data = {
             "frameId": frameId,
+            "mode": self._mode,
+            "strips": (
+                ocrResult.rawResult.get("strips")
+                if isinstance(ocrResult.rawResult, dict) else None
+            ),
             "textBlocks": [
                 {
                     "text": block.text,
@@ -13,7 +13,7 @@
 import time
 import logging
 from dataclasses import asdict
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 import numpy as np
 
@@ -21,6 +21,7 @@
 from core.interfaces.ocr_extractor_interface import TextBlock
 from core.interfaces.qr_detector_interface import QrDetectionResult
 from core.processor.label_text_processor import LabelTextProcessor
+from core.processor.similarity_backend_factory import createSimilarityBackend
 from services.interfaces.postprocessing_service_interface import (
     IPostprocessingService,
     PostprocessingServiceResult
@@ -47,6 +48,8 @@ def __init__(
         productsJsonPath: Optional[str] = None,
         sizesJsonPath: Optional[str] = None,
         colorsJsonPath: Optional[str] = None,
+        catalogIndexDir: Optional[str] = None,
+        similarityBackend: str = "python",
         debugBasePath: str = "output/debug",
         debugEnabled: bool = False
     ):
@@ -59,6 +62,10 @@ def __init__(
             productsJsonPath: Path to products JSON file.
             sizesJsonPath: Path to sizes JSON file.
             colorsJsonPath: Path to colors JSON file.
+            catalogIndexDir: Directory of compiled catalog index files
+                (None = parse the JSON catalogs on every start).
+            similarityBackend: String similarity backend ("python", "rapidfuzz"
+                or "auto"; all return identical scores).
             debugBasePath: Base path for debug output.
             debugEnabled: Whether to save debug output.
         """
@@ -74,21 +81,24 @@ def __init__(
             productsJsonPath=productsJsonPath,
             sizesJsonPath=sizesJsonPath,
             colorsJsonPath=colorsJsonPath,
-            minFuzzyScore=minFuzzyScore
+            minFuzzyScore=minFuzzyScore,
+            catalogIndexDir=catalogIndexDir,
+            similarityBackend=createSimilarityBackend(similarityBackend)
         )
         
         self._enabled = enabled
         
         self._logger.info(
             f"S8PostprocessingService initialized "
-            f"(minFuzzyScore={minFuzzyScore})"
+            f"(minFuzzyScore={minFuzzyScore}, similarityBackend={similarityBackend})"
         )
     
     def process(
         self,
         textBlocks: List[TextBlock],
         qrResult: QrDetectionResult,
-        frameId: str
+        frameId: str,
+        positionHint: Optional[Tuple[int, int]] = None
     ) -> PostprocessingServiceResult:
         """Process OCR results with fuzzy matching and validation."""
         startTime = time.time()
@@ -118,7 +128,7 @@ def process(
         
         try:
             # Run postprocessing
-            labelData = self._textProcessor.process(textBlocks, qrResult)
+            labelData = self._textProcessor.process(textBlocks, qrResult, positionHint)
             
             processingTimeMs = self._measureTime(startTime)
             
@@ -174,6 +184,7 @@ def _saveDebugOutput(
         data = {
             "frameId": frameId,
             "labelData": asdict(labelData),
-            "processingTimeMs": processingTimeMs
+            "processingTimeMs": processingTimeMs,
+            "matchStatistics": self._textProcessor.getMatchStatistics()
         }
         self._saveDebugJson(frameId, data, "result")
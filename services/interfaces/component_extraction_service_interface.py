@@ -15,6 +15,7 @@
 import numpy as np
 
 from core.interfaces.component_extractor_interface import ComponentResult
+from core.interfaces.image_format import ImageFormat
 
 
 @dataclass
@@ -28,12 +29,14 @@ class ComponentExtractionServiceResult:
         frameId: Frame identifier for debug output.
         success: Whether extraction was successful.
         processingTimeMs: Time taken for extraction.
+        imageFormat: Format of mergedImage (same as the input image).
     """
     componentData: Optional[ComponentResult]
     mergedImage: Optional[np.ndarray]
     frameId: str
     success: bool
     processingTimeMs: float = 0.0
+    imageFormat: Optional[ImageFormat] = None
 
 
 class IComponentExtractionService(ABC):
@@ -86,3 +89,14 @@ def isEnabled(self) -> bool:
             bool: True if component extraction is enabled.
         """
         pass
+    
+    @abstractmethod
+    def getInputFormats(self) -> List[ImageFormat]:
+        """
+        Get the image formats accepted without conversion.
+        
+        Returns:
+            Accepted formats, preferred first. The orchestrator converts
+            other inputs to the first one.
+        """
+        pass
@@ -14,6 +14,8 @@
 from typing import Optional
 import numpy as np
 
+from core.interfaces.image_format import ImageFormat
+
 
 @dataclass
 class EnhancementServiceResult:
@@ -27,6 +29,7 @@ class EnhancementServiceResult:
         frameId: Frame identifier for debug output.
         success: Whether enhancement was successful.
         processingTimeMs: Time taken for enhancement.
+        imageFormat: Format of enhancedImage.
     """
     enhancedImage: Optional[np.ndarray]
     brightnessApplied: bool
@@ -34,6 +37,7 @@ class EnhancementServiceResult:
     frameId: str
     success: bool
     processingTimeMs: float = 0.0
+    imageFormat: Optional[ImageFormat] = None
 
 
 class IEnhancementService(ABC):
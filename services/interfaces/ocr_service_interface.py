@@ -11,10 +11,11 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, List
 import numpy as np
 
 from core.interfaces.ocr_extractor_interface import OcrResult
+from core.interfaces.image_format import ImageFormat
 
 
 @dataclass
@@ -46,7 +47,8 @@ class IOcrService(ABC):
     def extractText(
         self,
         image: np.ndarray,
-        frameId: str
+        frameId: str,
+        regions: Optional[List[np.ndarray]] = None
     ) -> OcrServiceResult:
         """
         Extract text from an image.
@@ -54,12 +56,32 @@ def extractText(
         Args:
             image: Input image (BGR format).
             frameId: Frame identifier for debug output.
+            regions: Optional text regions of known layout (top to bottom),
+                used instead of image in recognition-only mode.
             
         Returns:
             OcrServiceResult: OCR result with text blocks.
         """
         pass
     
+    @abstractmethod
+    def extractTextBatch(
+        self,
+        images: List[np.ndarray],
+        frameId: str
+    ) -> List[OcrServiceResult]:
+        """
+        Extract text from several images, in parallel when supported.
+        
+        Args:
+            images: Input images (BGR format), e.g. one per label.
+            frameId: Frame identifier for debug output.
+            
+        Returns:
+            List[OcrServiceResult]: One result per image, in input order.
+        """
+        pass
+    
     @abstractmethod
     def setEnabled(self, enabled: bool) -> None:
         """
@@ -79,3 +101,14 @@ def isEnabled(self) -> bool:
             bool: True if OCR is enabled.
         """
         pass
+    
+    @abstractmethod
+    def getInputFormats(self) -> List[ImageFormat]:
+        """
+        Get the image formats accepted without conversion.
+        
+        Returns:
+            Accepted formats, preferred first. The orchestrator converts
+            other inputs to the first one.
+        """
+        pass
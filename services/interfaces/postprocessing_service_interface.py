@@ -11,7 +11,7 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional, List, Tuple
 import numpy as np
 
 from core.interfaces.text_processor_interface import LabelData
@@ -51,7 +51,8 @@ def process(
         self,
         textBlocks: List[TextBlock],
         qrResult: QrDetectionResult,
-        frameId: str
+        frameId: str,
+        positionHint: Optional[Tuple[int, int]] = None
     ) -> PostprocessingServiceResult:
         """
         Process OCR results with fuzzy matching and validation.
@@ -60,6 +61,8 @@ def process(
             textBlocks: List of text blocks from OCR.
             qrResult: QR detection result for validation.
             frameId: Frame identifier for debug output.
+            positionHint: (position, quantity) known from earlier frames,
+                used when the text blocks do not contain it.
             
         Returns:
             PostprocessingServiceResult: Processed result with validation.
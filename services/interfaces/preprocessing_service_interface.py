@@ -11,10 +11,11 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional, List, Tuple
 import numpy as np
 
 from core.interfaces.detector_interface import Detection
+from core.interfaces.image_format import ImageFormat
 
 
 @dataclass
@@ -30,6 +31,9 @@ class PreprocessingServiceResult:
         frameId: Frame identifier for debug output.
         success: Whether preprocessing was successful.
         processingTimeMs: Time taken for preprocessing.
+        transformMatrix: 2x3 affine matrix from frame to crop coordinates
+            (QR-anchored crops only).
+        imageFormat: Format of croppedImage.
     """
     croppedImage: Optional[np.ndarray]
     rotationAngle: float
@@ -38,6 +42,8 @@ class PreprocessingServiceResult:
     frameId: str
     success: bool
     processingTimeMs: float = 0.0
+    transformMatrix: Optional[np.ndarray] = None
+    imageFormat: Optional[ImageFormat] = None
 
 
 class IPreprocessingService(ABC):
@@ -71,6 +77,29 @@ def preprocess(
         """
         pass
     
+    @abstractmethod
+    def preprocessFromQr(
+        self,
+        frame: np.ndarray,
+        qrPolygon: List[Tuple[int, int]],
+        frameId: str
+    ) -> PreprocessingServiceResult:
+        """
+        Crop the upright label around a QR code decoded on the full frame.
+        
+        Skips mask contouring and orientation classification: the QR
+        corner order gives the label orientation.
+        
+        Args:
+            frame: Original frame (BGR format).
+            qrPolygon: QR corners in frame coordinates (decoder order).
+            frameId: Frame identifier for debug output.
+            
+        Returns:
+            PreprocessingServiceResult with transformMatrix set.
+        """
+        pass
+    
     @abstractmethod
     def setEnabled(self, enabled: bool) -> None:
         """
@@ -11,10 +11,11 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 import numpy as np
 
 from core.interfaces.qr_detector_interface import QrDetectionResult
+from core.interfaces.image_context import ImageContext
 
 
 @dataclass
@@ -46,7 +47,9 @@ class IQrDetectionService(ABC):
     def detectQr(
         self,
         image: np.ndarray,
-        frameId: str
+        frameId: str,
+        bbox: Optional[Tuple[int, int, int, int]] = None,
+        context: Optional[ImageContext] = None
     ) -> QrDetectionServiceResult:
         """
         Detect and decode QR code from an image.
@@ -54,12 +57,34 @@ def detectQr(
         Args:
             image: Input image (BGR format).
             frameId: Frame identifier for debug output.
+            bbox: Optional S2 bounding box of the label (x1, y1, x2, y2),
+                used to recognise a label that has not moved.
+            context: Optional frame context of image; resized variants
+                are shared through it.
             
         Returns:
             QrDetectionServiceResult: QR detection result with metadata.
         """
         pass
     
+    @abstractmethod
+    def detectQrInFrame(
+        self,
+        frame: np.ndarray,
+        frameId: str
+    ) -> QrDetectionServiceResult:
+        """
+        Cheap QR pass on the full camera frame (QR-first path).
+        
+        Args:
+            frame: Camera frame from S1 (BGR format).
+            frameId: Frame identifier for debug output.
+            
+        Returns:
+            QrDetectionServiceResult with coordinates in frame space.
+        """
+        pass
+    
     @abstractmethod
     def setEnabled(self, enabled: bool) -> None:
         """
@@ -7,6 +7,7 @@
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, TYPE_CHECKING
 
 from PySide6.QtCore import Qt, QTimer
@@ -15,6 +16,7 @@
     QStatusBar, QMessageBox, QLabel
 )
 
+from core.interfaces.image_context import ImageContext
 from ui.widgets.camera_widget import CameraWidget
 from ui.widgets.config_panel import ConfigPanel
 from ui.widgets.ocr_result_widget import OcrResultWidget
@@ -76,6 +78,26 @@ def __init__(self, orchestrator: "PipelineOrchestrator"):
         # Frame counter for unique IDs
         self._frameCounter = 0
         
+        # Pipeline output mode ("full" or "qr_only")
+        self._outputMode = self._configService.getOutputMode()
+        
+        # Validated results by QR text (None when disabled)
+        self._labelResultCache = orchestrator.labelResultCache
+        
+        # Cross-frame field voting per label (None when disabled)
+        self._labelAccumulator = orchestrator.labelFieldAccumulator
+        
+        # Best-quality crop per label for S6-S8 (None when disabled)
+        self._bestFrameSelector = orchestrator.bestFrameSelector
+        
+        # Worker for the full-frame QR pass that runs in parallel with S2
+        self._qrFirstExecutor: Optional[ThreadPoolExecutor] = None
+        if self._qrDetectionService.isQrFirstEnabled():
+            self._qrFirstExecutor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="qr-first"
+            )
+        
         self._setupUI()
         self._setupConnections()
         self._loadInitialState()
@@ -401,6 +423,13 @@ def _updateFrame(self):
         frame = frameResult.image
         frameId = frameResult.frameId
         
+        # QR-first: cheap full-frame QR pass in parallel with S2
+        qrFirstFuture = None
+        if self._qrFirstExecutor is not None:
+            qrFirstFuture = self._qrFirstExecutor.submit(
+                self._qrDetectionService.detectQrInFrame, frame, frameId
+            )
+        
         # S2: Run detection
         detectionResult = self._detectionService.detect(frame, frameId)
         pipelineTiming["s2_detection"] = detectionResult.processingTimeMs
@@ -409,90 +438,240 @@ def _updateFrame(self):
         detections = detectionResult.detections if detectionResult.success else []
         self._cameraWidget.updateFrame(frame, detections)
         
-        # If no detections, clear OCR results and return
-        if not detections:
-            self._configPanel.clearPreprocessedImage()
-            self._ocrResultWidget.clear()
-            return
-        
-        # Get first detection for processing
-        firstDetection = detections[0]
-        
-        # S3: Preprocessing (crop, rotate, fix orientation)
-        if self._preprocessingService.isEnabled():
-            preprocessResult = self._preprocessingService.preprocess(
-                frame, firstDetection, frameId
+        qrData = None
+        processedImage = None
+        processedFormat = None
+        
+        # Best-frame selection: a label whose window expired without a
+        # release (e.g. it left the view) is processed now from its best
+        # buffered crop instead of the current frame
+        dueFrame = None
+        if self._bestFrameSelector is not None and self._outputMode != "qr_only":
+            dueFrame = self._bestFrameSelector.popDue()
+        
+        pendingRegions = None
+        # Derived-image time already reported by earlier frames (a buffered
+        # crop's context keeps the timings of the frame that created it)
+        reportedDerivedMs = 0.0
+        if dueFrame is not None:
+            processedImage, labelContext, qrData = dueFrame.payload
+            imageContexts = [labelContext]
+            reportedDerivedMs = labelContext.getTotalTimeMs()
+            if self._labelAccumulator is not None:
+                pendingRegions = self._labelAccumulator.getPendingRegions(qrData.text)
+            logger.debug(f"[{frameId}] Best frame released on timeout: score={dueFrame.score:.3f}")
+        else:
+            # QR-first shortcut: crop around the QR polygon (no mask contour,
+            # no orientation model) and reuse the decoded QR (no S5)
+            if qrFirstFuture is not None:
+                frameQrResult = qrFirstFuture.result()
+                pipelineTiming["s5_qr_first"] = frameQrResult.processingTimeMs
+            
+                if frameQrResult.success and frameQrResult.qrData is not None:
+                    preprocessResult = self._preprocessingService.preprocessFromQr(
+                        frame, frameQrResult.qrData.polygon, frameId
+                    )
+                    pipelineTiming["s3_preprocessing"] = preprocessResult.processingTimeMs
+                
+                    if preprocessResult.success and preprocessResult.croppedImage is not None:
+                        processedImage = preprocessResult.croppedImage
+                        processedFormat = preprocessResult.imageFormat
+                        qrData = self._qrDetectionService.mapToLabelCrop(
+                            frameQrResult.qrData, preprocessResult.transformMatrix
+                        )
+            
+            if processedImage is None:
+                # If no detections, clear OCR results and return
+                if not detections:
+                    self._configPanel.clearPreprocessedImage()
+                    self._ocrResultWidget.clear()
+                    return
+            
+                # Get first detection for processing
+                firstDetection = detections[0]
+            
+                # S3: Preprocessing (crop, rotate, fix orientation)
+                if self._preprocessingService.isEnabled():
+                    preprocessResult = self._preprocessingService.preprocess(
+                        frame, firstDetection, frameId
+                    )
+                    pipelineTiming["s3_preprocessing"] = preprocessResult.processingTimeMs
+                
+                    if not preprocessResult.success or preprocessResult.croppedImage is None:
+                        self._configPanel.clearPreprocessedImage()
+                        self._ocrResultWidget.clear()
+                        return
+                    processedImage = preprocessResult.croppedImage
+                    processedFormat = preprocessResult.imageFormat
+                else:
+                    # Without preprocessing, skip further processing
+                    self._configPanel.clearPreprocessedImage()
+                    self._ocrResultWidget.clear()
+                    return
+            
+            # S4: Enhancement (brightness, sharpness)
+            if self._enhancementService.isEnabled():
+                enhanceResult = self._enhancementService.enhance(processedImage, frameId)
+                pipelineTiming["s4_enhancement"] = enhanceResult.processingTimeMs
+            
+                if enhanceResult.success and enhanceResult.enhancedImage is not None:
+                    processedImage = enhanceResult.enhancedImage
+                    processedFormat = enhanceResult.imageFormat
+            
+            # Derived images of the label crop (resizes, conversions) shared by S5-S7
+            labelContext = ImageContext(processedImage, processedFormat, "label")
+            imageContexts = [labelContext]
+            
+            # S5: QR Detection (skipped when the QR-first pass already decoded it)
+            if qrData is None:
+                qrResult = self._qrDetectionService.detectQr(
+                    processedImage, frameId, bbox=firstDetection.bbox, context=labelContext
+                )
+                pipelineTiming["s5_qr_detection"] = qrResult.processingTimeMs
+            
+                if not qrResult.success or qrResult.qrData is None:
+                    self._ocrResultWidget.showError("No QR detected")
+                    self._logPipelineTiming(
+                        frameId, pipelineTiming, pipelineStartTime, shouldSaveDebug, imageContexts
+                    )
+                    return
+                qrData = qrResult.qrData
+            
+            # Label already read and validated (cached, or all fields settled
+            # across frames): skip S6-S8
+            if self._outputMode != "qr_only":
+                cachedLabel = None
+                if self._labelResultCache is not None:
+                    cachedLabel = self._labelResultCache.lookup(qrData.text)
+                if cachedLabel is None and self._labelAccumulator is not None:
+                    pendingRegions = self._labelAccumulator.getPendingRegions(qrData.text)
+                    if not pendingRegions:
+                        cachedLabel = self._labelAccumulator.getFusedLabel(qrData.text)
+            
+                if cachedLabel is not None:
+                    logger.debug(f"[{frameId}] Label cache hit: {qrData.text}")
+                    self._configPanel.updatePreprocessedImage(processedImage, labelContext)
+                    self._ocrResultWidget.updateResult(cachedLabel, 0.0)
+                    self._logPipelineTiming(
+                        frameId, pipelineTiming, pipelineStartTime, shouldSaveDebug, imageContexts
+                    )
+                    if shouldSaveDebug:
+                        self._lastDebugSave = currentTime
+                    self._statusBar.showMessage(f"Detected: {len(detections)} label(s) (cached)")
+                    return
+            
+                # Best-frame selection: buffer this crop and run S6-S8 only on
+                # the best-scoring crop of the label (possibly an earlier frame)
+                if self._bestFrameSelector is not None:
+                    scoreStart = time.time()
+                    frameScore = self._bestFrameSelector.score(processedImage, labelContext)
+                    bestFrame = self._bestFrameSelector.offer(
+                        qrData.text, frameScore, (processedImage, labelContext, qrData)
+                    )
+                    pipelineTiming["frame_quality"] = (time.time() - scoreStart) * 1000
+                
+                    if bestFrame is None:
+                        self._configPanel.updatePreprocessedImage(processedImage, labelContext)
+                        self._logPipelineTiming(
+                            frameId, pipelineTiming, pipelineStartTime, shouldSaveDebug, imageContexts
+                        )
+                        if shouldSaveDebug:
+                            self._lastDebugSave = currentTime
+                        self._statusBar.showMessage(
+                            f"Detected: {len(detections)} label(s) (selecting frame, score {frameScore:.2f})"
+                        )
+                        return
+                
+                    releasedContext = bestFrame.payload[1]
+                    if releasedContext is not labelContext:
+                        # An earlier frame's crop was released: S6-S7 derive
+                        # from its context, which already holds reported time
+                        imageContexts.append(releasedContext)
+                        reportedDerivedMs = releasedContext.getTotalTimeMs()
+                    processedImage, labelContext, qrData = bestFrame.payload
+                    logger.debug(f"[{frameId}] Best frame selected: score={bestFrame.score:.3f}")
+        
+        textBlocks = []
+        positionHint = None
+        if self._outputMode == "qr_only":
+            # QR-only output: order code comes from the QR, OCR is skipped
+            self._configPanel.updatePreprocessedImage(processedImage, labelContext)
+        else:
+            # S6: Component Extraction (at most one conversion to an accepted format)
+            componentInput = labelContext.convertedTo(
+                self._componentExtractionService.getInputFormats()
+            )
+            componentResult = self._componentExtractionService.extractComponents(
+                componentInput.image,
+                qrData.polygon,
+                frameId
             )
-            pipelineTiming["s3_preprocessing"] = preprocessResult.processingTimeMs
+            pipelineTiming["s6_component_extraction"] = componentResult.processingTimeMs
             
-            if not preprocessResult.success or preprocessResult.croppedImage is None:
-                self._configPanel.clearPreprocessedImage()
-                self._ocrResultWidget.clear()
+            if not componentResult.success or componentResult.mergedImage is None:
+                self._ocrResultWidget.showError("Component extraction failed")
+                self._logPipelineTiming(
+                    frameId, pipelineTiming, pipelineStartTime, shouldSaveDebug, imageContexts,
+                    reportedDerivedMs
+                )
                 return
-            processedImage = preprocessResult.croppedImage
-        else:
-            # Without preprocessing, skip further processing
-            self._configPanel.clearPreprocessedImage()
-            self._ocrResultWidget.clear()
-            return
-        
-        # S4: Enhancement (brightness, sharpness)
-        if self._enhancementService.isEnabled():
-            enhanceResult = self._enhancementService.enhance(processedImage, frameId)
-            pipelineTiming["s4_enhancement"] = enhanceResult.processingTimeMs
             
-            if enhanceResult.success and enhanceResult.enhancedImage is not None:
-                processedImage = enhanceResult.enhancedImage
-        
-        # S5: QR Detection
-        qrResult = self._qrDetectionService.detectQr(processedImage, frameId)
-        pipelineTiming["s5_qr_detection"] = qrResult.processingTimeMs
-        
-        if not qrResult.success or qrResult.qrData is None:
-            self._ocrResultWidget.showError("No QR detected")
-            self._logPipelineTiming(frameId, pipelineTiming, pipelineStartTime, shouldSaveDebug)
-            return
-        
-        # S6: Component Extraction
-        componentResult = self._componentExtractionService.extractComponents(
-            processedImage, 
-            qrResult.qrData.polygon,
-            frameId
-        )
-        pipelineTiming["s6_component_extraction"] = componentResult.processingTimeMs
-        
-        if not componentResult.success or componentResult.mergedImage is None:
-            self._ocrResultWidget.showError("Component extraction failed")
-            self._logPipelineTiming(frameId, pipelineTiming, pipelineStartTime, shouldSaveDebug)
-            return
-        
-        # Update image display with merged components (will be used for OCR)
-        self._configPanel.updatePreprocessedImage(componentResult.mergedImage)
-        
-        # S7: OCR
-        ocrResult = self._ocrService.extractText(componentResult.mergedImage, frameId)
-        pipelineTiming["s7_ocr"] = ocrResult.processingTimeMs
-        
-        textBlocks = ocrResult.ocrData.textBlocks if ocrResult.success and ocrResult.ocrData else []
+            mergedContext = ImageContext(
+                componentResult.mergedImage, componentResult.imageFormat, "merged"
+            )
+            imageContexts.append(mergedContext)
+            
+            # Update image display with merged components (will be used for OCR)
+            self._configPanel.updatePreprocessedImage(componentResult.mergedImage, mergedContext)
+            
+            # S7: OCR (only the region below the QR once the position is settled)
+            componentData = componentResult.componentData
+            if pendingRegions == ["belowQr"] and componentData is not None:
+                belowContext = ImageContext(
+                    componentData.belowQrRoi, componentResult.imageFormat, "below_qr"
+                )
+                imageContexts.append(belowContext)
+                ocrInput = belowContext.convertedTo(self._ocrService.getInputFormats())
+                ocrRegions = [componentData.belowQrRoi]
+                positionHint = self._labelAccumulator.getPositionHint(qrData.text)
+            else:
+                ocrInput = mergedContext.convertedTo(self._ocrService.getInputFormats())
+                ocrRegions = (
+                    [componentData.aboveQrRoi, componentData.belowQrRoi] if componentData else None
+                )
+            ocrResult = self._ocrService.extractText(ocrInput.image, frameId, regions=ocrRegions)
+            pipelineTiming["s7_ocr"] = ocrResult.processingTimeMs
+            
+            textBlocks = ocrResult.ocrData.textBlocks if ocrResult.success and ocrResult.ocrData else []
         
         # S8: Postprocessing
         postResult = self._postprocessingService.process(
             textBlocks,
-            qrResult.qrData,
-            frameId
+            qrData,
+            frameId,
+            positionHint=positionHint
         )
         pipelineTiming["s8_postprocessing"] = postResult.processingTimeMs
         
         if postResult.success and postResult.labelData:
+            labelData = postResult.labelData
+            if self._outputMode != "qr_only":
+                if self._labelAccumulator is not None:
+                    labelData = self._labelAccumulator.update(qrData.text, labelData)
+                if self._labelResultCache is not None:
+                    self._labelResultCache.store(qrData.text, labelData)
             self._ocrResultWidget.updateResult(
-                postResult.labelData,
+                labelData,
                 postResult.processingTimeMs
             )
         else:
             self._ocrResultWidget.showError("Processing failed")
         
         # Log pipeline timing and update debug save time
-        self._logPipelineTiming(frameId, pipelineTiming, pipelineStartTime, shouldSaveDebug)
+        self._logPipelineTiming(
+            frameId, pipelineTiming, pipelineStartTime, shouldSaveDebug, imageContexts,
+            reportedDerivedMs
+        )
         
         if shouldSaveDebug:
             self._lastDebugSave = currentTime
@@ -505,7 +684,9 @@ def _logPipelineTiming(
         frameId: str, 
         timing: dict, 
         startTime: float,
-        saveToFile: bool = False
+        saveToFile: bool = False,
+        imageContexts: Optional[list] = None,
+        reportedDerivedMs: float = 0.0
     ) -> None:
         """
         Log and optionally save pipeline timing information.
@@ -518,9 +699,20 @@ def _logPipelineTiming(
             timing: Dictionary of service timings.
             startTime: Pipeline start time.
             saveToFile: Whether to save timing to debug file.
+            imageContexts: ImageContexts of the frame; the time spent on
+                derived images is reported as "derived_images".
+            reportedDerivedMs: Part of that time already reported by
+                earlier frames (buffered crop of the best-frame selector).
         """
         import time
         
+        if imageContexts:
+            timing["derived_images"] = (
+                sum(c.getTotalTimeMs() for c in imageContexts) - reportedDerivedMs
+            )
+            for context in imageContexts:
+                logger.debug(f"[{frameId}] Derived images: {context.getTimings()}")
+        
         totalTime = (time.time() - startTime) * 1000
         timing["total_pipeline"] = round(totalTime, 2)
         
@@ -569,5 +761,9 @@ def closeEvent(self, event):
         # Release camera via service
         self._cameraService.closeCamera()
         
+        # Stop QR-first worker
+        if self._qrFirstExecutor is not None:
+            self._qrFirstExecutor.shutdown(wait=False, cancel_futures=True)
+        
         logger.info("Application closed")
         event.accept()
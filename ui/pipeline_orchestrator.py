@@ -35,6 +35,9 @@
 from services.impl.s6_component_extraction_service import S6ComponentExtractionService
 from services.impl.s7_ocr_service import S7OcrService
 from services.impl.s8_postprocessing_service import S8PostprocessingService
+from core.processor.label_result_cache import LabelResultCache
+from core.processor.label_field_accumulator import LabelFieldAccumulator
+from core.enhancer.best_frame_selector import BestFrameSelector
 
 
 class PipelineOrchestrator:
@@ -124,6 +127,10 @@ def _initializeServices(
             paddleModelPath=self._configService.getPaddleModelPath(),
             orientationCpuThreads=self._configService.getOrientationCpuThreads(),
             orientationEnableMkldnn=self._configService.getOrientationEnableMkldnn(),
+            orientationBackend=self._configService.getOrientationBackend(),
+            orientationModelPath=self._configService.getOrientationModelPath(),
+            openvinoConfig=self._configService.getOpenvinoConfig(),
+            qrAnchorMargins=self._configService.getQrAnchorMargins(),
             debugBasePath=debugBasePath,
             debugEnabled=debugEnabled
         )
@@ -140,6 +147,12 @@ def _initializeServices(
             sharpnessEnabled=self._configService.isSharpnessEnabled(),
             sharpnessSigma=self._configService.getSharpnessSigma(),
             sharpnessAmount=self._configService.getSharpnessAmount(),
+            adaptiveEnabled=self._configService.isAdaptiveEnhancementEnabled(),
+            adaptiveThumbnailWidth=self._configService.getAdaptiveThumbnailWidth(),
+            adaptiveMinContrastSpread=self._configService.getAdaptiveMinContrastSpread(),
+            adaptiveMinMeanBrightness=self._configService.getAdaptiveMinMeanBrightness(),
+            adaptiveMaxMeanBrightness=self._configService.getAdaptiveMaxMeanBrightness(),
+            adaptiveMinSharpness=self._configService.getAdaptiveMinSharpness(),
             debugBasePath=debugBasePath,
             debugEnabled=debugEnabled
         )
@@ -160,6 +173,37 @@ def _initializeServices(
             preprocessingEnabled=self._configService.isQrPreprocessingEnabled(),
             preprocessingMode=self._configService.getQrPreprocessingMode(),
             preprocessingTargetWidth=self._configService.getQrPreprocessingTargetWidth(),
+            # Cascade params (prefixed with 'cascade')
+            cascadeStages=self._configService.getQrCascadeStages(),
+            cascadeAdaptiveOrdering=self._configService.isQrCascadeAdaptiveOrdering(),
+            cascadeMinAttempts=self._configService.getQrCascadeMinAttempts(),
+            cascadeExplorationInterval=self._configService.getQrCascadeExplorationInterval(),
+            # Concurrent params (prefixed with 'concurrent')
+            concurrentBackends=self._configService.getQrConcurrentBackends(),
+            concurrentTimeoutMs=self._configService.getQrConcurrentTimeoutMs(),
+            # Multi-scale params (prefixed with 'multiscale')
+            multiscaleBackend=self._configService.getQrMultiscaleBackend(),
+            multiscaleQrModules=self._configService.getQrMultiscaleQrModules(),
+            multiscaleExpectedQrWidthRatio=self._configService.getQrMultiscaleExpectedQrWidthRatio(),
+            multiscaleTargetModuleSize=self._configService.getQrMultiscaleTargetModuleSize(),
+            multiscaleLargeModuleSize=self._configService.getQrMultiscaleLargeModuleSize(),
+            multiscalePyramidFactors=self._configService.getQrMultiscalePyramidFactors(),
+            multiscaleTimeBudgetMs=self._configService.getQrMultiscaleTimeBudgetMs(),
+            # ROI localization params (prefixed with 'roi')
+            roiEnabled=self._configService.isQrRoiEnabled(),
+            roiHistorySize=self._configService.getQrRoiHistorySize(),
+            roiPadding=self._configService.getQrRoiPadding(),
+            roiFinderSearch=self._configService.isQrRoiFinderSearchEnabled(),
+            roiMaxRegionRatio=self._configService.getQrRoiMaxRegionRatio(),
+            # Result cache params (prefixed with 'cache')
+            cacheEnabled=self._configService.isQrCacheEnabled(),
+            cacheTtlMs=self._configService.getQrCacheTtlMs(),
+            cacheMinIou=self._configService.getQrCacheMinIou(),
+            cacheMaxHashDistance=self._configService.getQrCacheMaxHashDistance(),
+            # QR-first params (prefixed with 'qrFirst')
+            qrFirstEnabled=self._configService.isQrFirstEnabled(),
+            qrFirstBackend=self._configService.getQrFirstBackend(),
+            qrFirstMaxWidth=self._configService.getQrFirstMaxWidth(),
             # Debug settings
             debugBasePath=debugBasePath,
             debugEnabled=debugEnabled
@@ -202,6 +246,21 @@ def _initializeServices(
             mkldnnCacheCapacity=self._configService.getOcrMkldnnCacheCapacity(),
             cpuThreads=self._configService.getOcrCpuThreads(),
             device=self._configService.getOcrDevice(),
+            mode=self._configService.getOcrMode(),
+            recBatchSize=self._configService.getOcrRecBatchSize(),
+            lineMinHeight=self._configService.getOcrLineMinHeight(),
+            lineInkThreshold=self._configService.getOcrLineInkThreshold(),
+            linePadding=self._configService.getOcrLinePadding(),
+            executionMode=self._configService.getOcrExecutionMode(),
+            processWorkers=self._configService.getOcrProcessWorkers(),
+            processCoresPerWorker=self._configService.getOcrProcessCoresPerWorker(),
+            processWarmup=self._configService.isOcrProcessWarmup(),
+            backend=self._configService.getOcrBackend(),
+            detModelPath=self._configService.getOcrDetModelPath(),
+            recModelPath=self._configService.getOcrRecModelPath(),
+            recCharDictPath=self._configService.getOcrRecCharDictPath(),
+            modelCacheDir=self._configService.getOcrModelCacheDir(),
+            openvinoConfig=self._configService.getOpenvinoConfig(),
             debugBasePath=debugBasePath,
             debugEnabled=debugEnabled
         )
@@ -216,10 +275,47 @@ def _initializeServices(
             productsJsonPath=self._configService.getProductsJsonPath(),
             sizesJsonPath=self._configService.getSizesJsonPath(),
             colorsJsonPath=self._configService.getColorsJsonPath(),
+            catalogIndexDir=self._configService.getCatalogIndexDir(),
+            similarityBackend=self._configService.getSimilarityBackend(),
             debugBasePath=debugBasePath,
             debugEnabled=debugEnabled
         )
         self._logger.info("S8PostprocessingService initialized")
+        
+        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+        # Label Result Cache (skips S6-S8 for labels already validated)
+        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+        self._labelResultCache: Optional[LabelResultCache] = None
+        if self._configService.isLabelCacheEnabled():
+            self._labelResultCache = LabelResultCache(
+                ttlMs=self._configService.getLabelCacheTtlMs(),
+                maxEntries=self._configService.getLabelCacheMaxEntries(),
+                reverifyIntervalMs=self._configService.getLabelCacheReverifyIntervalMs()
+            )
+        
+        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+        # Label Field Accumulator (cross-frame voting per field)
+        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+        self._labelFieldAccumulator: Optional[LabelFieldAccumulator] = None
+        if self._configService.isFieldFusionEnabled():
+            self._labelFieldAccumulator = LabelFieldAccumulator(
+                minVoteScore=self._configService.getFieldFusionMinVoteScore(),
+                ttlMs=self._configService.getFieldFusionTtlMs(),
+                maxEntries=self._configService.getFieldFusionMaxEntries()
+            )
+        
+        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+        # Best Frame Selector (only the best crop of a label goes to S6-S8)
+        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+        self._bestFrameSelector: Optional[BestFrameSelector] = None
+        if self._configService.isBestFrameEnabled():
+            self._bestFrameSelector = BestFrameSelector(
+                bufferSize=self._configService.getBestFrameBufferSize(),
+                windowMs=self._configService.getBestFrameWindowMs(),
+                releaseScore=self._configService.getBestFrameReleaseScore(),
+                thumbnailWidth=self._configService.getBestFrameThumbnailWidth(),
+                sharpnessReference=self._configService.getBestFrameSharpnessReference()
+            )
     
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # Service Getters (For UI/External Access)
@@ -270,6 +366,21 @@ def postprocessingService(self) -> S8PostprocessingService:
         """Get Step 8: Postprocessing service."""
         return self._s8PostprocessingService
     
+    @property
+    def labelResultCache(self) -> Optional[LabelResultCache]:
+        """Get the cache of validated label results (None if disabled)."""
+        return self._labelResultCache
+    
+    @property
+    def labelFieldAccumulator(self) -> Optional[LabelFieldAccumulator]:
+        """Get the cross-frame field accumulator (None if disabled)."""
+        return self._labelFieldAccumulator
+    
+    @property
+    def bestFrameSelector(self) -> Optional[BestFrameSelector]:
+        """Get the best-frame selector (None if disabled)."""
+        return self._bestFrameSelector
+    
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # Debug Control
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -370,4 +481,12 @@ def shutdown(self) -> None:
         if hasattr(self._s1CameraService, 'release'):
             self._s1CameraService.release()
         
+        # Stop background QR decode workers
+        if hasattr(self._s5QrDetectionService, 'release'):
+            self._s5QrDetectionService.release()
+        
+        # Stop OCR worker processes
+        if hasattr(self._s7OcrService, 'release'):
+            self._s7OcrService.release()
+        
         self._logger.info("PipelineOrchestrator shutdown complete")
@@ -115,18 +115,15 @@ def updateFrame(self, frame: np.ndarray, detections: list[Detection] = None):
         # Draw detections on frame
         displayFrame = self._drawOverlay(frame.copy(), self._detections)
         
-        # Convert BGR to RGB for Qt
-        rgbFrame = cv2.cvtColor(displayFrame, cv2.COLOR_BGR2RGB)
-        
-        # Create QImage
-        height, width, channels = rgbFrame.shape
+        # Create QImage directly from BGR data (no color conversion)
+        height, width, channels = displayFrame.shape
         bytesPerLine = channels * width
         qImage = QImage(
-            rgbFrame.data,
+            displayFrame.data,
             width,
             height,
             bytesPerLine,
-            QImage.Format.Format_RGB888
+            QImage.Format.Format_BGR888
         )
         
         # Scale to fit label while maintaining aspect ratio
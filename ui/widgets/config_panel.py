@@ -228,15 +228,16 @@ def isCameraEnabled(self) -> bool:
         """Get camera toggle state."""
         return self._cameraToggle.isChecked()
     
-    def updatePreprocessedImage(self, image) -> None:
+    def updatePreprocessedImage(self, image, context=None) -> None:
         """
         Update the preprocessed image display.
         
         Args:
-            image: Preprocessed image (BGR format), or None to clear.
+            image: Preprocessed image (grayscale or BGR), or None to clear.
+            context: Optional ImageContext of image (shared resizes).
         """
         if image is not None:
-            self._preprocessedImageWidget.updateImage(image)
+            self._preprocessedImageWidget.updateImage(image, context)
         else:
             self._preprocessedImageWidget.clear()
     
@@ -13,6 +13,8 @@
 from PySide6.QtGui import QImage, QPixmap
 from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout, QGroupBox
 
+from core.interfaces.image_context import ImageContext
+
 
 logger = logging.getLogger(__name__)
 
@@ -91,12 +93,18 @@ def _showPlaceholder(self):
         self._imageLabel.setText("No label detected")
         self._imageLabel.setPixmap(QPixmap())  # Clear any existing pixmap
     
-    def updateImage(self, image: np.ndarray) -> None:
+    def updateImage(
+        self,
+        image: np.ndarray,
+        context: Optional[ImageContext] = None
+    ) -> None:
         """
         Update the displayed image.
         
         Args:
-            image: Merged component image for OCR (BGR format from OpenCV).
+            image: Merged component image for OCR (grayscale or BGR).
+            context: Optional frame context of image; the display
+                thumbnail is taken from it (timed with the frame).
         """
         if image is None:
             self.clear()
@@ -114,25 +122,31 @@ def updateImage(self, image: np.ndarray) -> None:
             scale = min(scaleW, scaleH, 1.0)  # Don't upscale
             
             # Resize if needed
-            if scale < 1.0:
+            if context is not None and context.image is image:
+                displayImage, _ = context.thumbnail(self._displayWidth, self._displayHeight)
+            elif scale < 1.0:
                 newW = int(w * scale)
                 newH = int(h * scale)
                 displayImage = cv2.resize(image, (newW, newH), interpolation=cv2.INTER_AREA)
             else:
                 displayImage = image
             
-            # Convert BGR to RGB for Qt
-            rgbImage = cv2.cvtColor(displayImage, cv2.COLOR_BGR2RGB)
-            
-            # Create QImage
-            h, w, ch = rgbImage.shape
+            # Create QImage directly from the OpenCV layout (no color conversion)
+            displayImage = np.ascontiguousarray(displayImage)
+            if len(displayImage.shape) == 2:
+                h, w = displayImage.shape
+                ch = 1
+                qFormat = QImage.Format.Format_Grayscale8
+            else:
+                h, w, ch = displayImage.shape
+                qFormat = QImage.Format.Format_BGR888
             bytesPerLine = ch * w
             qImage = QImage(
-                rgbImage.data,
+                displayImage.data,
                 w,
                 h,
                 bytesPerLine,
-                QImage.Format.Format_RGB888
+                qFormat
             )
             
             # Convert to QPixmap and display